@@ -18,7 +18,7 @@ import six
 from dynamodb_encryption_sdk.identifiers import EncryptionKeyType  # noqa pylint: disable=unused-import
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Optional, Text  # noqa pylint: disable=unused-import
+    from typing import Dict, Iterable, List, Optional, Text  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -160,6 +160,35 @@ class DelegatedKey(object):
         """
         _raise_not_implemented("verify")
 
+    def sign_many(self, algorithm, data):  # type: ignore
+        # type: (Text, Iterable[bytes]) -> List[bytes]
+        """Sign each of several pieces of data.
+
+        Unless overridden by a subclass, this calls :meth:`sign` for each piece of data.
+
+        :param str algorithm: Text description of algorithm to use to sign data
+        :param data: Data to sign
+        :type data: iterable of bytes
+        :returns: Signature values, in the same order as ``data``
+        :rtype: list of bytes
+        """
+        return [self.sign(algorithm=algorithm, data=each) for each in data]
+
+    def verify_many(self, algorithm, signatures, data):  # type: ignore
+        # type: (Text, Iterable[bytes], Iterable[bytes]) -> None
+        """Verify each of several signatures.
+
+        Unless overridden by a subclass, this calls :meth:`verify` for each signature.
+
+        :param str algorithm: Text description of algorithm to use to verify signatures
+        :param signatures: Signatures to verify
+        :type signatures: iterable of bytes
+        :param data: Data over which to verify each signature, in the same order as ``signatures``
+        :type data: iterable of bytes
+        """
+        for signature, each in zip(signatures, data):
+            self.verify(algorithm=algorithm, signature=signature, data=each)
+
     def signing_algorithm(self):  # type: ignore
         # type: () -> Text
         # pylint: disable=no-self-use
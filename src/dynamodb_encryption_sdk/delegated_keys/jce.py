@@ -25,11 +25,12 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 from dynamodb_encryption_sdk.exceptions import JceTransformationError, UnwrappingError
 from dynamodb_encryption_sdk.identifiers import LOGGER_NAME, EncryptionKeyType, KeyEncodingType
 from dynamodb_encryption_sdk.internal.crypto.jce_bridge import authentication, encryption, primitives
+from dynamodb_encryption_sdk.internal.str_ops import to_bytes
 
 from . import DelegatedKey
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Optional, Text  # noqa pylint: disable=unused-import
+    from typing import Dict, Iterable, List, Optional, Text  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -131,6 +132,10 @@ class JceNameLocalDelegatedKey(DelegatedKey):
         attr.validate(self)
         self.__attrs_post_init__()
 
+    def __reduce__(self):
+        """Pickle only the constructor arguments, since loaded keys and prebuilt signers cannot be pickled."""
+        return self.__class__, (self.key, self._algorithm, self._key_type, self._key_encoding)
+
     @property
     def algorithm(self):
         # type: () -> Text
@@ -142,6 +147,8 @@ class JceNameLocalDelegatedKey(DelegatedKey):
         """Enable authentication methods for keys that support them."""
         self.sign = self._sign
         self.verify = self._verify
+        self.sign_many = self._sign_many
+        self.verify_many = self._verify_many
         self.signing_algorithm = self._signing_algorithm
 
     def _enable_encryption(self):
@@ -169,6 +176,10 @@ class JceNameLocalDelegatedKey(DelegatedKey):
             self.__key = key_transformer.load_key(  # attrs confuses pylint: disable=attribute-defined-outside-init
                 self.key, self._key_type, self._key_encoding
             )
+            # Reused by every encrypt and decrypt call rather than rebuilt for each attribute.
+            self.__cipher_key = key_transformer.prepare_key(  # pylint: disable=attribute-defined-outside-init
+                self.__key
+            )
             self._enable_encryption()
             self._enable_wrap()
             return
@@ -184,6 +195,10 @@ class JceNameLocalDelegatedKey(DelegatedKey):
             self.__key = key_transformer.load_key(  # attrs confuses pylint: disable=attribute-defined-outside-init
                 self.key, self._key_type, self._key_encoding
             )
+            # Copied or reused by every sign and verify call rather than rebuilt for each item.
+            self.__signing_key = key_transformer.prepare_key(  # pylint: disable=attribute-defined-outside-init
+                self.__key
+            )
             self._enable_authentication()
             return
 
@@ -234,7 +249,8 @@ class JceNameLocalDelegatedKey(DelegatedKey):
 
         :param str algorithm: Java StandardName transformation string of algorithm to use to encrypt data
             https://docs.oracle.com/javase/8/docs/api/javax/crypto/Cipher.html
-        :param str name: Name associated with plaintext data
+        :param str name: Name associated with plaintext data.
+            GCM transformations authenticate this as additional associated data.
         :param bytes plaintext: Plaintext data to encrypt
         :param dict additional_associated_data: Not used by all delegated keys, but if it
             is, then if it is provided on encrypt it must be required on decrypt.
@@ -242,7 +258,7 @@ class JceNameLocalDelegatedKey(DelegatedKey):
         :rtype: bytes
         """
         encryptor = encryption.JavaCipher.from_transformation(algorithm)
-        return encryptor.encrypt(self.__key, plaintext)
+        return encryptor.encrypt(self.__cipher_key, plaintext, to_bytes(name))
 
     def _decrypt(self, algorithm, name, ciphertext, additional_associated_data=None):
         # type: (Text, Text, bytes, Optional[Dict[Text, Text]]) -> bytes
@@ -251,14 +267,15 @@ class JceNameLocalDelegatedKey(DelegatedKey):
 
         :param str algorithm: Java StandardName transformation string of algorithm to use to decrypt data
             https://docs.oracle.com/javase/8/docs/api/javax/crypto/Cipher.html
-        :param str name: Name associated with ciphertext data
+        :param str name: Name associated with ciphertext data.
+            GCM transformations authenticate this as additional associated data.
         :param bytes ciphertext: Ciphertext data to decrypt
         :param dict additional_associated_data: Not used by :class:`JceNameLocalDelegatedKey`
         :returns: Decrypted plaintext
         :rtype: bytes
         """
         decryptor = encryption.JavaCipher.from_transformation(algorithm)
-        return decryptor.decrypt(self.__key, ciphertext)
+        return decryptor.decrypt(self.__cipher_key, ciphertext, to_bytes(name))
 
     def _wrap(self, algorithm, content_key, additional_associated_data=None):
         # type: (Text, bytes, Optional[Dict[Text, Text]]) -> bytes
@@ -309,7 +326,7 @@ class JceNameLocalDelegatedKey(DelegatedKey):
         :rtype: bytes
         """
         signer = authentication.JAVA_AUTHENTICATOR[algorithm]
-        return signer.sign(self.__key, data)
+        return signer.sign(self.__signing_key, data)
 
     def _verify(self, algorithm, signature, data):
         # type: (Text, bytes, bytes) -> None
@@ -320,7 +337,33 @@ class JceNameLocalDelegatedKey(DelegatedKey):
         :param bytes data: Data over which to verify signature
         """
         verifier = authentication.JAVA_AUTHENTICATOR[algorithm]
-        verifier.verify(self.__key, signature, data)
+        verifier.verify(self.__signing_key, signature, data)
+
+    def _sign_many(self, algorithm, data):
+        # type: (Text, Iterable[bytes]) -> List[bytes]
+        """Sign each of several pieces of data.
+
+        :param str algorithm: Text description of algorithm to use to sign data
+        :param data: Data to sign
+        :type data: iterable of bytes
+        :returns: Signature values, in the same order as ``data``
+        :rtype: list of bytes
+        """
+        signer = authentication.JAVA_AUTHENTICATOR[algorithm]
+        return signer.sign_many(self.__signing_key, data)
+
+    def _verify_many(self, algorithm, signatures, data):
+        # type: (Text, Iterable[bytes], Iterable[bytes]) -> None
+        """Verify each of several signatures.
+
+        :param str algorithm: Text description of algorithm to use to verify signatures
+        :param signatures: Signatures to verify
+        :type signatures: iterable of bytes
+        :param data: Data over which to verify each signature, in the same order as ``signatures``
+        :type data: iterable of bytes
+        """
+        verifier = authentication.JAVA_AUTHENTICATOR[algorithm]
+        verifier.verify_many(self.__signing_key, signatures, data)
 
     def _signing_algorithm(self):
         # type: () -> Text
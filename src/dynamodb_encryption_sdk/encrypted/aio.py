@@ -0,0 +1,449 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""High-level helper classes to provide a familiar interface to encrypted tables from asyncio.
+
+.. note::
+
+    Requires Python 3.5 or later.
+"""
+from concurrent.futures import Executor  # noqa pylint: disable=unused-import
+from functools import partial
+
+import attr
+
+from dynamodb_encryption_sdk.internal.action_plan import AttributeActionPlan
+from dynamodb_encryption_sdk.internal.aio import (
+    AsyncTableInfoCache,
+    DecryptedPageIterator,
+    crypto_config_from_cache,
+    crypto_config_from_kwargs,
+    decrypt_batch_get_item,
+    decrypt_get_item,
+    decrypt_multi_get,
+    encrypt_batch_write_item,
+    encrypt_put_item,
+)
+from dynamodb_encryption_sdk.internal.utils import crypto_config_from_table_info
+from dynamodb_encryption_sdk.internal.validators import callable_validator
+from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
+from dynamodb_encryption_sdk.structures import AttributeActions, TableInfo
+
+from . import CryptoConfig  # noqa pylint: disable=unused-import
+from .item import decrypt_dynamodb_item, decrypt_python_item, encrypt_dynamodb_item, encrypt_python_item
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Any, Callable, Dict, Optional  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+
+__all__ = ("AsyncEncryptedClient", "AsyncEncryptedPaginator", "AsyncEncryptedTable")
+
+
+@attr.s(init=False)
+class AsyncEncryptedPaginator(object):
+    """Paginator that decrypts returned items before returning them.
+
+    :param paginator: Asynchronous DynamoDB paginator object, such as an aiobotocore paginator
+    :param decrypt_method: Item decryptor method from :mod:`dynamodb_encryption_sdk.encrypted.item`
+    :param callable crypto_config_method: Coroutine function that returns a :class:`CryptoConfig`
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    """
+
+    _paginator = attr.ib()
+    _decrypt_method = attr.ib()
+    _crypto_config_method = attr.ib(validator=callable_validator)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
+
+    def __init__(
+        self,
+        paginator,  # type: Any
+        decrypt_method,  # type: Callable
+        crypto_config_method,  # type: Callable
+        executor=None,  # type: Optional[Executor]
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._paginator = paginator
+        self._decrypt_method = decrypt_method
+        self._crypto_config_method = crypto_config_method
+        self._executor = executor
+        attr.validate(self)
+
+    @_decrypt_method.validator
+    def validate_decrypt_method(self, attribute, value):
+        # pylint: disable=unused-argument
+        """Validate that _decrypt_method is one of the item encryptors."""
+        if self._decrypt_method not in (decrypt_python_item, decrypt_dynamodb_item):
+            raise ValueError(
+                '"{name}" must be an item decryptor from dynamodb_encryption_sdk.encrypted.item'.format(
+                    name=attribute.name
+                )
+            )
+
+    def __getattr__(self, name):
+        """Catch any method/attribute lookups that are not defined in this class and try
+        to find them on the provided paginator object.
+
+        :param str name: Attribute name
+        :returns: Result of asking the provided paginator object for that attribute name
+        :raises AttributeError: if attribute is not found on provided paginator object
+        """
+        return getattr(self._paginator, name)
+
+    def paginate(self, **kwargs):
+        # type: (**Any) -> DecryptedPageIterator
+        # narrow this down
+        # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+        """Create an asynchronous iterator that will paginate through responses from the underlying
+        paginator, transparently decrypting any returned items.
+
+        >>> async for page in encrypted_paginator.paginate(TableName='my_table'):
+        ...     process(page['Items'])
+        """
+        return DecryptedPageIterator(
+            paginator=self._paginator,
+            decrypt_method=self._decrypt_method,
+            crypto_config_method=self._crypto_config_method,
+            kwargs=kwargs,
+            executor=self._executor,
+        )
+
+
+@attr.s(init=False)
+class AsyncEncryptedClient(object):
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """High-level helper class to provide a familiar interface to encrypted tables from asyncio.
+
+    >>> from aiobotocore.session import get_session
+    >>> from dynamodb_encryption_sdk.encrypted.aio import AsyncEncryptedClient
+    >>> async with get_session().create_client('dynamodb') as client:
+    ...     encrypted_client = AsyncEncryptedClient(
+    ...         client=client,
+    ...         materials_provider=my_materials_provider
+    ...     )
+    ...     response = await encrypted_client.get_item(TableName='my_table', Key=my_key)
+
+    .. note::
+
+        Any client with the boto3 DynamoDB client method shape whose methods return awaitables,
+        such as an aiobotocore client, may be used. All methods that this class wraps are coroutine
+        functions, and ``get_paginator`` returns paginators whose ``paginate`` method returns an
+        asynchronous iterator.
+
+        All cryptographic work is run in ``executor``. If the materials provider is an
+        :class:`AsyncCryptographicMaterialsProvider`, materials are awaited from it. Any other
+        materials provider is called in ``executor``.
+
+        If you want to provide per-request cryptographic details, the ``put_item``, ``get_item``,
+        ``query``, ``scan``, ``batch_write_item``, and ``batch_get_item`` methods will also accept
+        a ``crypto_config`` parameter, defining a custom :class:`CryptoConfig` instance for this request.
+
+    .. warning::
+
+        We do not currently support the ``update_item`` method.
+
+    :param client: Asynchronous DynamoDB client, such as an aiobotocore client
+    :param CryptographicMaterialsProvider materials_provider: Cryptographic materials provider to use
+    :param AttributeActions attribute_actions: Table-level configuration of how to encrypt/sign attributes
+    :param bool auto_refresh_table_indexes: Should we attempt to refresh information about table indexes?
+        Requires ``dynamodb:DescribeTable`` permissions on each table. (default: True)
+    :param bool expect_standard_dictionaries: Should we expect items to be standard Python
+        dictionaries? This should only be set to True if you are using a client obtained
+        from a service resource or table resource (ex: ``table.meta.client``). (default: False)
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    """
+
+    _client = attr.ib()
+    _materials_provider = attr.ib(validator=attr.validators.instance_of(CryptographicMaterialsProvider))
+    _attribute_actions = attr.ib(
+        validator=attr.validators.instance_of(AttributeActions), default=attr.Factory(AttributeActions)
+    )
+    _auto_refresh_table_indexes = attr.ib(validator=attr.validators.instance_of(bool), default=True)
+    _expect_standard_dictionaries = attr.ib(validator=attr.validators.instance_of(bool), default=False)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
+
+    def __init__(
+        self,
+        client,  # type: Any
+        materials_provider,  # type: CryptographicMaterialsProvider
+        attribute_actions=None,  # type: Optional[AttributeActions]
+        auto_refresh_table_indexes=True,  # type: Optional[bool]
+        expect_standard_dictionaries=False,  # type: Optional[bool]
+        executor=None,  # type: Optional[Executor]
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        if attribute_actions is None:
+            attribute_actions = AttributeActions()
+
+        self._client = client
+        self._materials_provider = materials_provider
+        self._attribute_actions = attribute_actions
+        self._auto_refresh_table_indexes = auto_refresh_table_indexes
+        self._expect_standard_dictionaries = expect_standard_dictionaries
+        self._executor = executor
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        """Set up the table info cache and translation methods."""
+        if self._expect_standard_dictionaries:
+            self._encrypt_item = encrypt_python_item  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._decrypt_item = decrypt_python_item  # attrs confuses pylint: disable=attribute-defined-outside-init
+        else:
+            self._encrypt_item = encrypt_dynamodb_item  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._decrypt_item = decrypt_dynamodb_item  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._table_info_cache = AsyncTableInfoCache(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            client=self._client, auto_refresh_table_indexes=self._auto_refresh_table_indexes
+        )
+        self._table_crypto_config = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            crypto_config_from_cache, self._materials_provider, self._attribute_actions, self._table_info_cache
+        )
+        self._item_crypto_config = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            crypto_config_from_kwargs, self._table_crypto_config
+        )
+        self.get_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_get_item,
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.get_item,
+            executor=self._executor,
+        )
+        self.put_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            encrypt_put_item,
+            self._encrypt_item,
+            self._item_crypto_config,
+            self._client.put_item,
+            executor=self._executor,
+        )
+        self.query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_multi_get,
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.query,
+            executor=self._executor,
+        )
+        self.scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_multi_get,
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.scan,
+            executor=self._executor,
+        )
+        self.batch_get_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_batch_get_item,
+            self._decrypt_item,
+            self._table_crypto_config,
+            self._client.batch_get_item,
+            executor=self._executor,
+        )
+        self.batch_write_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            encrypt_batch_write_item,
+            self._encrypt_item,
+            self._table_crypto_config,
+            self._client.batch_write_item,
+            executor=self._executor,
+        )
+
+    def __getattr__(self, name):
+        """Catch any method/attribute lookups that are not defined in this class and try
+        to find them on the provided client object.
+
+        :param str name: Attribute name
+        :returns: Result of asking the provided client object for that attribute name
+        :raises AttributeError: if attribute is not found on provided client object
+        """
+        return getattr(self._client, name)
+
+    async def update_item(self, **kwargs):
+        """Update item is not yet supported.
+
+        :raises NotImplementedError: if called
+        """
+        raise NotImplementedError('"update_item" is not yet implemented')
+
+    def get_paginator(self, operation_name):
+        """Get a paginator from the underlying client. If the paginator requested is for
+        "scan" or "query", the paginator returned will transparently decrypt the returned items.
+
+        :param str operation_name: Name of operation for which to get paginator
+        :returns: Paginator for name
+        :rtype: AsyncEncryptedPaginator or the underlying client's paginator
+        """
+        paginator = self._client.get_paginator(operation_name)
+
+        if operation_name in ("scan", "query"):
+            return AsyncEncryptedPaginator(
+                paginator=paginator,
+                decrypt_method=self._decrypt_item,
+                crypto_config_method=self._item_crypto_config,
+                executor=self._executor,
+            )
+
+        return paginator
+
+
+@attr.s(init=False)
+class AsyncEncryptedTable(object):
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """High-level helper class to provide a familiar interface to encrypted tables from asyncio.
+
+    >>> import aioboto3
+    >>> from dynamodb_encryption_sdk.encrypted.aio import AsyncEncryptedTable
+    >>> async with aioboto3.Session().resource('dynamodb') as resource:
+    ...     table = await resource.Table('my_table')
+    ...     encrypted_table = AsyncEncryptedTable(
+    ...         table=table,
+    ...         materials_provider=my_materials_provider
+    ...     )
+    ...     response = await encrypted_table.get_item(Key=my_key)
+
+    .. note::
+
+        Any table object with the boto3 DynamoDB Table method shape whose methods return awaitables,
+        such as an aioboto3 table resource, may be used. All methods that this class wraps are
+        coroutine functions.
+
+        Information about the table indexes is loaded from ``table.meta.client`` the first time that
+        it is needed, unless ``table_info`` is provided or ``auto_refresh_table_indexes`` is False.
+
+        If you want to provide per-request cryptographic details, the ``put_item``, ``get_item``,
+        ``query``, and ``scan`` methods will also accept a ``crypto_config`` parameter, defining
+        a custom :class:`CryptoConfig` instance for this request.
+
+    .. warning::
+
+        We do not currently support the ``update_item`` or ``batch_writer`` methods.
+
+    :param table: Asynchronous DynamoDB table object, such as an aioboto3 table resource
+    :param CryptographicMaterialsProvider materials_provider: Cryptographic materials provider to use
+    :param TableInfo table_info: Information about the target DynamoDB table
+    :param AttributeActions attribute_actions: Table-level configuration of how to encrypt/sign attributes
+    :param bool auto_refresh_table_indexes: Should we attempt to refresh information about table indexes?
+        Requires ``dynamodb:DescribeTable`` permissions on each table. (default: True)
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    """
+
+    _table = attr.ib()
+    _materials_provider = attr.ib(validator=attr.validators.instance_of(CryptographicMaterialsProvider))
+    _table_info = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(TableInfo)), default=None)
+    _attribute_actions = attr.ib(
+        validator=attr.validators.instance_of(AttributeActions), default=attr.Factory(AttributeActions)
+    )
+    _auto_refresh_table_indexes = attr.ib(validator=attr.validators.instance_of(bool), default=True)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
+
+    def __init__(
+        self,
+        table,  # type: Any
+        materials_provider,  # type: CryptographicMaterialsProvider
+        table_info=None,  # type: Optional[TableInfo]
+        attribute_actions=None,  # type: Optional[AttributeActions]
+        auto_refresh_table_indexes=True,  # type: Optional[bool]
+        executor=None,  # type: Optional[Executor]
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        if attribute_actions is None:
+            attribute_actions = AttributeActions()
+
+        self._table = table
+        self._materials_provider = materials_provider
+        self._table_info = table_info
+        self._attribute_actions = attribute_actions
+        self._auto_refresh_table_indexes = auto_refresh_table_indexes
+        self._executor = executor
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        """Prepare table info if it was not set and set up translation methods."""
+        if self._table_info is None:
+            self._table_info = TableInfo(name=self._table.name)
+
+        # Indexes are loaded on first use if they need to be refreshed.
+        self._table_info_loaded = (  # attrs confuses pylint: disable=attribute-defined-outside-init
+            not self._auto_refresh_table_indexes
+        )
+
+        # Compile the attribute actions once for every item written to or read from this table.
+        # If the indexes are not loaded yet, the index keys are added to the plan once they are.
+        index_keys = self._table_info.protected_index_keys() if self._table_info_loaded else ()
+        self._attribute_actions = AttributeActionPlan.compile(self._attribute_actions, *index_keys)
+
+        self._crypto_config = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            crypto_config_from_kwargs, self._table_crypto_config
+        )
+        self.get_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_get_item, decrypt_python_item, self._crypto_config, self._table.get_item, executor=self._executor
+        )
+        self.put_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            encrypt_put_item, encrypt_python_item, self._crypto_config, self._table.put_item, executor=self._executor
+        )
+        self.query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.query, executor=self._executor
+        )
+        self.scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.scan, executor=self._executor
+        )
+
+    async def _table_crypto_config(self):
+        # type: () -> CryptoConfig
+        """Build the crypto config for this table, loading the table indexes first if needed.
+
+        :rtype: CryptoConfig
+        """
+        if not self._table_info_loaded:
+            response = await self._table.meta.client.describe_table(TableName=self._table_info.name)
+            self._table_info.load_indexed_attributes(response["Table"])
+            self._attribute_actions.set_index_keys(*self._table_info.protected_index_keys())
+            self._table_info_loaded = True  # attrs confuses pylint: disable=attribute-defined-outside-init
+
+        return crypto_config_from_table_info(self._materials_provider, self._attribute_actions, self._table_info)
+
+    def __getattr__(self, name):
+        """Catch any method/attribute lookups that are not defined in this class and try
+        to find them on the provided table object.
+
+        :param str name: Attribute name
+        :returns: Result of asking the provided table object for that attribute name
+        :raises AttributeError: if attribute is not found on provided table object
+        """
+        return getattr(self._table, name)
+
+    async def update_item(self, **kwargs):
+        """Update item is not yet supported.
+
+        :raises NotImplementedError: if called
+        """
+        raise NotImplementedError('"update_item" is not yet implemented')
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        """Batch writer is not yet supported.
+
+        Use :class:`AsyncEncryptedClient` ``batch_write_item`` instead.
+
+        :raises NotImplementedError: if called
+        """
+        raise NotImplementedError('"batch_writer" is not yet implemented')
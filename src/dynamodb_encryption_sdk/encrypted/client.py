@@ -11,21 +11,26 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """High-level helper class to provide a familiar interface to encrypted tables."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor  # noqa pylint: disable=unused-import
 from functools import partial
 
 import attr
 import botocore
 
+from dynamodb_encryption_sdk.internal.parallel_scan import parallel_scan
 from dynamodb_encryption_sdk.internal.utils import (
     TableInfoCache,
     crypto_config_from_cache,
     crypto_config_from_kwargs,
     decrypt_batch_get_item,
+    decrypt_executor,
     decrypt_get_item,
     decrypt_list_of_items,
     decrypt_multi_get,
     encrypt_batch_write_item,
     encrypt_put_item,
+    iter_decrypt_multi_get,
     validate_get_arguments,
 )
 from dynamodb_encryption_sdk.internal.validators import callable_validator
@@ -52,17 +57,27 @@ class EncryptedPaginator(object):
     :type paginator: botocore.paginate.Paginator
     :param decrypt_method: Item decryptor method from :mod:`dynamodb_encryption_sdk.encrypted.item`
     :param callable crypto_config_method: Callable that returns a :class:`CryptoConfig`
+    :param int max_workers: If set, decrypt the items in each page in parallel using a thread pool
+        with this many threads. Call :meth:`close`, or use the paginator as a context manager, to shut
+        the thread pool down. (optional)
+    :param executor: If set, decrypt the items in each page in parallel using this executor.
+        Cannot be combined with ``max_workers``. (optional)
+    :type executor: concurrent.futures.Executor
     """
 
     _paginator = attr.ib(validator=attr.validators.instance_of(botocore.paginate.Paginator))
     _decrypt_method = attr.ib()
     _crypto_config_method = attr.ib(validator=callable_validator)
+    _max_workers = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
 
     def __init__(
         self,
         paginator,  # type: botocore.paginate.Paginator
         decrypt_method,  # type: Callable
         crypto_config_method,  # type: Callable
+        max_workers=None,  # type: Optional[int]
+        executor=None,  # type: Optional[Executor]
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -71,7 +86,15 @@ class EncryptedPaginator(object):
         self._paginator = paginator
         self._decrypt_method = decrypt_method
         self._crypto_config_method = crypto_config_method
+        self._max_workers = max_workers
+        self._executor = executor
         attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        """Set up the executor used to decrypt items, if any."""
+        self._owns_executor = self._executor is None and self._max_workers is not None
+        self._executor = decrypt_executor(self._executor, self._max_workers)
 
     @_decrypt_method.validator
     def validate_decrypt_method(self, attribute, value):
@@ -94,6 +117,25 @@ class EncryptedPaginator(object):
         """
         return getattr(self._paginator, name)
 
+    def __enter__(self):
+        # type: () -> EncryptedPaginator
+        """Use this paginator as a context manager that shuts down its thread pool on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Shut down the thread pool created for ``max_workers``, if any."""
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        """Shut down the thread pool created for ``max_workers``, if any, and wait for it to finish.
+
+        A caller-provided ``executor`` is left running.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
     def paginate(self, **kwargs):
         # type: (**Any) -> Iterator[Dict]
         # narrow this down
@@ -108,7 +150,10 @@ class EncryptedPaginator(object):
         for page in self._paginator.paginate(**ddb_kwargs):
             page["Items"] = list(
                 decrypt_list_of_items(
-                    crypto_config=crypto_config, decrypt_method=self._decrypt_method, items=page["Items"]
+                    crypto_config=crypto_config,
+                    decrypt_method=self._decrypt_method,
+                    items=page["Items"],
+                    executor=self._executor,
                 )
             )
             yield page
@@ -141,6 +186,12 @@ class EncryptedClient(object):
         accept a ``crypto_config`` parameter, defining a custom :class:`CryptoConfig` instance
         for this request.
 
+        The ``iter_query`` and ``iter_scan`` methods accept the same parameters as ``query`` and
+        ``scan``, but return an iterator that follows ``LastEvaluatedKey`` through every page and
+        yields decrypted items one at a time, holding no more than one page of encrypted items.
+        A ``Limit`` passed to these methods caps the total number of items evaluated across all
+        pages, not the size of each page.
+
     .. warning::
 
         We do not currently support the ``update_item`` method.
@@ -156,6 +207,13 @@ class EncryptedClient(object):
     :param bool expect_standard_dictionaries: Should we expect items to be standard Python
         dictionaries? This should only be set to True if you are using a client obtained
         from a service resource or table resource (ex: ``table.meta.client``). (default: False)
+    :param int max_workers: If set, decrypt items returned by ``query``, ``scan``, ``batch_get_item``,
+        and the ``query`` and ``scan`` paginators in parallel using a thread pool with this many
+        threads. Call :meth:`close`, or use the client as a context manager, to shut the thread pool
+        down. (optional)
+    :param executor: If set, decrypt returned items in parallel using this executor.
+        Cannot be combined with ``max_workers``. (optional)
+    :type executor: concurrent.futures.Executor
     """
 
     _client = attr.ib(validator=attr.validators.instance_of(botocore.client.BaseClient))
@@ -165,6 +223,8 @@ class EncryptedClient(object):
     )
     _auto_refresh_table_indexes = attr.ib(validator=attr.validators.instance_of(bool), default=True)
     _expect_standard_dictionaries = attr.ib(validator=attr.validators.instance_of(bool), default=False)
+    _max_workers = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
 
     def __init__(
         self,
@@ -173,6 +233,8 @@ class EncryptedClient(object):
         attribute_actions=None,  # type: Optional[AttributeActions]
         auto_refresh_table_indexes=True,  # type: Optional[bool]
         expect_standard_dictionaries=False,  # type: Optional[bool]
+        max_workers=None,  # type: Optional[int]
+        executor=None,  # type: Optional[Executor]
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -186,11 +248,19 @@ class EncryptedClient(object):
         self._attribute_actions = attribute_actions
         self._auto_refresh_table_indexes = auto_refresh_table_indexes
         self._expect_standard_dictionaries = expect_standard_dictionaries
+        self._max_workers = max_workers
+        self._executor = executor
         attr.validate(self)
         self.__attrs_post_init__()
 
     def __attrs_post_init__(self):
-        """Set up the table info cache and translation methods."""
+        """Set up the table info cache, decryption executor, and translation methods."""
+        self._owns_executor = (  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._executor is None and self._max_workers is not None
+        )
+        self._executor = decrypt_executor(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._executor, self._max_workers
+        )
         if self._expect_standard_dictionaries:
             self._encrypt_item = encrypt_python_item  # attrs confuses pylint: disable=attribute-defined-outside-init
             self._decrypt_item = decrypt_python_item  # attrs confuses pylint: disable=attribute-defined-outside-init
@@ -213,13 +283,31 @@ class EncryptedClient(object):
             encrypt_put_item, self._encrypt_item, self._item_crypto_config, self._client.put_item
         )
         self.query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
-            decrypt_multi_get, self._decrypt_item, self._item_crypto_config, self._client.query
+            decrypt_multi_get,
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.query,
+            executor=self._executor,
         )
         self.scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
-            decrypt_multi_get, self._decrypt_item, self._item_crypto_config, self._client.scan
+            decrypt_multi_get,
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.scan,
+            executor=self._executor,
+        )
+        self.iter_query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            iter_decrypt_multi_get, self._decrypt_item, self._item_crypto_config, self._client.query
+        )
+        self.iter_scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            iter_decrypt_multi_get, self._decrypt_item, self._item_crypto_config, self._client.scan
         )
         self.batch_get_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
-            decrypt_batch_get_item, self._decrypt_item, self._table_crypto_config, self._client.batch_get_item
+            decrypt_batch_get_item,
+            self._decrypt_item,
+            self._table_crypto_config,
+            self._client.batch_get_item,
+            executor=self._executor,
         )
         self.batch_write_item = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
             encrypt_batch_write_item, self._encrypt_item, self._table_crypto_config, self._client.batch_write_item
@@ -235,6 +323,29 @@ class EncryptedClient(object):
         """
         return getattr(self._client, name)
 
+    def __enter__(self):
+        # type: () -> EncryptedClient
+        """Use this client as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Close this client."""
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        """Shut down the thread pool created for ``max_workers``, if any, and wait for it to finish,
+        then close the underlying client if it can be closed.
+
+        A caller-provided ``executor`` is left running.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+        client_close = getattr(self._client, "close", None)
+        if client_close is not None:
+            client_close()
+
     def update_item(self, **kwargs):
         """Update item is not yet supported.
 
@@ -242,6 +353,58 @@ class EncryptedClient(object):
         """
         raise NotImplementedError('"update_item" is not yet implemented')
 
+    def parallel_scan(
+        self,
+        total_segments,  # type: int
+        workers,  # type: int
+        materials_provider_factory=None,  # type: Optional[Callable[[], CryptographicMaterialsProvider]]
+        max_pages_in_flight=None,  # type: Optional[int]
+        executor=None,  # type: Optional[ProcessPoolExecutor]
+        **kwargs  # type: Any
+    ):
+        # type: (...) -> Iterator[Dict]
+        """Scan the whole table using concurrent segment scans, decrypting each returned page
+        in a pool of worker processes.
+
+        >>> for item in encrypted_client.parallel_scan(
+        ...     TableName="my_table", total_segments=16,
+        ...     workers=8,
+        ...     materials_provider_factory=build_my_materials_provider,
+        ... ):
+        ...     process(item)
+
+        Each worker process builds its own :class:`CryptoConfig`, so the materials provider must
+        be usable from other processes. Either the materials provider must be picklable, or you must
+        provide ``materials_provider_factory``: a picklable callable (such as a module-level function)
+        that takes no arguments and returns the materials provider to use in each worker.
+
+        .. note::
+
+            Items are yielded as soon as each page is decrypted, and are not returned in any particular order.
+
+        :param int total_segments: Number of segments into which to divide the table
+        :param int workers: Number of worker processes to use to decrypt items
+        :param callable materials_provider_factory: Picklable callable that returns the materials provider
+            each worker process should use (optional)
+        :param int max_pages_in_flight: Maximum number of pages to be reading or decrypting at once
+            (default: twice ``workers``)
+        :param executor: Process pool to use instead of creating a new one (optional)
+        :type executor: concurrent.futures.ProcessPoolExecutor
+        :param **kwargs: Keyword arguments to pass to ``scan``
+        :returns: Iterator of plaintext items
+        """
+        return parallel_scan(
+            self._decrypt_item,
+            self._item_crypto_config,
+            self._client.scan,
+            total_segments=total_segments,
+            workers=workers,
+            materials_provider_factory=materials_provider_factory,
+            max_pages_in_flight=max_pages_in_flight,
+            executor=executor,
+            **kwargs
+        )
+
     def get_paginator(self, operation_name):
         """Get a paginator from the underlying client. If the paginator requested is for
         "scan" or "query", the paginator returned will transparently decrypt the returned items.
@@ -254,7 +417,10 @@ class EncryptedClient(object):
 
         if operation_name in ("scan", "query"):
             return EncryptedPaginator(
-                paginator=paginator, decrypt_method=self._decrypt_item, crypto_config_method=self._item_crypto_config
+                paginator=paginator,
+                decrypt_method=self._decrypt_item,
+                crypto_config_method=self._item_crypto_config,
+                executor=self._executor,
             )
 
         return paginator
@@ -12,14 +12,26 @@
 # language governing permissions and limitations under the License.
 """Top-level functions for encrypting and decrypting DynamoDB items."""
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Dict, Iterable, List, Optional, Text, Tuple  # noqa pylint: disable=unused-import
+
     from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import
+    from dynamodb_encryption_sdk.materials import CryptographicMaterials  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
 
-from dynamodb_encryption_sdk.exceptions import DecryptionError, EncryptionError
+from boto3.dynamodb.types import TypeDeserializer
+
+from dynamodb_encryption_sdk.exceptions import DecryptionError, EncryptionError, InvalidMaterialDescriptionError
 from dynamodb_encryption_sdk.identifiers import CryptoAction
-from dynamodb_encryption_sdk.internal.crypto.authentication import sign_item, verify_item_signature
+from dynamodb_encryption_sdk.internal.crypto.authentication import (
+    attribute_digest,
+    binary_attribute_digest,
+    sign_item,
+    sign_items,
+    verify_item_signature,
+    verify_item_signatures,
+)
 from dynamodb_encryption_sdk.internal.crypto.encryption import decrypt_attribute, encrypt_attribute
 from dynamodb_encryption_sdk.internal.formatting.material_description import (
     deserialize as deserialize_material_description,
@@ -29,12 +41,32 @@ from dynamodb_encryption_sdk.internal.identifiers import (
     MaterialDescriptionKeys,
     MaterialDescriptionValues,
     ReservedAttributes,
+    Tag,
 )
-from dynamodb_encryption_sdk.transform import ddb_to_dict, dict_to_ddb
+from dynamodb_encryption_sdk.transform import dict_to_ddb
 
 from . import CryptoConfig  # noqa pylint: disable=unused-import
 
-__all__ = ("encrypt_dynamodb_item", "encrypt_python_item", "decrypt_dynamodb_item", "decrypt_python_item")
+__all__ = (
+    "encrypt_dynamodb_item",
+    "encrypt_python_item",
+    "decrypt_dynamodb_item",
+    "decrypt_python_item",
+    "encrypt_dynamodb_items",
+    "encrypt_python_items",
+    "decrypt_dynamodb_items",
+    "decrypt_python_items",
+)
+
+_RESERVED_ATTRIBUTE_NAMES = frozenset(attribute.value for attribute in ReservedAttributes)
+# Attribute encryption modes that can be written. Any mode recorded in an item is passed
+# on to the decryption key, so items written with other modes can still be read.
+_ATTRIBUTE_ENCRYPTION_MODES = frozenset(
+    (
+        MaterialDescriptionValues.CBC_PKCS5_ATTRIBUTE_ENCRYPTION.value,
+        MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value,
+    )
+)
 
 
 def encrypt_dynamodb_item(item, crypto_config):
@@ -55,6 +87,14 @@ def encrypt_dynamodb_item(item, crypto_config):
 
         This handles DynamoDB-formatted items and is for use with the boto3 DynamoDB client.
 
+    .. note::
+
+        Attributes are encrypted with AES-CBC by default. To encrypt them with AES-GCM instead,
+        with each attribute name authenticated as associated data, include
+        ``"amzn-ddb-map-sym-mode": "/GCM/NoPadding"`` in the material description of the
+        materials provider or of the encryption context. Items written this way can only be
+        read by clients that support this mode.
+
     :param dict item: Plaintext DynamoDB item
     :param CryptoConfig crypto_config: Cryptographic configuration
     :returns: Encrypted and signed DynamoDB item
@@ -64,14 +104,57 @@ def encrypt_dynamodb_item(item, crypto_config):
         # If we explicitly have been told not to do anything to this item, just copy it.
         return item.copy()
 
+    _check_reserved_attributes(item)
+
+    return _encrypt_dynamodb_item_with_materials(item, crypto_config, crypto_config.encryption_materials())
+
+
+def _check_reserved_attributes(item):
+    # type: (dynamodb_types.ITEM) -> None
+    """Make sure that no reserved attribute names are present in a plaintext item.
+
+    :param dict item: Plaintext DynamoDB item
+    :raises EncryptionError: if a reserved attribute name is found
+    """
     for reserved_name in ReservedAttributes:
         if reserved_name.value in item:
             raise EncryptionError(
                 'Reserved attribute name "{}" is not allowed in plaintext item.'.format(reserved_name.value)
             )
 
-    encryption_materials = crypto_config.encryption_materials()
 
+def _encrypt_dynamodb_item_with_materials(item, crypto_config, encryption_materials):
+    # type: (dynamodb_types.ITEM, CryptoConfig, CryptographicMaterials) -> dynamodb_types.ITEM
+    """Encrypt and sign a DynamoDB item using already resolved encryption materials.
+
+    :param dict item: Plaintext DynamoDB item
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param CryptographicMaterials encryption_materials: Encryption materials to use
+    :returns: Encrypted and signed DynamoDB item
+    :rtype: dict
+    """
+    encrypted_item, value_digests, inner_material_description = _encrypt_item_attributes(
+        item, crypto_config, encryption_materials
+    )
+    signature_attribute = sign_item(
+        encrypted_item, encryption_materials.signing_key, crypto_config, value_digests=value_digests
+    )
+    return _add_reserved_attributes(
+        encrypted_item, signature_attribute, inner_material_description, encryption_materials
+    )
+
+
+def _encrypt_item_attributes(item, crypto_config, encryption_materials):
+    # type: (dynamodb_types.ITEM, CryptoConfig, CryptographicMaterials) -> Tuple[dynamodb_types.ITEM, Optional[Dict[Text, bytes]], Dict[Text, Text]]  # noqa pylint: disable=line-too-long
+    """Encrypt the attributes of a DynamoDB item, without signing it.
+
+    :param dict item: Plaintext DynamoDB item
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param CryptographicMaterials encryption_materials: Encryption materials to use
+    :returns: Encrypted item, digests of the signed attribute values (``None`` if not calculated),
+        and the material description to write to the item
+    :rtype: tuple
+    """
     inner_material_description = encryption_materials.material_description.copy()
     try:
         encryption_materials.encryption_key
@@ -81,34 +164,62 @@ def encrypt_dynamodb_item(item, crypto_config):
                 "Attribute actions ask for some attributes to be encrypted but no encryption key is available"
             )
 
-        encrypted_item = item.copy()
-    else:
-        # Add the attribute encryption mode to the inner material description
-        encryption_mode = MaterialDescriptionValues.CBC_PKCS5_ATTRIBUTE_ENCRYPTION.value
-        inner_material_description[MaterialDescriptionKeys.ATTRIBUTE_ENCRYPTION_MODE.value] = encryption_mode
-
-        algorithm_descriptor = encryption_materials.encryption_key.algorithm + encryption_mode
-
-        encrypted_item = {}
-        for name, attribute in item.items():
-            if crypto_config.attribute_actions.action(name) is CryptoAction.ENCRYPT_AND_SIGN:
-                encrypted_item[name] = encrypt_attribute(
-                    attribute_name=name,
-                    attribute=attribute,
-                    encryption_key=encryption_materials.encryption_key,
-                    algorithm=algorithm_descriptor,
-                )
-            else:
-                encrypted_item[name] = attribute.copy()
-
-    signature_attribute = sign_item(encrypted_item, encryption_materials.signing_key, crypto_config)
+        return item.copy(), None, inner_material_description
+
+    # Add the attribute encryption mode to the inner material description.
+    # The materials may opt in to a mode other than the default by already including one.
+    encryption_mode = inner_material_description.setdefault(
+        MaterialDescriptionKeys.ATTRIBUTE_ENCRYPTION_MODE.value,
+        MaterialDescriptionValues.CBC_PKCS5_ATTRIBUTE_ENCRYPTION.value,
+    )
+    if encryption_mode not in _ATTRIBUTE_ENCRYPTION_MODES:
+        raise EncryptionError('Unsupported attribute encryption mode: "{}"'.format(encryption_mode))
+
+    algorithm_descriptor = encryption_materials.encryption_key.algorithm + encryption_mode
+
+    # Encrypt and calculate the signature digest of each attribute in a single pass,
+    # so that no attribute is serialized again when the item is signed.
+    encrypted_item = {}
+    value_digests = {}
+    for name, attribute in item.items():
+        action = crypto_config.attribute_actions.action(name)
+        if action is CryptoAction.ENCRYPT_AND_SIGN:
+            encrypted_attribute = encrypt_attribute(
+                attribute_name=name,
+                attribute=attribute,
+                encryption_key=encryption_materials.encryption_key,
+                algorithm=algorithm_descriptor,
+            )
+            encrypted_item[name] = encrypted_attribute
+            # for some reason pylint can't follow the Enum member attributes
+            ciphertext = encrypted_attribute[Tag.BINARY.dynamodb_tag]  # pylint: disable=no-member
+            value_digests[name] = binary_attribute_digest(ciphertext)
+        else:
+            encrypted_item[name] = attribute.copy()
+            if action is CryptoAction.SIGN_ONLY:
+                value_digests[name] = attribute_digest(attribute)
+
+    return encrypted_item, value_digests, inner_material_description
+
+
+def _add_reserved_attributes(encrypted_item, signature_attribute, inner_material_description, encryption_materials):
+    # type: (dynamodb_types.ITEM, dynamodb_types.BINARY_ATTRIBUTE, Dict[Text, Text], CryptographicMaterials) -> dynamodb_types.ITEM  # noqa pylint: disable=line-too-long
+    """Add the signature and material description attributes to an encrypted item.
+
+    :param dict encrypted_item: Encrypted DynamoDB item
+    :param dict signature_attribute: Item signature DynamoDB attribute value
+    :param dict inner_material_description: Material description to write to the item
+    :param CryptographicMaterials encryption_materials: Encryption materials used to encrypt and sign the item
+    :returns: ``encrypted_item``
+    :rtype: dict
+    """
     encrypted_item[ReservedAttributes.SIGNATURE.value] = signature_attribute
 
     try:
         # Add the signing key algorithm identifier to the inner material description if provided
-        inner_material_description[
-            MaterialDescriptionKeys.SIGNING_KEY_ALGORITHM.value
-        ] = encryption_materials.signing_key.signing_algorithm()
+        inner_material_description[MaterialDescriptionKeys.SIGNING_KEY_ALGORITHM.value] = (
+            encryption_materials.signing_key.signing_algorithm()
+        )
     except NotImplementedError:
         # Not all signing keys will provide this value
         pass
@@ -144,11 +255,53 @@ def encrypt_python_item(item, crypto_config):
     """
     ddb_item = dict_to_ddb(item)
     encrypted_ddb_item = encrypt_dynamodb_item(ddb_item, crypto_config)
-    return ddb_to_dict(encrypted_ddb_item)
+    return _ddb_item_to_python(encrypted_ddb_item, item, crypto_config)
 
 
-def decrypt_dynamodb_item(item, crypto_config):
-    # type: (dynamodb_types.ITEM, CryptoConfig) -> dynamodb_types.ITEM
+def _ddb_item_to_python(ddb_item, source_item, crypto_config):
+    # type: (dynamodb_types.ITEM, Dict, CryptoConfig) -> Dict
+    """Convert an encrypted or decrypted DynamoDB item back to a dictionary.
+
+    Attributes that were not changed by the item encryptor or decryptor are taken from
+    ``source_item`` rather than being converted back from DynamoDB JSON.
+
+    :param dict ddb_item: Encrypted or decrypted DynamoDB item
+    :param dict source_item: Dictionary that ``ddb_item`` was created from
+    :param CryptoConfig crypto_config: Cryptographic configuration used to create ``ddb_item``
+    :returns: Dictionary
+    :rtype: dict
+    """
+    deserializer = TypeDeserializer()
+    python_item = {}
+    for name, attribute in ddb_item.items():
+        if name in source_item and crypto_config.attribute_actions.action(name) is not CryptoAction.ENCRYPT_AND_SIGN:
+            python_item[name] = source_item[name]
+        else:
+            python_item[name] = deserializer.deserialize(attribute)
+    return python_item
+
+
+def _encrypt_python_item_with_context(item, crypto_config):
+    # type: (Dict, CryptoConfig) -> Dict
+    """Encrypt a dictionary for DynamoDB, adding the item attributes to the encryption context.
+
+    This is equivalent to calling :func:`encrypt_python_item` with
+    ``crypto_config.with_item(dict_to_ddb(item))``, but each attribute is only converted
+    to DynamoDB JSON once.
+
+    :param dict item: Plaintext dictionary
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :returns: Encrypted and signed dictionary
+    :rtype: dict
+    """
+    ddb_item = dict_to_ddb(item)
+    item_crypto_config = crypto_config.with_item(ddb_item)
+    encrypted_ddb_item = encrypt_dynamodb_item(ddb_item, item_crypto_config)
+    return _ddb_item_to_python(encrypted_ddb_item, item, item_crypto_config)
+
+
+def decrypt_dynamodb_item(item, crypto_config, copy_attributes=True):
+    # type: (dynamodb_types.ITEM, CryptoConfig, bool) -> dynamodb_types.ITEM
     """Decrypt a DynamoDB item.
 
     >>> from dynamodb_encryption_sdk.encrypted.item import decrypt_python_item
@@ -165,41 +318,144 @@ def decrypt_dynamodb_item(item, crypto_config):
 
         This handles DynamoDB-formatted items and is for use with the boto3 DynamoDB client.
 
+    .. note::
+
+        ``item`` is never modified. If ``copy_attributes`` is ``False``, attributes that are not
+        decrypted are not copied: the plaintext item refers to the same attribute values as ``item``.
+
     :param dict item: Encrypted and signed DynamoDB item
     :param CryptoConfig crypto_config: Cryptographic configuration
+    :param bool copy_attributes: Should attributes that are not decrypted be copied into the
+        plaintext item? (default: True)
     :returns: Plaintext DynamoDB item
     :rtype: dict
     """
-    unique_actions = set([crypto_config.attribute_actions.default_action.name])
-    unique_actions.update({action.name for action in crypto_config.attribute_actions.attribute_actions.values()})
-
     if crypto_config.attribute_actions.take_no_actions:
         # If we explicitly have been told not to do anything to this item, just copy it.
         return item.copy()
 
+    signature_attribute, material_description_attribute = _reserved_attributes(item)
+    inner_crypto_config = _inner_decrypt_crypto_config(crypto_config, material_description_attribute)
+    decryption_materials = inner_crypto_config.decryption_materials()
+
+    return _decrypt_dynamodb_item_with_materials(
+        item, signature_attribute, inner_crypto_config, decryption_materials, copy_attributes
+    )
+
+
+def _reserved_attributes(item):
+    # type: (dynamodb_types.ITEM) -> Tuple[dynamodb_types.BINARY_ATTRIBUTE, Optional[dynamodb_types.BINARY_ATTRIBUTE]]  # noqa pylint: disable=line-too-long
+    """Find the signature and material description attributes in an encrypted item.
+
+    :param dict item: Encrypted and signed DynamoDB item
+    :returns: Signature attribute and material description attribute (``None`` if not present)
+    :rtype: tuple
+    :raises DecryptionError: if no signature attribute is found
+    """
     try:
-        signature_attribute = item.pop(ReservedAttributes.SIGNATURE.value)
+        signature_attribute = item[ReservedAttributes.SIGNATURE.value]
     except KeyError:
         # The signature is always written, so if no signature is found then the item was not
         # encrypted or signed.
         raise DecryptionError("No signature attribute found in item")
 
+    return signature_attribute, item.get(ReservedAttributes.MATERIAL_DESCRIPTION.value)
+
+
+def _inner_decrypt_crypto_config(crypto_config, material_description_attribute):
+    # type: (CryptoConfig, Optional[dynamodb_types.BINARY_ATTRIBUTE]) -> CryptoConfig
+    """Build the crypto config to use to decrypt an item with the provided material description.
+
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param dict material_description_attribute: Serialized material description attribute from the item
+        (``None`` if not present)
+    :returns: Copy of ``crypto_config`` with the item material description applied
+    :rtype: CryptoConfig
+    """
     inner_crypto_config = crypto_config.copy()
-    # Retrieve the material description from the item if found.
-    try:
-        material_description_attribute = item.pop(ReservedAttributes.MATERIAL_DESCRIPTION.value)
-    except KeyError:
-        # If no material description is found, we use inner_crypto_config as-is.
-        pass
-    else:
+    # If no material description is found, we use inner_crypto_config as-is.
+    if material_description_attribute is not None:
         # If material description is found, override the material description in inner_crypto_config.
         material_description = deserialize_material_description(material_description_attribute)
         inner_crypto_config.encryption_context.material_description = material_description
 
-    decryption_materials = inner_crypto_config.decryption_materials()
+    return inner_crypto_config
+
+
+def _decrypt_dynamodb_item_with_materials(
+    item,  # type: dynamodb_types.ITEM
+    signature_attribute,  # type: dynamodb_types.BINARY_ATTRIBUTE
+    inner_crypto_config,  # type: CryptoConfig
+    decryption_materials,  # type: CryptographicMaterials
+    copy_attributes=True,  # type: bool
+):
+    # type: (...) -> dynamodb_types.ITEM
+    """Verify and decrypt a DynamoDB item using already resolved decryption materials.
+
+    :param dict item: Encrypted DynamoDB item
+    :param dict signature_attribute: Signature attribute from the item
+    :param CryptoConfig inner_crypto_config: Cryptographic configuration containing the item material description
+    :param CryptographicMaterials decryption_materials: Decryption materials to use
+    :param bool copy_attributes: Should attributes that are not decrypted be copied into the
+        plaintext item? (default: True)
+    :returns: Plaintext DynamoDB item
+    :rtype: dict
+    """
+    plaintext_item, value_digests = _unverified_item(item, inner_crypto_config)
+    verify_item_signature(
+        signature_attribute,
+        plaintext_item,
+        decryption_materials.verification_key,
+        inner_crypto_config,
+        value_digests=value_digests,
+    )
+    return _decrypt_verified_item(plaintext_item, inner_crypto_config, decryption_materials, copy_attributes)
 
-    verify_item_signature(signature_attribute, item, decryption_materials.verification_key, inner_crypto_config)
 
+def _unverified_item(item, inner_crypto_config):
+    # type: (dynamodb_types.ITEM, CryptoConfig) -> Tuple[dynamodb_types.ITEM, Dict[Text, bytes]]
+    """Prepare an encrypted DynamoDB item for signature verification.
+
+    :param dict item: Encrypted DynamoDB item
+    :param CryptoConfig inner_crypto_config: Cryptographic configuration containing the item material description
+    :returns: Item without the reserved attributes, referring to the encrypted attribute values,
+        and digests of the encrypted attribute values
+    :rtype: tuple
+    """
+    # The plaintext item starts out referring to the encrypted attribute values;
+    # decrypted values replace them once the signature has been verified.
+    plaintext_item = {}
+    # Encrypted attributes are hashed directly from their ciphertext, rather than being serialized for verification.
+    value_digests = {}
+    for name, attribute in item.items():
+        if name in _RESERVED_ATTRIBUTE_NAMES:
+            continue
+        plaintext_item[name] = attribute
+        if inner_crypto_config.attribute_actions.action(name) is CryptoAction.ENCRYPT_AND_SIGN:
+            # for some reason pylint can't follow the Enum member attributes
+            ciphertext = attribute.get(Tag.BINARY.dynamodb_tag)  # pylint: disable=no-member
+            if ciphertext is not None and len(attribute) == 1:
+                value_digests[name] = binary_attribute_digest(ciphertext)
+    return plaintext_item, value_digests
+
+
+def _decrypt_verified_item(
+    plaintext_item,  # type: dynamodb_types.ITEM
+    inner_crypto_config,  # type: CryptoConfig
+    decryption_materials,  # type: CryptographicMaterials
+    copy_attributes=True,  # type: bool
+):
+    # type: (...) -> dynamodb_types.ITEM
+    """Decrypt the attributes of an item whose signature has already been verified.
+
+    :param dict plaintext_item: Item prepared by :func:`_unverified_item`, which is updated in place
+    :param CryptoConfig inner_crypto_config: Cryptographic configuration containing the item material description
+    :param CryptographicMaterials decryption_materials: Decryption materials to use
+    :param bool copy_attributes: Should attributes that are not decrypted be copied into the
+        plaintext item? (default: True)
+    :returns: Plaintext DynamoDB item
+    :rtype: dict
+    """
     try:
         decryption_key = decryption_materials.decryption_key
     except AttributeError:
@@ -208,24 +464,25 @@ def decrypt_dynamodb_item(item, crypto_config):
                 "Attribute actions ask for some attributes to be decrypted but no decryption key is available"
             )
 
-        return item.copy()
+        return plaintext_item
 
     decryption_mode = inner_crypto_config.encryption_context.material_description.get(
         MaterialDescriptionKeys.ATTRIBUTE_ENCRYPTION_MODE.value
     )
+    if decryption_mode is None:
+        raise DecryptionError("No attribute encryption mode found in material description")
     algorithm_descriptor = decryption_key.algorithm + decryption_mode
 
     # Once the signature has been verified, actually decrypt the item attributes.
-    decrypted_item = {}
-    for name, attribute in item.items():
+    for name, attribute in plaintext_item.items():
         if inner_crypto_config.attribute_actions.action(name) is CryptoAction.ENCRYPT_AND_SIGN:
-            decrypted_item[name] = decrypt_attribute(
+            plaintext_item[name] = decrypt_attribute(
                 attribute_name=name, attribute=attribute, decryption_key=decryption_key, algorithm=algorithm_descriptor
             )
-        else:
-            decrypted_item[name] = attribute.copy()
+        elif copy_attributes:
+            plaintext_item[name] = attribute.copy()
 
-    return decrypted_item
+    return plaintext_item
 
 
 def decrypt_python_item(item, crypto_config):
@@ -252,5 +509,243 @@ def decrypt_python_item(item, crypto_config):
     :rtype: dict
     """
     ddb_item = dict_to_ddb(item)
-    decrypted_ddb_item = decrypt_dynamodb_item(ddb_item, crypto_config)
-    return ddb_to_dict(decrypted_ddb_item)
+    decrypted_ddb_item = decrypt_dynamodb_item(ddb_item, crypto_config, copy_attributes=False)
+    return _ddb_item_to_python(decrypted_ddb_item, item, crypto_config)
+
+
+def _decrypt_python_item_with_context(item, crypto_config):
+    # type: (Dict, CryptoConfig) -> Dict
+    """Decrypt a dictionary for DynamoDB, adding the item attributes to the encryption context.
+
+    This is equivalent to calling :func:`decrypt_python_item` with
+    ``crypto_config.with_item(dict_to_ddb(item))``, but each attribute is only converted
+    to DynamoDB JSON once.
+
+    :param dict item: Encrypted and signed dictionary
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :returns: Plaintext dictionary
+    :rtype: dict
+    """
+    ddb_item = dict_to_ddb(item)
+    item_crypto_config = crypto_config.with_item(ddb_item)
+    decrypted_ddb_item = decrypt_dynamodb_item(ddb_item, item_crypto_config, copy_attributes=False)
+    return _ddb_item_to_python(decrypted_ddb_item, item, item_crypto_config)
+
+
+def encrypt_dynamodb_items(items, crypto_config):
+    # type: (Iterable[dynamodb_types.ITEM], CryptoConfig) -> List[dynamodb_types.ITEM]
+    """Encrypt many DynamoDB items that share a single cryptographic configuration.
+
+    Encryption materials are requested from the materials provider only once and are then
+    used for every item in ``items``. Each resulting item is identical in form to what
+    :func:`encrypt_dynamodb_item` would produce with those same materials.
+
+    >>> from dynamodb_encryption_sdk.encrypted.item import encrypt_dynamodb_items
+    >>> plaintext_items = [
+    ...     {'some': {'S': 'data'}, 'more': {'N': '5'}},
+    ...     {'some': {'S': 'other data'}, 'more': {'N': '6'}}
+    ... ]
+    >>> encrypted_items = encrypt_dynamodb_items(
+    ...     items=plaintext_items,
+    ...     crypto_config=my_crypto_config
+    ... )
+
+    .. note::
+
+        This handles DynamoDB-formatted items and is for use with the boto3 DynamoDB client.
+
+    .. warning::
+
+        Because materials are only resolved once, every item in the batch is protected by the same
+        encryption and signing keys. For providers that generate a new data key for every request,
+        such as :class:`AwsKmsCryptographicMaterialsProvider`, this means that a single data key is
+        used for the whole batch.
+
+    :param items: Plaintext DynamoDB items
+    :type items: iterable of dict
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :returns: Encrypted and signed DynamoDB items, in the same order as ``items``
+    :rtype: list of dict
+    """
+    if crypto_config.attribute_actions.take_no_actions:
+        # If we explicitly have been told not to do anything to these items, just copy them.
+        return [item.copy() for item in items]
+
+    encryption_materials = None
+    encrypted_items = []
+    value_digests = []
+    material_descriptions = []
+    for item in items:
+        _check_reserved_attributes(item)
+
+        if encryption_materials is None:
+            encryption_materials = crypto_config.encryption_materials()
+
+        encrypted_item, item_digests, inner_material_description = _encrypt_item_attributes(
+            item, crypto_config, encryption_materials
+        )
+        encrypted_items.append(encrypted_item)
+        value_digests.append(item_digests)
+        material_descriptions.append(inner_material_description)
+
+    if not encrypted_items:
+        return encrypted_items
+
+    # Every item shares the same signing key, so sign them all in one batch.
+    signature_attributes = sign_items(encrypted_items, encryption_materials.signing_key, crypto_config, value_digests)
+    return [
+        _add_reserved_attributes(encrypted_item, signature_attribute, inner_material_description, encryption_materials)
+        for encrypted_item, signature_attribute, inner_material_description in zip(
+            encrypted_items, signature_attributes, material_descriptions
+        )
+    ]
+
+
+def encrypt_python_items(items, crypto_config):
+    # type: (Iterable[dynamodb_types.ITEM], CryptoConfig) -> List[dynamodb_types.ITEM]
+    """Encrypt many dictionaries for DynamoDB that share a single cryptographic configuration.
+
+    >>> from dynamodb_encryption_sdk.encrypted.item import encrypt_python_items
+    >>> plaintext_items = [
+    ...     {'some': 'data', 'more': 5},
+    ...     {'some': 'other data', 'more': 6}
+    ... ]
+    >>> encrypted_items = encrypt_python_items(
+    ...     items=plaintext_items,
+    ...     crypto_config=my_crypto_config
+    ... )
+
+    .. note::
+
+        This handles human-friendly dictionaries and is for use with the boto3 DynamoDB service or table resource.
+
+    :param items: Plaintext dictionaries
+    :type items: iterable of dict
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :returns: Encrypted and signed dictionaries, in the same order as ``items``
+    :rtype: list of dict
+    """
+    items = list(items)
+    encrypted_ddb_items = encrypt_dynamodb_items([dict_to_ddb(item) for item in items], crypto_config)
+    return [_ddb_item_to_python(ddb_item, item, crypto_config) for ddb_item, item in zip(encrypted_ddb_items, items)]
+
+
+def _material_description_cache_key(material_description_attribute):
+    # type: (Optional[dynamodb_types.BINARY_ATTRIBUTE]) -> Optional[bytes]
+    """Determine the key under which to share decryption materials between items.
+
+    :param dict material_description_attribute: Serialized material description attribute from the item
+        (``None`` if not present)
+    :returns: Raw serialized material description (``None`` if not present)
+    :rtype: bytes
+    :raises InvalidMaterialDescriptionError: if material description attribute is malformed
+    """
+    if material_description_attribute is None:
+        return None
+
+    try:
+        # for some reason pylint can't follow the Enum member attributes
+        return bytes(material_description_attribute[Tag.BINARY.dynamodb_tag])  # pylint: disable=no-member
+    except (TypeError, KeyError):
+        raise InvalidMaterialDescriptionError("Invalid material description")
+
+
+def decrypt_dynamodb_items(items, crypto_config, copy_attributes=True):
+    # type: (Iterable[dynamodb_types.ITEM], CryptoConfig, bool) -> List[dynamodb_types.ITEM]
+    """Decrypt many DynamoDB items that share a single cryptographic configuration.
+
+    Decryption materials are requested from the materials provider once for each distinct
+    material description found in ``items`` and are reused for every item that carries
+    that same material description.
+
+    >>> from dynamodb_encryption_sdk.encrypted.item import decrypt_dynamodb_items
+    >>> encrypted_items = [
+    ...     {'some': {'B': b'ENCRYPTED_DATA'}, 'more': {'B': b'ENCRYPTED_DATA'}},
+    ...     {'some': {'B': b'ENCRYPTED_DATA'}, 'more': {'B': b'ENCRYPTED_DATA'}}
+    ... ]
+    >>> decrypted_items = decrypt_dynamodb_items(
+    ...     items=encrypted_items,
+    ...     crypto_config=my_crypto_config
+    ... )
+
+    .. note::
+
+        This handles DynamoDB-formatted items and is for use with the boto3 DynamoDB client.
+
+    :param items: Encrypted and signed DynamoDB items
+    :type items: iterable of dict
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param bool copy_attributes: Should attributes that are not decrypted be copied into the
+        plaintext items? (default: True)
+    :returns: Plaintext DynamoDB items, in the same order as ``items``
+    :rtype: list of dict
+    """
+    if crypto_config.attribute_actions.take_no_actions:
+        # If we explicitly have been told not to do anything to these items, just copy them.
+        return [item.copy() for item in items]
+
+    resolved_materials = {}  # type: Dict[Optional[bytes], Tuple[CryptoConfig, CryptographicMaterials]]
+    # Items waiting for signature verification, grouped by material description.
+    unverified_items = {}  # type: Dict[Optional[bytes], Tuple[List, List, List]]
+    prepared_items = []
+    for item in items:
+        signature_attribute, material_description_attribute = _reserved_attributes(item)
+        cache_key = _material_description_cache_key(material_description_attribute)
+
+        try:
+            inner_crypto_config, decryption_materials = resolved_materials[cache_key]
+        except KeyError:
+            inner_crypto_config = _inner_decrypt_crypto_config(crypto_config, material_description_attribute)
+            decryption_materials = inner_crypto_config.decryption_materials()
+            resolved_materials[cache_key] = (inner_crypto_config, decryption_materials)
+            unverified_items[cache_key] = ([], [], [])
+
+        plaintext_item, value_digests = _unverified_item(item, inner_crypto_config)
+        group_signatures, group_items, group_digests = unverified_items[cache_key]
+        group_signatures.append(signature_attribute)
+        group_items.append(plaintext_item)
+        group_digests.append(value_digests)
+        prepared_items.append((plaintext_item, inner_crypto_config, decryption_materials))
+
+    # Items with the same material description share a verification key, so verify each group in one batch.
+    for cache_key, (group_signatures, group_items, group_digests) in unverified_items.items():
+        inner_crypto_config, decryption_materials = resolved_materials[cache_key]
+        verify_item_signatures(
+            group_signatures, group_items, decryption_materials.verification_key, inner_crypto_config, group_digests
+        )
+
+    return [
+        _decrypt_verified_item(plaintext_item, inner_crypto_config, decryption_materials, copy_attributes)
+        for plaintext_item, inner_crypto_config, decryption_materials in prepared_items
+    ]
+
+
+def decrypt_python_items(items, crypto_config):
+    # type: (Iterable[dynamodb_types.ITEM], CryptoConfig) -> List[dynamodb_types.ITEM]
+    """Decrypt many dictionaries for DynamoDB that share a single cryptographic configuration.
+
+    >>> from dynamodb_encryption_sdk.encrypted.item import decrypt_python_items
+    >>> encrypted_items = [
+    ...     {'some': Binary(b'ENCRYPTED_DATA'), 'more': Binary(b'ENCRYPTED_DATA')},
+    ...     {'some': Binary(b'ENCRYPTED_DATA'), 'more': Binary(b'ENCRYPTED_DATA')}
+    ... ]
+    >>> decrypted_items = decrypt_python_items(
+    ...     items=encrypted_items,
+    ...     crypto_config=my_crypto_config
+    ... )
+
+    .. note::
+
+        This handles human-friendly dictionaries and is for use with the boto3 DynamoDB service or table resource.
+
+    :param items: Encrypted and signed dictionaries
+    :type items: iterable of dict
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :returns: Plaintext dictionaries, in the same order as ``items``
+    :rtype: list of dict
+    """
+    items = list(items)
+    decrypted_ddb_items = decrypt_dynamodb_items(
+        [dict_to_ddb(item) for item in items], crypto_config, copy_attributes=False
+    )
+    return [_ddb_item_to_python(ddb_item, item, crypto_config) for ddb_item, item in zip(decrypted_ddb_items, items)]
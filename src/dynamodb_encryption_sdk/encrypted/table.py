@@ -11,18 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """High-level helper class to provide a familiar interface to encrypted tables."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor  # noqa pylint: disable=unused-import
 from functools import partial
 
 import attr
 from boto3.dynamodb.table import BatchWriter
 from boto3.resources.base import ServiceResource
 
+from dynamodb_encryption_sdk.internal.action_plan import AttributeActionPlan
+from dynamodb_encryption_sdk.internal.parallel_scan import parallel_scan
 from dynamodb_encryption_sdk.internal.utils import (
     crypto_config_from_kwargs,
     crypto_config_from_table_info,
+    decrypt_executor,
     decrypt_get_item,
     decrypt_multi_get,
     encrypt_put_item,
+    iter_decrypt_multi_get,
 )
 from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
 from dynamodb_encryption_sdk.structures import AttributeActions, TableInfo
@@ -31,7 +37,7 @@ from .client import EncryptedClient
 from .item import decrypt_python_item, encrypt_python_item
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Optional  # noqa pylint: disable=unused-import
+    from typing import Any, Callable, Dict, Iterator, Optional  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -66,6 +72,12 @@ class EncryptedTable(object):
         ``query``, and ``scan`` methods will also accept a ``crypto_config`` parameter, defining
         a custom :class:`CryptoConfig` instance for this request.
 
+        The ``iter_query`` and ``iter_scan`` methods accept the same parameters as ``query`` and
+        ``scan``, but return an iterator that follows ``LastEvaluatedKey`` through every page and
+        yields decrypted items one at a time, holding no more than one page of encrypted items.
+        A ``Limit`` passed to these methods caps the total number of items evaluated across all
+        pages, not the size of each page.
+
     .. warning::
 
         We do not currently support the ``update_item`` method.
@@ -79,6 +91,12 @@ class EncryptedTable(object):
         attributes
     :param bool auto_refresh_table_indexes: Should we attempt to refresh information about table indexes?
         Requires ``dynamodb:DescribeTable`` permissions on each table. (default: True)
+    :param int max_workers: If set, decrypt items returned by ``query`` and ``scan`` in parallel
+        using a thread pool with this many threads. Call :meth:`close`, or use the table as a context
+        manager, to shut the thread pool down. (optional)
+    :param executor: If set, decrypt returned items in parallel using this executor.
+        Cannot be combined with ``max_workers``. (optional)
+    :type executor: concurrent.futures.Executor
     """
 
     _table = attr.ib(validator=attr.validators.instance_of(ServiceResource))
@@ -88,6 +106,8 @@ class EncryptedTable(object):
         validator=attr.validators.instance_of(AttributeActions), default=attr.Factory(AttributeActions)
     )
     _auto_refresh_table_indexes = attr.ib(validator=attr.validators.instance_of(bool), default=True)
+    _max_workers = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _executor = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(Executor)), default=None)
 
     def __init__(
         self,
@@ -96,6 +116,8 @@ class EncryptedTable(object):
         table_info=None,  # type: Optional[TableInfo]
         attribute_actions=None,  # type: Optional[AttributeActions]
         auto_refresh_table_indexes=True,  # type: Optional[bool]
+        max_workers=None,  # type: Optional[int]
+        executor=None,  # type: Optional[Executor]
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -109,20 +131,30 @@ class EncryptedTable(object):
         self._table_info = table_info
         self._attribute_actions = attribute_actions
         self._auto_refresh_table_indexes = auto_refresh_table_indexes
+        self._max_workers = max_workers
+        self._executor = executor
         attr.validate(self)
         self.__attrs_post_init__()
 
     def __attrs_post_init__(self):
-        """Prepare table info is it was not set and set up translation methods."""
+        """Prepare table info is it was not set and set up the decryption executor and translation methods."""
         if self._table_info is None:
             self._table_info = TableInfo(name=self._table.name)
 
         if self._auto_refresh_table_indexes:
             self._table_info.refresh_indexed_attributes(self._table.meta.client)
 
-        # Clone the attribute actions before we modify them
-        self._attribute_actions = self._attribute_actions.copy()
-        self._attribute_actions.set_index_keys(*self._table_info.protected_index_keys())
+        self._owns_executor = (  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._executor is None and self._max_workers is not None
+        )
+        self._executor = decrypt_executor(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._executor, self._max_workers
+        )
+
+        # Compile the attribute actions once for every item written to or read from this table
+        self._attribute_actions = AttributeActionPlan.compile(
+            self._attribute_actions, *self._table_info.protected_index_keys()
+        )
 
         self._crypto_config = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
             crypto_config_from_kwargs,
@@ -135,10 +167,16 @@ class EncryptedTable(object):
             encrypt_put_item, encrypt_python_item, self._crypto_config, self._table.put_item
         )
         self.query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
-            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.query
+            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.query, executor=self._executor
         )
         self.scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
-            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.scan
+            decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.scan, executor=self._executor
+        )
+        self.iter_query = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            iter_decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.query
+        )
+        self.iter_scan = partial(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            iter_decrypt_multi_get, decrypt_python_item, self._crypto_config, self._table.scan
         )
 
     def __getattr__(self, name):
@@ -151,10 +189,81 @@ class EncryptedTable(object):
         """
         return getattr(self._table, name)
 
+    def __enter__(self):
+        # type: () -> EncryptedTable
+        """Use this table as a context manager that shuts down its thread pool on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Shut down the thread pool created for ``max_workers``, if any."""
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        """Shut down the thread pool created for ``max_workers``, if any, and wait for it to finish.
+
+        A caller-provided ``executor`` is left running.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
     def update_item(self, **kwargs):
         """Update item is not yet supported."""
         raise NotImplementedError('"update_item" is not yet implemented')
 
+    def parallel_scan(
+        self,
+        total_segments,  # type: int
+        workers,  # type: int
+        materials_provider_factory=None,  # type: Optional[Callable[[], CryptographicMaterialsProvider]]
+        max_pages_in_flight=None,  # type: Optional[int]
+        executor=None,  # type: Optional[ProcessPoolExecutor]
+        **kwargs  # type: Any
+    ):
+        # type: (...) -> Iterator[Dict]
+        """Scan the whole table using concurrent segment scans, decrypting each returned page
+        in a pool of worker processes.
+
+        >>> for item in encrypted_table.parallel_scan(
+        ...     total_segments=16,
+        ...     workers=8,
+        ...     materials_provider_factory=build_my_materials_provider,
+        ... ):
+        ...     process(item)
+
+        Each worker process builds its own :class:`CryptoConfig`, so the materials provider must
+        be usable from other processes. Either the materials provider must be picklable, or you must
+        provide ``materials_provider_factory``: a picklable callable (such as a module-level function)
+        that takes no arguments and returns the materials provider to use in each worker.
+
+        .. note::
+
+            Items are yielded as soon as each page is decrypted, and are not returned in any particular order.
+
+        :param int total_segments: Number of segments into which to divide the table
+        :param int workers: Number of worker processes to use to decrypt items
+        :param callable materials_provider_factory: Picklable callable that returns the materials provider
+            each worker process should use (optional)
+        :param int max_pages_in_flight: Maximum number of pages to be reading or decrypting at once
+            (default: twice ``workers``)
+        :param executor: Process pool to use instead of creating a new one (optional)
+        :type executor: concurrent.futures.ProcessPoolExecutor
+        :param **kwargs: Keyword arguments to pass to ``scan``
+        :returns: Iterator of plaintext items
+        """
+        return parallel_scan(
+            decrypt_python_item,
+            self._crypto_config,
+            self._table.scan,
+            total_segments=total_segments,
+            workers=workers,
+            materials_provider_factory=materials_provider_factory,
+            max_pages_in_flight=max_pages_in_flight,
+            executor=executor,
+            **kwargs
+        )
+
     def batch_writer(self, overwrite_by_pkeys=None):
         """Create a batch writer object.
 
@@ -0,0 +1,214 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Attribute actions compiled for reuse across many items that share the same attribute names.
+
+.. warning::
+    No guarantee is provided on the modules and APIs within this
+    namespace staying consistent. Directly reference at your own risk.
+"""
+import attr
+
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.identifiers import TEXT_ENCODING
+from dynamodb_encryption_sdk.structures import AttributeActions, TableInfo  # noqa pylint: disable=unused-import
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Dict, Iterable, Text, Tuple  # noqa pylint: disable=unused-import
+
+    from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+__all__ = ("AttributeActionPlan", "AttributeActionPlanCache", "signed_attributes")
+
+# Bounds on the memoized values, so that items with unpredictable attribute names cannot grow a plan without limit.
+_MAX_CACHED_ATTRIBUTE_NAMES = 1024
+_MAX_CACHED_KEY_SETS = 64
+
+
+def _signed_attributes(attribute_actions, attribute_names):
+    # type: (AttributeActions, Iterable[Text]) -> Tuple[Tuple[Text, CryptoAction, bytes], ...]
+    """Determine the attributes that are included in an item signature.
+
+    :param AttributeActions attribute_actions: Actions to take for the item
+    :param attribute_names: Names of all attributes in the item
+    :returns: Name, action, and encoded name of each signed attribute, in canonical (sorted) order
+    :rtype: tuple
+    """
+    signed = []
+    for name in sorted(attribute_names):
+        action = attribute_actions.action(name)
+        if action is CryptoAction.DO_NOTHING:
+            continue
+        signed.append((name, action, name.encode(TEXT_ENCODING)))
+    return tuple(signed)
+
+
+def signed_attributes(attribute_actions, item):
+    # type: (AttributeActions, dynamodb_types.ITEM) -> Tuple[Tuple[Text, CryptoAction, bytes], ...]
+    """Determine the attributes of an item that are included in the item signature.
+
+    If ``attribute_actions`` is an :class:`AttributeActionPlan`, the result is memoized for the
+    set of attribute names in ``item``.
+
+    :param AttributeActions attribute_actions: Actions to take for the item
+    :param dict item: DynamoDB item
+    :returns: Name, action, and encoded name of each signed attribute, in canonical (sorted) order
+    :rtype: tuple
+    """
+    if isinstance(attribute_actions, AttributeActionPlan):
+        return attribute_actions.signed_attributes(item)
+    return _signed_attributes(attribute_actions, item.keys())
+
+
+@attr.s(init=False)
+class AttributeActionPlan(AttributeActions):
+    """Attribute actions that memoize everything that can be derived from attribute names alone.
+
+    The action for each attribute name, the set of actions that can be taken, and the canonical
+    signing order for each recurring set of attribute names are only determined once.
+
+    .. note::
+
+        Build a plan once the attribute actions are final. Use :meth:`copy` to get mutable
+        :class:`AttributeActions` back.
+
+    :param CryptoAction default_action: Action to take if no specific action is defined in
+        ``attribute_actions``
+    :param dict attribute_actions: Dictionary mapping attribute names to specific actions
+    """
+
+    def __attrs_post_init__(self):
+        # () -> None
+        """Set up the empty memoized values."""
+        super(AttributeActionPlan, self).__attrs_post_init__()
+        self._reset()
+
+    def _reset(self):
+        # () -> None
+        """Discard all memoized values."""
+        # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._actions = {}  # type: Dict[Text, CryptoAction]
+        self._action_names = {self.default_action.name}
+        self._action_names.update({action.name for action in self.attribute_actions.values()})
+        self._signed_attributes = {}  # type: Dict[Tuple[Text, ...], Tuple[Tuple[Text, CryptoAction, bytes], ...]]
+
+    @classmethod
+    def compile(cls, attribute_actions, *index_keys):
+        # type: (AttributeActions, *Text) -> AttributeActionPlan
+        """Build a plan from a copy of the provided attribute actions.
+
+        :param AttributeActions attribute_actions: Attribute actions to compile
+        :param str *index_keys: Attribute names to treat as indexed
+        :returns: Plan with the index keys set to be signed but not encrypted
+        :rtype: AttributeActionPlan
+        """
+        plan = cls(
+            default_action=attribute_actions.default_action,
+            attribute_actions=attribute_actions.attribute_actions.copy(),
+        )
+        plan.set_index_keys(*index_keys)
+        return plan
+
+    def action(self, attribute_name):
+        # (text) -> CryptoAction
+        """Determine the correct :class:`CryptoAction` to apply to a supplied attribute based
+        on this config.
+
+        :param str attribute_name: Attribute for which to determine action
+        """
+        try:
+            return self._actions[attribute_name]
+        except KeyError:
+            action = super(AttributeActionPlan, self).action(attribute_name)
+            if len(self._actions) < _MAX_CACHED_ATTRIBUTE_NAMES:
+                self._actions[attribute_name] = action
+            return action
+
+    def set_index_keys(self, *keys):
+        """Set the appropriate action for the specified indexed attribute names.
+
+        :param str *keys: Attribute names to treat as indexed
+        :raises InvalidArgumentError: if a custom action was previously set for any specified
+            attributes
+        """
+        super(AttributeActionPlan, self).set_index_keys(*keys)
+        self._reset()
+
+    def contains_action(self, action):
+        # (CryptoAction) -> bool
+        """Determine if the specified action is a possible action from this configuration.
+
+        :param CryptoAction action: Action to look for
+        """
+        return action.name in self._action_names
+
+    def signed_attributes(self, item):
+        # type: (dynamodb_types.ITEM) -> Tuple[Tuple[Text, CryptoAction, bytes], ...]
+        """Determine the attributes of an item that are included in the item signature.
+
+        :param dict item: DynamoDB item
+        :returns: Name, action, and encoded name of each signed attribute, in canonical (sorted) order
+        :rtype: tuple
+        """
+        key_set = tuple(item)
+        try:
+            return self._signed_attributes[key_set]
+        except KeyError:
+            signed = _signed_attributes(self, key_set)
+            if len(self._signed_attributes) < _MAX_CACHED_KEY_SETS:
+                self._signed_attributes[key_set] = signed
+            return signed
+
+
+@attr.s(init=False)
+class AttributeActionPlanCache(object):
+    # pylint: disable=too-few-public-methods
+    """Very simple cache of the attribute action plan to use for each table."""
+
+    def __init__(self):  # noqa=D107
+        # type: () -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        """Set up the empty cache."""
+        self._all_plans = (
+            {}
+        )  # type: Dict[Text, Tuple[AttributeActions, AttributeActionPlan]]  # noqa pylint: disable=attribute-defined-outside-init
+
+    def plan(self, attribute_actions, table_info):
+        # type: (AttributeActions, TableInfo) -> AttributeActionPlan
+        """Collect the plan for the specified table, building and adding it to the cache if
+        not already present for these attribute actions.
+
+        :param AttributeActions attribute_actions: Table-level attribute actions
+        :param TableInfo table_info: Information about the table
+        :returns: Attribute action plan for the table
+        :rtype: AttributeActionPlan
+        """
+        try:
+            cached_actions, plan = self._all_plans[table_info.name]
+        except KeyError:
+            pass
+        else:
+            if cached_actions is attribute_actions:
+                return plan
+
+        plan = AttributeActionPlan.compile(attribute_actions, *table_info.protected_index_keys())
+        self._all_plans[table_info.name] = (attribute_actions, plan)
+        return plan
@@ -0,0 +1,517 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Asynchronous counterparts of the helpers in :mod:`dynamodb_encryption_sdk.internal.utils`.
+
+All cryptographic work is run in an executor so that the event loop is never blocked on it.
+
+.. note::
+
+    Requires Python 3.5 or later.
+
+.. warning::
+    No guarantee is provided on the modules and APIs within this
+    namespace staying consistent. Directly reference at your own risk.
+"""
+import asyncio
+import copy
+from concurrent.futures import Executor  # noqa pylint: disable=unused-import
+from functools import partial
+
+import attr
+
+from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.encrypted.item import _inner_decrypt_crypto_config
+from dynamodb_encryption_sdk.internal.action_plan import (  # noqa pylint: disable=unused-import
+    AttributeActionPlan,
+    AttributeActionPlanCache,
+)
+from dynamodb_encryption_sdk.internal.identifiers import ReservedAttributes
+from dynamodb_encryption_sdk.internal.utils import (
+    _item_transformer,
+    _process_batch_write_response,
+    _transform_item_with_context,
+    crypto_config_from_table_info,
+    validate_get_arguments,
+)
+from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
+from dynamodb_encryption_sdk.material_providers.aio import AsyncCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.materials import CryptographicMaterials  # noqa pylint: disable=unused-import
+from dynamodb_encryption_sdk.structures import (  # noqa pylint: disable=unused-import
+    AttributeActions,
+    EncryptionContext,
+    TableInfo,
+)
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import (  # noqa pylint: disable=unused-import
+        Any,
+        Awaitable,
+        Callable,
+        Dict,
+        Iterable,
+        List,
+        Optional,
+        Text,
+        Tuple,
+    )
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+__all__ = (
+    "AsyncTableInfoCache",
+    "DecryptedPageIterator",
+    "crypto_config_from_kwargs",
+    "crypto_config_from_cache",
+    "encrypt_item",
+    "decrypt_item",
+    "decrypt_list_of_items",
+    "decrypt_get_item",
+    "decrypt_multi_get",
+    "decrypt_batch_get_item",
+    "encrypt_put_item",
+    "encrypt_batch_write_item",
+)
+
+
+@attr.s(init=False)
+class AsyncTableInfoCache(object):
+    # pylint: disable=too-few-public-methods
+    """Very simple cache of TableInfo objects, loaded using an asynchronous DynamoDB client.
+
+    :param client: Asynchronous DynamoDB client
+    :param bool auto_refresh_table_indexes: Should we attempt to refresh information about table indexes?
+        Requires ``dynamodb:DescribeTable`` permissions on each table.
+    """
+
+    _client = attr.ib()
+    _auto_refresh_table_indexes = attr.ib(validator=attr.validators.instance_of(bool))
+
+    def __init__(self, client, auto_refresh_table_indexes):  # noqa=D107
+        # type: (Any, bool) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._client = client
+        self._auto_refresh_table_indexes = auto_refresh_table_indexes
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        """Set up the empty caches."""
+        self._all_tables_info = {}  # type: Dict[Text, TableInfo]  # pylint: disable=attribute-defined-outside-init
+        self._attribute_action_plans = (  # attrs confuses pylint: disable=attribute-defined-outside-init
+            AttributeActionPlanCache()
+        )
+
+    async def table_info(self, table_name):
+        # type: (Text) -> TableInfo
+        """Collect a TableInfo object for the specified table, creating and adding it to
+        the cache if not already present.
+
+        :param str table_name: Name of table
+        :returns: TableInfo describing the requested table
+        :rtype: TableInfo
+        """
+        try:
+            return self._all_tables_info[table_name]
+        except KeyError:
+            _table_info = TableInfo(name=table_name)
+            if self._auto_refresh_table_indexes:
+                response = await self._client.describe_table(TableName=table_name)
+                _table_info.load_indexed_attributes(response["Table"])
+            self._all_tables_info[table_name] = _table_info
+            return _table_info
+
+    def attribute_action_plan(self, attribute_actions, table_info):
+        # type: (AttributeActions, TableInfo) -> AttributeActionPlan
+        """Collect the compiled attribute actions to use for the specified table.
+
+        :param AttributeActions attribute_actions: Table-level attribute actions
+        :param TableInfo table_info: Information about the table
+        :returns: Attribute action plan for the table
+        :rtype: AttributeActionPlan
+        """
+        return self._attribute_action_plans.plan(attribute_actions, table_info)
+
+
+@attr.s(init=False)
+class _ResolvedMaterialsProvider(CryptographicMaterialsProvider):
+    """Materials provider that supplies materials that were already obtained from another provider.
+
+    :param CryptographicMaterials materials: Materials to provide
+    """
+
+    _materials = attr.ib(validator=attr.validators.instance_of(CryptographicMaterials))
+
+    def __init__(self, materials):  # noqa=D107
+        # type: (CryptographicMaterials) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._materials = materials
+        attr.validate(self)
+
+    def decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument
+        """Return the resolved materials."""
+        return self._materials
+
+    def encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument
+        """Return the resolved materials."""
+        return self._materials
+
+
+async def _run_in_executor(executor, function, *args, **kwargs):
+    """Run ``function`` in ``executor`` (or the event loop's default executor) and wait for the result."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
+
+
+def _waits_for_materials(crypto_config):
+    # type: (CryptoConfig) -> bool
+    """Determine whether materials must be awaited from the materials provider before any item work."""
+    return (
+        isinstance(crypto_config.materials_provider, AsyncCryptographicMaterialsProvider)
+        and not crypto_config.attribute_actions.take_no_actions
+    )
+
+
+def _with_resolved_materials(crypto_config, materials):
+    # type: (CryptoConfig, CryptographicMaterials) -> CryptoConfig
+    """Build a copy of ``crypto_config`` that supplies the provided materials."""
+    return CryptoConfig(
+        materials_provider=_ResolvedMaterialsProvider(materials),
+        encryption_context=crypto_config.encryption_context,
+        attribute_actions=crypto_config.attribute_actions,
+    )
+
+
+def _item_crypto_config(crypto_method, crypto_config, item):
+    # type: (Callable, CryptoConfig, Dict) -> CryptoConfig
+    """Build the crypto config for a specific item."""
+    return crypto_config.with_item(_item_transformer(crypto_method)(item))
+
+
+def _transform_item(crypto_method, crypto_config, item):
+    # type: (Callable, CryptoConfig, Dict) -> Dict
+    """Encrypt or decrypt a single item with the crypto config for that item."""
+    return _transform_item_with_context(crypto_method, item, crypto_config)
+
+
+def _decryption_context(decrypt_method, crypto_config, item):
+    # type: (Callable, CryptoConfig, Dict) -> Optional[EncryptionContext]
+    """Build the encryption context to use to request decryption materials for an encrypted item.
+
+    :returns: Encryption context for the item (``None`` if the item is not signed)
+    """
+    ddb_item = _item_transformer(decrypt_method)(item)
+    if ReservedAttributes.SIGNATURE.value not in ddb_item:
+        # Leave it to the decrypt method to reject the item.
+        return None
+
+    inner_crypto_config = _inner_decrypt_crypto_config(
+        crypto_config.with_item(ddb_item), ddb_item.get(ReservedAttributes.MATERIAL_DESCRIPTION.value)
+    )
+    return inner_crypto_config.encryption_context
+
+
+async def encrypt_item(encrypt_method, crypto_config, item, executor=None):
+    # type: (Callable, CryptoConfig, Dict, Optional[Executor]) -> Dict
+    """Encrypt a single item without blocking the event loop.
+
+    If the materials provider is an :class:`AsyncCryptographicMaterialsProvider`, encryption materials
+    are awaited from it. Otherwise, the materials provider is called in the executor along with the
+    item encryptor.
+
+    :param callable encrypt_method: Method to use to encrypt the item
+    :param CryptoConfig crypto_config: :class:`CryptoConfig` to use
+    :param dict item: Plaintext item
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    :returns: Encrypted item
+    :rtype: dict
+    """
+    if not _waits_for_materials(crypto_config):
+        return await _run_in_executor(executor, _transform_item, encrypt_method, crypto_config, item)
+
+    item_crypto_config = await _run_in_executor(executor, _item_crypto_config, encrypt_method, crypto_config, item)
+    materials = await item_crypto_config.materials_provider.async_encryption_materials(
+        item_crypto_config.encryption_context
+    )
+    return await _run_in_executor(
+        executor, encrypt_method, item=item, crypto_config=_with_resolved_materials(item_crypto_config, materials)
+    )
+
+
+async def decrypt_item(decrypt_method, crypto_config, item, executor=None):
+    # type: (Callable, CryptoConfig, Dict, Optional[Executor]) -> Dict
+    """Decrypt a single item without blocking the event loop.
+
+    If the materials provider is an :class:`AsyncCryptographicMaterialsProvider`, decryption materials
+    are awaited from it. Otherwise, the materials provider is called in the executor along with the
+    item decryptor.
+
+    :param callable decrypt_method: Method to use to decrypt the item
+    :param CryptoConfig crypto_config: :class:`CryptoConfig` to use
+    :param dict item: Encrypted item
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    :returns: Plaintext item
+    :rtype: dict
+    """
+    if not _waits_for_materials(crypto_config):
+        return await _run_in_executor(executor, _transform_item, decrypt_method, crypto_config, item)
+
+    encryption_context = await _run_in_executor(executor, _decryption_context, decrypt_method, crypto_config, item)
+    if encryption_context is not None:
+        materials = await crypto_config.materials_provider.async_decryption_materials(encryption_context)
+        crypto_config = _with_resolved_materials(crypto_config, materials)
+    return await _run_in_executor(executor, _transform_item, decrypt_method, crypto_config, item)
+
+
+async def decrypt_list_of_items(crypto_config, decrypt_method, items, executor=None):
+    # type: (CryptoConfig, Callable, Iterable[Any], Optional[Executor]) -> List[Any]
+    """Decrypt a list of encrypted items concurrently.
+
+    :param CryptoConfig crypto_config: :class:`CryptoConfig` to use
+    :param callable decrypt_method: Method to use to decrypt items
+    :param items: Iterable of encrypted items
+    :param executor: Executor in which to run cryptographic work (default: the event loop's default executor)
+    :type executor: concurrent.futures.Executor
+    :return: Plaintext items, in the same order as ``items``
+    :rtype: list
+    """
+    return list(await asyncio.gather(*(decrypt_item(decrypt_method, crypto_config, item, executor) for item in items)))
+
+
+async def crypto_config_from_kwargs(fallback, **kwargs):
+    """Pull all encryption-specific parameters from the request and use them to build a crypto config.
+
+    :param callable fallback: Coroutine function that provides the crypto config if none is in the request
+    :returns: crypto config and updated kwargs
+    :rtype: dynamodb_encryption_sdk.encrypted.CryptoConfig and dict
+    """
+    try:
+        crypto_config = kwargs.pop("crypto_config")
+    except KeyError:
+        try:
+            fallback_kwargs = {"table_name": kwargs["TableName"]}
+        except KeyError:
+            fallback_kwargs = {}
+        crypto_config = await fallback(**fallback_kwargs)
+    return crypto_config, kwargs
+
+
+async def crypto_config_from_cache(materials_provider, attribute_actions, table_info_cache, table_name):
+    """Build a crypto config from the provided values, loading the table info from the provided cache.
+
+    :returns: crypto config
+    :rtype: CryptoConfig
+    """
+    table_info = await table_info_cache.table_info(table_name)
+    attribute_actions = table_info_cache.attribute_action_plan(attribute_actions, table_info)
+
+    return crypto_config_from_table_info(materials_provider, attribute_actions, table_info)
+
+
+async def decrypt_get_item(decrypt_method, crypto_config_method, read_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently decrypt an item after getting it from the table.
+
+    :param callable decrypt_method: Method to use to decrypt item
+    :param callable crypto_config_method: Coroutine function that accepts ``kwargs`` and provides
+        a :class:`CryptoConfig`
+    :param callable read_method: Coroutine function that reads from the table
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    :param **kwargs: Keyword arguments to pass to ``read_method``
+    :return: DynamoDB response
+    :rtype: dict
+    """
+    validate_get_arguments(kwargs)
+    crypto_config, ddb_kwargs = await crypto_config_method(**kwargs)
+    response = await read_method(**ddb_kwargs)
+    if "Item" in response:
+        response["Item"] = await decrypt_item(decrypt_method, crypto_config, response["Item"], executor)
+    return response
+
+
+async def decrypt_multi_get(decrypt_method, crypto_config_method, read_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently decrypt multiple items after getting them from the table with a scan or query method.
+
+    :param callable decrypt_method: Method to use to decrypt items
+    :param callable crypto_config_method: Coroutine function that accepts ``kwargs`` and provides
+        a :class:`CryptoConfig`
+    :param callable read_method: Coroutine function that reads from the table
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    :param **kwargs: Keyword arguments to pass to ``read_method``
+    :return: DynamoDB response
+    :rtype: dict
+    """
+    validate_get_arguments(kwargs)
+    crypto_config, ddb_kwargs = await crypto_config_method(**kwargs)
+    response = await read_method(**ddb_kwargs)
+    response["Items"] = await decrypt_list_of_items(
+        crypto_config=crypto_config, decrypt_method=decrypt_method, items=response["Items"], executor=executor
+    )
+    return response
+
+
+async def decrypt_batch_get_item(decrypt_method, crypto_config_method, read_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently decrypt multiple items after getting them in a batch request.
+
+    :param callable decrypt_method: Method to use to decrypt items
+    :param callable crypto_config_method: Coroutine function that accepts a table name and provides
+        a :class:`CryptoConfig`
+    :param callable read_method: Coroutine function that reads from the table
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    :param **kwargs: Keyword arguments to pass to ``read_method``
+    :return: DynamoDB response
+    :rtype: dict
+    """
+    request_crypto_config = kwargs.pop("crypto_config", None)
+
+    for _table_name, table_kwargs in kwargs["RequestItems"].items():
+        validate_get_arguments(table_kwargs)
+
+    response = await read_method(**kwargs)
+    for table_name, items in response["Responses"].items():
+        if request_crypto_config is not None:
+            crypto_config = request_crypto_config
+        else:
+            crypto_config = await crypto_config_method(table_name=table_name)
+
+        items[:] = await decrypt_list_of_items(
+            crypto_config=crypto_config, decrypt_method=decrypt_method, items=items, executor=executor
+        )
+    return response
+
+
+async def encrypt_put_item(encrypt_method, crypto_config_method, write_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently encrypt an item before putting it to the table.
+
+    :param callable encrypt_method: Method to use to encrypt items
+    :param callable crypto_config_method: Coroutine function that accepts ``kwargs`` and provides
+        a :class:`CryptoConfig`
+    :param callable write_method: Coroutine function that writes to the table
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    :param **kwargs: Keyword arguments to pass to ``write_method``
+    :return: DynamoDB response
+    :rtype: dict
+    """
+    crypto_config, ddb_kwargs = await crypto_config_method(**kwargs)
+    ddb_kwargs["Item"] = await encrypt_item(encrypt_method, crypto_config, ddb_kwargs["Item"], executor)
+    return await write_method(**ddb_kwargs)
+
+
+async def encrypt_batch_write_item(encrypt_method, crypto_config_method, write_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently encrypt multiple items before putting them in a batch request.
+
+    :param callable encrypt_method: Method to use to encrypt items
+    :param callable crypto_config_method: Coroutine function that accepts a table name and provides
+        a :class:`CryptoConfig`
+    :param callable write_method: Coroutine function that writes to the table
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    :param **kwargs: Keyword arguments to pass to ``write_method``
+    :return: DynamoDB response
+    :rtype: dict
+    """
+    request_crypto_config = kwargs.pop("crypto_config", None)
+    table_crypto_configs = {}
+    plaintext_items = await _run_in_executor(executor, copy.deepcopy, kwargs["RequestItems"])
+
+    for table_name, items in kwargs["RequestItems"].items():
+        if request_crypto_config is not None:
+            crypto_config = request_crypto_config
+        else:
+            crypto_config = await crypto_config_method(table_name=table_name)
+        table_crypto_configs[table_name] = crypto_config
+
+        # We don't encrypt primary indexes, so we can ignore DeleteItem requests
+        put_requests = [value["PutRequest"] for value in items if "PutRequest" in value]
+        encrypted_items = await asyncio.gather(
+            *(encrypt_item(encrypt_method, crypto_config, request["Item"], executor) for request in put_requests)
+        )
+        for request, encrypted_item in zip(put_requests, encrypted_items):
+            request["Item"] = encrypted_item
+
+    response = await write_method(**kwargs)
+    return _process_batch_write_response(plaintext_items, response, table_crypto_configs)
+
+
+class DecryptedPageIterator(object):
+    # pylint: disable=too-few-public-methods
+    """Asynchronous iterator over the pages from an asynchronous paginator, transparently decrypting
+    the items in each page.
+
+    :param paginator: Asynchronous paginator
+    :param callable decrypt_method: Method to use to decrypt items
+    :param callable crypto_config_method: Coroutine function that accepts ``kwargs`` and provides
+        a :class:`CryptoConfig`
+    :param dict kwargs: Keyword arguments to pass to the paginator
+    :param executor: Executor in which to run cryptographic work (optional)
+    :type executor: concurrent.futures.Executor
+    """
+
+    def __init__(self, paginator, decrypt_method, crypto_config_method, kwargs, executor=None):  # noqa=D107
+        # type: (Any, Callable, Callable, Dict[Text, Any], Optional[Executor]) -> None
+        validate_get_arguments(kwargs)
+        self._paginator = paginator
+        self._decrypt_method = decrypt_method
+        self._crypto_config_method = crypto_config_method
+        self._kwargs = kwargs
+        self._executor = executor
+        self._crypto_config = None  # type: Optional[CryptoConfig]
+        self._pages = None  # type: Any
+
+    def __aiter__(self):
+        """Return this iterator."""
+        return self
+
+    async def __anext__(self):
+        # type: () -> Dict
+        """Read and decrypt the next page."""
+        if self._pages is None:
+            self._crypto_config, ddb_kwargs = await self._crypto_config_method(**self._kwargs)
+            self._pages = self._paginator.paginate(**ddb_kwargs).__aiter__()
+
+        page = await self._pages.__anext__()
+        page["Items"] = await decrypt_list_of_items(
+            crypto_config=self._crypto_config,
+            decrypt_method=self._decrypt_method,
+            items=page["Items"],
+            executor=self._executor,
+        )
+        return page
@@ -16,18 +16,21 @@
     No guarantee is provided on the modules and APIs within this
     namespace staying consistent. Directly reference at your own risk.
 """
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
+import hashlib
+import struct
+
+from boto3.dynamodb.types import Binary
 
 from dynamodb_encryption_sdk.delegated_keys import DelegatedKey  # noqa pylint: disable=unused-import
 from dynamodb_encryption_sdk.encrypted import CryptoConfig  # noqa pylint: disable=unused-import
 from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.action_plan import signed_attributes
 from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import serialize_attribute
 from dynamodb_encryption_sdk.internal.identifiers import TEXT_ENCODING, SignatureValues, Tag
 from dynamodb_encryption_sdk.structures import AttributeActions  # noqa pylint: disable=unused-import
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Text  # noqa pylint: disable=unused-import
+    from typing import Dict, List, Optional, Sequence, Text, Tuple  # noqa pylint: disable=unused-import
 
     from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
@@ -35,16 +38,70 @@ except ImportError:  # pragma: no cover
     pass
 
 
-__all__ = ("sign_item", "verify_item_signature")
+__all__ = (
+    "attribute_digest",
+    "binary_attribute_digest",
+    "sign_item",
+    "sign_items",
+    "verify_item_signature",
+    "verify_item_signatures",
+)
+
+_DIGEST_LENGTH = 32
+# Bounds on the memoized digests, so that unpredictable table or attribute names cannot grow them without limit.
+_MAX_CACHED_TABLES = 64
+_MAX_CACHED_NAMES_PER_TABLE = 1024
+# Digest of "TABLE>{name}<TABLE" and digests of encoded attribute names, for each table name.
+_TABLE_DIGESTS = {}  # type: Dict[Text, Tuple[bytes, Dict[bytes, bytes]]]
+# Serialized binary attributes start with a reserved byte and the binary tag, followed by the length-prefixed value.
+_BINARY_ATTRIBUTE_PREFIX = b"\x00" + Tag.BINARY.tag  # pylint: disable=no-member
+_BINARY_LENGTH = struct.Struct(">I")
+
 
+def attribute_digest(attribute):
+    # type: (dynamodb_types.RAW_ATTRIBUTE) -> bytes
+    """Calculate the digest of an attribute value as it is included in the string to sign.
+
+    :param dict attribute: DynamoDB attribute
+    :returns: SHA256 digest of the serialized attribute
+    :rtype: bytes
+    """
+    return _sha256(serialize_attribute(attribute))
 
-def sign_item(encrypted_item, signing_key, crypto_config):
-    # type: (dynamodb_types.ITEM, DelegatedKey, CryptoConfig) -> dynamodb_types.BINARY_ATTRIBUTE
+
+def binary_attribute_digest(value):
+    # type: (dynamodb_types.BINARY) -> bytes
+    """Calculate the digest of a binary attribute value as it is included in the string to sign.
+
+    This is equivalent to ``attribute_digest({"B": value})``, but the value is hashed in place
+    rather than being copied into a serialized attribute first.
+
+    :param value: Binary attribute value, such as an attribute ciphertext
+    :type value: bytes or boto3.dynamodb.types.Binary
+    :returns: SHA256 digest of the serialized attribute
+    :rtype: bytes
+    """
+    if isinstance(value, Binary):
+        value = value.value
+    hasher = hashlib.sha256(_BINARY_ATTRIBUTE_PREFIX)
+    hasher.update(_BINARY_LENGTH.pack(len(value)))
+    hasher.update(value)
+    return hasher.digest()
+
+
+def sign_item(
+    encrypted_item,  # type: dynamodb_types.ITEM
+    signing_key,  # type: DelegatedKey
+    crypto_config,  # type: CryptoConfig
+    value_digests=None,  # type: Optional[Dict[Text, bytes]]
+):
+    # type: (...) -> dynamodb_types.BINARY_ATTRIBUTE
     """Generate the signature DynamoDB atttribute.
 
     :param dict encrypted_item: Encrypted DynamoDB item
     :param DelegatedKey signing_key: DelegatedKey to use to calculate the signature
     :param CryptoConfig crypto_config: Cryptographic configuration
+    :param dict value_digests: Already calculated digests of attribute values, by attribute name (optional)
     :returns: Item signature DynamoDB attribute value
     :rtype: dict
     """
@@ -54,20 +111,28 @@ def sign_item(encrypted_item, signing_key, crypto_config):
             item=encrypted_item,
             table_name=crypto_config.encryption_context.table_name,
             attribute_actions=crypto_config.attribute_actions,
+            value_digests=value_digests,
         ),
     )
     # for some reason pylint can't follow the Enum member attributes
     return {Tag.BINARY.dynamodb_tag: signature}  # pylint: disable=no-member
 
 
-def verify_item_signature(signature_attribute, encrypted_item, verification_key, crypto_config):
-    # type: (dynamodb_types.BINARY_ATTRIBUTE, dynamodb_types.ITEM, DelegatedKey, CryptoConfig) -> None
+def verify_item_signature(
+    signature_attribute,  # type: dynamodb_types.BINARY_ATTRIBUTE
+    encrypted_item,  # type: dynamodb_types.ITEM
+    verification_key,  # type: DelegatedKey
+    crypto_config,  # type: CryptoConfig
+    value_digests=None,  # type: Optional[Dict[Text, bytes]]
+):
+    # type: (...) -> None
     """Verify the item signature.
 
     :param dict signature_attribute: Item signature DynamoDB attribute value
     :param dict encrypted_item: Encrypted DynamoDB item
     :param DelegatedKey verification_key: DelegatedKey to use to calculate the signature
     :param CryptoConfig crypto_config: Cryptographic configuration
+    :param dict value_digests: Already calculated digests of attribute values, by attribute name (optional)
     """
     # for some reason pylint can't follow the Enum member attributes
     signature = signature_attribute[Tag.BINARY.dynamodb_tag]  # pylint: disable=no-member
@@ -78,47 +143,167 @@ def verify_item_signature(signature_attribute, encrypted_item, verification_key,
             item=encrypted_item,
             table_name=crypto_config.encryption_context.table_name,
             attribute_actions=crypto_config.attribute_actions,
+            value_digests=value_digests,
         ),
     )
 
 
-def _string_to_sign(item, table_name, attribute_actions):
-    # type: (dynamodb_types.ITEM, Text, AttributeActions) -> bytes
+def sign_items(
+    encrypted_items,  # type: Sequence[dynamodb_types.ITEM]
+    signing_key,  # type: DelegatedKey
+    crypto_config,  # type: CryptoConfig
+    value_digests,  # type: Sequence[Optional[Dict[Text, bytes]]]
+):
+    # type: (...) -> List[dynamodb_types.BINARY_ATTRIBUTE]
+    """Generate the signature DynamoDB attributes for several items that share a signing key.
+
+    :param encrypted_items: Encrypted DynamoDB items
+    :type encrypted_items: sequence of dict
+    :param DelegatedKey signing_key: DelegatedKey to use to calculate the signatures
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param value_digests: Already calculated digests of attribute values for each item (items may be ``None``)
+    :type value_digests: sequence of dict
+    :returns: Item signature DynamoDB attribute values, in the same order as ``encrypted_items``
+    :rtype: list of dict
+    """
+    table_name = crypto_config.encryption_context.table_name
+    attribute_actions = crypto_config.attribute_actions
+    signatures = signing_key.sign_many(
+        algorithm=signing_key.algorithm,
+        data=[
+            _string_to_sign(
+                item=item, table_name=table_name, attribute_actions=attribute_actions, value_digests=item_digests
+            )
+            for item, item_digests in zip(encrypted_items, value_digests)
+        ],
+    )
+    # for some reason pylint can't follow the Enum member attributes
+    return [{Tag.BINARY.dynamodb_tag: signature} for signature in signatures]  # pylint: disable=no-member
+
+
+def verify_item_signatures(
+    signature_attributes,  # type: Sequence[dynamodb_types.BINARY_ATTRIBUTE]
+    encrypted_items,  # type: Sequence[dynamodb_types.ITEM]
+    verification_key,  # type: DelegatedKey
+    crypto_config,  # type: CryptoConfig
+    value_digests,  # type: Sequence[Optional[Dict[Text, bytes]]]
+):
+    # type: (...) -> None
+    """Verify the signatures of several items that share a verification key.
+
+    :param signature_attributes: Item signature DynamoDB attribute values
+    :type signature_attributes: sequence of dict
+    :param encrypted_items: Encrypted DynamoDB items, in the same order as ``signature_attributes``
+    :type encrypted_items: sequence of dict
+    :param DelegatedKey verification_key: DelegatedKey to use to calculate the signatures
+    :param CryptoConfig crypto_config: Cryptographic configuration
+    :param value_digests: Already calculated digests of attribute values for each item (items may be ``None``)
+    :type value_digests: sequence of dict
+    """
+    table_name = crypto_config.encryption_context.table_name
+    attribute_actions = crypto_config.attribute_actions
+    # for some reason pylint can't follow the Enum member attributes
+    binary_tag = Tag.BINARY.dynamodb_tag  # pylint: disable=no-member
+    verification_key.verify_many(
+        algorithm=verification_key.algorithm,
+        signatures=[attribute[binary_tag] for attribute in signature_attributes],
+        data=[
+            _string_to_sign(
+                item=item, table_name=table_name, attribute_actions=attribute_actions, value_digests=item_digests
+            )
+            for item, item_digests in zip(encrypted_items, value_digests)
+        ],
+    )
+
+
+def _table_digests(table_name):
+    # type: (Text) -> Tuple[bytes, Dict[bytes, bytes]]
+    """Load the memoized digests for a table.
+
+    :param str table_name: Table name to use when generating the string to sign
+    :returns: Digest of the table name marker and memoized digests of attribute names
+    :rtype: tuple
+    """
+    try:
+        return _TABLE_DIGESTS[table_name]
+    except KeyError:
+        digests = (_sha256("TABLE>{}<TABLE".format(table_name).encode(TEXT_ENCODING)), {})
+        if len(_TABLE_DIGESTS) < _MAX_CACHED_TABLES:
+            _TABLE_DIGESTS[table_name] = digests
+        return digests
+
+
+def _name_digest(name_digests, encoded_name):
+    # type: (Dict[bytes, bytes], bytes) -> bytes
+    """Load the memoized digest of an attribute name.
+
+    :param dict name_digests: Memoized attribute name digests for a table
+    :param bytes encoded_name: Encoded attribute name
+    :returns: Digest of attribute name
+    :rtype: bytes
+    """
+    try:
+        return name_digests[encoded_name]
+    except KeyError:
+        digest = _sha256(encoded_name)
+        if len(name_digests) < _MAX_CACHED_NAMES_PER_TABLE:
+            name_digests[encoded_name] = digest
+        return digest
+
+
+def _string_to_sign(item, table_name, attribute_actions, value_digests=None):
+    # type: (dynamodb_types.ITEM, Text, AttributeActions, Optional[Dict[Text, bytes]]) -> bytes
     """Generate the string to sign from an encrypted item and configuration.
 
+    The string to sign is a sequence of SHA256 digests: one for the table name, then three for
+    each signed attribute (name, action, and serialized value). It is written into a buffer of
+    exactly that size.
+
     :param dict item: Encrypted DynamoDB item
     :param str table_name: Table name to use when generating the string to sign
     :param AttributeActions attribute_actions: Actions to take for item
+    :param dict value_digests: Already calculated digests of attribute values, by attribute name (optional)
     """
-    hasher = hashes.Hash(hashes.SHA256(), backend=default_backend())
-    data_to_sign = bytearray()
-    data_to_sign.extend(_hash_data(hasher=hasher, data="TABLE>{}<TABLE".format(table_name).encode(TEXT_ENCODING)))
-    for key in sorted(item.keys()):
-        action = attribute_actions.action(key)
-        if action is CryptoAction.DO_NOTHING:
-            continue
+    if value_digests is None:
+        value_digests = {}
+    table_digest, name_digests = _table_digests(table_name)
+    attributes = signed_attributes(attribute_actions, item)
 
-        data_to_sign.extend(_hash_data(hasher=hasher, data=key.encode(TEXT_ENCODING)))
+    data_to_sign = bytearray(_DIGEST_LENGTH * (1 + 3 * len(attributes)))
+    data_to_sign[:_DIGEST_LENGTH] = table_digest
+    offset = _DIGEST_LENGTH
+    for key, action, encoded_key in attributes:
+        data_to_sign[offset : offset + _DIGEST_LENGTH] = _name_digest(name_digests, encoded_key)
+        offset += _DIGEST_LENGTH
 
         # for some reason pylint can't follow the Enum member attributes
         if action is CryptoAction.SIGN_ONLY:
-            data_to_sign.extend(SignatureValues.PLAINTEXT.sha256)  # pylint: disable=no-member
+            action_digest = SignatureValues.PLAINTEXT.sha256  # pylint: disable=no-member
         else:
-            data_to_sign.extend(SignatureValues.ENCRYPTED.sha256)  # pylint: disable=no-member
+            action_digest = SignatureValues.ENCRYPTED.sha256  # pylint: disable=no-member
+        data_to_sign[offset : offset + _DIGEST_LENGTH] = action_digest
+        offset += _DIGEST_LENGTH
 
-        data_to_sign.extend(_hash_data(hasher=hasher, data=serialize_attribute(item[key])))
+        try:
+            value_digest = value_digests[key]
+        except KeyError:
+            value_digest = attribute_digest(item[key])
+        data_to_sign[offset : offset + _DIGEST_LENGTH] = value_digest
+        offset += _DIGEST_LENGTH
     return bytes(data_to_sign)
 
 
-def _hash_data(hasher, data):
-    """Generate hash of data using provided hash type.
+def _sha256(data):
+    # type: (bytes) -> bytes
+    """Calculate the SHA256 digest of data.
+
+    .. note::
+
+        ``hashlib`` is used rather than ``cryptography`` because the inputs are small, and
+        creating a ``cryptography`` hash context costs more than hashing them.
 
-    :param hasher: Hasher instance to use as a base for calculating hash
-    :type hasher: cryptography.hazmat.primitives.hashes.Hash
-    :param bytes data: Data to sign
-    :returns: Hash of data
+    :param bytes data: Data to hash
+    :returns: Digest of data
     :rtype: bytes
     """
-    _hasher = hasher.copy()
-    _hasher.update(data)
-    return _hasher.finalize()
+    return hashlib.sha256(data).digest()
@@ -33,7 +33,7 @@ from dynamodb_encryption_sdk.internal.validators import callable_validator
 from .primitives import load_rsa_key
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Any, Callable, Text  # noqa pylint: disable=unused-import
+    from typing import Any, Callable, Iterable, List, Text  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -60,6 +60,15 @@ class JavaAuthenticator(object):
         :rtype: bytes
         """
 
+    def prepare_key(self, key):  # pylint: disable=no-self-use
+        # type: (Any) -> Any
+        """Build whatever this authenticator can reuse across operations with a loaded key.
+
+        :param key: Key loaded by :meth:`load_key`
+        :returns: Object to pass as ``key`` to ``sign`` and ``verify``
+        """
+        return key
+
     @abc.abstractmethod
     def validate_algorithm(self, algorithm):
         # type: (Text) -> None
@@ -92,6 +101,35 @@ class JavaAuthenticator(object):
         :raises SignatureVerificationError: if unable to verify ``signature``
         """
 
+    def sign_many(self, key, data):
+        # type: (Any, Iterable[bytes]) -> List[bytes]
+        """Sign each of several pieces of data using loaded ``key``.
+
+        :param key: Loaded key
+        :param data: Data to sign
+        :type data: iterable of bytes
+        :returns: Calculated signatures, in the same order as ``data``
+        :rtype: list of bytes
+        :raises SigningError: if unable to sign any of ``data`` with ``key``
+        """
+        sign = self.sign
+        return [sign(key, each) for each in data]
+
+    def verify_many(self, key, signatures, data):
+        # type: (Any, Iterable[bytes], Iterable[bytes]) -> None
+        """Verify each of several signatures over the matching piece of data using ``key``.
+
+        :param key: Loaded key
+        :param signatures: Signatures to verify
+        :type signatures: iterable of bytes
+        :param data: Data over which to verify each signature, in the same order as ``signatures``
+        :type data: iterable of bytes
+        :raises SignatureVerificationError: if unable to verify any of ``signatures``
+        """
+        verify = self.verify
+        for signature, each in zip(signatures, data):
+            verify(key, signature, each)
+
 
 @attr.s(init=False)
 class JavaMac(JavaAuthenticator):
@@ -123,6 +161,31 @@ class JavaMac(JavaAuthenticator):
         """
         return self.algorithm_type(key, self.hash_type(), backend=default_backend())
 
+    def prepare_key(self, key):
+        # type: (bytes) -> Any
+        """Build a pre-keyed HMAC signer that is copied for each operation.
+
+        If a signer cannot be built for the key, it is returned unchanged so that the
+        failure is reported by ``sign`` or ``verify`` as before.
+
+        :param bytes key: Loaded key
+        :returns: Pre-keyed HMAC signer, or ``key`` if one cannot be built
+        """
+        try:
+            return self._build_hmac_signer(key)
+        except Exception:  # pylint: disable=broad-except
+            return key
+
+    def _signer(self, key):
+        # type: (Any) -> Any
+        """Load a fresh HMAC signer for a key.
+
+        :param key: Loaded key or pre-keyed HMAC signer built by :meth:`prepare_key`
+        """
+        if isinstance(key, bytes):
+            return self._build_hmac_signer(key)
+        return key.copy()
+
     def load_key(self, key, key_type, key_encoding):
         # (bytes, EncryptionKeyType, KeyEncodingType) -> bytes
         """Load a raw key from bytes.
@@ -157,17 +220,17 @@ class JavaMac(JavaAuthenticator):
             )
 
     def sign(self, key, data):
-        # type: (bytes, bytes) -> bytes
+        # type: (Any, bytes) -> bytes
         """Sign ``data`` using loaded ``key``.
 
-        :param bytes key: Loaded key
+        :param key: Loaded key or pre-keyed HMAC signer built by :meth:`prepare_key`
         :param bytes data: Data to sign
         :returns: Calculated signature
         :rtype: bytes
         :raises SigningError: if unable to sign ``data`` with ``key``
         """
         try:
-            signer = self._build_hmac_signer(key)
+            signer = self._signer(key)
             signer.update(data)
             return signer.finalize()
         except Exception:
@@ -176,16 +239,16 @@ class JavaMac(JavaAuthenticator):
             raise SigningError(message)
 
     def verify(self, key, signature, data):
-        # type: (bytes, bytes, bytes) -> None
+        # type: (Any, bytes, bytes) -> None
         """Verify ``signature`` over ``data`` using ``key``.
 
-        :param bytes key: Loaded key
+        :param key: Loaded key or pre-keyed HMAC signer built by :meth:`prepare_key`
         :param bytes signature: Signature to verify
         :param bytes data: Data over which to verify signature
         :raises SignatureVerificationError: if unable to verify ``signature``
         """
         try:
-            verifier = self._build_hmac_signer(key)
+            verifier = self._signer(key)
             verifier.update(data)
             verifier.verify(signature)
         except Exception:
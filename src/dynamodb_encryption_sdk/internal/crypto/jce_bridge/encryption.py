@@ -29,7 +29,19 @@ from .primitives import (
     JavaPadding,
 )
 
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Dict, Text  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
 __all__ = ("JavaCipher",)
+_AES_CBC_PKCS5 = "AES/CBC/PKCS5Padding"
+_AES_GCM = "AES/GCM/NoPadding"
+# Only a handful of transformations are ever used, but they arrive as caller-provided
+# strings, so stop adding new ones once this many have been seen.
+_MAX_CACHED_TRANSFORMATIONS = 64
+_TRANSFORMATIONS = {}  # type: Dict[Text, JavaCipher]
 
 
 @attr.s(init=False)
@@ -56,22 +68,39 @@ class JavaCipher(object):
         self.mode = mode
         self.padding = padding
         attr.validate(self)
-
-    def encrypt(self, key, data):
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        # () -> None
+        """Use the dedicated methods of the cipher for AES-CBC with PKCS5 padding and for AES-GCM."""
+        transformation = self.transformation
+        if transformation == _AES_CBC_PKCS5:
+            self.encrypt = self.cipher.encrypt_cbc_pkcs5
+            self.decrypt = self.cipher.decrypt_cbc_pkcs5
+        elif transformation == _AES_GCM:
+            self.encrypt = self.cipher.encrypt_gcm
+            self.decrypt = self.cipher.decrypt_gcm
+
+    def encrypt(self, key, data, associated_data=None):
+        # this can be replaced by __attrs_post_init__, so pylint: disable=method-hidden,unused-argument
         """Encrypt data using loaded key.
 
         :param key: Key loaded by ``cipher``
         :param bytes data: Data to encrypt
+        :param bytes associated_data: Additional data to authenticate. This is only used by GCM mode. (optional)
         :returns: Encrypted data
         :rtype: bytes
         """
         return self.cipher.encrypt(key, data, self.mode, self.padding)
 
-    def decrypt(self, key, data):
+    def decrypt(self, key, data, associated_data=None):
+        # this can be replaced by __attrs_post_init__, so pylint: disable=method-hidden,unused-argument
         """Decrypt data using loaded key.
 
         :param key: Key loaded by ``cipher``
         :param bytes data: Data to decrypt
+        :param bytes associated_data: Additional data that was authenticated on encrypt.
+            This is only used by GCM mode. (optional)
         :returns: Decrypted data
         :rtype: bytes
         """
@@ -133,6 +162,26 @@ class JavaCipher(object):
         https://docs.oracle.com/javase/8/docs/api/javax/crypto/Cipher.html
         https://docs.oracle.com/javase/8/docs/technotes/guides/security/StandardNames.html#Cipher
 
+        .. note::
+
+            JavaCipher instances are shared between callers that request the same transformation.
+
+        :param str cipher_transformation: Formatted transformation
+        :returns: JavaCipher instance
+        :rtype: JavaCipher
+        """
+        try:
+            return _TRANSFORMATIONS[cipher_transformation]
+        except KeyError:
+            cipher = cls._parse_transformation(cipher_transformation)
+            if len(_TRANSFORMATIONS) < _MAX_CACHED_TRANSFORMATIONS:
+                _TRANSFORMATIONS[cipher_transformation] = cipher
+            return cipher
+
+    @classmethod
+    def _parse_transformation(cls, cipher_transformation):
+        """Build a new JavaCipher object from the Java transformation.
+
         :param str cipher_transformation: Formatted transformation
         :returns: JavaCipher instance
         :rtype: JavaCipher
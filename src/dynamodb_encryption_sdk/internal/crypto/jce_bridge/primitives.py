@@ -25,7 +25,7 @@ import six
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, keywrap, padding as symmetric_padding, serialization
 from cryptography.hazmat.primitives.asymmetric import padding as asymmetric_padding, rsa
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherAlgorithm, algorithms, modes
 
 from dynamodb_encryption_sdk.exceptions import (
     DecryptionError,
@@ -59,6 +59,9 @@ __all__ = (
     "JAVA_PADDING",
 )
 _LOGGER = logging.getLogger(LOGGER_NAME)
+# GCM uses the 96-bit IVs and 128-bit tags that Java uses by default for AES/GCM/NoPadding.
+_GCM_IV_BYTES = 12
+_GCM_TAG_BYTES = 16
 
 
 class _NoPadding(object):
@@ -265,6 +268,14 @@ class JavaEncryptionAlgorithm(object):
     def __attrs_post_init__(self):
         """No-op stub to standardize API."""
 
+    def prepare_key(self, key):  # pylint: disable=no-self-use
+        """Build whatever this algorithm can reuse across operations with a loaded key.
+
+        :param key: Key loaded by :meth:`load_key`
+        :returns: Object to pass as ``key`` to ``encrypt`` and ``decrypt``
+        """
+        return key
+
     def validate_algorithm(self, algorithm):
         # type: (Text) -> None
         """Determine whether the requested algorithm name is compatible with this cipher"""
@@ -294,10 +305,17 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
         """Enable encryption methods for ciphers that support them."""
         self.encrypt = self._disabled_encrypt
         self.decrypt = self._disabled_decrypt
+        self.encrypt_cbc_pkcs5 = self._disabled_encrypt
+        self.decrypt_cbc_pkcs5 = self._disabled_decrypt
+        self.encrypt_gcm = self._disabled_encrypt
+        self.decrypt_gcm = self._disabled_decrypt
 
     def __attrs_post_init__(self):
         # () -> None
-        """Disable encryption if algorithm is AESWrap."""
+        """Prepare the reusable CBC/PKCS5 values and disable encryption if algorithm is AESWrap."""
+        self._block_bytes = self.cipher.block_size // 8  # pylint: disable=attribute-defined-outside-init
+        # PKCS7 padding is a generalization of PKCS5 padding.
+        self._pkcs5 = symmetric_padding.PKCS7(self.cipher.block_size)  # pylint: disable=attribute-defined-outside-init
         if self.java_name == "AESWrap":
             self._disable_encryption()
 
@@ -361,11 +379,35 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
             _LOGGER.exception(error_message)
             raise UnwrappingError(error_message)
 
+    def prepare_key(self, key):
+        """Build the cipher algorithm object for a loaded key so that it can be reused.
+
+        If the key is not valid for this cipher, it is returned unchanged so that the
+        failure is reported by ``encrypt`` or ``decrypt`` as before.
+
+        :param bytes key: Loaded key
+        :returns: Cipher algorithm object, or ``key`` if one cannot be built
+        """
+        try:
+            return self.cipher(key)
+        except ValueError:
+            return key
+
+    def _cipher_algorithm(self, key):
+        """Load the cipher algorithm object for a key.
+
+        :param key: Loaded key or cipher algorithm object built by :meth:`prepare_key`
+        :returns: Cipher algorithm object
+        """
+        if isinstance(key, CipherAlgorithm):
+            return key
+        return self.cipher(key)
+
     def encrypt(self, key, data, mode, padding):
         # this can be disabled by _disable_encryption, so pylint: disable=method-hidden
         """Encrypt data using the supplied values.
 
-        :param bytes key: Loaded encryption key
+        :param key: Loaded encryption key or cipher algorithm object built by :meth:`prepare_key`
         :param bytes data: Data to encrypt
         :param JavaMode mode: Encryption mode to use
         :param JavaPadding padding: Padding mode to use
@@ -377,7 +419,7 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
             iv_len = block_size // 8
             iv = os.urandom(iv_len)
 
-            encryptor = Cipher(self.cipher(key), mode.build(iv), backend=default_backend()).encryptor()
+            encryptor = Cipher(self._cipher_algorithm(key), mode.build(iv), backend=default_backend()).encryptor()
             padder = padding.build(block_size).padder()
 
             padded_data = padder.update(data) + padder.finalize()
@@ -391,7 +433,7 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
         # this can be disabled by _disable_encryption, so pylint: disable=method-hidden
         """Decrypt data using the supplied values.
 
-        :param bytes key: Loaded decryption key
+        :param key: Loaded decryption key or cipher algorithm object built by :meth:`prepare_key`
         :param bytes data: IV prepended to encrypted data
         :param JavaMode mode: Decryption mode to use
         :param JavaPadding padding: Padding mode to use
@@ -404,7 +446,7 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
             iv = data[:iv_len]
             data = data[iv_len:]
 
-            decryptor = Cipher(self.cipher(key), mode.build(iv), backend=default_backend()).decryptor()
+            decryptor = Cipher(self._cipher_algorithm(key), mode.build(iv), backend=default_backend()).decryptor()
             decrypted_data = decryptor.update(data) + decryptor.finalize()
 
             unpadder = padding.build(block_size).unpadder()
@@ -414,6 +456,109 @@ class JavaSymmetricEncryptionAlgorithm(JavaEncryptionAlgorithm):
             _LOGGER.exception(error_message)
             raise DecryptionError(error_message)
 
+    def encrypt_cbc_pkcs5(self, key, data, associated_data=None):
+        # this can be disabled by _disable_encryption, so pylint: disable=method-hidden,unused-argument
+        """Encrypt data using CBC mode and PKCS5 padding.
+
+        This produces the same output as :meth:`encrypt` with the CBC mode and PKCS5 padding,
+        without going through the generic mode and padding builders.
+
+        :param key: Loaded encryption key or cipher algorithm object built by :meth:`prepare_key`
+        :param bytes data: Data to encrypt
+        :param bytes associated_data: Not used by CBC mode
+        :returns: IV prepended to encrypted data
+        :rtype: bytes
+        """
+        try:
+            iv = os.urandom(self._block_bytes)
+            encryptor = Cipher(self._cipher_algorithm(key), modes.CBC(iv), backend=default_backend()).encryptor()
+            padder = self._pkcs5.padder()
+            return iv + encryptor.update(padder.update(data) + padder.finalize()) + encryptor.finalize()
+        except Exception:
+            error_message = "Encryption failed"
+            _LOGGER.exception(error_message)
+            raise EncryptionError(error_message)
+
+    def decrypt_cbc_pkcs5(self, key, data, associated_data=None):
+        # this can be disabled by _disable_encryption, so pylint: disable=method-hidden,unused-argument
+        """Decrypt data using CBC mode and PKCS5 padding.
+
+        This is the counterpart to :meth:`encrypt_cbc_pkcs5`.
+
+        :param key: Loaded decryption key or cipher algorithm object built by :meth:`prepare_key`
+        :param bytes data: IV prepended to encrypted data
+        :param bytes associated_data: Not used by CBC mode
+        :returns: Decrypted data
+        :rtype: bytes
+        """
+        try:
+            iv_len = self._block_bytes
+            decryptor = Cipher(
+                self._cipher_algorithm(key), modes.CBC(data[:iv_len]), backend=default_backend()
+            ).decryptor()
+            unpadder = self._pkcs5.unpadder()
+            return unpadder.update(decryptor.update(data[iv_len:]) + decryptor.finalize()) + unpadder.finalize()
+        except Exception:
+            error_message = "Decryption failed"
+            _LOGGER.exception(error_message)
+            raise DecryptionError(error_message)
+
+    def encrypt_gcm(self, key, data, associated_data=None):
+        # this can be disabled by _disable_encryption, so pylint: disable=method-hidden
+        """Encrypt data using GCM mode.
+
+        As with the Java ``GCM/NoPadding`` transformation, the authentication tag is appended
+        to the ciphertext.
+
+        .. warning::
+
+            A random IV is generated for each call, so a single key should not be used for
+            more than 2^32 calls.
+
+        :param key: Loaded encryption key or cipher algorithm object built by :meth:`prepare_key`
+        :param bytes data: Data to encrypt
+        :param bytes associated_data: Additional data to authenticate (optional)
+        :returns: IV prepended to encrypted data and authentication tag
+        :rtype: bytes
+        """
+        try:
+            iv = os.urandom(_GCM_IV_BYTES)
+            encryptor = Cipher(self._cipher_algorithm(key), modes.GCM(iv), backend=default_backend()).encryptor()
+            if associated_data:
+                encryptor.authenticate_additional_data(associated_data)
+            ciphertext = encryptor.update(data) + encryptor.finalize()
+            return iv + ciphertext + encryptor.tag
+        except Exception:
+            error_message = "Encryption failed"
+            _LOGGER.exception(error_message)
+            raise EncryptionError(error_message)
+
+    def decrypt_gcm(self, key, data, associated_data=None):
+        # this can be disabled by _disable_encryption, so pylint: disable=method-hidden
+        """Decrypt and authenticate data using GCM mode.
+
+        This is the counterpart to :meth:`encrypt_gcm`.
+
+        :param key: Loaded decryption key or cipher algorithm object built by :meth:`prepare_key`
+        :param bytes data: IV prepended to encrypted data and authentication tag
+        :param bytes associated_data: Additional data that was authenticated on encrypt (optional)
+        :returns: Decrypted data
+        :rtype: bytes
+        """
+        try:
+            if len(data) < _GCM_IV_BYTES + _GCM_TAG_BYTES:
+                raise ValueError("Ciphertext is too short")
+            iv = data[:_GCM_IV_BYTES]
+            tag = data[-_GCM_TAG_BYTES:]
+            decryptor = Cipher(self._cipher_algorithm(key), modes.GCM(iv, tag), backend=default_backend()).decryptor()
+            if associated_data:
+                decryptor.authenticate_additional_data(associated_data)
+            return decryptor.update(data[_GCM_IV_BYTES:-_GCM_TAG_BYTES]) + decryptor.finalize()
+        except Exception:
+            error_message = "Decryption failed"
+            _LOGGER.exception(error_message)
+            raise DecryptionError(error_message)
+
 
 _RSA_KEY_LOADING = {
     EncryptionKeyType.PRIVATE: {
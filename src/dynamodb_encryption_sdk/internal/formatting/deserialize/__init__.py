@@ -16,11 +16,14 @@
     No guarantee is provided on the modules and APIs within this
     namespace staying consistent. Directly reference at your own risk.
 """
+
 import struct
 
 from dynamodb_encryption_sdk.exceptions import DeserializationError
 
-__all__ = ("unpack_value", "decode_length", "decode_value", "decode_tag")
+__all__ = ("unpack_value", "decode_length", "decode_value", "decode_tag", "ByteCursor")
+_LENGTH = struct.Struct(">I")
+_TAG = struct.Struct(">cc")
 
 
 def unpack_value(format_string, stream):
@@ -44,7 +47,7 @@ def decode_length(stream):
     :returns: Decoded length
     :rtype: int
     """
-    (value,) = unpack_value(">I", stream)
+    (value,) = _LENGTH.unpack(stream.read(_LENGTH.size))
     return value
 
 
@@ -57,7 +60,10 @@ def decode_value(stream):
     :rtype: bytes
     """
     length = decode_length(stream)
-    (value,) = unpack_value(">{:d}s".format(length), stream)
+    value = stream.read(length)
+    # Truncated data fails the same way that unpacking a short read does.
+    if len(value) != length:
+        raise struct.error("unpack requires a buffer of {:d} bytes".format(length))
     return value
 
 
@@ -69,7 +75,9 @@ def decode_byte(stream):
     :returns: Decoded value
     :rtype: bytes
     """
-    (value,) = unpack_value(">1s", stream)
+    value = stream.read(1)
+    if not value:
+        raise struct.error("unpack requires a buffer of 1 bytes")
     return value
 
 
@@ -81,9 +89,90 @@ def decode_tag(stream):
     :returns: Decoded tag
     :rtype: bytes
     """
-    (reserved, tag) = unpack_value(">cc", stream)
+    reserved, tag = _TAG.unpack(stream.read(_TAG.size))
 
     if reserved != b"\x00":
         raise DeserializationError("Invalid tag: reserved byte is not null")
 
     return tag
+
+
+class ByteCursor(object):
+    """Reads serialized values from a buffer without copying it.
+
+    Values are returned as :class:`memoryview` slices of the source data, so the caller decides
+    when, and whether, to materialize them as ``bytes`` or ``str``.
+
+    :param bytes data: Source data
+    """
+
+    __slots__ = ("_view", "offset")
+
+    def __init__(self, data):
+        # type: (bytes) -> None
+        """Position a new cursor at the start of the data."""
+        self._view = memoryview(data)
+        self.offset = 0
+
+    def _slice(self, length):
+        # type: (int) -> memoryview
+        """Read the next ``length`` bytes.
+
+        :raises struct.error: if fewer than ``length`` bytes remain
+        """
+        start = self.offset
+        end = start + length
+        if end > len(self._view):
+            raise struct.error("unpack requires a buffer of {:d} bytes".format(length))
+        self.offset = end
+        return self._view[start:end]
+
+    def decode_length(self):
+        # type: () -> int
+        """Decode the length of a value.
+
+        :returns: Decoded length
+        :rtype: int
+        """
+        (value,) = _LENGTH.unpack_from(self._view, self.offset)
+        self.offset += _LENGTH.size
+        return value
+
+    def decode_value(self):
+        # type: () -> memoryview
+        """Decode the contents of a value.
+
+        :returns: Decoded value
+        :rtype: memoryview
+        """
+        start = self.offset + _LENGTH.size
+        (length,) = _LENGTH.unpack_from(self._view, self.offset)
+        end = start + length
+        if end > len(self._view):
+            raise struct.error("unpack requires a buffer of {:d} bytes".format(length))
+        self.offset = end
+        return self._view[start:end]
+
+    def decode_byte(self):
+        # type: () -> bytes
+        """Decode a single raw byte.
+
+        :returns: Decoded value
+        :rtype: bytes
+        """
+        return self._slice(1).tobytes()
+
+    def decode_tag(self):
+        # type: () -> bytes
+        """Decode a tag value.
+
+        :returns: Decoded tag
+        :rtype: bytes
+        """
+        reserved, tag = _TAG.unpack_from(self._view, self.offset)
+        self.offset += _TAG.size
+
+        if reserved != b"\x00":
+            raise DeserializationError("Invalid tag: reserved byte is not null")
+
+        return tag
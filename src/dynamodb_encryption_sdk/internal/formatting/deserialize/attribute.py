@@ -16,17 +16,14 @@
     No guarantee is provided on the modules and APIs within this
     namespace staying consistent. Directly reference at your own risk.
 """
-import codecs
-import io
+
 import logging
 import struct
 from decimal import Decimal
 
-from boto3.dynamodb.types import Binary
-
 from dynamodb_encryption_sdk.exceptions import DeserializationError
 from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
-from dynamodb_encryption_sdk.internal.formatting.deserialize import decode_byte, decode_length, decode_tag, decode_value
+from dynamodb_encryption_sdk.internal.formatting.deserialize import ByteCursor
 from dynamodb_encryption_sdk.internal.identifiers import TEXT_ENCODING, Tag, TagValues
 from dynamodb_encryption_sdk.internal.str_ops import to_str
 
@@ -41,239 +38,298 @@ except ImportError:  # pragma: no cover
 
 __all__ = ("deserialize_attribute",)
 _LOGGER = logging.getLogger(LOGGER_NAME)
+_BOOLEAN_MAP = {TagValues.FALSE.value: False, TagValues.TRUE.value: True}
+# for some reason pylint can't follow the Enum member attributes
+_BINARY = Tag.BINARY.dynamodb_tag  # pylint: disable=no-member
+_BINARY_SET = Tag.BINARY_SET.dynamodb_tag  # pylint: disable=no-member
+_NUMBER = Tag.NUMBER.dynamodb_tag  # pylint: disable=no-member
+_NUMBER_SET = Tag.NUMBER_SET.dynamodb_tag  # pylint: disable=no-member
+_STRING = Tag.STRING.dynamodb_tag  # pylint: disable=no-member
+_STRING_SET = Tag.STRING_SET.dynamodb_tag  # pylint: disable=no-member
+_BOOLEAN = Tag.BOOLEAN.dynamodb_tag  # pylint: disable=no-member
+_NULL = Tag.NULL.dynamodb_tag  # pylint: disable=no-member
+_LIST = Tag.LIST.dynamodb_tag  # pylint: disable=no-member
+_MAP = Tag.MAP.dynamodb_tag  # pylint: disable=no-member
+
+
+def _transform_binary_value(value):
+    # (memoryview) -> bytes
+    """Transforms a serialized binary value.
+
+    :param memoryview value: Raw deserialized value
+    :rtype: bytes
+    """
+    return value.tobytes()
 
 
-def deserialize_attribute(serialized_attribute):  # noqa: C901 pylint: disable=too-many-locals
-    # type: (bytes) -> dynamodb_types.RAW_ATTRIBUTE
-    """Deserializes serialized attributes for decryption.
+def _transform_string_value(value):
+    # (memoryview) -> dynamodb_types.STRING
+    """Transforms a serialized string value.
 
-    :param bytes serialized_attribute: Serialized attribute bytes
-    :returns: Deserialized attribute
+    :param memoryview value: Raw deserialized value
+    :rtype: dynamodb_encryption_sdk.internal.dynamodb_types.STRING
+    """
+    return value.tobytes().decode(TEXT_ENCODING)
+
+
+def _transform_number_value(value):
+    # (memoryview) -> dynamodb_types.STRING
+    """Transforms a serialized number value.
+
+    :param memoryview value: Raw deserialized value
+    :rtype: dynamodb_encryption_sdk.internal.dynamodb_types.STRING
+    """
+    raw_value = value.tobytes().decode(TEXT_ENCODING)
+    decimal_value = Decimal(to_str(raw_value)).normalize()
+    return "{0:f}".format(decimal_value)
+
+
+def _deserialize_binary(cursor):
+    # type: (ByteCursor) -> Dict[Text, bytes]
+    """Deserializes a binary object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_BINARY: _transform_binary_value(cursor.decode_value())}
+
+
+def _deserialize_string(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.STRING]
+    """Deserializes a string object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_STRING: _transform_string_value(cursor.decode_value())}
+
+
+def _deserialize_number(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.STRING]
+    """Deserializes a number object.
+
+    :param ByteCursor cursor: Cursor over serialized object
     :rtype: dict
     """
+    return {_NUMBER: _transform_number_value(cursor.decode_value())}
+
+
+def _deserialize_boolean(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.BOOLEAN]
+    """Deserializes a boolean object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_BOOLEAN: _BOOLEAN_MAP[cursor.decode_byte()]}
+
+
+def _deserialize_null(cursor):  # we want a consistent API but don't use cursor, so pylint: disable=unused-argument
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.BOOLEAN]
+    """Deserializes a null object.
 
-    def _transform_binary_value(value):
-        # (bytes) -> bytes
-        """Transforms a serialized binary value.
-
-        :param bytes value: Raw deserialized value
-        :rtype: bytes
-        """
-        if isinstance(value, Binary):
-            return value.value
-        return value
-
-    def _deserialize_binary(stream):
-        # type: (io.BytesIO) -> Dict[Text, bytes]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a binary object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        value = decode_value(stream)
-        return {Tag.BINARY.dynamodb_tag: _transform_binary_value(value)}
-
-    def _transform_string_value(value):
-        # (bytes) -> dynamodb_types.STRING
-        """Transforms a serialized string value.
-
-        :param bytes value: Raw deserialized value
-        :rtype: dynamodb_encryption_sdk.internal.dynamodb_types.STRING
-        """
-        return codecs.decode(value, TEXT_ENCODING)
-
-    def _deserialize_string(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.STRING]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a string object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        value = decode_value(stream)
-        return {Tag.STRING.dynamodb_tag: _transform_string_value(value)}
-
-    def _transform_number_value(value):
-        # (bytes) -> dynamodb_types.STRING
-        """Transforms a serialized number value.
-
-        :param bytes value: Raw deserialized value
-        :rtype: dynamodb_encryption_sdk.internal.dynamodb_types.STRING
-        """
-        raw_value = codecs.decode(value, TEXT_ENCODING)
-        decimal_value = Decimal(to_str(raw_value)).normalize()
-        return "{0:f}".format(decimal_value)
-
-    def _deserialize_number(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.STRING]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a number object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        value = decode_value(stream)
-        return {Tag.NUMBER.dynamodb_tag: _transform_number_value(value)}
-
-    _boolean_map = {TagValues.FALSE.value: False, TagValues.TRUE.value: True}
-
-    def _deserialize_boolean(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.BOOLEAN]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a boolean object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        value = decode_byte(stream)
-        return {Tag.BOOLEAN.dynamodb_tag: _boolean_map[value]}
-
-    def _deserialize_null(stream):  # we want a consistent API but don't use stream, so pylint: disable=unused-argument
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.BOOLEAN]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a null object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        return {Tag.NULL.dynamodb_tag: True}
-
-    def _deserialize_set(stream, member_transform):
-        # type: (io.BytesIO, Callable) -> List[Union[dynamodb_types.BINARY, dynamodb_types.STRING]]
-        """Deserializes contents of serialized set.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: list
-        """
-        member_count = decode_length(stream)
-        return sorted([member_transform(decode_value(stream)) for _ in range(member_count)])
-
-    def _deserialize_binary_set(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.SET[dynamodb_types.BINARY]]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a binary set object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        return {Tag.BINARY_SET.dynamodb_tag: _deserialize_set(stream, _transform_binary_value)}
-
-    def _deserialize_string_set(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.SET[dynamodb_types.STRING]]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a string set object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        return {Tag.STRING_SET.dynamodb_tag: _deserialize_set(stream, _transform_string_value)}
-
-    def _deserialize_number_set(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.SET[dynamodb_types.STRING]]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a number set object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        return {Tag.NUMBER_SET.dynamodb_tag: _deserialize_set(stream, _transform_number_value)}
-
-    def _deserialize_list(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.LIST]
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """Deserializes a list object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        member_count = decode_length(stream)
-        return {Tag.LIST.dynamodb_tag: [_deserialize(stream) for _ in range(member_count)]}
-
-    def _deserialize_map(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.MAP]
-        """Deserializes a map object.
-
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        # for some reason pylint can't follow the Enum member attributes
-        member_count = decode_length(stream)
-        members = {}  # type: dynamodb_types.MAP
-        for _ in range(member_count):
-            key = _deserialize(stream)
-            if Tag.STRING.dynamodb_tag not in key:  # pylint: disable=no-member
-                raise DeserializationError(
-                    'Malformed serialized map: found "{}" as map key.'.format(list(key.keys())[0])
-                )
-
-            value = _deserialize(stream)
-            members[key[Tag.STRING.dynamodb_tag]] = value  # pylint: disable=no-member
-
-        return {Tag.MAP.dynamodb_tag: members}  # pylint: disable=no-member
-
-    def _deserialize_function(tag):
-        # type: (bytes) -> Callable
-        """Identifies the correct deserialization function based on the provided tag.
-
-        :param tag: Identifying tag, read from start of serialized object
-        :type tag: dynamodb_encryption_sdk.internal.identifiers.Tag
-        :rtype: callable
-        """
-        # for some reason pylint can't follow the Enum member attributes
-        deserialize_functions = {
-            Tag.BINARY.tag: _deserialize_binary,  # pylint: disable=no-member
-            Tag.BINARY_SET.tag: _deserialize_binary_set,  # pylint: disable=no-member
-            Tag.NUMBER.tag: _deserialize_number,  # pylint: disable=no-member
-            Tag.NUMBER_SET.tag: _deserialize_number_set,  # pylint: disable=no-member
-            Tag.STRING.tag: _deserialize_string,  # pylint: disable=no-member
-            Tag.STRING_SET.tag: _deserialize_string_set,  # pylint: disable=no-member
-            Tag.BOOLEAN.tag: _deserialize_boolean,  # pylint: disable=no-member
-            Tag.NULL.tag: _deserialize_null,  # pylint: disable=no-member
-            Tag.LIST.tag: _deserialize_list,  # pylint: disable=no-member
-            Tag.MAP.tag: _deserialize_map,  # pylint: disable=no-member
-        }
-        try:
-            return deserialize_functions[tag]
-        except KeyError:
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_NULL: True}
+
+
+def _deserialize_set(cursor, member_transform):
+    # type: (ByteCursor, Callable) -> List[Union[dynamodb_types.BINARY, dynamodb_types.STRING]]
+    """Deserializes contents of serialized set.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: list
+    """
+    member_count = cursor.decode_length()
+    return sorted([member_transform(cursor.decode_value()) for _ in range(member_count)])
+
+
+def _deserialize_binary_set(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.SET[dynamodb_types.BINARY]]
+    """Deserializes a binary set object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_BINARY_SET: _deserialize_set(cursor, _transform_binary_value)}
+
+
+def _deserialize_string_set(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.SET[dynamodb_types.STRING]]
+    """Deserializes a string set object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_STRING_SET: _deserialize_set(cursor, _transform_string_value)}
+
+
+def _deserialize_number_set(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.SET[dynamodb_types.STRING]]
+    """Deserializes a number set object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    return {_NUMBER_SET: _deserialize_set(cursor, _transform_number_value)}
+
+
+class _Container(object):
+    # pylint: disable=too-few-public-methods
+    """List or map that is being filled as its members are deserialized.
+
+    :param dict attribute: Deserialized list or map attribute
+    :param members: List or map members from ``attribute``
+    :type members: list or dict
+    :param int remaining: Number of members still to be deserialized
+    """
+
+    __slots__ = ("attribute", "members", "remaining")
+
+    def __init__(self, attribute, members, remaining):
+        # type: (dynamodb_types.RAW_ATTRIBUTE, Union[dynamodb_types.LIST, dynamodb_types.MAP], int) -> None
+        """Prepare a container."""
+        self.attribute = attribute
+        self.members = members
+        self.remaining = remaining
+
+
+def _open_list(cursor):
+    # type: (ByteCursor) -> _Container
+    """Deserializes the header of a list object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: _Container
+    """
+    members = []  # type: dynamodb_types.LIST
+    return _Container({_LIST: members}, members, cursor.decode_length())
+
+
+def _open_map(cursor):
+    # type: (ByteCursor) -> _Container
+    """Deserializes the header of a map object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: _Container
+    """
+    members = {}  # type: dynamodb_types.MAP
+    return _Container({_MAP: members}, members, cursor.decode_length())
+
+
+# for some reason pylint can't follow the Enum member attributes
+_DESERIALIZERS = {
+    Tag.BINARY.tag: _deserialize_binary,  # pylint: disable=no-member
+    Tag.BINARY_SET.tag: _deserialize_binary_set,  # pylint: disable=no-member
+    Tag.NUMBER.tag: _deserialize_number,  # pylint: disable=no-member
+    Tag.NUMBER_SET.tag: _deserialize_number_set,  # pylint: disable=no-member
+    Tag.STRING.tag: _deserialize_string,  # pylint: disable=no-member
+    Tag.STRING_SET.tag: _deserialize_string_set,  # pylint: disable=no-member
+    Tag.BOOLEAN.tag: _deserialize_boolean,  # pylint: disable=no-member
+    Tag.NULL.tag: _deserialize_null,  # pylint: disable=no-member
+}  # type: Dict[bytes, Callable[[ByteCursor], dynamodb_types.RAW_ATTRIBUTE]]
+_CONTAINER_OPENERS = {
+    Tag.LIST.tag: _open_list,  # pylint: disable=no-member
+    Tag.MAP.tag: _open_map,  # pylint: disable=no-member
+}  # type: Dict[bytes, Callable[[ByteCursor], _Container]]
+_STRING_TAG = Tag.STRING.tag  # pylint: disable=no-member
+_DYNAMODB_TAGS = {tag.tag: tag.dynamodb_tag for tag in Tag}
+
+
+def _open_container(cursor, tag):
+    # type: (ByteCursor, bytes) -> _Container
+    """Deserializes the header of a list or map object.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :param bytes tag: Tag that was read for the object
+    :rtype: _Container
+    :raises DeserializationError: if tag is not a known tag
+    """
+    try:
+        open_function = _CONTAINER_OPENERS[tag]
+    except KeyError:
+        raise DeserializationError('Unsupported tag: "{}"'.format(tag))
+    return open_function(cursor)
+
+
+def _map_key(cursor):
+    # type: (ByteCursor) -> Text
+    """Deserializes a map key.
+
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: str
+    :raises DeserializationError: if the key is not a string
+    """
+    tag = cursor.decode_tag()
+    if tag != _STRING_TAG:
+        if tag not in _DYNAMODB_TAGS:
             raise DeserializationError('Unsupported tag: "{}"'.format(tag))
+        raise DeserializationError('Malformed serialized map: found "{}" as map key.'.format(_DYNAMODB_TAGS[tag]))
+    return _transform_string_value(cursor.decode_value())
+
 
-    def _deserialize(stream):
-        # type: (io.BytesIO) -> Dict[Text, dynamodb_types.RAW_ATTRIBUTE]
-        """Deserializes a serialized object.
+def _deserialize(cursor):
+    # type: (ByteCursor) -> Dict[Text, dynamodb_types.RAW_ATTRIBUTE]
+    """Deserializes a serialized object.
 
-        :param stream: Stream containing serialized object
-        :type stream: io.BytesIO
-        :rtype: dict
-        """
-        try:
-            tag = decode_tag(stream)
-            return _deserialize_function(tag)(stream)
-        except struct.error:
-            raise DeserializationError("Malformed serialized data")
+    Lists and maps are filled from an explicit stack of open containers rather than by recursion,
+    so deeply nested documents do not run into the recursion limit.
 
+    :param ByteCursor cursor: Cursor over serialized object
+    :rtype: dict
+    """
+    tag = cursor.decode_tag()
+    deserialize_function = _DESERIALIZERS.get(tag)
+    if deserialize_function is not None:
+        return deserialize_function(cursor)
+
+    root = _open_container(cursor, tag)
+    stack = [root]
+    while stack:
+        container = stack[-1]
+        members = container.members
+        is_map = isinstance(members, dict)
+        while container.remaining:
+            key = _map_key(cursor) if is_map else None
+            tag = cursor.decode_tag()
+            container.remaining -= 1
+            deserialize_function = _DESERIALIZERS.get(tag)
+            if deserialize_function is not None:
+                attribute = deserialize_function(cursor)
+            else:
+                child = _open_container(cursor, tag)
+                attribute = child.attribute
+
+            if is_map:
+                members[key] = attribute
+            else:
+                members.append(attribute)
+
+            if deserialize_function is None and child.remaining:
+                # Fill the child before returning to the rest of this container's members.
+                stack.append(child)
+                break
+        else:
+            stack.pop()
+
+    return root.attribute
+
+
+def deserialize_attribute(serialized_attribute):
+    # type: (bytes) -> dynamodb_types.RAW_ATTRIBUTE
+    """Deserializes serialized attributes for decryption.
+
+    The serialized data is read through a :class:`memoryview`, so each value is copied
+    only once, when it is materialized in the deserialized attribute.
+
+    :param bytes serialized_attribute: Serialized attribute bytes
+    :returns: Deserialized attribute
+    :rtype: dict
+    """
     if not serialized_attribute:
         raise DeserializationError("Empty serialized attribute data")
 
-    stream = io.BytesIO(serialized_attribute)
-    return _deserialize(stream)
+    try:
+        return _deserialize(ByteCursor(serialized_attribute))
+    except struct.error:
+        raise DeserializationError("Malformed serialized data")
@@ -16,20 +16,22 @@
     No guarantee is provided on the modules and APIs within this
     namespace staying consistent. Directly reference at your own risk.
 """
+
 import io
 import logging
 import struct
 
 from dynamodb_encryption_sdk.exceptions import InvalidMaterialDescriptionError, InvalidMaterialDescriptionVersionError
 from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
-from dynamodb_encryption_sdk.internal.identifiers import Tag
+from dynamodb_encryption_sdk.internal.identifiers import MaterialDescriptionKeys, Tag
 from dynamodb_encryption_sdk.internal.str_ops import to_bytes, to_str
+from dynamodb_encryption_sdk.material_providers.most_recent import BasicCache
 
 from .deserialize import decode_value, unpack_value
 from .serialize import encode_value
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Text  # noqa pylint: disable=unused-import
+    from typing import Dict, Iterable, List, Text, Tuple, Union  # noqa pylint: disable=unused-import
 
     from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
@@ -40,36 +42,157 @@ except ImportError:  # pragma: no cover
 __all__ = ("serialize", "deserialize")
 _LOGGER = logging.getLogger(LOGGER_NAME)
 _MATERIAL_DESCRIPTION_VERSION = b"\00" * 4
+# Entries that usually differ between one set of materials and the next, even when
+# every other entry in the material description is the same.
+_VARIABLE_ENTRIES = frozenset((MaterialDescriptionKeys.WRAPPED_DATA_KEY.value,))
+_MAX_CACHED_TEMPLATES = 64
+_MAX_CACHED_DESCRIPTIONS = 256
+# Serialization templates, keyed by the constant entries and the names of the variable entries.
+_TEMPLATES = BasicCache(_MAX_CACHED_TEMPLATES)
+# Deserialized material descriptions, keyed by the raw serialized material description.
+_DESCRIPTIONS = BasicCache(_MAX_CACHED_DESCRIPTIONS)
+
+
+class _ReadOnlyMaterialDescription(dict):
+    """Deserialized material description that can be shared between items because it cannot be modified.
+
+    :meth:`copy` returns a modifiable ``dict``.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        """Refuse to modify the material description.
+
+        :raises TypeError: always
+        """
+        raise TypeError("Deserialized material descriptions cannot be modified")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        """Copy and pickle as a plain ``dict``."""
+        return dict, (dict(self),)
+
+
+def _encode_entry(name, value):
+    # type: (Text, Text) -> bytes
+    """Serialize a single material description entry.
+
+    :param str name: Entry name
+    :param str value: Entry value
+    :returns: Serialized name and value
+    :rtype: bytes
+    :raises InvalidMaterialDescriptionError: if name or value is invalid
+    """
+    try:
+        return encode_value(to_bytes(name)) + encode_value(to_bytes(value))
+    except (TypeError, struct.error):
+        raise InvalidMaterialDescriptionError(
+            'Invalid name or value in material description: "{name}"="{value}"'.format(name=name, value=value)
+        )
+
+
+class _Template(object):
+    # pylint: disable=too-few-public-methods
+    """Serialized material description with the constant entries already encoded.
+
+    Serializing a material description only encodes the variable entries and splices
+    them in between the pre-encoded constant entries.
+
+    :param dict constant_entries: Entries that are encoded into the template
+    :param variable_names: Names of entries that are encoded on every use
+    """
+
+    __slots__ = ("_segments",)
+
+    def __init__(self, constant_entries, variable_names):
+        # type: (Dict[Text, Text], Iterable[Text]) -> None
+        """Encode the constant entries."""
+        # Encoded runs of constant entries alternate with the names of variable entries.
+        segments = []  # type: List[Union[bytes, Text]]
+        constant_bytes = bytearray(_MATERIAL_DESCRIPTION_VERSION)
+        for name in sorted(list(constant_entries) + list(variable_names)):
+            if name in constant_entries:
+                constant_bytes.extend(_encode_entry(name, constant_entries[name]))
+            else:
+                segments.append(bytes(constant_bytes))
+                segments.append(name)
+                constant_bytes = bytearray()
+        segments.append(bytes(constant_bytes))
+        self._segments = segments
+
+    def serialize(self, material_description):
+        # type: (Dict[Text, Text]) -> bytes
+        """Serialize a material description that matches this template.
+
+        :param dict material_description: Material description dictionary
+        :returns: Serialized material description
+        :rtype: bytes
+        """
+        segments = self._segments
+        material_description_bytes = bytearray(segments[0])
+        for index in range(1, len(segments), 2):
+            name = segments[index]
+            material_description_bytes.extend(_encode_entry(name, material_description[name]))
+            material_description_bytes.extend(segments[index + 1])
+        return bytes(material_description_bytes)
+
+
+def _template(material_description):
+    # type: (Dict[Text, Text]) -> _Template
+    """Find or build the serialization template for a material description.
+
+    :param dict material_description: Material description dictionary
+    :rtype: _Template
+    :raises InvalidMaterialDescriptionError: if invalid name or value found in material description
+    """
+    constant_entries = []  # type: List[Tuple[Text, Text]]
+    variable_names = []  # type: List[Text]
+    for name, value in material_description.items():
+        if name in _VARIABLE_ENTRIES:
+            variable_names.append(name)
+        else:
+            constant_entries.append((name, value))
+    constant_entries.sort(key=lambda x: x[0])
+    key = (tuple(constant_entries), tuple(sorted(variable_names)))
+
+    try:
+        return _TEMPLATES.get(key)
+    except KeyError:
+        template = _Template(dict(constant_entries), variable_names)
+        _TEMPLATES.put(key, template)
+        return template
+    except TypeError:
+        # Unhashable values are never valid, so let the template report them.
+        return _Template(dict(constant_entries), variable_names)
 
 
 def serialize(material_description):
     # type: (Dict[Text, Text]) -> dynamodb_types.BINARY_ATTRIBUTE
     """Serialize a material description dictionary into a DynamodDB attribute.
 
+    Material descriptions that share all of their entries other than the wrapped data key
+    share a template, so only the wrapped data key is encoded for each item.
+
     :param dict material_description: Material description dictionary
     :returns: Serialized material description as a DynamoDB binary attribute value
     :rtype: dict
     :raises InvalidMaterialDescriptionError: if invalid name or value found in material description
     """
-    material_description_bytes = bytearray(_MATERIAL_DESCRIPTION_VERSION)
-
-    for name, value in sorted(material_description.items(), key=lambda x: x[0]):
-        try:
-            material_description_bytes.extend(encode_value(to_bytes(name)))
-            material_description_bytes.extend(encode_value(to_bytes(value)))
-        except (TypeError, struct.error):
-            raise InvalidMaterialDescriptionError(
-                'Invalid name or value in material description: "{name}"="{value}"'.format(name=name, value=value)
-            )
-
+    material_description_bytes = _template(material_description).serialize(material_description)
     # for some reason pylint can't follow the Enum member attributes
-    return {Tag.BINARY.dynamodb_tag: bytes(material_description_bytes)}  # pylint: disable=no-member
+    return {Tag.BINARY.dynamodb_tag: material_description_bytes}  # pylint: disable=no-member
 
 
 def deserialize(serialized_material_description):
     # type: (dynamodb_types.BINARY_ATTRIBUTE) -> Dict[Text, Text]
     """Deserialize a serialized material description attribute into a material description dictionary.
 
+    Recently deserialized material descriptions are remembered, and the same read-only
+    dictionary is returned for every item that carries the same serialized material description.
+    Use ``copy()`` to get a dictionary that can be modified.
+
     :param dict serialized_material_description: DynamoDB attribute value containing serialized material description.
     :returns: Material description dictionary
     :rtype: dict
@@ -88,6 +211,14 @@ def deserialize(serialized_material_description):
         message = "Invalid material description"
         _LOGGER.exception(message)
         raise InvalidMaterialDescriptionError(message)
+
+    cacheable = isinstance(_raw_material_description, bytes)
+    if cacheable:
+        try:
+            return _DESCRIPTIONS.get(_raw_material_description)
+        except KeyError:
+            pass
+
     # We don't currently do anything with the version, but do check to make sure it is the one we know about.
     _read_version(material_description_bytes)
 
@@ -101,7 +232,11 @@ def deserialize(serialized_material_description):
         message = "Invalid material description"
         _LOGGER.exception(message)
         raise InvalidMaterialDescriptionError(message)
-    return material_description
+
+    read_only_material_description = _ReadOnlyMaterialDescription(material_description)
+    if cacheable:
+        _DESCRIPTIONS.put(_raw_material_description, read_only_material_description)
+    return read_only_material_description
 
 
 def _read_version(material_description_bytes):
@@ -25,6 +25,7 @@ except ImportError:  # pragma: no cover
     pass
 
 __all__ = ("encode_length", "encode_value")
+_LENGTH = struct.Struct(">I")
 
 
 def encode_length(attribute):
@@ -35,7 +36,7 @@ def encode_length(attribute):
     :returns: Encoded value
     :rtype: bytes
     """
-    return struct.pack(">I", len(attribute))
+    return _LENGTH.pack(len(attribute))
 
 
 def encode_value(value):
@@ -47,4 +48,4 @@ def encode_value(value):
     :returns: Length-Value encoded value
     :rtype: bytes
     """
-    return struct.pack(">I{attr_len:d}s".format(attr_len=len(value)), len(value), value)
+    return _LENGTH.pack(len(value)) + value
@@ -16,19 +16,20 @@
     No guarantee is provided on the modules and APIs within this
     namespace staying consistent. Directly reference at your own risk.
 """
-import io
+
 import logging
+import struct
 
+import six
 from boto3.dynamodb.types import DYNAMODB_CONTEXT, Binary
 
 from dynamodb_encryption_sdk.exceptions import SerializationError
 from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
-from dynamodb_encryption_sdk.internal.formatting.serialize import encode_length, encode_value
 from dynamodb_encryption_sdk.internal.identifiers import Tag, TagValues
 from dynamodb_encryption_sdk.internal.str_ops import to_bytes
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Callable  # noqa pylint: disable=unused-import
+    from typing import Callable, Dict, Iterator, Optional, Text, Tuple  # noqa pylint: disable=unused-import
 
     from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import,ungrouped-imports
 except ImportError:  # pragma: no cover
@@ -39,6 +40,25 @@ except ImportError:  # pragma: no cover
 __all__ = ("serialize_attribute",)
 _LOGGER = logging.getLogger(LOGGER_NAME)
 _RESERVED = b"\x00"
+_pack_length = struct.Struct(">I").pack
+# for some reason pylint can't follow the Enum member attributes
+_BINARY_PREFIX = _RESERVED + Tag.BINARY.tag  # pylint: disable=no-member
+_BINARY_SET_PREFIX = _RESERVED + Tag.BINARY_SET.tag  # pylint: disable=no-member
+_NUMBER_PREFIX = _RESERVED + Tag.NUMBER.tag  # pylint: disable=no-member
+_NUMBER_SET_PREFIX = _RESERVED + Tag.NUMBER_SET.tag  # pylint: disable=no-member
+_STRING_PREFIX = _RESERVED + Tag.STRING.tag  # pylint: disable=no-member
+_STRING_SET_PREFIX = _RESERVED + Tag.STRING_SET.tag  # pylint: disable=no-member
+_TRUE = _RESERVED + Tag.BOOLEAN.tag + TagValues.TRUE.value  # pylint: disable=no-member
+_FALSE = _RESERVED + Tag.BOOLEAN.tag + TagValues.FALSE.value  # pylint: disable=no-member
+_NULL = _RESERVED + Tag.NULL.tag  # pylint: disable=no-member
+_LIST_PREFIX = _RESERVED + Tag.LIST.tag  # pylint: disable=no-member
+_MAP_PREFIX = _RESERVED + Tag.MAP.tag  # pylint: disable=no-member
+_DIGITS = "0123456789"
+# Decimal.normalize rounds to the precision of the default decimal context, so only numbers
+# with no more digits than that can be canonicalized without going through Decimal.
+_MAX_SIMPLE_NUMBER_DIGITS = 28
+_MAX_CACHED_NUMBERS = 4096
+_CANONICAL_NUMBERS = {}  # type: Dict[Text, bytes]
 
 
 def _sorted_key_map(item, transform=to_bytes):
@@ -57,221 +77,257 @@ def _sorted_key_map(item, transform=to_bytes):
     return sorted_items
 
 
-def serialize_attribute(attribute):  # noqa: C901 pylint: disable=too-many-locals
-    # type: (dynamodb_types.RAW_ATTRIBUTE) -> bytes
-    """Serializes a raw attribute to a byte string as defined for the DynamoDB Client-Side Encryption Standard.
+def _transform_binary_value(value):
+    # type: (dynamodb_types.BINARY) -> bytes
+    """
+    :param value: Input value
+    :type value: boto3.dynamodb.types.Binary
+    :returns: bytes value
+    :rtype: bytes
+    """
+    if isinstance(value, Binary):
+        return bytes(value.value)
+    return bytes(value)
 
-    :param dict attribute: Item attribute value
-    :returns: Serialized attribute
+
+def _canonical_simple_number(value):
+    # type: (Text) -> Optional[Text]
+    """Canonicalizes a plain integer or decimal string without going through Decimal.
+
+    :param str value: Input value
+    :returns: Canonical value, or None if value is not a simple number
+    :rtype: str
+    """
+    sign = ""
+    if value[:1] == "-":
+        sign = "-"
+        value = value[1:]
+
+    integer, _point, fraction = value.partition(".")
+    if not (integer or fraction) or len(integer) + len(fraction) > _MAX_SIMPLE_NUMBER_DIGITS:
+        return None
+    # Stripping every digit from both ends leaves nothing only if every character is a digit.
+    if integer.strip(_DIGITS) or fraction.strip(_DIGITS):
+        return None
+
+    integer = integer.lstrip("0") or "0"
+    fraction = fraction.rstrip("0")
+    if fraction:
+        return "{}{}.{}".format(sign, integer, fraction)
+    return sign + integer
+
+
+def _transform_number_value(value):
+    # type: (str) -> bytes
+    """Canonicalizes a number, skipping Decimal for simple numbers and memoizing the results.
+
+    :param value: Input value
+    :type value: numbers.Number
+    :returns: bytes value
     :rtype: bytes
     """
+    if not isinstance(value, six.string_types):
+        return _transform_decimal_value(value)
+
+    try:
+        return _CANONICAL_NUMBERS[value]
+    except KeyError:
+        simple_value = _canonical_simple_number(value)
+        if simple_value is None:
+            canonical_value = _transform_decimal_value(value)
+        else:
+            canonical_value = simple_value.encode("utf-8")
+        if len(_CANONICAL_NUMBERS) < _MAX_CACHED_NUMBERS:
+            _CANONICAL_NUMBERS[value] = canonical_value
+        return canonical_value
+
+
+def _transform_decimal_value(value):
+    # type: (str) -> bytes
+    """Canonicalizes a number through Decimal.
+
+    :param value: Input value
+    :type value: numbers.Number
+    :returns: bytes value
+    :rtype: bytes
+    """
+    # At this point we are receiving values which have already been transformed
+    # by dynamodb.TypeSerializer, so all numbers are str. However, TypeSerializer
+    # leaves trailing zeros if they are defined in the Decimal call, but we need to
+    # strip all trailing zeros.
+    decimal_value = DYNAMODB_CONTEXT.create_decimal(value).normalize()
+    return "{0:f}".format(decimal_value).encode("utf-8")
+
+
+def _write_value(output, value):
+    # type: (bytearray, bytes) -> None
+    """Writes a value to the output in Length-Value format.
+
+    :param bytearray output: Output buffer
+    :param bytes value: Value to write
+    """
+    output.extend(_pack_length(len(value)))
+    output.extend(value)
+
+
+def _serialize_binary(output, _attribute):
+    # type: (bytearray, dynamodb_types.BINARY) -> None
+    """
+    :param bytearray output: Output buffer
+    :param _attribute: Attribute to serialize
+    :type _attribute: boto3.dynamodb.types.Binary
+    """
+    output.extend(_BINARY_PREFIX)
+    _write_value(output, _transform_binary_value(_attribute))
+
+
+def _serialize_number(output, _attribute):
+    # type: (bytearray, str) -> None
+    """
+    :param bytearray output: Output buffer
+    :param _attribute: Attribute to serialize
+    :type _attribute: numbers.Number
+    """
+    output.extend(_NUMBER_PREFIX)
+    _write_value(output, _transform_number_value(_attribute))
+
+
+def _serialize_string(output, _attribute):
+    # type: (bytearray, dynamodb_types.STRING) -> None
+    """
+    :param bytearray output: Output buffer
+    :param _attribute: Attribute to serialize
+    :type _attribute: six.string_types
+    """
+    output.extend(_STRING_PREFIX)
+    _write_value(output, to_bytes(_attribute))
+
+
+def _serialize_boolean(output, _attribute):
+    # type: (bytearray, dynamodb_types.BOOLEAN) -> None
+    """
+    :param bytearray output: Output buffer
+    :param bool _attribute: Attribute to serialize
+    """
+    output.extend(_TRUE if _attribute else _FALSE)
+
+
+def _serialize_null(output, _attribute):  # we want a consistent API but don't use _attribute
+    # type: (bytearray, dynamodb_types.NULL) -> None
+    # pylint: disable=unused-argument
+    """
+    :param bytearray output: Output buffer
+    :param _attribute: Attribute to serialize
+    :type _attribute: types.NoneType
+    """
+    output.extend(_NULL)
+
+
+def _serialize_set(output, prefix, _attribute, member_function):
+    # type: (bytearray, bytes, dynamodb_types.SET[dynamodb_types.ATTRIBUTE], Callable) -> None
+    """
+    :param bytearray output: Output buffer
+    :param bytes prefix: Reserved byte and tag identifying this set
+    :param set _attribute: Attribute to serialize
+    :param member_function: Serialization function for members
+    """
+    output.extend(prefix)
+    output.extend(_pack_length(len(_attribute)))
+    for member in sorted([member_function(member) for member in _attribute]):
+        _write_value(output, member)
 
-    def _transform_binary_value(value):
-        # type: (dynamodb_types.BINARY) -> bytes
-        """
-        :param value: Input value
-        :type value: boto3.dynamodb.types.Binary
-        :returns: bytes value
-        :rtype: bytes
-        """
-        if isinstance(value, Binary):
-            return bytes(value.value)
-        return bytes(value)
-
-    def _serialize_binary(_attribute):
-        # type: (dynamodb_types.BINARY) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param _attribute: Attribute to serialize
-        :type _attribute: boto3.dynamodb.types.Binary
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _RESERVED + Tag.BINARY.tag + encode_value(_transform_binary_value(_attribute))
-
-    def _transform_number_value(value):
-        # type: (str) -> bytes
-        """
-        :param value: Input value
-        :type value: numbers.Number
-        :returns: bytes value
-        :rtype: bytes
-        """
-        # At this point we are receiving values which have already been transformed
-        # by dynamodb.TypeSerializer, so all numbers are str. However, TypeSerializer
-        # leaves trailing zeros if they are defined in the Decimal call, but we need to
-        # strip all trailing zeros.
-        decimal_value = DYNAMODB_CONTEXT.create_decimal(value).normalize()
-        return "{0:f}".format(decimal_value).encode("utf-8")
-
-    def _serialize_number(_attribute):
-        # type: (str) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param _attribute: Attribute to serialize
-        :type _attribute: numbers.Number
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _RESERVED + Tag.NUMBER.tag + encode_value(_transform_number_value(_attribute))
-
-    def _transform_string_value(value):
-        # type: (dynamodb_types.STRING) -> bytes
-        """
-        :param value: Input value
-        :type value: bytes or str
-        :returns: bytes value
-        :rtype: bytes
-        """
-        return to_bytes(value)
-
-    def _serialize_string(_attribute):
-        # type: (dynamodb_types.STRING) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param _attribute: Attribute to serialize
-        :type _attribute: six.string_types
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _RESERVED + Tag.STRING.tag + encode_value(_transform_string_value(_attribute))
-
-    def _serialize_boolean(_attribute):
-        # type: (dynamodb_types.BOOLEAN) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param bool _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        _attribute_value = TagValues.TRUE.value if _attribute else TagValues.FALSE.value
-        return _RESERVED + Tag.BOOLEAN.tag + _attribute_value
-
-    def _serialize_null(_attribute):
-        # type: (dynamodb_types.NULL) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param _attribute: Attribute to serialize
-        :type _attribute: types.NoneType
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _RESERVED + Tag.NULL.tag
-
-    def _serialize_set(tag, _attribute, member_function):
-        # type: (Tag, dynamodb_types.SET[dynamodb_types.ATTRIBUTE], Callable) -> bytes
-        """
-        :param bytes tag: Tag to identify this set
-        :param set _attribute: Attribute to serialize
-        :param member_function: Serialization function for members
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        serialized_attribute = io.BytesIO()
-        serialized_attribute.write(_RESERVED)
-        serialized_attribute.write(tag.tag)
-        serialized_attribute.write(encode_length(_attribute))
-
-        encoded_members = []
-        for member in _attribute:
-            encoded_members.append(member_function(member))
-        for member in sorted(encoded_members):
-            serialized_attribute.write(encode_value(member))
-
-        return serialized_attribute.getvalue()
-
-    def _serialize_binary_set(_attribute):
-        # type: (dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> bytes
-        """
-        :param set _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _serialize_set(Tag.BINARY_SET, _attribute, _transform_binary_value)
-
-    def _serialize_number_set(_attribute):
-        # type: (dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> bytes
-        """
-        :param set _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _serialize_set(Tag.NUMBER_SET, _attribute, _transform_number_value)
-
-    def _serialize_string_set(_attribute):
-        # type: (dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> bytes
-        """
-        :param set _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        return _serialize_set(Tag.STRING_SET, _attribute, _transform_string_value)
-
-    def _serialize_list(_attribute):
-        # type: (dynamodb_types.LIST) -> bytes
-        # pylint: disable=no-member
-        # for some reason pylint can't follow the Enum member attributes
-        """
-        :param list _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        serialized_attribute = io.BytesIO()
-        serialized_attribute.write(_RESERVED)
-        serialized_attribute.write(Tag.LIST.tag)
-        serialized_attribute.write(encode_length(_attribute))
-        for member in _attribute:
-            serialized_attribute.write(serialize_attribute(member))
-
-        return serialized_attribute.getvalue()
-
-    def _serialize_map(_attribute):
-        # type: (dynamodb_types.MAP) -> bytes
-        """
-        :param list _attribute: Attribute to serialize
-        :returns: Serialized _attribute
-        :rtype: bytes
-        """
-        serialized_attribute = io.BytesIO()
-        serialized_attribute.write(_RESERVED)
-        # for some reason pylint can't follow the Enum member attributes
-        serialized_attribute.write(Tag.MAP.tag)  # pylint: disable=no-member
-        serialized_attribute.write(encode_length(_attribute))
-
-        sorted_items = _sorted_key_map(item=_attribute, transform=_transform_string_value)
-
-        for key, value, _original_key in sorted_items:
-            serialized_attribute.write(_serialize_string(key))
-            serialized_attribute.write(serialize_attribute(value))
-
-        return serialized_attribute.getvalue()
-
-    def _serialize_function(dynamodb_tag):
-        # type: (str) -> Callable[[dynamodb_types.ATTRIBUTE], bytes]
-        """Locates the appropriate serialization function for the specified DynamoDB attribute tag."""
-        # for some reason pylint can't follow the Enum member attributes
-        serialize_functions = {
-            Tag.BINARY.dynamodb_tag: _serialize_binary,  # pylint: disable=no-member
-            Tag.BINARY_SET.dynamodb_tag: _serialize_binary_set,  # pylint: disable=no-member
-            Tag.NUMBER.dynamodb_tag: _serialize_number,  # pylint: disable=no-member
-            Tag.NUMBER_SET.dynamodb_tag: _serialize_number_set,  # pylint: disable=no-member
-            Tag.STRING.dynamodb_tag: _serialize_string,  # pylint: disable=no-member
-            Tag.STRING_SET.dynamodb_tag: _serialize_string_set,  # pylint: disable=no-member
-            Tag.BOOLEAN.dynamodb_tag: _serialize_boolean,  # pylint: disable=no-member
-            Tag.NULL.dynamodb_tag: _serialize_null,  # pylint: disable=no-member
-            Tag.LIST.dynamodb_tag: _serialize_list,  # pylint: disable=no-member
-            Tag.MAP.dynamodb_tag: _serialize_map,  # pylint: disable=no-member
-        }
-        try:
-            return serialize_functions[dynamodb_tag]
-        except KeyError:
-            raise SerializationError('Unsupported DynamoDB data type: "{}"'.format(dynamodb_tag))
 
+def _serialize_binary_set(output, _attribute):
+    # type: (bytearray, dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> None
+    """
+    :param bytearray output: Output buffer
+    :param set _attribute: Attribute to serialize
+    """
+    _serialize_set(output, _BINARY_SET_PREFIX, _attribute, _transform_binary_value)
+
+
+def _serialize_number_set(output, _attribute):
+    # type: (bytearray, dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> None
+    """
+    :param bytearray output: Output buffer
+    :param set _attribute: Attribute to serialize
+    """
+    _serialize_set(output, _NUMBER_SET_PREFIX, _attribute, _transform_number_value)
+
+
+def _serialize_string_set(output, _attribute):
+    # type: (bytearray, dynamodb_types.SET[dynamodb_types.ATTRIBUTE]) -> None
+    """
+    :param bytearray output: Output buffer
+    :param set _attribute: Attribute to serialize
+    """
+    _serialize_set(output, _STRING_SET_PREFIX, _attribute, to_bytes)
+
+
+def _serialize_list(output, _attribute):
+    # type: (bytearray, dynamodb_types.LIST) -> Iterator[dynamodb_types.RAW_ATTRIBUTE]
+    """
+    :param bytearray output: Output buffer
+    :param list _attribute: Attribute to serialize
+    :returns: Members to serialize after the list header
+    :rtype: iterator
+    """
+    output.extend(_LIST_PREFIX)
+    output.extend(_pack_length(len(_attribute)))
+    return iter(_attribute)
+
+
+def _map_members(output, _attribute):
+    # type: (bytearray, dynamodb_types.MAP) -> Iterator[dynamodb_types.RAW_ATTRIBUTE]
+    """Writes each map key to the output buffer just before its value is requested.
+
+    :param bytearray output: Output buffer
+    :param dict _attribute: Attribute to serialize
+    :returns: Map values, in key order
+    :rtype: iterator
+    """
+    for key, value, _original_key in _sorted_key_map(item=_attribute, transform=to_bytes):
+        output.extend(_STRING_PREFIX)
+        _write_value(output, key)
+        yield value
+
+
+def _serialize_map(output, _attribute):
+    # type: (bytearray, dynamodb_types.MAP) -> Iterator[dynamodb_types.RAW_ATTRIBUTE]
+    """
+    :param bytearray output: Output buffer
+    :param dict _attribute: Attribute to serialize
+    :returns: Members to serialize after the map header
+    :rtype: iterator
+    """
+    output.extend(_MAP_PREFIX)
+    output.extend(_pack_length(len(_attribute)))
+    return _map_members(output, _attribute)
+
+
+# for some reason pylint can't follow the Enum member attributes
+_SERIALIZERS = {
+    Tag.BINARY.dynamodb_tag: _serialize_binary,  # pylint: disable=no-member
+    Tag.BINARY_SET.dynamodb_tag: _serialize_binary_set,  # pylint: disable=no-member
+    Tag.NUMBER.dynamodb_tag: _serialize_number,  # pylint: disable=no-member
+    Tag.NUMBER_SET.dynamodb_tag: _serialize_number_set,  # pylint: disable=no-member
+    Tag.STRING.dynamodb_tag: _serialize_string,  # pylint: disable=no-member
+    Tag.STRING_SET.dynamodb_tag: _serialize_string_set,  # pylint: disable=no-member
+    Tag.BOOLEAN.dynamodb_tag: _serialize_boolean,  # pylint: disable=no-member
+    Tag.NULL.dynamodb_tag: _serialize_null,  # pylint: disable=no-member
+    Tag.LIST.dynamodb_tag: _serialize_list,  # pylint: disable=no-member
+    Tag.MAP.dynamodb_tag: _serialize_map,  # pylint: disable=no-member
+}  # type: Dict[Text, Callable[[bytearray, dynamodb_types.ATTRIBUTE], Optional[Iterator]]]
+
+
+def _serialize_function(attribute):
+    # type: (dynamodb_types.RAW_ATTRIBUTE) -> Tuple[Callable, dynamodb_types.ATTRIBUTE]
+    """Locates the appropriate serialization function for a raw attribute.
+
+    :param dict attribute: Item attribute value
+    :returns: Serialization function and the attribute value to pass to it
+    :rtype: tuple
+    """
     if not isinstance(attribute, dict):
         raise TypeError('Invalid attribute type "{}": must be dict'.format(type(attribute)))
 
@@ -279,5 +335,48 @@ def serialize_attribute(attribute):  # noqa: C901 pylint: disable=too-many-local
         raise SerializationError(
             "cannot serialize attribute: incorrect number of members {} != 1".format(len(attribute))
         )
-    key, value = list(attribute.items())[0]
-    return _serialize_function(key)(value)
+
+    ((key, value),) = attribute.items()
+    try:
+        return _SERIALIZERS[key], value
+    except KeyError:
+        raise SerializationError('Unsupported DynamoDB data type: "{}"'.format(key))
+
+
+def _serialize(output, attribute):
+    # type: (bytearray, dynamodb_types.RAW_ATTRIBUTE) -> None
+    """Serializes a raw attribute into the output buffer.
+
+    Lists and maps are walked with an explicit stack of member iterators rather than by recursion,
+    so deeply nested documents do not run into the recursion limit.
+
+    :param bytearray output: Output buffer
+    :param dict attribute: Item attribute value
+    """
+    stack = [iter((attribute,))]
+    while stack:
+        for member in stack[-1]:
+            serialize_function, value = _serialize_function(member)
+            members = serialize_function(output, value)
+            if members is not None:
+                stack.append(members)
+                break
+        else:
+            stack.pop()
+
+
+def serialize_attribute(attribute):
+    # type: (dynamodb_types.RAW_ATTRIBUTE) -> bytes
+    """Serializes a raw attribute to a byte string as defined for the DynamoDB Client-Side Encryption Standard.
+
+    Members of lists, maps, and sets are written into a single output buffer rather than
+    being serialized separately and copied into their parent, without recursing into
+    nested lists and maps.
+
+    :param dict attribute: Item attribute value
+    :returns: Serialized attribute
+    :rtype: bytes
+    """
+    output = bytearray()
+    _serialize(output, attribute)
+    return bytes(output)
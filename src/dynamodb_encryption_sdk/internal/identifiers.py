@@ -132,3 +132,4 @@ class MaterialDescriptionValues(Enum):
     """Static default values for use when building material descriptions."""
 
     CBC_PKCS5_ATTRIBUTE_ENCRYPTION = "/CBC/PKCS5Padding"
+    GCM_ATTRIBUTE_ENCRYPTION = "/GCM/NoPadding"
@@ -0,0 +1,261 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Segmented scan engine that decrypts scan pages in worker processes.
+
+.. warning::
+    No guarantee is provided on the modules and APIs within this
+    namespace staying consistent. Directly reference at your own risk.
+"""
+
+import collections
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import attr
+
+from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.exceptions import InvalidArgumentError
+from dynamodb_encryption_sdk.internal.utils import decrypt_list_of_items, validate_get_arguments
+from dynamodb_encryption_sdk.internal.validators import callable_validator
+from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Any, Callable, Dict, Iterator, Optional, Text  # noqa pylint: disable=unused-import
+
+    from dynamodb_encryption_sdk.material_providers import (  # noqa pylint: disable=unused-import
+        CryptographicMaterialsProvider,
+    )
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+__all__ = ("ScanWorkerConfig", "parallel_scan")
+
+# Crypto config most recently built in this worker process, keyed by scan token.
+_WORKER_CRYPTO_CONFIG = {}  # type: Dict[Text, CryptoConfig]
+
+
+@attr.s(init=False)
+class ScanWorkerConfig(object):
+    # pylint: disable=too-few-public-methods
+    """Picklable description of everything a worker process needs to decrypt scan pages.
+
+    :param callable materials_provider_factory: Picklable callable that takes no arguments and returns
+        the :class:`CryptographicMaterialsProvider` to use in the worker process
+    :param EncryptionContext encryption_context: Encryption context for the scanned table
+    :param AttributeActions attribute_actions: Description of what action should be taken for each attribute
+    :param callable decrypt_method: Item decryptor from :mod:`dynamodb_encryption_sdk.encrypted.item`
+    :param str token: Unique identifier for the scan that this configuration belongs to
+    """
+
+    materials_provider_factory = attr.ib(validator=callable_validator)
+    encryption_context = attr.ib(validator=attr.validators.instance_of(EncryptionContext))
+    attribute_actions = attr.ib(validator=attr.validators.instance_of(AttributeActions))
+    decrypt_method = attr.ib(validator=callable_validator)
+    token = attr.ib(validator=attr.validators.instance_of(str))
+
+    def __init__(
+        self,
+        materials_provider_factory,  # type: Callable[[], CryptographicMaterialsProvider]
+        encryption_context,  # type: EncryptionContext
+        attribute_actions,  # type: AttributeActions
+        decrypt_method,  # type: Callable
+        token,  # type: str
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self.materials_provider_factory = materials_provider_factory
+        self.encryption_context = encryption_context
+        self.attribute_actions = attribute_actions
+        self.decrypt_method = decrypt_method
+        self.token = token
+        attr.validate(self)
+
+    def crypto_config(self):
+        # type: () -> CryptoConfig
+        """Load the crypto config for this scan, building it only once per worker process.
+
+        :rtype: CryptoConfig
+        """
+        try:
+            return _WORKER_CRYPTO_CONFIG[self.token]
+        except KeyError:
+            crypto_config = CryptoConfig(
+                materials_provider=self.materials_provider_factory(),
+                encryption_context=self.encryption_context,
+                attribute_actions=self.attribute_actions,
+            )
+            # Only keep the configuration for the most recent scan to avoid growing without bound
+            # in long-lived, caller-provided executors.
+            _WORKER_CRYPTO_CONFIG.clear()
+            _WORKER_CRYPTO_CONFIG[self.token] = crypto_config
+            return crypto_config
+
+
+@attr.s(init=False)
+class _FactoryFromProvider(object):
+    # pylint: disable=too-few-public-methods
+    """Picklable materials provider factory that returns a specific materials provider.
+
+    :param CryptographicMaterialsProvider materials_provider: Materials provider to return
+    """
+
+    _materials_provider = attr.ib()
+
+    def __init__(self, materials_provider):  # noqa=D107
+        # type: (CryptographicMaterialsProvider) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._materials_provider = materials_provider
+        attr.validate(self)
+
+    def __call__(self):
+        # type: () -> CryptographicMaterialsProvider
+        """Return the materials provider."""
+        return self._materials_provider
+
+
+def _decrypt_page(worker_config, items):
+    # type: (ScanWorkerConfig, Iterator[Dict]) -> list
+    """Decrypt a page of scanned items inside a worker process.
+
+    :param ScanWorkerConfig worker_config: Worker configuration
+    :param list items: Encrypted items
+    :returns: Plaintext items
+    :rtype: list
+    """
+    return list(
+        decrypt_list_of_items(
+            crypto_config=worker_config.crypto_config(), decrypt_method=worker_config.decrypt_method, items=items
+        )
+    )
+
+
+def _validate_parallel_scan_arguments(kwargs, total_segments, workers, max_pages_in_flight):
+    # type: (Dict[Text, Any], int, int, int) -> None
+    """Verify that the requested parallel scan is sensible.
+
+    :raises InvalidArgumentError: if segmentation is requested in the DynamoDB parameters
+    :raises InvalidArgumentError: if any count is not a positive integer
+    """
+    validate_get_arguments(kwargs)
+
+    for arg in ("Segment", "TotalSegments", "ExclusiveStartKey"):
+        if arg in kwargs:
+            raise InvalidArgumentError('"{}" is not supported for parallel scans'.format(arg))
+
+    for name, value in (
+        ("total_segments", total_segments),
+        ("workers", workers),
+        ("max_pages_in_flight", max_pages_in_flight),
+    ):
+        if value < 1:
+            raise InvalidArgumentError('"{}" must be a positive integer'.format(name))
+
+
+def parallel_scan(  # noqa: C901 pylint: disable=too-many-arguments,too-many-locals
+    decrypt_method,  # type: Callable
+    crypto_config_method,  # type: Callable
+    read_method,  # type: Callable
+    total_segments,  # type: int
+    workers,  # type: int
+    materials_provider_factory=None,  # type: Optional[Callable[[], CryptographicMaterialsProvider]]
+    max_pages_in_flight=None,  # type: Optional[int]
+    executor=None,  # type: Optional[ProcessPoolExecutor]
+    **kwargs  # type: Any
+):
+    # type: (...) -> Iterator[Dict]
+    """Scan all segments of a table concurrently, decrypting each page in a pool of worker processes.
+
+    Segments are scanned in threads in this process. Each page that is read is sent to a worker
+    process to be decrypted, and the plaintext items are yielded as each page finishes decrypting.
+    No more than ``max_pages_in_flight`` pages are being read or decrypted at any one time.
+
+    .. note::
+
+        Items are not returned in any particular order.
+
+    :param callable decrypt_method: Method to use to decrypt items
+    :param callable crypto_config_method: Method that accepts ``kwargs`` and provides a :class:`CryptoConfig`
+    :param callable read_method: Method that scans the table
+    :param int total_segments: Number of segments into which to divide the table
+    :param int workers: Number of worker processes to use if ``executor`` is not provided
+    :param callable materials_provider_factory: Picklable callable that takes no arguments and returns the
+        materials provider that each worker process should use. If not provided, the materials provider from
+        the crypto config is pickled and sent to the workers. (optional)
+    :param int max_pages_in_flight: Maximum number of pages to be reading or decrypting at once
+        (default: twice ``workers``)
+    :param executor: Process pool to use instead of creating one (optional)
+    :type executor: concurrent.futures.ProcessPoolExecutor
+    :param **kwargs: Keyword arguments to pass to ``read_method``
+    :returns: Iterator of plaintext items
+    :raises InvalidArgumentError: if arguments are invalid
+    """
+    if max_pages_in_flight is None:
+        max_pages_in_flight = 2 * workers
+    _validate_parallel_scan_arguments(kwargs, total_segments, workers, max_pages_in_flight)
+
+    crypto_config, ddb_kwargs = crypto_config_method(**kwargs)
+    if materials_provider_factory is None:
+        materials_provider_factory = _FactoryFromProvider(crypto_config.materials_provider)
+    worker_config = ScanWorkerConfig(
+        materials_provider_factory=materials_provider_factory,
+        encryption_context=crypto_config.encryption_context,
+        attribute_actions=crypto_config.attribute_actions,
+        decrypt_method=decrypt_method,
+        token=uuid.uuid4().hex,
+    )
+
+    def _scan_page(segment, start_key):
+        page_kwargs = dict(ddb_kwargs, Segment=segment, TotalSegments=total_segments)
+        if start_key is not None:
+            page_kwargs["ExclusiveStartKey"] = start_key
+        return read_method(**page_kwargs)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    read_executor = ThreadPoolExecutor(max_workers=min(total_segments, max_pages_in_flight))
+
+    # Segments that are ready for their next page to be read, with the key to start that page from.
+    ready_segments = collections.deque((segment, None) for segment in range(total_segments))
+    reads = {}  # type: Dict[Any, int]
+    decrypts = set()
+
+    try:
+        while ready_segments or reads or decrypts:
+            while ready_segments and len(reads) + len(decrypts) < max_pages_in_flight:
+                segment, start_key = ready_segments.popleft()
+                reads[read_executor.submit(_scan_page, segment, start_key)] = segment
+
+            done, _pending = wait(set(reads) | decrypts, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in reads:
+                    segment = reads.pop(future)
+                    response = future.result()
+                    decrypts.add(executor.submit(_decrypt_page, worker_config, response["Items"]))
+                    if "LastEvaluatedKey" in response:
+                        ready_segments.append((segment, response["LastEvaluatedKey"]))
+                else:
+                    decrypts.remove(future)
+                    for item in future.result():
+                        yield item
+    finally:
+        for future in list(reads) + list(decrypts):
+            future.cancel()
+        read_executor.shutdown(wait=True)
+        if own_executor:
+            executor.shutdown(wait=True)
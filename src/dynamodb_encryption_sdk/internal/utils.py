@@ -17,30 +17,58 @@
     namespace staying consistent. Directly reference at your own risk.
 """
 import copy
+from concurrent.futures import Executor, ThreadPoolExecutor  # noqa pylint: disable=unused-import
 from functools import partial
 
 import attr
 import botocore.client
 
 from dynamodb_encryption_sdk.encrypted import CryptoConfig
-from dynamodb_encryption_sdk.encrypted.item import decrypt_python_item, encrypt_python_item
+from dynamodb_encryption_sdk.encrypted.item import (
+    _decrypt_python_item_with_context,
+    _encrypt_python_item_with_context,
+    decrypt_dynamodb_item,
+    decrypt_python_item,
+    encrypt_python_item,
+)
 from dynamodb_encryption_sdk.exceptions import InvalidArgumentError
-from dynamodb_encryption_sdk.structures import CryptoAction, EncryptionContext, TableInfo
+from dynamodb_encryption_sdk.internal.action_plan import (  # noqa pylint: disable=unused-import
+    AttributeActionPlan,
+    AttributeActionPlanCache,
+)
+from dynamodb_encryption_sdk.structures import (  # noqa pylint: disable=unused-import
+    AttributeActions,
+    CryptoAction,
+    EncryptionContext,
+    TableInfo,
+)
 from dynamodb_encryption_sdk.transform import dict_to_ddb
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Any, Bool, Callable, Dict, Iterable, Text  # noqa pylint: disable=unused-import
+    from typing import (  # noqa pylint: disable=unused-import
+        Any,
+        Bool,
+        Callable,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Text,
+    )
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
 
 __all__ = (
     "TableInfoCache",
+    "decrypt_executor",
     "crypto_config_from_kwargs",
     "crypto_config_from_table_info",
     "crypto_config_from_cache",
     "decrypt_get_item",
     "decrypt_multi_get",
+    "iter_decrypt_multi_get",
     "decrypt_list_of_items",
     "decrypt_batch_get_item",
     "encrypt_put_item",
@@ -74,8 +102,11 @@ class TableInfoCache(object):
         self.__attrs_post_init__()
 
     def __attrs_post_init__(self):
-        """Set up the empty cache."""
+        """Set up the empty caches."""
         self._all_tables_info = {}  # type: Dict[Text, TableInfo]  # pylint: disable=attribute-defined-outside-init
+        self._attribute_action_plans = (  # attrs confuses pylint: disable=attribute-defined-outside-init
+            AttributeActionPlanCache()
+        )
 
     def table_info(self, table_name):
         """Collect a TableInfo object for the specified table, creating and adding it to
@@ -94,6 +125,43 @@ class TableInfoCache(object):
             self._all_tables_info[table_name] = _table_info
             return _table_info
 
+    def attribute_action_plan(self, attribute_actions, table_info):
+        # type: (AttributeActions, TableInfo) -> AttributeActionPlan
+        """Collect the compiled attribute actions to use for the specified table.
+
+        :param AttributeActions attribute_actions: Table-level attribute actions
+        :param TableInfo table_info: Information about the table
+        :returns: Attribute action plan for the table
+        :rtype: AttributeActionPlan
+        """
+        return self._attribute_action_plans.plan(attribute_actions, table_info)
+
+
+def decrypt_executor(executor, max_workers):
+    # type: (Optional[Executor], Optional[int]) -> Optional[Executor]
+    """Determine the executor to use to decrypt returned items in parallel.
+
+    :param executor: Caller-provided executor (optional)
+    :type executor: concurrent.futures.Executor
+    :param int max_workers: Number of threads to use if a new executor should be created (optional)
+    :returns: Executor to use, or ``None`` if items should be decrypted serially
+    :rtype: concurrent.futures.Executor
+    :raises InvalidArgumentError: if both ``executor`` and ``max_workers`` are provided
+    :raises InvalidArgumentError: if ``max_workers`` is not a positive integer
+    """
+    if executor is not None:
+        if max_workers is not None:
+            raise InvalidArgumentError('Only one of "executor" or "max_workers" may be provided')
+        return executor
+
+    if max_workers is None:
+        return None
+
+    if max_workers < 1:
+        raise InvalidArgumentError('"max_workers" must be a positive integer')
+
+    return ThreadPoolExecutor(max_workers=max_workers)
+
 
 def validate_get_arguments(kwargs):
     # type: (Dict[Text, Any]) -> None
@@ -152,9 +220,7 @@ def crypto_config_from_cache(materials_provider, attribute_actions, table_info_c
     :rtype: tuple(CryptoConfig, dict)
     """
     table_info = table_info_cache.table_info(table_name)
-
-    attribute_actions = attribute_actions.copy()
-    attribute_actions.set_index_keys(*table_info.protected_index_keys())
+    attribute_actions = table_info_cache.attribute_action_plan(attribute_actions, table_info)
 
     return crypto_config_from_table_info(materials_provider, attribute_actions, table_info)
 
@@ -172,25 +238,64 @@ def _item_transformer(crypto_transformer):
     return lambda x: x
 
 
-def decrypt_list_of_items(crypto_config, decrypt_method, items):
-    # type: (CryptoConfig, Callable, Iterable[Any]) -> Iterable[Any]
+def _transform_item_with_context(crypto_transformer, item, crypto_config):
+    # type: (Callable, Dict, CryptoConfig) -> Dict
+    """Encrypt or decrypt an item with the item attributes added to the encryption context.
+
+    Dictionaries handled by the python item encryptor and decryptor are only converted
+    to DynamoDB JSON once, and that converted item is shared with the encryption context.
+    Items are decrypted without modifying or copying the encrypted item.
+
+    :param callable crypto_transformer: An item encryptor or decryptor function
+    :param dict item: Item to encrypt or decrypt
+    :param CryptoConfig crypto_config: :class:`CryptoConfig` to use
+    :returns: Encrypted or decrypted item
+    :rtype: dict
+    """
+    if crypto_transformer is encrypt_python_item:
+        return _encrypt_python_item_with_context(item=item, crypto_config=crypto_config)
+
+    if crypto_transformer is decrypt_python_item:
+        return _decrypt_python_item_with_context(item=item, crypto_config=crypto_config)
+
+    if crypto_transformer is decrypt_dynamodb_item:
+        # The encrypted item is not used again, so attributes that are not decrypted can be shared with it.
+        return decrypt_dynamodb_item(item=item, crypto_config=crypto_config.with_item(item), copy_attributes=False)
+
+    return crypto_transformer(item=item, crypto_config=crypto_config.with_item(item))
+
+
+def decrypt_list_of_items(crypto_config, decrypt_method, items, executor=None):
+    # type: (CryptoConfig, Callable, Iterable[Any], Optional[Executor]) -> Iterable[Any]
     # narrow this down
     # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
     """Iterate through a list of encrypted items, decrypting each item and yielding the plaintext item.
 
+    If an executor is provided, all items are submitted to it at once and the plaintext items
+    are yielded in the same order as the encrypted items.
+
     :param CryptoConfig crypto_config: :class:`CryptoConfig` to use
     :param callable decrypt_method: Method to use to decrypt items
     :param items: Iterable of encrypted items
+    :param executor: Executor to use to decrypt items in parallel (optional)
+    :type executor: concurrent.futures.Executor
     :return: Iterable of plaintext items
     """
-    for value in items:
-        yield decrypt_method(
-            item=value, crypto_config=crypto_config.with_item(_item_transformer(decrypt_method)(value))
-        )
 
+    def _decrypt_item(value):
+        return _transform_item_with_context(decrypt_method, value, crypto_config)
 
-def decrypt_multi_get(decrypt_method, crypto_config_method, read_method, **kwargs):
-    # type: (Callable, Callable, Callable, **Any) -> Dict
+    if executor is None:
+        for value in items:
+            yield _decrypt_item(value)
+        return
+
+    for plaintext_item in executor.map(_decrypt_item, items):
+        yield plaintext_item
+
+
+def decrypt_multi_get(decrypt_method, crypto_config_method, read_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
     # narrow this down
     # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
     """Transparently decrypt multiple items after getting them from the table with a scan or query method.
@@ -198,6 +303,8 @@ def decrypt_multi_get(decrypt_method, crypto_config_method, read_method, **kwarg
     :param callable decrypt_method: Method to use to decrypt items
     :param callable crypto_config_method: Method that accepts ``kwargs`` and provides a :class:`CryptoConfig`
     :param callable read_method: Method that reads from the table
+    :param executor: Executor to use to decrypt items in parallel (optional)
+    :type executor: concurrent.futures.Executor
     :param **kwargs: Keyword arguments to pass to ``read_method``
     :return: DynamoDB response
     :rtype: dict
@@ -206,11 +313,71 @@ def decrypt_multi_get(decrypt_method, crypto_config_method, read_method, **kwarg
     crypto_config, ddb_kwargs = crypto_config_method(**kwargs)
     response = read_method(**ddb_kwargs)
     response["Items"] = list(
-        decrypt_list_of_items(crypto_config=crypto_config, decrypt_method=decrypt_method, items=response["Items"])
+        decrypt_list_of_items(
+            crypto_config=crypto_config, decrypt_method=decrypt_method, items=response["Items"], executor=executor
+        )
     )
     return response
 
 
+def _drain_items(items):
+    # type: (List[Any]) -> Iterator[Any]
+    """Iterate through a list of items, removing each item from the list as it is returned.
+
+    This allows each item to be released as soon as the caller is done with it.
+
+    :param list items: Items to drain
+    :return: Iterator of items, in order
+    """
+    items.reverse()
+    while items:
+        yield items.pop()
+
+
+def iter_decrypt_multi_get(decrypt_method, crypto_config_method, read_method, **kwargs):
+    # type: (Callable, Callable, Callable, **Any) -> Iterator[Dict]
+    # narrow this down
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
+    """Transparently decrypt items one at a time while following ``LastEvaluatedKey`` through all pages
+    of a scan or query.
+
+    Only a single page of encrypted items is held at once, and each encrypted item is released
+    as soon as it has been decrypted.
+
+    A ``Limit`` applies to the whole iteration rather than to each page: it caps the total number
+    of items evaluated across all pages, just as it caps a single ``query`` or ``scan`` call.
+
+    :param callable decrypt_method: Method to use to decrypt items
+    :param callable crypto_config_method: Method that accepts ``kwargs`` and provides a :class:`CryptoConfig`
+    :param callable read_method: Method that reads from the table
+    :param **kwargs: Keyword arguments to pass to ``read_method``
+    :return: Iterator of plaintext items
+    """
+    validate_get_arguments(kwargs)
+    crypto_config, ddb_kwargs = crypto_config_method(**kwargs)
+    remaining = ddb_kwargs.get("Limit")
+
+    while True:
+        response = read_method(**ddb_kwargs)
+        # Responses contain no items when Select is COUNT
+        items = response.pop("Items", [])
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if remaining is not None:
+            remaining -= response.get("ScannedCount", len(items))
+        del response
+
+        for item in decrypt_list_of_items(
+            crypto_config=crypto_config, decrypt_method=decrypt_method, items=_drain_items(items)
+        ):
+            yield item
+
+        if last_evaluated_key is None or (remaining is not None and remaining <= 0):
+            return
+        ddb_kwargs = dict(ddb_kwargs, ExclusiveStartKey=last_evaluated_key)
+        if remaining is not None:
+            ddb_kwargs["Limit"] = remaining
+
+
 def decrypt_get_item(decrypt_method, crypto_config_method, read_method, **kwargs):
     # type: (Callable, Callable, Callable, **Any) -> Dict
     # narrow this down
@@ -228,15 +395,12 @@ def decrypt_get_item(decrypt_method, crypto_config_method, read_method, **kwargs
     crypto_config, ddb_kwargs = crypto_config_method(**kwargs)
     response = read_method(**ddb_kwargs)
     if "Item" in response:
-        response["Item"] = decrypt_method(
-            item=response["Item"],
-            crypto_config=crypto_config.with_item(_item_transformer(decrypt_method)(response["Item"])),
-        )
+        response["Item"] = _transform_item_with_context(decrypt_method, response["Item"], crypto_config)
     return response
 
 
-def decrypt_batch_get_item(decrypt_method, crypto_config_method, read_method, **kwargs):
-    # type: (Callable, Callable, Callable, **Any) -> Dict
+def decrypt_batch_get_item(decrypt_method, crypto_config_method, read_method, executor=None, **kwargs):
+    # type: (Callable, Callable, Callable, Optional[Executor], **Any) -> Dict
     # narrow this down
     # https://github.com/aws/aws-dynamodb-encryption-python/issues/66
     """Transparently decrypt multiple items after getting them in a batch request.
@@ -244,6 +408,8 @@ def decrypt_batch_get_item(decrypt_method, crypto_config_method, read_method, **
     :param callable decrypt_method: Method to use to decrypt items
     :param callable crypto_config_method: Method that accepts ``kwargs`` and provides a :class:`CryptoConfig`
     :param callable read_method: Method that reads from the table
+    :param executor: Executor to use to decrypt items in parallel (optional)
+    :type executor: concurrent.futures.Executor
     :param **kwargs: Keyword arguments to pass to ``read_method``
     :return: DynamoDB response
     :rtype: dict
@@ -260,10 +426,9 @@ def decrypt_batch_get_item(decrypt_method, crypto_config_method, read_method, **
         else:
             crypto_config = crypto_config_method(table_name=table_name)
 
-        for pos, value in enumerate(items):
-            items[pos] = decrypt_method(
-                item=value, crypto_config=crypto_config.with_item(_item_transformer(decrypt_method)(items[pos]))
-            )
+        items[:] = decrypt_list_of_items(
+            crypto_config=crypto_config, decrypt_method=decrypt_method, items=list(items), executor=executor
+        )
     return response
 
 
@@ -281,10 +446,7 @@ def encrypt_put_item(encrypt_method, crypto_config_method, write_method, **kwarg
     :rtype: dict
     """
     crypto_config, ddb_kwargs = crypto_config_method(**kwargs)
-    ddb_kwargs["Item"] = encrypt_method(
-        item=ddb_kwargs["Item"],
-        crypto_config=crypto_config.with_item(_item_transformer(encrypt_method)(ddb_kwargs["Item"])),
-    )
+    ddb_kwargs["Item"] = _transform_item_with_context(encrypt_method, ddb_kwargs["Item"], crypto_config)
     return write_method(**ddb_kwargs)
 
 
@@ -316,9 +478,8 @@ def encrypt_batch_write_item(encrypt_method, crypto_config_method, write_method,
             for request_type, item in value.items():
                 # We don't encrypt primary indexes, so we can ignore DeleteItem requests
                 if request_type == "PutRequest":
-                    items[pos][request_type]["Item"] = encrypt_method(
-                        item=item["Item"],
-                        crypto_config=crypto_config.with_item(_item_transformer(encrypt_method)(item["Item"])),
+                    items[pos][request_type]["Item"] = _transform_item_with_context(
+                        encrypt_method, item["Item"], crypto_config
                     )
 
     response = write_method(**kwargs)
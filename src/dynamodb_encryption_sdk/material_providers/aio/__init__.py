@@ -0,0 +1,70 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Cryptographic materials providers for use with asyncio.
+
+.. note::
+
+    Requires Python 3.5 or later.
+"""
+from dynamodb_encryption_sdk.materials import CryptographicMaterials  # noqa pylint: disable=unused-import
+from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
+
+from .. import CryptographicMaterialsProvider
+
+__all__ = ("AsyncCryptographicMaterialsProvider",)
+
+
+class AsyncCryptographicMaterialsProvider(CryptographicMaterialsProvider):
+    """Base class for all cryptographic materials providers that must wait on I/O to provide materials.
+
+    Materials are provided by awaiting ``async_decryption_materials`` and ``async_encryption_materials``.
+    These providers can only be used with the helpers in :mod:`dynamodb_encryption_sdk.encrypted.aio`.
+    """
+
+    async def async_decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument,no-self-use
+        """Return decryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no decryption materials are available
+        """
+        raise AttributeError("No decryption materials available")
+
+    async def async_encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument,no-self-use
+        """Return encryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no encryption materials are available
+        """
+        raise AttributeError("No encryption materials available")
+
+    def decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument,no-self-use
+        """Asynchronous materials providers cannot provide materials synchronously.
+
+        :raises AttributeError: always
+        """
+        raise AttributeError("Decryption materials are only available from async_decryption_materials")
+
+    def encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        # pylint: disable=unused-argument,no-self-use
+        """Asynchronous materials providers cannot provide materials synchronously.
+
+        :raises AttributeError: always
+        """
+        raise AttributeError("Encryption materials are only available from async_encryption_materials")
@@ -0,0 +1,194 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Cryptographic materials provider for use with the AWS Key Management Service (KMS) from asyncio.
+
+.. note::
+
+    Requires Python 3.5 or later.
+"""
+import logging
+
+import attr
+import botocore
+import six
+
+from dynamodb_encryption_sdk.exceptions import UnknownRegionError, UnwrappingError, WrappingError
+from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
+from dynamodb_encryption_sdk.internal.validators import dictionary_validator
+from dynamodb_encryption_sdk.material_providers.aws_kms import AwsKmsCryptographicMaterialsProvider, DataKeyPartition
+from dynamodb_encryption_sdk.materials.raw import (  # noqa pylint: disable=unused-import
+    RawDecryptionMaterials,
+    RawEncryptionMaterials,
+)
+from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
+
+from . import AsyncCryptographicMaterialsProvider
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Any, Dict, Optional, Text, Tuple  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+
+__all__ = ("AsyncAwsKmsCryptographicMaterialsProvider",)
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+@attr.s(init=False)
+class AsyncAwsKmsCryptographicMaterialsProvider(
+    AsyncCryptographicMaterialsProvider, AwsKmsCryptographicMaterialsProvider
+):
+    """Cryptographic materials provider for use with the AWS Key Management Service (KMS),
+    awaiting each AWS KMS call on an asynchronous KMS client.
+
+    >>> from aiobotocore.session import get_session
+    >>> from dynamodb_encryption_sdk.material_providers.aio.aws_kms import (
+    ...     AsyncAwsKmsCryptographicMaterialsProvider
+    ... )
+    >>> async with get_session().create_client('kms', region_name='us-west-2') as kms_client:
+    ...     aws_kms_cmp = AsyncAwsKmsCryptographicMaterialsProvider(
+    ...         key_id='arn:aws:kms:us-west-2:111122223333:alias/MyKmsAlias',
+    ...         regional_clients={'us-west-2': kms_client}
+    ...     )
+
+    .. note::
+
+        Clients are never created by this provider. Any client with the boto3 KMS client method
+        shape whose ``generate_data_key`` and ``decrypt`` methods return awaitables may be used,
+        but one must be provided in ``regional_clients`` for every region that will be used.
+
+    :param str key_id: ID of AWS KMS CMK to use
+    :param dict regional_clients: Dictionary mapping AWS region names to asynchronous KMS clients
+    :param botocore_session: botocore session object used to determine the default region (optional)
+    :type botocore_session: botocore.session.Session
+    :param list grant_tokens: List of grant tokens to pass to KMS on CMK operations (optional)
+    :param dict material_description: Material description to use as default state for this CMP (optional)
+    :param float cache_max_age: Max time in seconds that a data key may be used from the cache
+        (default: data keys are not cached)
+    :param int cache_max_items: Max number of items that a cached data key may be used to encrypt (optional)
+    :param int cache_size: The maximum number of data keys that each of the encryption and decryption
+        caches can hold
+    :param DataKeyPartition data_key_partition: Which parts of an item to bind into the AWS KMS
+        encryption context when encrypting (default: ``DataKeyPartition.PRIMARY_KEY``)
+    """
+
+    _regional_clients = attr.ib(validator=dictionary_validator(six.string_types, object), default=attr.Factory(dict))
+
+    def __init__(
+        self,
+        key_id,  # type: Text
+        regional_clients,  # type: Dict[Text, Any]
+        botocore_session=None,  # type: Optional[botocore.session.Session]
+        grant_tokens=None,  # type: Optional[Tuple[Text]]
+        material_description=None,  # type: Optional[Dict[Text, Text]]
+        cache_max_age=None,  # type: Optional[float]
+        cache_max_items=None,  # type: Optional[int]
+        cache_size=1000,  # type: int
+        data_key_partition=DataKeyPartition.PRIMARY_KEY,  # type: DataKeyPartition
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        super(AsyncAwsKmsCryptographicMaterialsProvider, self).__init__(
+            key_id=key_id,
+            botocore_session=botocore_session,
+            grant_tokens=grant_tokens,
+            material_description=material_description,
+            regional_clients=regional_clients,
+            cache_max_age=cache_max_age,
+            cache_max_items=cache_max_items,
+            cache_size=cache_size,
+            data_key_partition=data_key_partition,
+        )
+
+    def _add_regional_client(self, region_name):
+        # type: (Text) -> Any
+        """Find the asynchronous client for the specified region.
+
+        :param str region_name: AWS Region ID (ex: us-east-1)
+        :raises UnknownRegionError: if no client was provided for the region
+        """
+        try:
+            return self._regional_clients[region_name]
+        except KeyError:
+            raise UnknownRegionError('No AWS KMS client provided for region "{}"'.format(region_name))
+
+    async def _async_generate_initial_material(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[bytes, bytes]
+        """Generate the initial cryptographic material for use with HKDF.
+
+        :param EncryptionContext encryption_context: Encryption context providing information about request
+        :returns: Plaintext and ciphertext of initial cryptographic material
+        :rtype: bytes and bytes
+        """
+        key_id, kms_params = self._generate_initial_material_request(encryption_context)
+        # Catch any botocore errors and normalize to expected WrappingError
+        try:
+            response = await self._client(key_id).generate_data_key(**kms_params)
+            return response["Plaintext"], response["CiphertextBlob"]
+        except (botocore.exceptions.ClientError, KeyError):
+            message = "Failed to generate materials using AWS KMS"
+            _LOGGER.exception(message)
+            raise WrappingError(message)
+
+    async def _async_decrypt_initial_material(self, encryption_context):
+        # type: (EncryptionContext) -> bytes
+        """Decrypt an encrypted initial cryptographic material value.
+
+        :param EncryptionContext encryption_context: Encryption context providing information about request
+        :returns: Plaintext of initial cryptographic material
+        :rtype: bytes
+        """
+        key_id, kms_params = self._decrypt_initial_material_request(encryption_context)
+        # Catch any botocore errors and normalize to expected UnwrappingError
+        try:
+            response = await self._client(key_id).decrypt(**kms_params)
+            return response["Plaintext"]
+        except (botocore.exceptions.ClientError, KeyError):
+            message = "Failed to unwrap AWS KMS protected materials"
+            _LOGGER.exception(message)
+            raise UnwrappingError(message)
+
+    async def async_decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> RawDecryptionMaterials
+        """Provide decryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Decryption materials
+        :rtype: RawDecryptionMaterials
+        """
+        cache_key, materials = self._cached_decryption_materials(encryption_context)
+        if materials is not None:
+            return materials
+
+        initial_material = await self._async_decrypt_initial_material(encryption_context)
+        return self._decryption_materials_from_initial_material(encryption_context, initial_material, cache_key)
+
+    async def async_encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> RawEncryptionMaterials
+        """Provide encryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Encryption materials
+        :rtype: RawEncryptionMaterials
+        """
+        cache_key, materials = self._cached_encryption_materials(encryption_context)
+        if materials is not None:
+            return materials
+
+        initial_material, encrypted_initial_material = await self._async_generate_initial_material(encryption_context)
+        return self._encryption_materials_from_initial_material(
+            encryption_context, initial_material, encrypted_initial_material, cache_key
+        )
@@ -0,0 +1,260 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Cryptographic materials provider that uses an asynchronous provider store to obtain cryptographic materials.
+
+.. note::
+
+    Requires Python 3.5 or later.
+"""
+import asyncio
+import logging
+import time
+
+import attr
+
+from dynamodb_encryption_sdk.exceptions import InvalidVersionError, NoKnownVersionError
+from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
+from dynamodb_encryption_sdk.material_providers.most_recent import (
+    _DECRYPT_ACTION,
+    _ENCRYPT_ACTION,
+    CachingMostRecentProvider,
+    TtlActions,
+)
+from dynamodb_encryption_sdk.materials import CryptographicMaterials  # noqa pylint: disable=unused-import
+from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
+
+from . import AsyncCryptographicMaterialsProvider
+from .store import AsyncProviderStore
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Optional, Text  # noqa pylint: disable=unused-import
+
+    from dynamodb_encryption_sdk.material_providers import (  # noqa pylint: disable=unused-import
+        CryptographicMaterialsProvider,
+    )
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+
+__all__ = ("AsyncCachingMostRecentProvider",)
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+@attr.s(init=False)
+class AsyncCachingMostRecentProvider(AsyncCryptographicMaterialsProvider, CachingMostRecentProvider):
+    """Cryptographic materials provider that uses an asynchronous provider store to obtain cryptography
+    materials. Materials obtained from the store are cached for a user-defined amount of time,
+    then removed from the cache and re-retrieved from the store.
+
+    This behaves exactly like :class:`CachingMostRecentProvider`, except that provider store
+    calls are awaited. While one task is asking the provider store for a version, other tasks
+    that are within the grace period use the cached version rather than waiting. Refreshing
+    versions ahead of expiry is not supported.
+
+    :param AsyncProviderStore provider_store: Provider store to use
+    :param str material_name: Name of materials for which to ask the provider store
+    :param float version_ttl: Max time in seconds to go until checking with provider store
+        for a more recent version
+    :param int cache_size: The maximum number of entries that the cache can hold
+    """
+
+    _provider_store = attr.ib(validator=attr.validators.instance_of(AsyncProviderStore))
+
+    def __attrs_post_init__(self):
+        # type: () -> None
+        """Initialize the cache."""
+        if self._refresh_ahead is not None:
+            raise ValueError("Refresh ahead is not supported with an asynchronous provider store")
+        # The lock is created on first use so that it belongs to the running event loop.
+        self._async_lock = None  # type: Optional[asyncio.Lock] # pylint: disable=attribute-defined-outside-init
+        super(AsyncCachingMostRecentProvider, self).__attrs_post_init__()
+
+    def _lock_for_loop(self):
+        # type: () -> asyncio.Lock
+        """Load the lock that guards provider store requests."""
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()  # pylint: disable=attribute-defined-outside-init
+        return self._async_lock
+
+    async def async_decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        """Return decryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no decryption materials are available
+        """
+        provider = None
+
+        version = self._provider_store.version_from_material_description(encryption_context.material_description)
+
+        ttl_action = self._ttl_action(version, _DECRYPT_ACTION)
+
+        if ttl_action is TtlActions.EXPIRED:
+            self._check_missing_version(version)
+            self._cache.evict(self._version)
+
+        _LOGGER.debug('TTL Action "%s" when getting decryption materials', ttl_action.name)
+        if ttl_action is TtlActions.LIVE:
+            try:
+                _LOGGER.debug("Looking in cache for encryption materials provider version %d", version)
+                _, provider = self._cache.get(version)
+            except KeyError:
+                _LOGGER.debug("Decryption materials provider not found in cache")
+
+        if provider is None:
+            try:
+                provider = await self._async_get_provider_with_grace_period(version, ttl_action)
+            except InvalidVersionError:
+                _LOGGER.exception("Unable to get decryption materials from provider store.")
+                self._record_missing_version(version)
+                raise AttributeError("No decryption materials available")
+
+        return provider.decryption_materials(encryption_context)
+
+    async def _async_get_max_version(self):
+        # type: () -> int
+        """Ask the provider store for the most recent version of this material.
+
+        :returns: Latest version in the provider store (0 if not found)
+        :rtype: int
+        """
+        try:
+            return await self._provider_store.max_version(self._material_name)
+        except NoKnownVersionError:
+            return 0
+
+    async def _async_get_provider(self, version):
+        # type: (int) -> CryptographicMaterialsProvider
+        """Ask the provider for a specific version of this material.
+
+        :param int version: Version to request
+        :returns: Cryptographic materials provider for the requested version
+        :rtype: CryptographicMaterialsProvider
+        :raises AttributeError: if provider could not locate version
+        """
+        try:
+            return await self._provider_store.get_or_create_provider(self._material_name, version)
+        except InvalidVersionError:
+            _LOGGER.exception("Unable to get encryption materials from provider store.")
+            raise AttributeError("No encryption materials available")
+
+    async def _async_get_provider_with_grace_period(self, version, ttl_action):
+        # type: (int, TtlActions) -> CryptographicMaterialsProvider
+        """Ask the provider to retrieve a specific version of this material, falling back to the cache if
+        another task is currently retrieving from the provider store.
+
+        :param int version: Version to request
+        :param TtlActions ttl_action: The ttl action to take for this version
+        :returns: Cryptographic materials provider for the requested version
+        :rtype: CryptographicMaterialsProvider
+        :raises AttributeError: if provider could not locate version
+        """
+        lock = self._lock_for_loop()
+        if lock.locked() and ttl_action is not TtlActions.EXPIRED:
+            # Another task is already asking the provider store.
+            # We want whatever the latest local version is.
+            _LOGGER.debug("Provider store request in progress. Returning the last cached version.")
+            _, provider = self._cache.get(version)
+            return provider
+
+        async with lock:
+            # If the entry was expired then we waited for the lock, so it's possible some other task already
+            # queried the provider store and re-populated the cache. If so, we don't want to re-query the provider
+            # store, so check if the entry is back in the cache first
+            if ttl_action is TtlActions.EXPIRED:
+                try:
+                    _, provider = self._cache.get(version)
+                    return provider
+                except KeyError:
+                    pass
+            provider = await self._provider_store.provider(self._material_name, version)
+            self._cache.put(version, (time.time(), provider))
+            return provider
+
+    async def _async_get_most_recent_version(self, ttl_action):
+        # type: (TtlActions) -> CryptographicMaterialsProvider
+        """Get the most recent version of the provider.
+
+        If another task is already asking the provider store and the cached version is within its
+        grace period, just return the most recent local version. Otherwise, wait for the lock and ask
+        the provider store for the most recent version of the provider.
+
+        :param TtlActions ttl_action: The ttl action to take for this version
+        :returns: version and corresponding cryptographic materials provider
+        :rtype: CryptographicMaterialsProvider
+        """
+        lock = self._lock_for_loop()
+        if lock.locked() and ttl_action is not TtlActions.EXPIRED:
+            _LOGGER.debug("Provider store request in progress. Returning the last cached version.")
+            _, provider = self._cache.get(self._version)
+            return provider
+
+        async with lock:
+            # If the entry was expired then we waited for the lock, so it's possible some other task already
+            # queried the provider store and re-populated the cache. If so, we don't want to re-query the provider
+            # store, so check if the entry is back in the cache first
+            if ttl_action is TtlActions.EXPIRED:
+                try:
+                    _, provider = self._cache.get(self._version)
+                    return provider
+                except KeyError:
+                    pass
+
+            max_version = await self._async_get_max_version()
+            try:
+                _, provider = self._cache.get(max_version)
+            except KeyError:
+                provider = await self._async_get_provider(max_version)
+            received_version = self._provider_store.version_from_material_description(
+                provider._material_description  # pylint: disable=protected-access
+            )
+
+            _LOGGER.debug("Caching materials provider version %d", received_version)
+            self._version = received_version  # pylint: disable=attribute-defined-outside-init
+            self._last_updated = time.time()  # pylint: disable=attribute-defined-outside-init
+            self._cache.put(received_version, (self._last_updated, provider))
+
+        _LOGGER.debug("New latest version is %d", self._version)
+
+        return provider
+
+    async def async_encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        """Return encryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no encryption materials are available
+        """
+        ttl_action = self._ttl_action(self._version, _ENCRYPT_ACTION)
+
+        _LOGGER.debug('TTL Action "%s" when getting encryption materials', ttl_action.name)
+
+        provider = None
+
+        if ttl_action is TtlActions.EXPIRED:
+            self._cache.evict(self._version)
+
+        if ttl_action is TtlActions.LIVE:
+            try:
+                _LOGGER.debug("Looking in cache for encryption materials provider version %d", self._version)
+                _, provider = self._cache.get(self._version)
+            except KeyError:
+                _LOGGER.debug("Encryption materials provider not found in cache")
+                ttl_action = TtlActions.EXPIRED
+
+        if provider is None:
+            _LOGGER.debug("Getting most recent materials provider version")
+            provider = await self._async_get_most_recent_version(ttl_action)
+
+        return provider.encryption_materials(encryption_context)
@@ -0,0 +1,239 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Meta cryptographic provider store for use with asyncio.
+
+.. note::
+
+    Requires Python 3.5 or later.
+"""
+
+import logging
+
+import attr
+import botocore
+from boto3.dynamodb.conditions import Attr, Key
+
+from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
+from dynamodb_encryption_sdk.encrypted.aio import AsyncEncryptedTable
+from dynamodb_encryption_sdk.exceptions import InvalidVersionError, NoKnownVersionError, VersionAlreadyExistsError
+from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
+from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
+from dynamodb_encryption_sdk.material_providers.store.meta import (
+    MetaStore,
+    MetaStoreAttributeNames,
+    MetaStoreValues,
+    _item_from_keys,
+    _keys_from_item,
+    _version_from_material_description,
+)
+from dynamodb_encryption_sdk.material_providers.wrapped import WrappedCryptographicMaterialsProvider
+
+from . import AsyncProviderStore
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Any, Dict, Optional, Text, Tuple  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+
+__all__ = ("AsyncMetaStore",)
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+@attr.s(init=False)
+class AsyncMetaStore(AsyncProviderStore):
+    """Create and retrieve wrapped cryptographic materials providers, storing their cryptographic
+    materials using the provided encrypted table and awaiting every table operation.
+
+    The table layout is identical to that used by :class:`MetaStore`, so the same table can be
+    shared between the two.
+
+    :param table: Asynchronous DynamoDB table object, such as an aioboto3 table resource
+    :param CryptographicMaterialsProvider materials_provider: Cryptographic materials provider to use
+    """
+
+    _table = attr.ib()
+    _materials_provider = attr.ib(validator=attr.validators.instance_of(CryptographicMaterialsProvider))
+
+    def __init__(self, table, materials_provider):  # noqa=D107
+        # type: (Any, CryptographicMaterialsProvider) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._table = table
+        self._materials_provider = materials_provider
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        # type: () -> None
+        """Prepare the encrypted table resource from the provided table and materials provider."""
+        self._encrypted_table = AsyncEncryptedTable(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            table=self._table, materials_provider=self._materials_provider
+        )
+
+    async def _load_materials(self, material_name, version):
+        # type: (Text, int) -> Tuple[JceNameLocalDelegatedKey, JceNameLocalDelegatedKey]
+        """Load materials from table.
+
+        :returns: Materials loaded into delegated keys
+        :rtype: tuple(JceNameLocalDelegatedKey)
+        """
+        _LOGGER.debug('Loading material "%s" version %d from MetaStore table', material_name, version)
+        key = {MetaStoreAttributeNames.PARTITION.value: material_name, MetaStoreAttributeNames.SORT.value: version}
+        response = await self._encrypted_table.get_item(Key=key)
+        try:
+            item = response["Item"]
+        except KeyError:
+            raise InvalidVersionError('Version not found: "{}#{}"'.format(material_name, version))
+
+        return _keys_from_item(item)
+
+    async def _save_materials(self, material_name, version, encryption_key, signing_key):
+        # type: (Text, int, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> None
+        """Save materials to the table, raising an error if the version already exists.
+
+        :param str material_name: Material to locate
+        :param int version: Version of material to locate
+        :raises VersionAlreadyExistsError: if the specified version already exists
+        """
+        _LOGGER.debug('Saving material "%s" version %d to MetaStore table', material_name, version)
+        item = _item_from_keys(material_name, version, encryption_key, signing_key)
+        try:
+            await self._encrypted_table.put_item(
+                Item=item,
+                ConditionExpression=(
+                    Attr(MetaStoreAttributeNames.PARTITION.value).not_exists()
+                    & Attr(MetaStoreAttributeNames.SORT.value).not_exists()
+                ),
+            )
+        except botocore.exceptions.ClientError as error:
+            if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise VersionAlreadyExistsError('Version already exists: "{}#{}"'.format(material_name, version))
+
+    async def _save_or_load_materials(
+        self,
+        material_name,  # type: Text
+        version,  # type: int
+        encryption_key,  # type: JceNameLocalDelegatedKey
+        signing_key,  # type: JceNameLocalDelegatedKey
+    ):
+        # type: (...) -> Tuple[JceNameLocalDelegatedKey, JceNameLocalDelegatedKey]
+        """Attempt to save the materials to the table.
+
+        If the specified version already exists, the existing materials will be loaded from
+        the table and returned. Otherwise, the provided materials will be returned.
+
+        :param str material_name: Material to locate
+        :param int version: Version of material to locate
+        :param JceNameLocalDelegatedKey encryption_key: Loaded encryption key
+        :param JceNameLocalDelegatedKey signing_key: Loaded signing key
+        """
+        try:
+            await self._save_materials(material_name, version, encryption_key, signing_key)
+            return encryption_key, signing_key
+        except VersionAlreadyExistsError:
+            return await self._load_materials(material_name, version)
+
+    @staticmethod
+    def _provider(material_name, version, encryption_key, signing_key):
+        # type: (Text, int, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> CryptographicMaterialsProvider
+        """Build the wrapped cryptographic materials provider for the provided materials.
+
+        :param str material_name: Material name
+        :param int version: Material version
+        :param JceNameLocalDelegatedKey encryption_key: Loaded encryption key
+        :param JceNameLocalDelegatedKey signing_key: Loaded signing key
+        """
+        return WrappedCryptographicMaterialsProvider(
+            signing_key=signing_key,
+            wrapping_key=encryption_key,
+            unwrapping_key=encryption_key,
+            material_description=MetaStore._material_description(  # pylint: disable=protected-access
+                material_name, version
+            ),
+        )
+
+    async def get_or_create_provider(self, material_name, version):
+        # type: (Text, int) -> CryptographicMaterialsProvider
+        """Obtain a cryptographic materials provider identified by a name and version.
+
+        If the requested version does not exist, a new one will be created.
+
+        :param str material_name: Material to locate
+        :param int version: Version of material to locate
+        :returns: cryptographic materials provider
+        :rtype: CryptographicMaterialsProvider
+        :raises InvalidVersionError: if the requested version is not available and cannot be created
+        """
+        encryption_key = JceNameLocalDelegatedKey.generate(
+            MetaStoreValues.ENCRYPTION_ALGORITHM.value, MetaStoreValues.KEY_BITS.value
+        )
+        signing_key = JceNameLocalDelegatedKey.generate(
+            MetaStoreValues.INTEGRITY_ALGORITHM.value, MetaStoreValues.KEY_BITS.value
+        )
+        encryption_key, signing_key = await self._save_or_load_materials(
+            material_name, version, encryption_key, signing_key
+        )
+        return self._provider(material_name, version, encryption_key, signing_key)
+
+    async def provider(self, material_name, version=None):
+        # type: (Text, Optional[int]) -> CryptographicMaterialsProvider
+        """Obtain a cryptographic materials provider identified by a name and version.
+
+        If the version is provided, an error will be raised if that version is not found.
+
+        If the version is not provided, the maximum version will be used.
+
+        :param str material_name: Material to locate
+        :param int version: Version of material to locate (optional)
+        :returns: cryptographic materials provider
+        :rtype: CryptographicMaterialsProvider
+        :raises InvalidVersionError: if the requested version is not found
+        """
+        if version is not None:
+            encryption_key, signing_key = await self._load_materials(material_name, version)
+            return self._provider(material_name, version, encryption_key, signing_key)
+
+        return await super(AsyncMetaStore, self).provider(material_name, version)
+
+    def version_from_material_description(self, material_description):
+        # (Dict[Text, Text]) -> int
+        """Determine the version from the provided material description.
+
+        :param dict material_description: Material description to use with this request
+        :returns: version to use
+        :rtype: int
+        """
+        return _version_from_material_description(material_description)
+
+    async def max_version(self, material_name):
+        # (Text) -> int
+        """Find the maximum known version of the specified material.
+
+        :param str material_name: Material to locate
+        :returns: Maximum known version
+        :rtype: int
+        :raises NoKnownVersion: if no version can be found
+        """
+        response = await self._encrypted_table.query(
+            KeyConditionExpression=Key(MetaStoreAttributeNames.PARTITION.value).eq(material_name),
+            ScanIndexForward=False,
+            Limit=1,
+        )
+
+        if not response["Items"]:
+            raise NoKnownVersionError('No known version for name: "{}"'.format(material_name))
+
+        return int(response["Items"][0][MetaStoreAttributeNames.SORT.value])
@@ -35,9 +35,11 @@ from dynamodb_encryption_sdk.materials.raw import RawDecryptionMaterials, RawEnc
 from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
 
 from . import CryptographicMaterialsProvider
+from .caching import _UsageLimitedCache
+from .most_recent import _min_capacity_validator
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Optional, Text, Tuple  # noqa pylint: disable=unused-import
+    from typing import Any, Dict, Hashable, Optional, Text, Tuple  # noqa pylint: disable=unused-import
 
     from dynamodb_encryption_sdk.internal import dynamodb_types  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
@@ -45,7 +47,7 @@ except ImportError:  # pragma: no cover
     pass
 
 
-__all__ = ("AwsKmsCryptographicMaterialsProvider",)
+__all__ = ("AwsKmsCryptographicMaterialsProvider", "DataKeyPartition")
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
 _COVERED_ATTR_CTX_KEY = "aws-kms-ec-attr"
@@ -55,6 +57,7 @@ _DEFAULT_CONTENT_KEY_LENGTH = 256
 _DEFAULT_SIGNING_ALGORITHM = "HmacSHA256/256"
 _DEFAULT_SIGNING_KEY_LENGTH = 256
 _KEY_COVERAGE = "*keys*"
+_TABLE_COVERAGE = "*table*"
 _KDF_ALG = "HmacSHA256"
 
 
@@ -73,6 +76,27 @@ class EncryptionContextKeys(Enum):
     TABLE_NAME = "*aws-kms-table*"
 
 
+class DataKeyPartition(Enum):
+    """Strategies for which parts of an item are bound into the AWS KMS encryption context.
+
+    The AWS KMS encryption context determines which items can share a cached data key, because
+    a data key can only be decrypted using the encryption context that it was generated with.
+    The strategy is recorded in the material description of each item.
+    """
+
+    #: Bind the table name and the primary key attribute values. A data key can only be shared
+    #: between writes of items with the same primary key.
+    PRIMARY_KEY = _KEY_COVERAGE
+    #: Bind only the table name. A data key can be shared between all items in a table.
+    #:
+    #: .. warning::
+    #:
+    #:     Items written with this strategy cannot be decrypted by DynamoDB Encryption Client
+    #:     implementations that do not support it. The primary key attributes are still covered
+    #:     by the item signature.
+    TABLE = _TABLE_COVERAGE
+
+
 @attr.s(init=False)
 class KeyInfo(object):
     # pylint: disable=too-few-public-methods
@@ -143,9 +167,16 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
 
     .. note::
 
-        This cryptographic materials provider makes one AWS KMS API call each time encryption
-        or decryption materials are requested. This means that one request will be made for
-        each item that you read or write.
+        Unless ``cache_max_age`` is set, this cryptographic materials provider makes one AWS KMS
+        API call each time encryption or decryption materials are requested. This means that one
+        request will be made for each item that you read or write.
+
+    When ``cache_max_age`` is set, data keys and the keys derived from them are cached. A data key
+    is reused to encrypt items whose AWS KMS encryption context is identical, until it is older than
+    ``cache_max_age`` or has been used for ``cache_max_items`` items. Which items share an AWS KMS
+    encryption context is determined by ``data_key_partition``. Decrypted data keys are cached by
+    their ciphertext and AWS KMS encryption context, so repeated reads of items that share a data
+    key only call AWS KMS once.
 
     :param str key_id: ID of AWS KMS CMK to use
     :param botocore_session: botocore session object (optional)
@@ -154,6 +185,13 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
     :param dict material_description: Material description to use as default state for this CMP (optional)
     :param dict regional_clients: Dictionary mapping AWS region names to pre-configured boto3
         KMS clients (optional)
+    :param float cache_max_age: Max time in seconds that a data key may be used from the cache
+        (default: data keys are not cached)
+    :param int cache_max_items: Max number of items that a cached data key may be used to encrypt (optional)
+    :param int cache_size: The maximum number of data keys that each of the encryption and decryption
+        caches can hold
+    :param DataKeyPartition data_key_partition: Which parts of an item to bind into the AWS KMS
+        encryption context when encrypting (default: ``DataKeyPartition.PRIMARY_KEY``)
     """
 
     _key_id = attr.ib(validator=attr.validators.instance_of(six.string_types))
@@ -167,6 +205,12 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
     _regional_clients = attr.ib(
         validator=dictionary_validator(six.string_types, botocore.client.BaseClient), default=attr.Factory(dict)
     )
+    _cache_max_age = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(float)), default=None)
+    _cache_max_items = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _cache_size = attr.ib(validator=(attr.validators.instance_of(int), _min_capacity_validator), default=1000)
+    _data_key_partition = attr.ib(
+        validator=attr.validators.instance_of(DataKeyPartition), default=DataKeyPartition.PRIMARY_KEY
+    )
 
     def __init__(
         self,
@@ -175,6 +219,10 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         grant_tokens=None,  # type: Optional[Tuple[Text]]
         material_description=None,  # type: Optional[Dict[Text, Text]]
         regional_clients=None,  # type: Optional[Dict[Text, botocore.client.BaseClient]]
+        cache_max_age=None,  # type: Optional[float]
+        cache_max_items=None,  # type: Optional[int]
+        cache_size=1000,  # type: int
+        data_key_partition=DataKeyPartition.PRIMARY_KEY,  # type: DataKeyPartition
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -195,12 +243,29 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         self._grant_tokens = grant_tokens
         self._material_description = material_description
         self._regional_clients = regional_clients
+        self._cache_max_age = cache_max_age
+        self._cache_max_items = cache_max_items
+        self._cache_size = cache_size
+        self._data_key_partition = data_key_partition
         attr.validate(self)
         self.__attrs_post_init__()
 
     def __attrs_post_init__(self):
         # type: () -> None
-        """Load the content and signing key info."""
+        """Load the content and signing key info and prepare the data key caches."""
+        if self._cache_max_age is not None and self._cache_max_age <= 0:
+            raise ValueError("Cache max age must be greater than 0")
+        if self._cache_max_items is not None and self._cache_max_items < 1:
+            raise ValueError("Cache max items must be at least 1")
+        self._encryption_key_cache = None  # pylint: disable=attribute-defined-outside-init
+        self._decryption_key_cache = None  # pylint: disable=attribute-defined-outside-init
+        if self._cache_max_age is not None:
+            self._encryption_key_cache = _UsageLimitedCache(  # pylint: disable=attribute-defined-outside-init
+                self._cache_size, self._cache_max_age, self._cache_max_items
+            )
+            self._decryption_key_cache = _UsageLimitedCache(  # pylint: disable=attribute-defined-outside-init
+                self._cache_size, self._cache_max_age
+            )
         self._user_agent_adding_config = botocore.config.Config(  # pylint: disable=attribute-defined-outside-init
             user_agent_extra=USER_AGENT_SUFFIX
         )
@@ -294,13 +359,16 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             return attribute_value
         raise ValueError('Attribute of type "{}" cannot be used in KMS encryption context.'.format(attribute_type))
 
-    def _kms_encryption_context(self, encryption_context, encryption_description, signing_description):
-        # type: (EncryptionContext, Text, Text) -> Dict[Text, Text]
+    def _kms_encryption_context(
+        self, encryption_context, encryption_description, signing_description, key_coverage=_KEY_COVERAGE
+    ):
+        # type: (EncryptionContext, Text, Text, Text) -> Dict[Text, Text]
         """Build the KMS encryption context from the encryption context and key descriptions.
 
         :param EncryptionContext encryption_context: Encryption context providing information about request
         :param str encryption_description: Description value from encryption KeyInfo
         :param str signing_description: Description value from signing KeyInfo
+        :param str key_coverage: Which parts of the item to include, as recorded in the material description
         :returns: KMS encryption context for use in request
         :rtype: dict
         """
@@ -309,6 +377,12 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             EncryptionContextKeys.SIGNATURE_ALGORITHM.value: signing_description,
         }
 
+        if encryption_context.table_name is not None:
+            kms_encryption_context[_TABLE_NAME_EC_KEY] = encryption_context.table_name
+
+        if key_coverage == _TABLE_COVERAGE:
+            return kms_encryption_context
+
         if encryption_context.partition_key_name is not None:
             try:
                 partition_key_attribute = encryption_context.attributes[encryption_context.partition_key_name]
@@ -327,18 +401,15 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             else:
                 kms_encryption_context[encryption_context.sort_key_name] = self._attribute_to_value(sort_key_attribute)
 
-        if encryption_context.table_name is not None:
-            kms_encryption_context[_TABLE_NAME_EC_KEY] = encryption_context.table_name
-
         return kms_encryption_context
 
-    def _generate_initial_material(self, encryption_context):
-        # type: (EncryptionContext) -> Tuple[bytes, bytes]
-        """Generate the initial cryptographic material for use with HKDF.
+    def _generate_initial_material_request(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[Text, Dict[Text, Any]]
+        """Build the AWS KMS GenerateDataKey request for the initial cryptographic material.
 
         :param EncryptionContext encryption_context: Encryption context providing information about request
-        :returns: Plaintext and ciphertext of initial cryptographic material
-        :rtype: bytes and bytes
+        :returns: Key id to use and parameters for the GenerateDataKey request
+        :rtype: str and dict
         """
         key_id = self._select_key_id(encryption_context)
         self._validate_key_id(key_id, encryption_context)
@@ -347,10 +418,22 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             encryption_context=encryption_context,
             encryption_description=self._content_key_info.description,
             signing_description=self._signing_key_info.description,
+            key_coverage=self._data_key_partition.value,
         )
         kms_params = dict(KeyId=key_id, NumberOfBytes=key_length, EncryptionContext=kms_encryption_context)
         if self._grant_tokens:
             kms_params["GrantTokens"] = self._grant_tokens
+        return key_id, kms_params
+
+    def _generate_initial_material(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[bytes, bytes]
+        """Generate the initial cryptographic material for use with HKDF.
+
+        :param EncryptionContext encryption_context: Encryption context providing information about request
+        :returns: Plaintext and ciphertext of initial cryptographic material
+        :rtype: bytes and bytes
+        """
+        key_id, kms_params = self._generate_initial_material_request(encryption_context)
         # Catch any boto3 errors and normalize to expected WrappingError
         try:
             response = self._client(key_id).generate_data_key(**kms_params)
@@ -360,14 +443,13 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             _LOGGER.exception(message)
             raise WrappingError(message)
 
-    def _decrypt_initial_material(self, encryption_context):
-        # type: (EncryptionContext) -> bytes
-        """Decrypt an encrypted initial cryptographic material value.
+    def _decrypt_initial_material_request(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[Text, Dict[Text, Any]]
+        """Build the AWS KMS Decrypt request for an encrypted initial cryptographic material value.
 
-        :param encryption_context: Encryption context providing information about request
-        :type encryption_context: EncryptionContext
-        :returns: Plaintext of initial cryptographic material
-        :rtype: bytes
+        :param EncryptionContext encryption_context: Encryption context providing information about request
+        :returns: Key id to use and parameters for the Decrypt request
+        :rtype: str and dict
         """
         key_id = self._select_key_id(encryption_context)
         self._validate_key_id(key_id, encryption_context)
@@ -379,6 +461,7 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             signing_description=encryption_context.material_description.get(
                 MaterialDescriptionKeys.ITEM_SIGNATURE_ALGORITHM.value
             ),
+            key_coverage=encryption_context.material_description.get(_COVERED_ATTR_CTX_KEY, _KEY_COVERAGE),
         )
         encrypted_initial_material = base64.b64decode(
             to_bytes(encryption_context.material_description.get(MaterialDescriptionKeys.WRAPPED_DATA_KEY.value))
@@ -386,6 +469,18 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         kms_params = dict(CiphertextBlob=encrypted_initial_material, EncryptionContext=kms_encryption_context)
         if self._grant_tokens:
             kms_params["GrantTokens"] = self._grant_tokens
+        return key_id, kms_params
+
+    def _decrypt_initial_material(self, encryption_context):
+        # type: (EncryptionContext) -> bytes
+        """Decrypt an encrypted initial cryptographic material value.
+
+        :param encryption_context: Encryption context providing information about request
+        :type encryption_context: EncryptionContext
+        :returns: Plaintext of initial cryptographic material
+        :rtype: bytes
+        """
+        key_id, kms_params = self._decrypt_initial_material_request(encryption_context)
         # Catch any boto3 errors and normalize to expected UnwrappingError
         try:
             response = self._client(key_id).decrypt(**kms_params)
@@ -448,16 +543,14 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         """
         return self._derive_delegated_key(initial_material, key_info, HkdfInfo.SIGNING)
 
-    def decryption_materials(self, encryption_context):
-        # type: (EncryptionContext) -> RawDecryptionMaterials
-        """Provide decryption materials.
+    def _decryption_key_infos(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[KeyInfo, KeyInfo]
+        """Load the signing and content key info from the material description of an encrypted item.
 
         :param EncryptionContext encryption_context: Encryption context for request
-        :returns: Encryption materials
-        :rtype: RawDecryptionMaterials
+        :returns: Signing and content key info
+        :rtype: tuple
         """
-        decryption_material_description = encryption_context.material_description.copy()
-        initial_material = self._decrypt_initial_material(encryption_context)
         signing_key_info = KeyInfo.from_material_description(
             material_description=encryption_context.material_description,
             description_key=MaterialDescriptionKeys.ITEM_SIGNATURE_ALGORITHM.value,
@@ -470,25 +563,61 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             default_algorithm=_DEFAULT_CONTENT_ENCRYPTION_ALGORITHM,
             default_key_length=_DEFAULT_CONTENT_KEY_LENGTH,
         )
+        return signing_key_info, decryption_key_info
+
+    def _decryption_materials_from_keys(self, encryption_context, verification_key, decryption_key):
+        # type: (EncryptionContext, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> RawDecryptionMaterials
+        # pylint: disable=no-self-use
+        """Build decryption materials from derived keys.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :param JceNameLocalDelegatedKey verification_key: Derived signature verification key
+        :param JceNameLocalDelegatedKey decryption_key: Derived decryption key
+        :returns: Decryption materials
+        :rtype: RawDecryptionMaterials
+        """
         return RawDecryptionMaterials(
-            verification_key=self._mac_key(initial_material, signing_key_info),
-            decryption_key=self._encryption_key(initial_material, decryption_key_info),
-            material_description=decryption_material_description,
+            verification_key=verification_key,
+            decryption_key=decryption_key,
+            material_description=encryption_context.material_description.copy(),
         )
 
-    def encryption_materials(self, encryption_context):
-        # type: (EncryptionContext) -> RawEncryptionMaterials
-        """Provide encryption materials.
+    def _decryption_materials_from_initial_material(self, encryption_context, initial_material, cache_key=None):
+        # type: (EncryptionContext, bytes, Optional[Hashable]) -> RawDecryptionMaterials
+        """Build decryption materials from the plaintext initial cryptographic material.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :param bytes initial_material: Plaintext of initial cryptographic material
+        :param cache_key: Key under which to cache the derived keys (optional)
+        :returns: Decryption materials
+        :rtype: RawDecryptionMaterials
+        """
+        signing_key_info, decryption_key_info = self._decryption_key_infos(encryption_context)
+        derived_keys = (
+            self._mac_key(initial_material, signing_key_info),
+            self._encryption_key(initial_material, decryption_key_info),
+        )
+        if cache_key is not None:
+            self._decryption_key_cache.put(cache_key, derived_keys)
+        return self._decryption_materials_from_keys(encryption_context, *derived_keys)
+
+    def _encryption_materials_from_keys(
+        self, encryption_context, encrypted_initial_material, signing_key, encryption_key
+    ):
+        # type: (EncryptionContext, bytes, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> RawEncryptionMaterials
+        """Build encryption materials from the ciphertext initial cryptographic material and derived keys.
 
         :param EncryptionContext encryption_context: Encryption context for request
+        :param bytes encrypted_initial_material: Ciphertext of initial cryptographic material
+        :param JceNameLocalDelegatedKey signing_key: Derived signing key
+        :param JceNameLocalDelegatedKey encryption_key: Derived encryption key
         :returns: Encryption materials
         :rtype: RawEncryptionMaterials
         """
-        initial_material, encrypted_initial_material = self._generate_initial_material(encryption_context)
         encryption_material_description = encryption_context.material_description.copy()
         encryption_material_description.update(
             {
-                _COVERED_ATTR_CTX_KEY: _KEY_COVERAGE,
+                _COVERED_ATTR_CTX_KEY: self._data_key_partition.value,
                 MaterialDescriptionKeys.CONTENT_KEY_WRAPPING_ALGORITHM.value: "kms",
                 MaterialDescriptionKeys.CONTENT_ENCRYPTION_ALGORITHM.value: self._content_key_info.description,
                 MaterialDescriptionKeys.ITEM_SIGNATURE_ALGORITHM.value: self._signing_key_info.description,
@@ -496,7 +625,108 @@ class AwsKmsCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             }
         )
         return RawEncryptionMaterials(
-            signing_key=self._mac_key(initial_material, self._signing_key_info),
-            encryption_key=self._encryption_key(initial_material, self._content_key_info),
-            material_description=encryption_material_description,
+            signing_key=signing_key, encryption_key=encryption_key, material_description=encryption_material_description
+        )
+
+    def _encryption_materials_from_initial_material(
+        self, encryption_context, initial_material, encrypted_initial_material, cache_key=None
+    ):
+        # type: (EncryptionContext, bytes, bytes, Optional[Hashable]) -> RawEncryptionMaterials
+        """Build encryption materials from the plaintext and ciphertext initial cryptographic material.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :param bytes initial_material: Plaintext of initial cryptographic material
+        :param bytes encrypted_initial_material: Ciphertext of initial cryptographic material
+        :param cache_key: Key under which to cache the data key and derived keys (optional)
+        :returns: Encryption materials
+        :rtype: RawEncryptionMaterials
+        """
+        cached_keys = (
+            encrypted_initial_material,
+            self._mac_key(initial_material, self._signing_key_info),
+            self._encryption_key(initial_material, self._content_key_info),
         )
+        if cache_key is not None:
+            self._encryption_key_cache.put(cache_key, cached_keys, 0)
+        return self._encryption_materials_from_keys(encryption_context, *cached_keys)
+
+    def _cached_decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[Optional[Hashable], Optional[RawDecryptionMaterials]]
+        """Build decryption materials from a cached data key, if one is available.
+
+        Decrypted data keys are cached by the key id, the data key ciphertext and the AWS KMS encryption context.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Key for the data key in the cache, if caching is enabled, and decryption materials, if
+            the data key was found in the cache
+        :rtype: tuple
+        """
+        if self._decryption_key_cache is None:
+            return None, None
+
+        key_id, kms_params = self._decrypt_initial_material_request(encryption_context)
+        cache_key = (key_id, kms_params["CiphertextBlob"], tuple(sorted(kms_params["EncryptionContext"].items())))
+        derived_keys = self._decryption_key_cache.get(cache_key)
+        if derived_keys is None:
+            return cache_key, None
+        return cache_key, self._decryption_materials_from_keys(encryption_context, *derived_keys)
+
+    def _cached_encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[Optional[Hashable], Optional[RawEncryptionMaterials]]
+        """Build encryption materials from a cached data key, if a usable one is available.
+
+        Data keys are cached by the key id and the AWS KMS encryption context.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Key for the data key in the cache, if caching is enabled, and encryption materials, if
+            a usable data key was found in the cache
+        :rtype: tuple
+        """
+        if self._encryption_key_cache is None:
+            return None, None
+
+        key_id, kms_params = self._generate_initial_material_request(encryption_context)
+        cache_key = (key_id, tuple(sorted(kms_params["EncryptionContext"].items())))
+        cached_keys = self._encryption_key_cache.get(cache_key, 0)
+        if cached_keys is None:
+            return cache_key, None
+        return cache_key, self._encryption_materials_from_keys(encryption_context, *cached_keys)
+
+    def decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> RawDecryptionMaterials
+        """Provide decryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Encryption materials
+        :rtype: RawDecryptionMaterials
+        """
+        cache_key, materials = self._cached_decryption_materials(encryption_context)
+        if materials is not None:
+            return materials
+
+        initial_material = self._decrypt_initial_material(encryption_context)
+        return self._decryption_materials_from_initial_material(encryption_context, initial_material, cache_key)
+
+    def encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> RawEncryptionMaterials
+        """Provide encryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Encryption materials
+        :rtype: RawEncryptionMaterials
+        """
+        cache_key, materials = self._cached_encryption_materials(encryption_context)
+        if materials is not None:
+            return materials
+
+        initial_material, encrypted_initial_material = self._generate_initial_material(encryption_context)
+        return self._encryption_materials_from_initial_material(
+            encryption_context, initial_material, encrypted_initial_material, cache_key
+        )
+
+    def refresh(self):
+        # type: () -> None
+        """Clear any cached data keys."""
+        if self._encryption_key_cache is not None:
+            self._encryption_key_cache.clear()
+            self._decryption_key_cache.clear()
@@ -0,0 +1,375 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Cryptographic materials provider that caches the materials returned by another cryptographic materials provider."""
+import logging
+import time
+from threading import Lock
+
+import attr
+
+from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
+from dynamodb_encryption_sdk.internal.formatting.material_description import serialize as serialize_material_description
+from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import serialize_attribute
+from dynamodb_encryption_sdk.materials import CryptographicMaterials  # noqa pylint: disable=unused-import
+from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
+
+from . import CryptographicMaterialsProvider
+from .most_recent import BasicCache, _min_capacity_validator
+
+try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
+    from typing import Any, Hashable, Optional, Tuple  # noqa pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    # We only actually need these imports when running the mypy checks
+    pass
+
+
+__all__ = ("CacheCounters", "CachingCryptographicMaterialsProvider")
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+def _optional_limit_validator(instance, attribute, value):
+    # pylint: disable=unused-argument
+    """Attrs validator to require that value is either ``None`` or at least 1."""
+    if value is not None and value < 1:
+        raise ValueError('"{}" must be at least 1'.format(attribute.name.lstrip("_")))
+
+
+def _positive_age_validator(instance, attribute, value):
+    # pylint: disable=unused-argument
+    """Attrs validator to require that value is greater than 0."""
+    if value <= 0:
+        raise ValueError("Max age must be greater than 0")
+
+
+def _encryption_context_size(encryption_context):
+    # type: (EncryptionContext) -> int
+    """Determine how many bytes of plaintext the attributes in an encryption context account for.
+
+    :param EncryptionContext encryption_context: Encryption context for request
+    :rtype: int
+    """
+    return sum(len(serialize_attribute(value)) for value in encryption_context.attributes.values())
+
+
+@attr.s(init=False)
+class CacheCounters(object):
+    # pylint: disable=too-few-public-methods
+    """Snapshot of the cache hit and miss counters for a :class:`CachingCryptographicMaterialsProvider`.
+
+    :param int encryption_hits: Number of encryption materials requests served from the cache
+    :param int encryption_misses: Number of encryption materials requests passed to the wrapped provider
+    :param int decryption_hits: Number of decryption materials requests served from the cache
+    :param int decryption_misses: Number of decryption materials requests passed to the wrapped provider
+    """
+
+    encryption_hits = attr.ib(validator=attr.validators.instance_of(int))
+    encryption_misses = attr.ib(validator=attr.validators.instance_of(int))
+    decryption_hits = attr.ib(validator=attr.validators.instance_of(int))
+    decryption_misses = attr.ib(validator=attr.validators.instance_of(int))
+
+    def __init__(self, encryption_hits=0, encryption_misses=0, decryption_hits=0, decryption_misses=0):  # noqa=D107
+        # type: (int, int, int, int) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self.encryption_hits = encryption_hits
+        self.encryption_misses = encryption_misses
+        self.decryption_hits = decryption_hits
+        self.decryption_misses = decryption_misses
+        attr.validate(self)
+
+
+class _CacheEntry(object):
+    # pylint: disable=too-few-public-methods
+    """Cached value along with its creation time and usage so far."""
+
+    __slots__ = ("value", "created", "items", "bytes")
+
+    def __init__(self, value):
+        # type: (Any) -> None
+        """Prepare a new cache entry."""
+        self.value = value
+        self.created = time.time()
+        self.items = 0
+        self.bytes = 0
+
+
+class _UsageLimitedCache(object):
+    """LRU cache whose entries expire after a max age and, optionally, after a number of uses.
+
+    :param int capacity: The maximum number of entries that the cache can hold
+    :param float max_age: Max time in seconds that a cached value may be used
+    :param int max_items: Max number of items that a cached value may be used for (optional)
+    :param int max_bytes: Max number of bytes that a cached value may be used for (optional)
+    """
+
+    def __init__(self, capacity, max_age, max_items=None, max_bytes=None):
+        # type: (int, float, Optional[int], Optional[int]) -> None
+        """Prepare an empty cache."""
+        self._cache = BasicCache(capacity)
+        self._max_age = max_age
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._lock = Lock()
+
+    def _use(self, entry, item_size):
+        # type: (_CacheEntry, Optional[int]) -> bool
+        """Record a use of a cache entry, if it is still usable.
+
+        :param _CacheEntry entry: Cache entry to use
+        :param int item_size: Number of bytes this use accounts for, or ``None`` if uses are not counted
+        :returns: True if the cached value may be used
+        :rtype: bool
+        """
+        if time.time() - entry.created >= self._max_age:
+            return False
+        if item_size is None:
+            return True
+        with self._lock:
+            if self._max_items is not None and entry.items >= self._max_items:
+                return False
+            if self._max_bytes is not None and entry.bytes + item_size > self._max_bytes:
+                return False
+            entry.items += 1
+            entry.bytes += item_size
+            return True
+
+    def get(self, key, item_size=None):
+        # type: (Hashable, Optional[int]) -> Optional[Any]
+        """Get a usable value from the cache, recording its use.
+
+        :param key: Hashable object to identify the value in the cache
+        :param int item_size: Number of bytes this use accounts for, or ``None`` if uses are not counted
+        :returns: Cached value, or ``None`` if no usable value is cached
+        """
+        try:
+            entry = self._cache.get(key)
+        except KeyError:
+            return None
+        if self._use(entry, item_size):
+            return entry.value
+        _LOGGER.debug("Cached value has expired or reached its usage limits")
+        self._cache.evict(key)
+        return None
+
+    def put(self, key, value, item_size=None):
+        # type: (Hashable, Any, Optional[int]) -> None
+        """Add a value to the cache, recording its first use.
+
+        :param key: Hashable object to identify the value in the cache
+        :param value: Value to add to cache
+        :param int item_size: Number of bytes this use accounts for, or ``None`` if uses are not counted
+        """
+        entry = _CacheEntry(value)
+        if self._use(entry, item_size):
+            self._cache.put(key, entry)
+
+    def clear(self):
+        # type: () -> None
+        """Clear the cache."""
+        self._cache.clear()
+
+
+@attr.s(init=False)
+class CachingCryptographicMaterialsProvider(CryptographicMaterialsProvider):
+    # pylint: disable=too-many-instance-attributes
+    """Cryptographic materials provider that caches the materials returned by another
+    cryptographic materials provider.
+
+    Encryption materials are cached by encryption context partition: the table name, the primary
+    key attribute names, the requested material description and, unless ``partition_by_primary_key``
+    is disabled, the primary key attribute values of the item. A cache entry is reused until it is
+    older than ``max_age`` or has been used to encrypt ``max_items`` items or ``max_bytes`` bytes.
+
+    Decryption materials are cached by the same partition and the serialized material description
+    found on the item, which includes any wrapped content key. Decryption cache entries are reused
+    until they are older than ``max_age``.
+
+    .. warning::
+
+        With the default ``partition_by_primary_key=True`` every distinct item gets its own cache
+        entry, so encryption materials are only reused when the *same* item is written again and
+        decryption materials only when the *same* item is read again. Scans, queries and batch
+        writes over many distinct items will see no cache hits at all.
+
+        This default is kept because :class:`AwsKmsCryptographicMaterialsProvider` binds both the
+        encryption and decryption materials for an item to its primary key values, so sharing
+        materials between items would produce items that cannot be decrypted. For providers that
+        do not use the item attributes, such as :class:`WrappedCryptographicMaterialsProvider`,
+        set ``partition_by_primary_key=False`` so that one cache entry is shared by every item in
+        a table; this is the recommended setting for them.
+
+    .. note::
+
+        The wrapped provider is only told how large an item is through the attributes in the
+        encryption context, so ``max_bytes`` counts the serialized size of every attribute in the
+        encryption context, whether or not that attribute is then encrypted.
+
+    :param CryptographicMaterialsProvider materials_provider: Cryptographic materials provider to cache
+    :param float max_age: Max time in seconds that cached materials may be used
+    :param int max_items: Max number of items that cached encryption materials may be used to encrypt (optional)
+    :param int max_bytes: Max number of plaintext bytes that cached encryption materials may be used to
+        encrypt (optional)
+    :param int cache_size: The maximum number of entries that each of the encryption and decryption caches can hold
+    :param bool partition_by_primary_key: Should the primary key values of the item be part of the cache
+        partition (default: True; see the warning above before relying on this default)
+    """
+
+    _materials_provider = attr.ib(validator=attr.validators.instance_of(CryptographicMaterialsProvider))
+    _max_age = attr.ib(validator=(attr.validators.instance_of(float), _positive_age_validator))
+    _max_items = attr.ib(
+        validator=(attr.validators.optional(attr.validators.instance_of(int)), _optional_limit_validator)
+    )
+    _max_bytes = attr.ib(
+        validator=(attr.validators.optional(attr.validators.instance_of(int)), _optional_limit_validator)
+    )
+    _cache_size = attr.ib(validator=(attr.validators.instance_of(int), _min_capacity_validator))
+    _partition_by_primary_key = attr.ib(validator=attr.validators.instance_of(bool))
+
+    def __init__(
+        self,
+        materials_provider,  # type: CryptographicMaterialsProvider
+        max_age,  # type: float
+        max_items=None,  # type: Optional[int]
+        max_bytes=None,  # type: Optional[int]
+        cache_size=1000,  # type: int
+        partition_by_primary_key=True,  # type: bool
+    ):  # noqa=D107
+        # type: (...) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self._materials_provider = materials_provider
+        self._max_age = max_age
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._cache_size = cache_size
+        self._partition_by_primary_key = partition_by_primary_key
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        # type: () -> None
+        """Initialize the caches and counters."""
+        self._encryption_cache = _UsageLimitedCache(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._cache_size, self._max_age, self._max_items, self._max_bytes
+        )
+        self._decryption_cache = _UsageLimitedCache(  # attrs confuses pylint: disable=attribute-defined-outside-init
+            self._cache_size, self._max_age
+        )
+        self._counters_lock = Lock()  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._counters = CacheCounters()  # attrs confuses pylint: disable=attribute-defined-outside-init
+
+    def counters(self):
+        # type: () -> CacheCounters
+        """Return a snapshot of the cache hit and miss counters.
+
+        :rtype: CacheCounters
+        """
+        with self._counters_lock:
+            return attr.evolve(self._counters)
+
+    def _count(self, name):
+        # type: (str) -> None
+        """Increment a cache counter.
+
+        :param str name: Name of counter to increment
+        """
+        with self._counters_lock:
+            setattr(self._counters, name, getattr(self._counters, name) + 1)
+
+    def _partition(self, encryption_context):
+        # type: (EncryptionContext) -> Tuple[Hashable, ...]
+        """Build the parts of a cache key that identify the encryption context partition.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :rtype: tuple
+        """
+        key_names = (encryption_context.partition_key_name, encryption_context.sort_key_name)
+        key_values = ()  # type: Tuple[Hashable, ...]
+        if self._partition_by_primary_key:
+            key_values = tuple(
+                (
+                    serialize_attribute(encryption_context.attributes[name])
+                    if name is not None and name in encryption_context.attributes
+                    else None
+                )
+                for name in key_names
+            )
+        return (encryption_context.table_name,) + key_names + key_values
+
+    def _material_description_key(self, encryption_context):
+        # type: (EncryptionContext) -> bytes
+        """Serialize the material description from an encryption context for use in a cache key.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :rtype: bytes
+        """
+        return serialize_material_description(encryption_context.material_description)["B"]
+
+    def _item_size(self, encryption_context):
+        # type: (EncryptionContext) -> int
+        """Determine how many bytes of plaintext will be encrypted for this request.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :rtype: int
+        """
+        if self._max_bytes is None:
+            return 0
+        return _encryption_context_size(encryption_context)
+
+    def decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        """Return decryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no decryption materials are available
+        """
+        cache_key = self._partition(encryption_context) + (self._material_description_key(encryption_context),)
+        materials = self._decryption_cache.get(cache_key)
+        if materials is not None:
+            self._count("decryption_hits")
+            return materials
+
+        _LOGGER.debug("Usable decryption materials not found in cache")
+        self._count("decryption_misses")
+        materials = self._materials_provider.decryption_materials(encryption_context)
+        self._decryption_cache.put(cache_key, materials)
+        return materials
+
+    def encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> CryptographicMaterials
+        """Return encryption materials.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :raises AttributeError: if no encryption materials are available
+        """
+        cache_key = self._partition(encryption_context) + (self._material_description_key(encryption_context),)
+        item_size = self._item_size(encryption_context)
+        materials = self._encryption_cache.get(cache_key, item_size)
+        if materials is not None:
+            self._count("encryption_hits")
+            return materials
+
+        _LOGGER.debug("Usable encryption materials not found in cache")
+        self._count("encryption_misses")
+        materials = self._materials_provider.encryption_materials(encryption_context)
+        self._encryption_cache.put(cache_key, materials, item_size)
+        return materials
+
+    def refresh(self):
+        # type: () -> None
+        """Clear all cached materials and ask the wrapped provider to refresh."""
+        self._encryption_cache.clear()
+        self._decryption_cache.clear()
+        self._materials_provider.refresh()
@@ -11,11 +11,13 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Cryptographic materials provider that uses a provider store to obtain cryptographic materials."""
+
 import logging
 import time
+import weakref
 from collections import OrderedDict
 from enum import Enum
-from threading import Lock, RLock
+from threading import Event, Lock, RLock, Thread, local
 
 import attr
 import six
@@ -29,7 +31,7 @@ from . import CryptographicMaterialsProvider
 from .store import ProviderStore
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Any, Text  # noqa pylint: disable=unused-import
+    from typing import Any, Dict, List, Optional, Text  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -37,12 +39,15 @@ except ImportError:  # pragma: no cover
 
 __all__ = (
     "CachingMostRecentProvider",
+    "ProviderCacheCounters",
 )
 _LOGGER = logging.getLogger(LOGGER_NAME)
 #: Grace period during which we will return the latest local materials. This allows multiple
 #: threads to be using this same provider without risking lock contention or many threads
 #: all attempting to create new versions simultaneously.
 _GRACE_PERIOD = 0.5
+#: Time to wait before retrying a failed refresh-ahead request to the provider store.
+_REFRESH_AHEAD_RETRY_INTERVAL = 1.0
 _ENCRYPT_ACTION = "encrypt"
 _DECRYPT_ACTION = "decrypt"
 
@@ -132,6 +137,239 @@ class BasicCache(object):
                 pass
 
 
+@attr.s(init=False)
+class ProviderCacheCounters(object):
+    # pylint: disable=too-few-public-methods
+    """Snapshot of the provider cache counters for a :class:`CachingMostRecentProvider`.
+
+    :param int hits: Number of cache lookups that found a cached provider
+    :param int misses: Number of cache lookups that did not find a cached provider
+    :param int evictions: Number of providers evicted to make room for another provider
+    :param int missing_version_hits: Number of decryption requests that failed without asking the
+        provider store, because their version was recently found to be missing
+    :param int missing_version_misses: Number of times the provider store did not have a requested version
+    """
+
+    hits = attr.ib(validator=attr.validators.instance_of(int))
+    misses = attr.ib(validator=attr.validators.instance_of(int))
+    evictions = attr.ib(validator=attr.validators.instance_of(int))
+    missing_version_hits = attr.ib(validator=attr.validators.instance_of(int))
+    missing_version_misses = attr.ib(validator=attr.validators.instance_of(int))
+
+    def __init__(self, hits=0, misses=0, evictions=0, missing_version_hits=0, missing_version_misses=0):  # noqa=D107
+        # type: (int, int, int, int, int) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.missing_version_hits = missing_version_hits
+        self.missing_version_misses = missing_version_misses
+        attr.validate(self)
+
+
+class _ClockEntry(object):
+    # pylint: disable=too-few-public-methods
+    """Cached value along with its clock slot and reference bit."""
+
+    __slots__ = ("value", "slot", "referenced")
+
+    def __init__(self, value, slot):
+        # type: (Any, int) -> None
+        """Prepare a new, unreferenced cache entry."""
+        self.value = value
+        self.slot = slot
+        self.referenced = False
+
+
+class _ThreadMarker(object):
+    # pylint: disable=too-few-public-methods
+    """Object held in thread-local storage, so that the lookup counts of a thread can be retired once it exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+@attr.s(init=False)
+class ClockCache(object):
+    """Approximate LRU cache using the CLOCK algorithm, with reads that do not take a lock.
+
+    A read only sets the reference bit of the entry it finds. Writes and evictions take the lock.
+    When the cache is full, the clock hand sweeps the slots, clearing reference bits, and evicts
+    the first entry that has not been read since the hand last passed it.
+
+    Hits and misses are counted separately by each thread, so counting them does not take the
+    lock either. Once a thread exits, its counts are added to a running total, so short-lived
+    threads do not leave counts behind.
+    """
+
+    capacity = attr.ib(validator=(attr.validators.instance_of(int), _min_capacity_validator))
+
+    def __init__(self, capacity):  # noqa=D107
+        # type: (int) -> None
+        # Workaround pending resolution of attrs/mypy interaction.
+        # https://github.com/python/mypy/issues/2088
+        # https://github.com/python-attrs/attrs/issues/215
+        self.capacity = capacity
+        attr.validate(self)
+        self.__attrs_post_init__()
+
+    def __attrs_post_init__(self):
+        # type: () -> None
+        """Initialize the internal cache and counters."""
+        self._cache_lock = Lock()  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._local = local()  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._lookup_counts = {}  # type: Dict[Any, List[int]] # pylint: disable=attribute-defined-outside-init
+        self._retired_lookup_counts = [0, 0]  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._evictions = 0  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self.clear()
+
+    def _thread_lookup_counts(self):
+        # type: () -> List[int]
+        """Load the hit and miss counts for the current thread.
+
+        :returns: Hit and miss counts
+        :rtype: list
+        """
+        try:
+            return self._local.lookup_counts
+        except AttributeError:
+            counts = [0, 0]
+            marker = _ThreadMarker()
+            with self._cache_lock:
+                self._lookup_counts[weakref.ref(marker, self._retire_lookup_counts)] = counts
+            self._local.marker = marker
+            self._local.lookup_counts = counts
+            return counts
+
+    def _retire_lookup_counts(self, marker_reference):
+        # type: (weakref.ReferenceType) -> None
+        """Add the hit and miss counts of a thread that has exited to the running total.
+
+        :param marker_reference: Weak reference to the thread marker of the exited thread
+        """
+        with self._cache_lock:
+            counts = self._lookup_counts.pop(marker_reference)
+            self._retired_lookup_counts[0] += counts[0]
+            self._retired_lookup_counts[1] += counts[1]
+
+    def _evict_slot(self):
+        # type: () -> int
+        """Sweep the clock hand until an unreferenced entry is found, then evict it.
+
+        The caller must hold the lock, and every slot must be in use.
+
+        :returns: Slot freed by the eviction
+        :rtype: int
+        """
+        while True:
+            slot = self._hand
+            self._hand = (slot + 1) % self.capacity  # pylint: disable=attribute-defined-outside-init
+            entry = self._cache[self._slots[slot]]
+            if entry.referenced:
+                entry.referenced = False
+                continue
+            del self._cache[self._slots[slot]]
+            self._evictions += 1  # pylint: disable=attribute-defined-outside-init
+            return slot
+
+    def put(self, name, value):
+        # type: (Any, Any) -> None
+        """Add a value to the cache.
+
+        :param name: Hashable object to identify the value in the cache
+        :param value: Value to add to cache
+        """
+        with self._cache_lock:
+            entry = self._cache.get(name)
+            if entry is not None:
+                entry.value = value
+                entry.referenced = True
+                return
+            slot = self._free_slots.pop() if self._free_slots else self._evict_slot()
+            self._slots[slot] = name
+            self._cache[name] = _ClockEntry(value, slot)
+
+    def get(self, name):
+        # type: (Any) -> Any
+        """Get a value from the cache.
+
+        :param name: Object to identify the value in the cache
+        :returns: Value from cache
+        :raises KeyError: if the value is not in the cache
+        """
+        try:
+            entry = self._cache[name]
+        except KeyError:
+            self._thread_lookup_counts()[1] += 1
+            raise
+        entry.referenced = True
+        self._thread_lookup_counts()[0] += 1
+        return entry.value
+
+    def clear(self):
+        # type: () -> None
+        """Clear the cache."""
+        _LOGGER.debug("Clearing cache")
+        with self._cache_lock:
+            self._cache = {}  # type: Dict[Any, _ClockEntry] # pylint: disable=attribute-defined-outside-init
+            self._slots = [None] * self.capacity  # type: List[Any] # pylint: disable=attribute-defined-outside-init
+            self._free_slots = list(  # attrs confuses pylint: disable=attribute-defined-outside-init
+                reversed(range(self.capacity))
+            )
+            self._hand = 0  # attrs confuses pylint: disable=attribute-defined-outside-init
+
+    def evict(self, name):
+        # type: (Any) -> None
+        """Evict a single entry from the cache."""
+        with self._cache_lock:
+            entry = self._cache.pop(name, None)
+            if entry is None:
+                # If the key wasn't in the cache, do nothing
+                return
+            self._slots[entry.slot] = None
+            self._free_slots.append(entry.slot)
+
+    def counters(self):
+        # type: () -> ProviderCacheCounters
+        """Return a snapshot of the cache counters.
+
+        :rtype: ProviderCacheCounters
+        """
+        with self._cache_lock:
+            return ProviderCacheCounters(
+                hits=self._retired_lookup_counts[0] + sum(counts[0] for counts in self._lookup_counts.values()),
+                misses=self._retired_lookup_counts[1] + sum(counts[1] for counts in self._lookup_counts.values()),
+                evictions=self._evictions,
+            )
+
+
+def _refresh_ahead(provider_reference, stop):
+    # type: (weakref.ReferenceType, Event) -> None
+    """Keep the most recent version of a :class:`CachingMostRecentProvider` fresh until stopped.
+
+    Only a weak reference to the provider is held between refreshes, so the thread exits once
+    the provider is no longer used, even if it was never closed.
+
+    :param provider_reference: Weak reference to the provider to refresh
+    :param Event stop: Event that is set when the thread should exit
+    """
+    while not stop.is_set():
+        provider = provider_reference()
+        if provider is None:
+            return
+        delay = provider._refresh_ahead_delay()  # pylint: disable=protected-access
+        if delay <= 0:
+            try:
+                provider._refresh_most_recent_version()  # pylint: disable=protected-access
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unable to refresh the most recent version ahead of expiry")
+                delay = _REFRESH_AHEAD_RETRY_INTERVAL
+        del provider
+        if delay > 0:
+            stop.wait(delay)
+
+
 @attr.s(init=False)
 @attr.s(init=False)
 class CachingMostRecentProvider(CryptographicMaterialsProvider):
@@ -143,20 +381,53 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
     When encrypting, the most recent provider that the provider store knows about will always
     be used.
 
+    Cached providers are held in a :class:`ClockCache`, so looking up a cached provider does not
+    take a lock. Cache hits, misses and evictions are counted in :meth:`counters`.
+
+    When ``missing_version_ttl`` is set, versions that the provider store does not have are
+    remembered for that long, and decryption requests for them fail without asking the provider
+    store again. Keep it short: :class:`MetaStore` reads are eventually consistent, so a version
+    that another writer has just created may briefly appear to be missing.
+
+    When ``refresh_ahead`` is set, a background thread asks the provider store for the most recent
+    version ``refresh_ahead`` seconds before ``version_ttl`` expires, so encryption requests do not
+    wait on the provider store. The thread is only started once an encryption request has loaded a
+    version, and it never creates a new version, so providers that only decrypt never start it.
+    If the background request fails, it is retried, and encryption requests fall back to asking the
+    provider store themselves once the version has expired. Call :meth:`close`, or use the provider
+    as a context manager, to stop the thread.
+
     :param ProviderStore provider_store: Provider store to use
     :param str material_name: Name of materials for which to ask the provider store
     :param float version_ttl: Max time in seconds to go until checking with provider store
         for a more recent version
     :param int cache_size: The maximum number of entries that the cache can hold
+    :param float refresh_ahead: Time in seconds before ``version_ttl`` expires at which to refresh the
+        most recent version in the background (default: versions are only refreshed once expired)
+    :param float missing_version_ttl: Time in seconds to remember that the provider store does not have a
+        version (default: missing versions are not remembered)
+    :param int missing_version_cache_size: The maximum number of missing versions to remember
     """
 
     _provider_store = attr.ib(validator=attr.validators.instance_of(ProviderStore))
     _material_name = attr.ib(validator=attr.validators.instance_of(six.string_types))
     _version_ttl = attr.ib(validator=attr.validators.instance_of(float))
     _cache_size = attr.ib(validator=attr.validators.instance_of(int))
-
-    def __init__(self, provider_store, material_name, version_ttl, cache_size=1000):  # noqa=D107
-        # type: (ProviderStore, Text, float, int) -> None
+    _refresh_ahead = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(float)), default=None)
+    _missing_version_ttl = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(float)), default=None)
+    _missing_version_cache_size = attr.ib(validator=attr.validators.instance_of(int), default=1000)
+
+    def __init__(
+        self,
+        provider_store,  # type: ProviderStore
+        material_name,  # type: Text
+        version_ttl,  # type: float
+        cache_size=1000,  # type: int
+        refresh_ahead=None,  # type: Optional[float]
+        missing_version_ttl=None,  # type: Optional[float]
+        missing_version_cache_size=1000,  # type: int
+    ):  # noqa=D107
+        # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
         # https://github.com/python/mypy/issues/2088
         # https://github.com/python-attrs/attrs/issues/215
@@ -165,17 +436,145 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
         self._version_ttl = version_ttl
         self._grace_period = _GRACE_PERIOD
         self._cache_size = cache_size
+        self._refresh_ahead = refresh_ahead
+        self._missing_version_ttl = missing_version_ttl
+        self._missing_version_cache_size = missing_version_cache_size
         attr.validate(self)
         self.__attrs_post_init__()
 
     def __attrs_post_init__(self):
         # type: () -> None
-        """Initialize the cache."""
+        """Initialize the caches."""
+        if self._refresh_ahead is not None and not 0 < self._refresh_ahead < self._version_ttl:
+            raise ValueError("Refresh ahead must be greater than 0 and less than the version TTL")
+        if self._missing_version_ttl is not None and self._missing_version_ttl <= 0:
+            raise ValueError("Missing version TTL must be greater than 0")
+        self._missing_versions = None  # pylint: disable=attribute-defined-outside-init
+        if self._missing_version_ttl is not None:
+            self._missing_versions = ClockCache(  # pylint: disable=attribute-defined-outside-init
+                self._missing_version_cache_size
+            )
+        self._counters_lock = Lock()  # pylint: disable=attribute-defined-outside-init
+        self._missing_version_hits = 0  # pylint: disable=attribute-defined-outside-init
+        self._missing_version_misses = 0  # pylint: disable=attribute-defined-outside-init
         self._version = None  # type: int # pylint: disable=attribute-defined-outside-init
         self._last_updated = None  # type: float # pylint: disable=attribute-defined-outside-init
         self._lock = Lock()  # pylint: disable=attribute-defined-outside-init
-        self._cache = BasicCache(self._cache_size)  # pylint: disable=attribute-defined-outside-init
+        self._cache = ClockCache(self._cache_size)  # pylint: disable=attribute-defined-outside-init
         self.refresh()
+        self._refresh_ahead_stop = Event()  # pylint: disable=attribute-defined-outside-init
+        self._refresh_ahead_thread = None  # pylint: disable=attribute-defined-outside-init
+
+    def counters(self):
+        # type: () -> ProviderCacheCounters
+        """Return a snapshot of the provider cache and missing version counters.
+
+        :rtype: ProviderCacheCounters
+        """
+        counters = self._cache.counters()
+        with self._counters_lock:
+            counters.missing_version_hits = self._missing_version_hits
+            counters.missing_version_misses = self._missing_version_misses
+        return counters
+
+    def _check_missing_version(self, version):
+        # type: (Any) -> None
+        """Fail without asking the provider store if it recently did not have a version.
+
+        :param version: Version to check
+        :raises AttributeError: if the version is known to be missing
+        """
+        if self._missing_versions is None:
+            return
+        try:
+            expires = self._missing_versions.get(version)
+        except KeyError:
+            return
+        if time.time() >= expires:
+            self._missing_versions.evict(version)
+            return
+        with self._counters_lock:
+            self._missing_version_hits += 1
+        _LOGGER.debug("Version %s is known to be missing from the provider store", version)
+        raise AttributeError("No decryption materials available")
+
+    def _record_missing_version(self, version):
+        # type: (Any) -> None
+        """Record that the provider store does not have a version.
+
+        :param version: Missing version
+        """
+        with self._counters_lock:
+            self._missing_version_misses += 1
+        if self._missing_versions is not None:
+            self._missing_versions.put(version, time.time() + self._missing_version_ttl)
+
+    def __enter__(self):
+        # type: () -> CachingMostRecentProvider
+        """Use this provider as a context manager that stops the refresh-ahead thread on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Stop the refresh-ahead thread."""
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        """Stop the refresh-ahead thread, if one is running, and wait for it to exit.
+
+        The provider keeps working after it is closed, but only refreshes expired versions on request.
+        """
+        self._refresh_ahead_stop.set()
+        if self._refresh_ahead_thread is not None:
+            self._refresh_ahead_thread.join()
+
+    def _start_refresh_ahead(self):
+        # type: () -> None
+        """Start the refresh-ahead thread, unless it is disabled, already running or stopped.
+
+        The caller must hold the lock.
+        """
+        if self._refresh_ahead is None or self._refresh_ahead_thread is not None or self._refresh_ahead_stop.is_set():
+            return
+        self._refresh_ahead_thread = Thread(  # pylint: disable=attribute-defined-outside-init
+            target=_refresh_ahead,
+            args=(weakref.ref(self), self._refresh_ahead_stop),
+            name="CachingMostRecentProvider-refresh-ahead",
+        )
+        self._refresh_ahead_thread.daemon = True
+        self._refresh_ahead_thread.start()
+
+    def _refresh_ahead_delay(self):
+        # type: () -> float
+        """Determine how long to wait before refreshing the most recent version in the background.
+
+        :returns: Time in seconds until the next refresh is due (0 or less if it is due now)
+        :rtype: float
+        """
+        last_updated = self._last_updated
+        if last_updated is None:
+            # Nothing to refresh until an encryption request loads a version again
+            return self._version_ttl - self._refresh_ahead
+        return last_updated + self._version_ttl - self._refresh_ahead - time.time()
+
+    def _refresh_most_recent_version(self):
+        # type: () -> None
+        """Ask the provider store for the most recent version of the provider, unless another caller
+        has already done so since the refresh was scheduled.
+
+        Only versions that the provider store reports or that are already in use are loaded, so this
+        never creates a new version.
+        """
+        with self._lock:
+            if self._refresh_ahead_delay() > 0:
+                return
+            try:
+                max_version = self._provider_store.max_version(self._material_name)
+            except NoKnownVersionError:
+                max_version = self._version
+            self._load_version(max_version)
+            _LOGGER.debug("Refreshed latest version ahead of expiry: %d", self._version)
 
     def decryption_materials(self, encryption_context):
         # type: (EncryptionContext) -> CryptographicMaterials
@@ -191,6 +590,7 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
         ttl_action = self._ttl_action(version, _DECRYPT_ACTION)
 
         if ttl_action is TtlActions.EXPIRED:
+            self._check_missing_version(version)
             self._cache.evict(self._version)
 
         _LOGGER.debug('TTL Action "%s" when getting decryption materials', ttl_action.name)
@@ -206,6 +606,7 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
                 provider = self._get_provider_with_grace_period(version, ttl_action)
             except InvalidVersionError:
                 _LOGGER.exception("Unable to get decryption materials from provider store.")
+                self._record_missing_version(version)
                 raise AttributeError("No decryption materials available")
 
         return provider.decryption_materials(encryption_context)
@@ -342,19 +743,8 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
                 except KeyError:
                     pass
 
-            max_version = self._get_max_version()
-            try:
-                _, provider = self._cache.get(max_version)
-            except KeyError:
-                provider = self._get_provider(max_version)
-            received_version = self._provider_store.version_from_material_description(
-                provider._material_description  # pylint: disable=protected-access
-            )
-
-            _LOGGER.debug("Caching materials provider version %d", received_version)
-            self._version = received_version  # pylint: disable=attribute-defined-outside-init
-            self._last_updated = time.time()  # pylint: disable=attribute-defined-outside-init
-            self._cache.put(received_version, (self._last_updated, provider))
+            provider = self._load_most_recent_version()
+            self._start_refresh_ahead()
         finally:
             self._lock.release()
 
@@ -362,6 +752,41 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
 
         return provider
 
+    def _load_most_recent_version(self):
+        # type: () -> CryptographicMaterialsProvider
+        """Ask the provider store for the most recent version of the provider and cache it.
+
+        The caller must hold the lock.
+
+        :returns: Cryptographic materials provider for the most recent version
+        :rtype: CryptographicMaterialsProvider
+        """
+        return self._load_version(self._get_max_version())
+
+    def _load_version(self, max_version):
+        # type: (int) -> CryptographicMaterialsProvider
+        """Load a version of the provider and cache it as the most recent version.
+
+        The caller must hold the lock.
+
+        :param int max_version: Version to load
+        :returns: Cryptographic materials provider for the version
+        :rtype: CryptographicMaterialsProvider
+        """
+        try:
+            _, provider = self._cache.get(max_version)
+        except KeyError:
+            provider = self._get_provider(max_version)
+        received_version = self._provider_store.version_from_material_description(
+            provider._material_description  # pylint: disable=protected-access
+        )
+
+        _LOGGER.debug("Caching materials provider version %d", received_version)
+        self._version = received_version  # pylint: disable=attribute-defined-outside-init
+        self._last_updated = time.time()  # pylint: disable=attribute-defined-outside-init
+        self._cache.put(received_version, (self._last_updated, provider))
+        return provider
+
     def encryption_materials(self, encryption_context):
         # type: (EncryptionContext) -> CryptographicMaterials
         """Return encryption materials.
@@ -398,5 +823,7 @@ class CachingMostRecentProvider(CryptographicMaterialsProvider):
         _LOGGER.debug("Refreshing CachingMostRecentProvider instance.")
         with self._lock:
             self._cache.clear()
+            if self._missing_versions is not None:
+                self._missing_versions.clear()
             self._version = None  # type: int # pylint: disable=attribute-defined-outside-init
             self._last_updated = None  # type: float # pylint: disable=attribute-defined-outside-init
@@ -30,7 +30,7 @@ from dynamodb_encryption_sdk.material_providers.wrapped import WrappedCryptograp
 from . import ProviderStore
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Optional, Text, Tuple  # noqa pylint: disable=unused-import
+    from typing import Any, Dict, Optional, Text, Tuple  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -65,6 +65,83 @@ class MetaStoreValues(Enum):
 _MATERIAL_DESCRIPTION_META_FIELD = "amzn-ddb-meta-id"
 
 
+def _keys_from_item(item):
+    # type: (Dict[Text, Any]) -> Tuple[JceNameLocalDelegatedKey, JceNameLocalDelegatedKey]
+    """Load the delegated keys stored in a MetaStore table item.
+
+    :param dict item: Item read from the MetaStore table
+    :returns: Encryption key and signing key
+    :rtype: tuple(JceNameLocalDelegatedKey)
+    """
+    try:
+        encryption_key_kwargs = dict(
+            key=item[MetaStoreAttributeNames.ENCRYPTION_KEY.value].value,
+            algorithm=item[MetaStoreAttributeNames.ENCRYPTION_ALGORITHM.value],
+            key_type=EncryptionKeyType.SYMMETRIC,
+            key_encoding=KeyEncodingType.RAW,
+        )
+        signing_key_kwargs = dict(
+            key=item[MetaStoreAttributeNames.INTEGRITY_KEY.value].value,
+            algorithm=item[MetaStoreAttributeNames.INTEGRITY_ALGORITHM.value],
+            key_type=EncryptionKeyType.SYMMETRIC,
+            key_encoding=KeyEncodingType.RAW,
+        )
+    except KeyError:
+        raise Exception("Invalid record")
+
+    # need to handle if the material type version is not in the item
+    # https://github.com/aws/aws-dynamodb-encryption-python/issues/140
+    if item[MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value] != MetaStoreValues.MATERIAL_TYPE_VERSION.value:
+        raise InvalidVersionError(
+            'Unsupported material type: "{}"'.format(item[MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value])
+        )
+
+    encryption_key = JceNameLocalDelegatedKey(**encryption_key_kwargs)
+    signing_key = JceNameLocalDelegatedKey(**signing_key_kwargs)
+    return encryption_key, signing_key
+
+
+def _item_from_keys(material_name, version, encryption_key, signing_key):
+    # type: (Text, int, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> Dict[Text, Any]
+    """Build the MetaStore table item that stores the provided delegated keys.
+
+    :param str material_name: Material name
+    :param int version: Material version
+    :param JceNameLocalDelegatedKey encryption_key: Encryption key
+    :param JceNameLocalDelegatedKey signing_key: Signing key
+    :returns: Item to write to the MetaStore table
+    :rtype: dict
+    """
+    return {
+        MetaStoreAttributeNames.PARTITION.value: material_name,
+        MetaStoreAttributeNames.SORT.value: version,
+        MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value: MetaStoreValues.MATERIAL_TYPE_VERSION.value,
+        MetaStoreAttributeNames.ENCRYPTION_ALGORITHM.value: encryption_key.algorithm,
+        MetaStoreAttributeNames.ENCRYPTION_KEY.value: Binary(encryption_key.key),
+        MetaStoreAttributeNames.INTEGRITY_ALGORITHM.value: signing_key.algorithm,
+        MetaStoreAttributeNames.INTEGRITY_KEY.value: Binary(signing_key.key),
+    }
+
+
+def _version_from_material_description(material_description):
+    # type: (Dict[Text, Text]) -> int
+    """Determine the MetaStore version from the provided material description.
+
+    :param dict material_description: Material description to use with this request
+    :returns: version to use
+    :rtype: int
+    """
+    try:
+        info = material_description[_MATERIAL_DESCRIPTION_META_FIELD]
+    except KeyError:
+        raise Exception("No info found")
+
+    try:
+        return int(info.split("#", 1)[1])
+    except (IndexError, ValueError):
+        raise Exception("Malformed info")
+
+
 @attr.s(init=False)
 class MetaStore(ProviderStore):
     """Create and retrieve wrapped cryptographic materials providers, storing their cryptographic
@@ -138,32 +215,7 @@ class MetaStore(ProviderStore):
         except KeyError:
             raise InvalidVersionError('Version not found: "{}#{}"'.format(material_name, version))
 
-        try:
-            encryption_key_kwargs = dict(
-                key=item[MetaStoreAttributeNames.ENCRYPTION_KEY.value].value,
-                algorithm=item[MetaStoreAttributeNames.ENCRYPTION_ALGORITHM.value],
-                key_type=EncryptionKeyType.SYMMETRIC,
-                key_encoding=KeyEncodingType.RAW,
-            )
-            signing_key_kwargs = dict(
-                key=item[MetaStoreAttributeNames.INTEGRITY_KEY.value].value,
-                algorithm=item[MetaStoreAttributeNames.INTEGRITY_ALGORITHM.value],
-                key_type=EncryptionKeyType.SYMMETRIC,
-                key_encoding=KeyEncodingType.RAW,
-            )
-        except KeyError:
-            raise Exception("Invalid record")
-
-        # need to handle if the material type version is not in the item
-        # https://github.com/aws/aws-dynamodb-encryption-python/issues/140
-        if item[MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value] != MetaStoreValues.MATERIAL_TYPE_VERSION.value:
-            raise InvalidVersionError(
-                'Unsupported material type: "{}"'.format(item[MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value])
-            )
-
-        encryption_key = JceNameLocalDelegatedKey(**encryption_key_kwargs)
-        signing_key = JceNameLocalDelegatedKey(**signing_key_kwargs)
-        return encryption_key, signing_key
+        return _keys_from_item(item)
 
     def _save_materials(self, material_name, version, encryption_key, signing_key):
         # type: (Text, int, JceNameLocalDelegatedKey, JceNameLocalDelegatedKey) -> None
@@ -174,15 +226,7 @@ class MetaStore(ProviderStore):
         :raises VersionAlreadyExistsError: if the specified version already exists
         """
         _LOGGER.debug('Saving material "%s" version %d to MetaStore table', material_name, version)
-        item = {
-            MetaStoreAttributeNames.PARTITION.value: material_name,
-            MetaStoreAttributeNames.SORT.value: version,
-            MetaStoreAttributeNames.MATERIAL_TYPE_VERSION.value: MetaStoreValues.MATERIAL_TYPE_VERSION.value,
-            MetaStoreAttributeNames.ENCRYPTION_ALGORITHM.value: encryption_key.algorithm,
-            MetaStoreAttributeNames.ENCRYPTION_KEY.value: Binary(encryption_key.key),
-            MetaStoreAttributeNames.INTEGRITY_ALGORITHM.value: signing_key.algorithm,
-            MetaStoreAttributeNames.INTEGRITY_KEY.value: Binary(signing_key.key),
-        }
+        item = _item_from_keys(material_name, version, encryption_key, signing_key)
         try:
             self._encrypted_table.put_item(
                 Item=item,
@@ -299,15 +343,7 @@ class MetaStore(ProviderStore):
         :returns: version to use
         :rtype: int
         """
-        try:
-            info = material_description[_MATERIAL_DESCRIPTION_META_FIELD]
-        except KeyError:
-            raise Exception("No info found")
-
-        try:
-            return int(info.split("#", 1)[1])
-        except (IndexError, ValueError):
-            raise Exception("Malformed info")
+        return _version_from_material_description(material_description)
 
     def max_version(self, material_name):
         # (Text) -> int
@@ -11,35 +11,39 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Cryptographic materials provider to use ephemeral content encryption keys wrapped by delegated keys."""
+import logging
+from threading import Lock
+
 import attr
 import six
 
 from dynamodb_encryption_sdk.delegated_keys import DelegatedKey
 from dynamodb_encryption_sdk.exceptions import UnwrappingError, WrappingError
+from dynamodb_encryption_sdk.identifiers import LOGGER_NAME
+from dynamodb_encryption_sdk.internal.identifiers import MaterialDescriptionKeys
+from dynamodb_encryption_sdk.internal.str_ops import to_str
 from dynamodb_encryption_sdk.internal.validators import dictionary_validator
 from dynamodb_encryption_sdk.materials.wrapped import WrappedCryptographicMaterials
 from dynamodb_encryption_sdk.structures import EncryptionContext  # noqa pylint: disable=unused-import
 
 from . import CryptographicMaterialsProvider
+from .caching import CacheCounters, _encryption_context_size, _UsageLimitedCache
+from .most_recent import _min_capacity_validator
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Optional, Text  # noqa pylint: disable=unused-import
-except ImportError:  # pragma: no cover
-    # We only actually need these imports when running the mypy checks
-    pass
-
-try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Optional  # noqa pylint: disable=unused-import
+    from typing import Dict, Hashable, Optional, Text, Tuple  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
 
 
 __all__ = ("WrappedCryptographicMaterialsProvider",)
+_LOGGER = logging.getLogger(LOGGER_NAME)
 
 
 @attr.s(init=False)
 class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
+    # pylint: disable=too-many-instance-attributes
     """Cryptographic materials provider to use ephemeral content encryption keys wrapped by delegated keys.
 
     :param DelegatedKey signing_key: Delegated key used as signing and verification key
@@ -55,6 +59,47 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
 
         ``unwrapping_key`` must be provided if providing decryption materials or loading
         materials from material description
+
+    .. note::
+
+        By default, this cryptographic materials provider generates and wraps a new content key
+        each time encryption materials are requested, and unwraps the content key each time
+        decryption materials are requested.
+
+    When ``cache_max_age`` is set, unwrapped content keys are cached by their wrapping algorithm,
+    content encryption algorithm and wrapped content key, so repeated reads of items that share a
+    wrapped content key only unwrap it once. This never changes what is written.
+
+    When ``content_key_reuse_max_age`` is set, generated content keys are reused for encryption.
+    A content key is used to encrypt items with the same requested material description until it
+    is older than ``content_key_reuse_max_age`` or has been used for ``cache_max_items`` items or
+    ``cache_max_bytes`` bytes, and at least one of those two limits is required. The material
+    description of every item encrypted with it contains the same wrapped content key, so readers
+    are unaffected. Cache hits and misses are counted in :meth:`counters`.
+
+    .. note::
+
+        Items encrypted with the AES-GCM attribute encryption mode use a random 96-bit IV for
+        every attribute, so no more than 2^32 attributes should ever be encrypted under one content
+        key. Keep ``cache_max_items`` well below that divided by the number of encrypted attributes
+        per item.
+
+    .. note::
+
+        This provider is only told how large an item is through the attributes in the encryption
+        context, so ``cache_max_bytes`` counts the serialized size of every attribute in the
+        encryption context, whether or not that attribute is then encrypted.
+
+    :param dict material_description: Material description to use as default state for this CMP (optional)
+    :param float cache_max_age: Max time in seconds that an unwrapped content key may be used from the cache
+        (default: unwrapped content keys are not cached)
+    :param float content_key_reuse_max_age: Max time in seconds that a generated content key may be used to
+        encrypt items (default: every encryption uses a new content key)
+    :param int cache_max_items: Max number of items that a reused content key may be used to encrypt (optional)
+    :param int cache_max_bytes: Max number of plaintext bytes that a reused content key may be used to
+        encrypt (optional)
+    :param int cache_size: The maximum number of content keys that each of the encryption and decryption
+        caches can hold
     """
 
     _signing_key = attr.ib(validator=attr.validators.instance_of(DelegatedKey))
@@ -66,6 +111,13 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         validator=attr.validators.optional(dictionary_validator(six.string_types, six.string_types)),
         default=attr.Factory(dict),
     )
+    _cache_max_age = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(float)), default=None)
+    _content_key_reuse_max_age = attr.ib(
+        validator=attr.validators.optional(attr.validators.instance_of(float)), default=None
+    )
+    _cache_max_items = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _cache_max_bytes = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)), default=None)
+    _cache_size = attr.ib(validator=(attr.validators.instance_of(int), _min_capacity_validator), default=1000)
 
     def __init__(
         self,
@@ -73,6 +125,11 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         wrapping_key=None,  # type: Optional[DelegatedKey]
         unwrapping_key=None,  # type: Optional[DelegatedKey]
         material_description=None,  # type: Optional[Dict[Text, Text]]
+        cache_max_age=None,  # type: Optional[float]
+        content_key_reuse_max_age=None,  # type: Optional[float]
+        cache_max_items=None,  # type: Optional[int]
+        cache_max_bytes=None,  # type: Optional[int]
+        cache_size=1000,  # type: int
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -85,18 +142,109 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         self._wrapping_key = wrapping_key
         self._unwrapping_key = unwrapping_key
         self._material_description = material_description
+        self._cache_max_age = cache_max_age
+        self._content_key_reuse_max_age = content_key_reuse_max_age
+        self._cache_max_items = cache_max_items
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_size = cache_size
         attr.validate(self)
+        self.__attrs_post_init__()
 
-    def _build_materials(self, encryption_context):
-        # type: (EncryptionContext) -> WrappedCryptographicMaterials
+    def __attrs_post_init__(self):
+        # type: () -> None
+        """Prepare the content key caches and counters."""
+        if self._cache_max_age is not None and self._cache_max_age <= 0:
+            raise ValueError("Cache max age must be greater than 0")
+        if self._content_key_reuse_max_age is not None and self._content_key_reuse_max_age <= 0:
+            raise ValueError("Content key reuse max age must be greater than 0")
+        if self._cache_max_items is not None and self._cache_max_items < 1:
+            raise ValueError("Cache max items must be at least 1")
+        if self._cache_max_bytes is not None and self._cache_max_bytes < 1:
+            raise ValueError("Cache max bytes must be at least 1")
+        if (
+            self._content_key_reuse_max_age is not None
+            and self._cache_max_items is None
+            and self._cache_max_bytes is None
+        ):
+            raise ValueError("Content key reuse requires cache max items or cache max bytes")
+        self._encryption_materials_cache = None  # pylint: disable=attribute-defined-outside-init
+        self._content_key_cache = None  # pylint: disable=attribute-defined-outside-init
+        if self._content_key_reuse_max_age is not None:
+            self._encryption_materials_cache = _UsageLimitedCache(  # pylint: disable=attribute-defined-outside-init
+                self._cache_size, self._content_key_reuse_max_age, self._cache_max_items, self._cache_max_bytes
+            )
+        if self._cache_max_age is not None:
+            self._content_key_cache = _UsageLimitedCache(  # pylint: disable=attribute-defined-outside-init
+                self._cache_size, self._cache_max_age
+            )
+        self._counters_lock = Lock()  # attrs confuses pylint: disable=attribute-defined-outside-init
+        self._counters = CacheCounters()  # attrs confuses pylint: disable=attribute-defined-outside-init
+
+    def __reduce__(self):
+        """Pickle only the constructor arguments, since locks and cached content keys cannot be pickled."""
+        return (
+            self.__class__,
+            (
+                self._signing_key,
+                self._wrapping_key,
+                self._unwrapping_key,
+                self._material_description,
+                self._cache_max_age,
+                self._content_key_reuse_max_age,
+                self._cache_max_items,
+                self._cache_max_bytes,
+                self._cache_size,
+            ),
+        )
+
+    def counters(self):
+        # type: () -> CacheCounters
+        """Return a snapshot of the content key cache hit and miss counters.
+
+        :rtype: CacheCounters
+        """
+        with self._counters_lock:
+            return attr.evolve(self._counters)
+
+    def _count(self, name):
+        # type: (str) -> None
+        """Increment a cache counter.
+
+        :param str name: Name of counter to increment
+        """
+        with self._counters_lock:
+            setattr(self._counters, name, getattr(self._counters, name) + 1)
+
+    def _request_material_description(self, encryption_context):
+        # type: (EncryptionContext) -> Dict[Text, Text]
+        """Combine the default material description with the one from the encryption context.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :rtype: dict
+        """
+        material_description = self._material_description.copy()
+        material_description.update(encryption_context.material_description)
+        return material_description
+
+    def _build_materials(self, encryption_context, content_key=None):
+        # type: (EncryptionContext, Optional[DelegatedKey]) -> WrappedCryptographicMaterials
         """Construct
 
         :param EncryptionContext encryption_context: Encryption context for request
+        :param DelegatedKey content_key: Already unwrapped content key for the wrapped content key
+            in the material description (optional)
         :returns: Wrapped cryptographic materials
         :rtype: WrappedCryptographicMaterials
         """
-        material_description = self._material_description.copy()
-        material_description.update(encryption_context.material_description)
+        material_description = self._request_material_description(encryption_context)
+        if content_key is not None:
+            return WrappedCryptographicMaterials(
+                wrapping_key=self._wrapping_key,
+                unwrapping_key=self._unwrapping_key,
+                signing_key=self._signing_key,
+                material_description=material_description,
+                content_key=content_key,
+            )
         return WrappedCryptographicMaterials(
             wrapping_key=self._wrapping_key,
             unwrapping_key=self._unwrapping_key,
@@ -104,6 +252,93 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
             material_description=material_description,
         )
 
+    def _content_key_cache_key(self, encryption_context):
+        # type: (EncryptionContext) -> Optional[Tuple[Hashable, ...]]
+        """Build the key under which the unwrapped content key for a request is cached.
+
+        Missing algorithms fall back to defaults that are fixed for this provider, so they
+        are left as ``None`` rather than resolved.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Cache key, or ``None`` if the material description contains no wrapped content key
+        :rtype: tuple
+        """
+        return self._wrapped_key_cache_key(self._request_material_description(encryption_context))
+
+    @staticmethod
+    def _wrapped_key_cache_key(material_description):
+        # type: (Dict[Text, Text]) -> Optional[Tuple[Hashable, ...]]
+        """Build the key under which the unwrapped content key for a material description is cached.
+
+        Newly generated material descriptions hold the encoded wrapped content key as bytes
+        rather than text, so it is normalized to text.
+
+        :param dict material_description: Material description containing the wrapped content key
+        :returns: Cache key, or ``None`` if the material description contains no wrapped content key
+        :rtype: tuple
+        """
+        try:
+            wrapped_key = material_description[MaterialDescriptionKeys.WRAPPED_DATA_KEY.value]
+        except KeyError:
+            return None
+        return (
+            material_description.get(MaterialDescriptionKeys.CONTENT_KEY_WRAPPING_ALGORITHM.value),
+            material_description.get(MaterialDescriptionKeys.CONTENT_ENCRYPTION_ALGORITHM.value),
+            to_str(wrapped_key),
+        )
+
+    def _cached_decryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> WrappedCryptographicMaterials
+        """Build decryption materials, reusing a cached unwrapped content key if one is available.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Decryption materials
+        :rtype: WrappedCryptographicMaterials
+        """
+        cache_key = self._content_key_cache_key(encryption_context)
+        if cache_key is None:
+            return self._build_materials(encryption_context)
+
+        content_key = self._content_key_cache.get(cache_key)
+        if content_key is not None:
+            self._count("decryption_hits")
+            return self._build_materials(encryption_context, content_key)
+
+        _LOGGER.debug("Unwrapped content key not found in cache")
+        self._count("decryption_misses")
+        materials = self._build_materials(encryption_context)
+        self._content_key_cache.put(cache_key, materials.decryption_key)
+        return materials
+
+    def _cached_encryption_materials(self, encryption_context):
+        # type: (EncryptionContext) -> WrappedCryptographicMaterials
+        """Build encryption materials, reusing a cached content key if a usable one is available.
+
+        Content keys are cached by the requested material description. If unwrapped content keys
+        are cached, a newly generated content key is also added to that cache, so reading back items
+        it encrypted does not unwrap it.
+
+        :param EncryptionContext encryption_context: Encryption context for request
+        :returns: Encryption materials
+        :rtype: WrappedCryptographicMaterials
+        """
+        cache_key = tuple(sorted(self._request_material_description(encryption_context).items()))
+        item_size = 0 if self._cache_max_bytes is None else _encryption_context_size(encryption_context)
+        materials = self._encryption_materials_cache.get(cache_key, item_size)
+        if materials is not None:
+            self._count("encryption_hits")
+            return materials
+
+        _LOGGER.debug("Usable content key not found in cache")
+        self._count("encryption_misses")
+        materials = self._build_materials(encryption_context)
+        self._encryption_materials_cache.put(cache_key, materials, item_size)
+        if self._content_key_cache is not None:
+            self._content_key_cache.put(
+                self._wrapped_key_cache_key(materials.material_description), materials.encryption_key
+            )
+        return materials
+
     def encryption_materials(self, encryption_context):
         # type: (EncryptionContext) -> WrappedCryptographicMaterials
         """Provide encryption materials.
@@ -116,6 +351,8 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         if self._wrapping_key is None:
             raise WrappingError("Encryption materials cannot be provided: no wrapping key")
 
+        if self._encryption_materials_cache is not None:
+            return self._cached_encryption_materials(encryption_context)
         return self._build_materials(encryption_context)
 
     def decryption_materials(self, encryption_context):
@@ -130,4 +367,14 @@ class WrappedCryptographicMaterialsProvider(CryptographicMaterialsProvider):
         if self._unwrapping_key is None:
             raise UnwrappingError("Decryption materials cannot be provided: no unwrapping key")
 
+        if self._content_key_cache is not None:
+            return self._cached_decryption_materials(encryption_context)
         return self._build_materials(encryption_context)
+
+    def refresh(self):
+        # type: () -> None
+        """Clear any cached content keys."""
+        if self._encryption_materials_cache is not None:
+            self._encryption_materials_cache.clear()
+        if self._content_key_cache is not None:
+            self._content_key_cache.clear()
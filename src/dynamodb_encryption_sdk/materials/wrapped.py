@@ -56,6 +56,8 @@ class WrappedCryptographicMaterials(CryptographicMaterials):
         ``unwrapping_key`` must be provided if material description does not contain a wrapped content key
 
     :param dict material_description: Material description to use with these cryptographic materials
+    :param DelegatedKey content_key: Already unwrapped content key for the wrapped content key in
+        ``material_description``. If provided, the wrapped content key is not unwrapped again. (optional)
     """
 
     _signing_key = attr.ib(validator=attr.validators.instance_of(DelegatedKey))
@@ -68,6 +70,7 @@ class WrappedCryptographicMaterials(CryptographicMaterials):
         converter=copy.deepcopy,
         default=attr.Factory(dict),
     )
+    _content_key = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(DelegatedKey)), default=None)
 
     def __init__(
         self,
@@ -75,6 +78,7 @@ class WrappedCryptographicMaterials(CryptographicMaterials):
         wrapping_key=None,  # type: Optional[DelegatedKey]
         unwrapping_key=None,  # type: Optional[DelegatedKey]
         material_description=None,  # type: Optional[Dict[Text, Text]]
+        content_key=None,  # type: Optional[DelegatedKey]
     ):  # noqa=D107
         # type: (...) -> None
         # Workaround pending resolution of attrs/mypy interaction.
@@ -87,6 +91,7 @@ class WrappedCryptographicMaterials(CryptographicMaterials):
         self._wrapping_key = wrapping_key
         self._unwrapping_key = unwrapping_key
         self._material_description = material_description
+        self._content_key = content_key
         attr.validate(self)
         self.__attrs_post_init__()
 
@@ -97,6 +102,8 @@ class WrappedCryptographicMaterials(CryptographicMaterials):
         )
 
         if MaterialDescriptionKeys.WRAPPED_DATA_KEY.value in self.material_description:
+            if self._content_key is not None:
+                return
             self._content_key = (
                 self._content_key_from_material_description()
             )  # noqa pylint: disable=attribute-defined-outside-init
@@ -23,7 +23,7 @@ from dynamodb_encryption_sdk.internal.validators import dictionary_validator, it
 from .identifiers import CryptoAction
 
 try:  # Python 3.5.0 and 3.5.1 have incompatible typing modules
-    from typing import Dict, Iterable, List, Optional, Set, Text  # noqa pylint: disable=unused-import
+    from typing import Any, Dict, Iterable, List, Optional, Set, Text  # noqa pylint: disable=unused-import
 except ImportError:  # pragma: no cover
     # We only actually need these imports when running the mypy checks
     pass
@@ -342,7 +342,14 @@ class TableInfo(object):
         :param client: Pre-configured boto3 DynamoDB client
         :type client: botocore.client.BaseClient
         """
-        table = client.describe_table(TableName=self.name)["Table"]
+        self.load_indexed_attributes(client.describe_table(TableName=self.name)["Table"])
+
+    def load_indexed_attributes(self, table):
+        # type: (Dict[Text, Any]) -> None
+        """Load all indexes for this table from a DescribeTable response.
+
+        :param dict table: ``Table`` value from a DescribeTable response
+        """
         self._primary_index = TableIndex.from_key_schema(table["KeySchema"])
 
         self._secondary_indexes = []
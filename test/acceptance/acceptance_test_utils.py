@@ -130,30 +130,35 @@ def _load_signing_key(key):
     return _load_key(key)
 
 
-def _build_static_cmp(encrypt_key, decrypt_key, sign_key, verify_key):
+def _build_static_cmp(encrypt_key, decrypt_key, sign_key, verify_key, material_description=None):
     encryption_key = _load_key(encrypt_key)
     decryption_key = _load_key(decrypt_key)
     verification_key = _load_signing_key(verify_key)
     signing_key = _load_signing_key(sign_key)
     decryption_materials = RawDecryptionMaterials(decryption_key=decryption_key, verification_key=verification_key)
-    encryption_materials = RawEncryptionMaterials(encryption_key=encryption_key, signing_key=signing_key)
+    encryption_materials = RawEncryptionMaterials(
+        encryption_key=encryption_key, signing_key=signing_key, material_description=material_description
+    )
     return StaticCryptographicMaterialsProvider(
         decryption_materials=decryption_materials, encryption_materials=encryption_materials
     )
 
 
-def _build_wrapped_cmp(encrypt_key, decrypt_key, sign_key, verify_key):
+def _build_wrapped_cmp(encrypt_key, decrypt_key, sign_key, verify_key, material_description=None):
     wrapping_key = _load_key(encrypt_key)
     unwrapping_key = _load_key(decrypt_key)
     signing_key = _load_signing_key(sign_key)
     return WrappedCryptographicMaterialsProvider(
-        signing_key=signing_key, unwrapping_key=unwrapping_key, wrapping_key=wrapping_key
+        signing_key=signing_key,
+        unwrapping_key=unwrapping_key,
+        wrapping_key=wrapping_key,
+        material_description=material_description,
     )
 
 
-def _build_aws_kms_cmp(encrypt_key, decrypt_key, sign_key, verify_key):
+def _build_aws_kms_cmp(encrypt_key, decrypt_key, sign_key, verify_key, material_description=None):
     key_id = decrypt_key["keyId"]
-    return AwsKmsCryptographicMaterialsProvider(key_id=key_id)
+    return AwsKmsCryptographicMaterialsProvider(key_id=key_id, material_description=material_description)
 
 
 def _meta_table_prep(table_name, items_filename):
@@ -222,8 +227,17 @@ def _build_cmp(scenario, keys):
     # We added encrypt and sign for some new scenarios; use them if they exist, otherwise use the existing ones
     encrypt_key = scenario["keys"].get("encrypt", decrypt_key)
     sign_key = scenario["keys"].get("sign", verify_key)
+    # Some scenarios ask for materials that opt in to non-default behavior, such as the attribute encryption mode
+    material_description = scenario.get("material_description")
     return (
-        partial(cmp_builder, keys[encrypt_key], keys[decrypt_key], keys[sign_key], keys[verify_key]),
+        partial(
+            cmp_builder,
+            keys[encrypt_key],
+            keys[decrypt_key],
+            keys[sign_key],
+            keys[verify_key],
+            material_description=material_description,
+        ),
         scenario["keys"]["decrypt"],
         scenario["keys"]["verify"],
     )
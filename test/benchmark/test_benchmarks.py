@@ -0,0 +1,115 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Timing benchmarks for hot paths.
+
+These only report timings, so they never fail on a slow or busy machine. They are not selected
+by the local, integ or all tox environments; run them with ``tox -e py37-benchmark``, or with
+``pytest test/benchmark -m benchmark -s``.
+"""
+
+import timeit
+from decimal import Decimal
+from threading import Thread
+
+import pytest
+from mock import sentinel
+
+from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
+from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.encrypted.item import _decrypt_python_item_with_context, _encrypt_python_item_with_context
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.formatting.deserialize.attribute import deserialize_attribute
+from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import serialize_attribute
+from dynamodb_encryption_sdk.material_providers.most_recent import ClockCache
+from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
+
+from ..functional.functional_test_utils import build_static_jce_cmp
+from ..functional.functional_test_vector_generators import attribute_test_vectors
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def _report(name, function, number=20, repeat=9):
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    print("\n{}: {:.1f} us per call".format(name, best / number * 1e6))
+
+
+def test_python_item_with_context_benchmark():
+    """Encrypt and decrypt 50-attribute python items, converting each attribute once."""
+    crypto_config = CryptoConfig(
+        materials_provider=build_static_jce_cmp("AES", 256, "HmacSHA256", 256),
+        encryption_context=EncryptionContext(table_name="table", partition_key_name="attribute_0"),
+        attribute_actions=AttributeActions(
+            default_action=CryptoAction.SIGN_ONLY,
+            attribute_actions={
+                "attribute_{}".format(index): CryptoAction.ENCRYPT_AND_SIGN for index in range(1, 50, 5)
+            },
+        ),
+    )
+    item = {
+        "attribute_{}".format(index): (
+            {"number": Decimal(index), "list": [Decimal(1), "two"]} if index % 2 else "value {}".format(index)
+        )
+        for index in range(50)
+    }
+    encrypted_item = _encrypt_python_item_with_context(item, crypto_config)
+
+    _report("encrypt python item", lambda: _encrypt_python_item_with_context(item, crypto_config))
+    _report("decrypt python item", lambda: _decrypt_python_item_with_context(encrypted_item, crypto_config))
+
+
+def test_attribute_codec_benchmark():
+    """Serialize and deserialize the attribute test vectors."""
+    attributes = [attribute for attribute, _serialized in attribute_test_vectors("serialize")]
+    serialized_attributes = [serialize_attribute(attribute) for attribute in attributes]
+
+    _report("serialize attributes", lambda: [serialize_attribute(attribute) for attribute in attributes])
+    _report("deserialize attributes", lambda: [deserialize_attribute(each) for each in serialized_attributes])
+
+
+def test_aes_cbc_pkcs5_benchmark():
+    """Encrypt attributes of several lengths with a delegated AES key."""
+    delegated_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    plaintexts = [b"a" * length for length in range(0, 200, 8)]
+
+    _report(
+        "encrypt AES/CBC/PKCS5Padding attributes",
+        lambda: [
+            delegated_key.encrypt(algorithm="AES/CBC/PKCS5Padding", name="attribute", plaintext=plaintext)
+            for plaintext in plaintexts
+        ],
+        number=100,
+    )
+
+
+def test_hmac_sign_benchmark():
+    """Sign a batch of items with a delegated HMAC key."""
+    key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    data = [b"string to sign %d" % index for index in range(100)]
+
+    _report("sign 100 items with HmacSHA256", lambda: key.sign_many(algorithm="HmacSHA256", data=data))
+
+
+def test_provider_cache_threaded_benchmark():
+    """Look up a cached provider from many threads at once."""
+    cache = ClockCache(1000)
+    cache.put(0, sentinel.provider)
+
+    def _get_in_threads():
+        threads = [Thread(target=lambda: [cache.get(0) for _ in range(1000)]) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    _report("1000 provider cache lookups in each of 32 threads", _get_in_threads, number=1, repeat=5)
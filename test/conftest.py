@@ -0,0 +1,20 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Test configuration."""
+import sys
+
+collect_ignore_glob = []
+
+if sys.version_info < (3, 5):
+    # The asyncio helpers and their tests use syntax that requires Python 3.5 or later.
+    collect_ignore_glob.extend(["*/test_aio.py", "*/aio_test_utils.py"])
@@ -0,0 +1,83 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Helper tools for testing the asyncio helpers against synchronous boto3 objects."""
+import asyncio
+
+
+def run(coroutine):
+    """Run a coroutine to completion on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncPaginator(object):
+    """Present a synchronous boto3 paginator as an asynchronous paginator."""
+
+    def __init__(self, paginator):
+        self._paginator = paginator
+
+    def paginate(self, **kwargs):
+        return AsyncPageIterator(self._paginator.paginate(**kwargs))
+
+
+class AsyncPageIterator(object):
+    """Present a synchronous page iterator as an asynchronous iterator."""
+
+    def __init__(self, pages):
+        self._pages = iter(pages)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        try:
+            return next(self._pages)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncMeta(object):
+    """Stand-in for ``table.meta`` that exposes an asynchronous client."""
+
+    def __init__(self, meta):
+        self.client = AsyncWrapper(meta.client)
+
+
+class AsyncWrapper(object):
+    """Present a synchronous boto3 client or table resource with the aiobotocore/aioboto3 method shape."""
+
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+
+    @property
+    def meta(self):
+        return AsyncMeta(self._wrapped.meta)
+
+    def get_paginator(self, operation_name):
+        return AsyncPaginator(self._wrapped.get_paginator(operation_name))
+
+    def __getattr__(self, name):
+        attribute = getattr(self._wrapped, name)
+        if not callable(attribute):
+            return attribute
+
+        async def _method(*args, **kwargs):
+            # Yield to the event loop like a real network call would.
+            await asyncio.sleep(0)
+            return attribute(*args, **kwargs)
+
+        return _method
@@ -11,16 +11,20 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional test suite for ``dynamodb_encryption_sdk.delegated_keys.jce``."""
+
 from __future__ import division
 
 import logging
+import pickle
 
 import pytest
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
+from pytest_mock import mocker  # noqa pylint: disable=unused-import
 
 from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
-from dynamodb_encryption_sdk.internal.crypto.jce_bridge.authentication import JAVA_AUTHENTICATOR
+from dynamodb_encryption_sdk.exceptions import SignatureVerificationError
+from dynamodb_encryption_sdk.internal.crypto.jce_bridge.authentication import JAVA_AUTHENTICATOR, JavaMac
 from dynamodb_encryption_sdk.internal.identifiers import MinimumKeySizes
 
 pytestmark = [pytest.mark.functional, pytest.mark.local]
@@ -82,3 +86,61 @@ def test_warn_on_short_keys(caplog, algorithm, key_bits, too_short, error_messag
 
     logging_results = caplog.text
     assert (too_short and error_message in logging_results) or (not too_short and error_message not in logging_results)
+
+
+_SIGNED_DATA = [b"", b"some data", b"more data" * 100]
+
+
+@pytest.mark.parametrize("algorithm", ("HmacSHA256", "HmacSHA512", "SHA256withRSA"))
+def test_sign_many_matches_sign(algorithm):
+    key = JceNameLocalDelegatedKey.generate(algorithm, 2048 if "RSA" in algorithm else 256)
+
+    signatures = key.sign_many(algorithm=algorithm, data=_SIGNED_DATA)
+
+    assert len(signatures) == len(_SIGNED_DATA)
+    key.verify_many(algorithm=algorithm, signatures=signatures, data=_SIGNED_DATA)
+    for signature, data in zip(signatures, _SIGNED_DATA):
+        key.verify(algorithm=algorithm, signature=signature, data=data)
+
+
+def test_hmac_signer_is_reused_without_being_consumed():
+    key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    fresh_key = JceNameLocalDelegatedKey(key.key, "HmacSHA256", key._key_type, key._key_encoding)
+
+    signature = key.sign(algorithm="HmacSHA256", data=b"some data")
+
+    assert key.sign(algorithm="HmacSHA256", data=b"some data") == signature
+    assert fresh_key.sign(algorithm="HmacSHA256", data=b"some data") == signature
+
+
+def test_verify_many_rejects_bad_signature():
+    key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    signatures = key.sign_many(algorithm="HmacSHA256", data=_SIGNED_DATA)
+    signatures[1] = signatures[0]
+
+    with pytest.raises(SignatureVerificationError):
+        key.verify_many(algorithm="HmacSHA256", signatures=signatures, data=_SIGNED_DATA)
+
+
+@pytest.mark.parametrize("algorithm", ("AES", "HmacSHA256", "SHA256withRSA"))
+def test_pickle_cycle(algorithm):
+    key = JceNameLocalDelegatedKey.generate(algorithm, 2048 if "RSA" in algorithm else 256)
+
+    assert pickle.loads(pickle.dumps(key)) == key
+
+
+def _legacy_sign(key, data):
+    signer = JAVA_AUTHENTICATOR["HmacSHA256"]
+    return signer.sign(key.key, data)
+
+
+def test_hmac_sign_many_reuses_prepared_signer(mocker):
+    key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    data = [b"string to sign %d" % index for index in range(100)]
+    build_hmac_signer = mocker.spy(JavaMac, "_build_hmac_signer")
+
+    signatures = key.sign_many(algorithm="HmacSHA256", data=data)
+    key.verify_many(algorithm="HmacSHA256", signatures=signatures, data=data)
+
+    assert not build_hmac_signer.called
+    assert signatures == [_legacy_sign(key, each) for each in data]
@@ -0,0 +1,269 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Functional tests for ``dynamodb_encryption_sdk.encrypted.aio``."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+
+from dynamodb_encryption_sdk.encrypted.aio import AsyncEncryptedClient, AsyncEncryptedTable
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.material_providers.aio import AsyncCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.structures import AttributeActions, TableIndex, TableInfo
+from dynamodb_encryption_sdk.transform import ddb_to_dict, dict_to_ddb
+
+from ..aio_test_utils import AsyncWrapper, run
+from ..functional_test_utils import example_table  # noqa=F401 pylint: disable=unused-import
+from ..functional_test_utils import mock_ddb_service  # noqa=F401 pylint: disable=unused-import
+from ..functional_test_utils import (
+    TEST_BATCH_KEYS,
+    TEST_KEY,
+    TEST_REGION_NAME,
+    TEST_TABLE_NAME,
+    assert_equal_lists_of_items,
+    build_static_jce_cmp,
+    check_encrypted_item,
+    diverse_item,
+)
+
+pytestmark = [pytest.mark.functional, pytest.mark.local]
+
+
+class SlowAsyncMaterialsProvider(AsyncCryptographicMaterialsProvider):
+    """Asynchronous materials provider that simulates a network call before delegating to another provider."""
+
+    def __init__(self, materials_provider):
+        self._materials_provider = materials_provider
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _wait(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+    async def async_encryption_materials(self, encryption_context):
+        await self._wait()
+        return self._materials_provider.encryption_materials(encryption_context)
+
+    async def async_decryption_materials(self, encryption_context):
+        await self._wait()
+        return self._materials_provider.decryption_materials(encryption_context)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts the work submitted to it."""
+
+    def __init__(self):
+        super(CountingExecutor, self).__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.submitted += 1
+        return super(CountingExecutor, self).submit(*args, **kwargs)
+
+
+def _attribute_actions():
+    return AttributeActions(
+        default_action=CryptoAction.ENCRYPT_AND_SIGN, attribute_actions={"string": CryptoAction.SIGN_ONLY}
+    )
+
+
+def _check_attribute_actions():
+    check_actions = _attribute_actions()
+    check_actions.set_index_keys(*list(TEST_KEY.keys()))
+    return check_actions
+
+
+def _table_info():
+    return TableInfo(
+        name=TEST_TABLE_NAME, primary_index=TableIndex(partition="partition_attribute", sort="sort_attribute")
+    )
+
+
+def _static_cmp():
+    return build_static_jce_cmp("AES", 256, "HmacSHA256", 256)
+
+
+def _batch_items():
+    items = []
+    for key in TEST_BATCH_KEYS:
+        item = diverse_item()
+        item.update(key)
+        items.append(item)
+    return items
+
+
+@pytest.fixture
+def sync_client(example_table):
+    return boto3.client("dynamodb", region_name=TEST_REGION_NAME)
+
+
+@pytest.fixture
+def sync_table(example_table):
+    return boto3.resource("dynamodb", region_name=TEST_REGION_NAME).Table(TEST_TABLE_NAME)
+
+
+@pytest.mark.parametrize("materials_provider", (_static_cmp(), SlowAsyncMaterialsProvider(_static_cmp())))
+def test_client_cycle_single_item(sync_client, materials_provider):
+    executor = CountingExecutor()
+    e_client = AsyncEncryptedClient(
+        client=AsyncWrapper(sync_client),
+        materials_provider=materials_provider,
+        attribute_actions=_attribute_actions(),
+        executor=executor,
+    )
+    item = diverse_item()
+    item.update(TEST_KEY)
+    ddb_key = dict_to_ddb(TEST_KEY)
+
+    async def _cycle():
+        await e_client.put_item(TableName=TEST_TABLE_NAME, Item=dict_to_ddb(item))
+        return await e_client.get_item(TableName=TEST_TABLE_NAME, Key=ddb_key, ConsistentRead=True)
+
+    decrypted_result = run(_cycle())
+
+    encrypted_result = sync_client.get_item(TableName=TEST_TABLE_NAME, Key=ddb_key, ConsistentRead=True)
+    check_encrypted_item(item, ddb_to_dict(encrypted_result["Item"]), _check_attribute_actions())
+    assert ddb_to_dict(decrypted_result["Item"]) == item
+    assert executor.submitted > 0
+    executor.shutdown()
+
+
+def test_client_cycle_batch_items(sync_client):
+    materials_provider = SlowAsyncMaterialsProvider(_static_cmp())
+    e_client = AsyncEncryptedClient(
+        client=AsyncWrapper(sync_client), materials_provider=materials_provider, attribute_actions=_attribute_actions()
+    )
+    items = _batch_items()
+
+    async def _cycle():
+        write_response = await e_client.batch_write_item(
+            RequestItems={TEST_TABLE_NAME: [{"PutRequest": {"Item": dict_to_ddb(item)}} for item in items]}
+        )
+        get_response = await e_client.batch_get_item(
+            RequestItems={TEST_TABLE_NAME: {"Keys": [dict_to_ddb(key) for key in TEST_BATCH_KEYS]}}
+        )
+        scan_response = await e_client.scan(TableName=TEST_TABLE_NAME, ConsistentRead=True)
+        query_response = await e_client.query(
+            TableName=TEST_TABLE_NAME,
+            KeyConditionExpression="partition_attribute = :value",
+            ExpressionAttributeValues={":value": {"S": "test_value"}},
+        )
+        return write_response, get_response, scan_response, query_response
+
+    write_response, get_response, scan_response, query_response = run(_cycle())
+
+    ddb_items = [dict_to_ddb(item) for item in items]
+    assert not write_response.get("UnprocessedItems")
+    assert_equal_lists_of_items(get_response["Responses"][TEST_TABLE_NAME], ddb_items, ddb_to_dict)
+    assert_equal_lists_of_items(scan_response["Items"], ddb_items, ddb_to_dict)
+    assert_equal_lists_of_items(
+        query_response["Items"],
+        [item for item in ddb_items if item["partition_attribute"] == {"S": "test_value"}],
+        ddb_to_dict,
+    )
+    for encrypted_item in sync_client.scan(TableName=TEST_TABLE_NAME)["Items"]:
+        plaintext_item = [
+            item for item in items if dict_to_ddb(item)["sort_attribute"] == encrypted_item["sort_attribute"]
+        ][0]
+        check_encrypted_item(plaintext_item, ddb_to_dict(encrypted_item), _check_attribute_actions())
+    # Materials for the items in each request were awaited concurrently.
+    assert materials_provider.max_in_flight > 1
+
+
+def test_client_scan_paginator(sync_client):
+    e_client = AsyncEncryptedClient(
+        client=AsyncWrapper(sync_client), materials_provider=_static_cmp(), attribute_actions=_attribute_actions()
+    )
+    items = _batch_items()
+
+    async def _cycle():
+        for item in items:
+            await e_client.put_item(TableName=TEST_TABLE_NAME, Item=dict_to_ddb(item))
+
+        pages = []
+        async for page in e_client.get_paginator("scan").paginate(
+            TableName=TEST_TABLE_NAME, ConsistentRead=True, PaginationConfig={"PageSize": 1}
+        ):
+            pages.append(page)
+        return pages
+
+    pages = run(_cycle())
+
+    assert len([page for page in pages if page["Items"]]) == len(items)
+    assert_equal_lists_of_items(
+        [item for page in pages for item in page["Items"]], [dict_to_ddb(item) for item in items], ddb_to_dict
+    )
+
+
+@pytest.mark.parametrize("auto_refresh_table_indexes", (True, False))
+def test_table_cycle(sync_table, auto_refresh_table_indexes):
+    materials_provider = SlowAsyncMaterialsProvider(_static_cmp())
+    e_table = AsyncEncryptedTable(
+        table=AsyncWrapper(sync_table),
+        materials_provider=materials_provider,
+        table_info=_table_info(),
+        attribute_actions=_attribute_actions(),
+        auto_refresh_table_indexes=auto_refresh_table_indexes,
+    )
+    items = _batch_items()
+
+    async def _cycle():
+        for item in items:
+            await e_table.put_item(Item=item)
+        get_response = await e_table.get_item(Key=TEST_KEY, ConsistentRead=True)
+        scan_response = await e_table.scan(ConsistentRead=True)
+        return get_response, scan_response
+
+    get_response, scan_response = run(_cycle())
+
+    assert get_response["Item"] == items[0]
+    assert_equal_lists_of_items(scan_response["Items"], items)
+    for encrypted_item in sync_table.scan()["Items"]:
+        plaintext_item = [item for item in items if item["sort_attribute"] == encrypted_item["sort_attribute"]][0]
+        check_encrypted_item(plaintext_item, encrypted_item, _check_attribute_actions())
+    assert materials_provider.max_in_flight > 1
+
+
+def test_table_unsupported_methods(sync_table):
+    e_table = AsyncEncryptedTable(
+        table=AsyncWrapper(sync_table),
+        materials_provider=_static_cmp(),
+        table_info=_table_info(),
+        auto_refresh_table_indexes=False,
+    )
+
+    with pytest.raises(NotImplementedError) as excinfo:
+        run(e_table.update_item(Key=TEST_KEY))
+    excinfo.match(r'"update_item" is not yet implemented')
+
+    with pytest.raises(NotImplementedError) as excinfo:
+        e_table.batch_writer()
+    excinfo.match(r'"batch_writer" is not yet implemented')
+
+
+def test_async_provider_rejected_by_sync_methods():
+    materials_provider = SlowAsyncMaterialsProvider(_static_cmp())
+
+    with pytest.raises(AttributeError) as excinfo:
+        AsyncCryptographicMaterialsProvider.encryption_materials(materials_provider, None)
+    excinfo.match(r"Encryption materials are only available from async_encryption_materials")
+
+    with pytest.raises(AttributeError) as excinfo:
+        AsyncCryptographicMaterialsProvider.decryption_materials(materials_provider, None)
+    excinfo.match(r"Decryption materials are only available from async_decryption_materials")
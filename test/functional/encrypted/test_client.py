@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for ``dynamodb_encryption_sdk.encrypted.client``."""
+
 import hypothesis
 import pytest
 
@@ -24,6 +25,10 @@ from ..functional_test_utils import (
     client_cycle_batch_items_check,
     client_cycle_batch_items_check_scan_paginator,
     client_cycle_single_item_check,
+    client_executor_shutdown_check,
+    client_iter_scan_check,
+    client_parallel_decrypt_check,
+    client_parallel_scan_check,
     set_parametrized_actions,
     set_parametrized_cmp,
     set_parametrized_item,
@@ -84,6 +89,26 @@ def test_batch_item_unprocessed(example_table, parametrized_actions, parametrize
     _client_batch_items_unprocessed_check(cmp, parametrized_actions, parametrized_item)
 
 
+def test_ephemeral_iter_scan(example_table, some_cmps, parametrized_actions, parametrized_item):
+    """Test streaming scan and query iterators against a small number of curated items."""
+    client_iter_scan_check(some_cmps, parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_parallel_decrypt(example_table, parametrized_actions, parametrized_item):
+    """Test decrypting read results in parallel with a single ephemeral static CMP."""
+    cmp = build_static_jce_cmp("AES", 256, "HmacSHA256", 256)
+    client_parallel_decrypt_check(cmp, parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_close_shuts_down_created_executor(example_table):
+    client_executor_shutdown_check(TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_parallel_scan(example_table, parametrized_actions, parametrized_item):
+    """Test decrypting a parallel scan in worker processes against a small number of curated items."""
+    client_parallel_scan_check(parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
 @pytest.mark.slow
 def test_ephemeral_item_cycle_slow(example_table, all_the_cmps, parametrized_actions, parametrized_item):
     """Test ALL THE CMPS against a small number of curated items."""
@@ -11,22 +11,50 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for ``dynamodb_encryption_sdk.encrypted.item``."""
+
+import copy
+import pickle
+from decimal import Decimal
+
 import hypothesis
 import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 
 from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
 from dynamodb_encryption_sdk.encrypted import CryptoConfig
-from dynamodb_encryption_sdk.encrypted.item import decrypt_python_item, encrypt_python_item
-from dynamodb_encryption_sdk.exceptions import DecryptionError, EncryptionError
+from dynamodb_encryption_sdk.encrypted.item import (
+    _decrypt_python_item_with_context,
+    _encrypt_python_item_with_context,
+    decrypt_dynamodb_item,
+    decrypt_dynamodb_items,
+    decrypt_python_item,
+    decrypt_python_items,
+    encrypt_dynamodb_item,
+    encrypt_dynamodb_items,
+    encrypt_python_item,
+    encrypt_python_items,
+)
+from dynamodb_encryption_sdk.exceptions import DecryptionError, EncryptionError, SignatureVerificationError
 from dynamodb_encryption_sdk.identifiers import CryptoAction
-from dynamodb_encryption_sdk.internal.identifiers import MaterialDescriptionKeys, ReservedAttributes
+from dynamodb_encryption_sdk.internal.crypto import authentication, encryption
+from dynamodb_encryption_sdk.internal.formatting.material_description import serialize as serialize_material_description
+from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import serialize_attribute
+from dynamodb_encryption_sdk.internal.identifiers import (
+    MaterialDescriptionKeys,
+    MaterialDescriptionValues,
+    ReservedAttributes,
+)
+from dynamodb_encryption_sdk.material_providers.caching import CacheCounters
 from dynamodb_encryption_sdk.material_providers.static import StaticCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.material_providers.wrapped import WrappedCryptographicMaterialsProvider
 from dynamodb_encryption_sdk.materials.raw import RawDecryptionMaterials, RawEncryptionMaterials
 from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
+from dynamodb_encryption_sdk.transform import dict_to_ddb
 
 from ..functional_test_utils import (
     build_static_jce_cmp,
     cycle_item_check,
+    cycle_items_check,
     set_parametrized_actions,
     set_parametrized_cmp,
     set_parametrized_item,
@@ -68,6 +96,83 @@ def test_reserved_attributes_on_encrypt(static_cmp_crypto_config, item):
     exc_info.match(r"Reserved attribute name *")
 
 
+def _mode_crypto_config(encryption_mode):
+    encryption_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    cmp = StaticCryptographicMaterialsProvider(
+        encryption_materials=RawEncryptionMaterials(
+            encryption_key=encryption_key,
+            signing_key=signing_key,
+            material_description={MaterialDescriptionKeys.ATTRIBUTE_ENCRYPTION_MODE.value: encryption_mode},
+        ),
+        decryption_materials=RawDecryptionMaterials(decryption_key=encryption_key, verification_key=signing_key),
+    )
+    return CryptoConfig(
+        materials_provider=cmp, encryption_context=EncryptionContext(), attribute_actions=AttributeActions()
+    )
+
+
+def test_gcm_item_cycle(parametrized_item):
+    crypto_config = _mode_crypto_config(MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value)
+
+    encrypted_item = encrypt_python_item(parametrized_item, crypto_config)
+
+    material_description = encrypted_item[ReservedAttributes.MATERIAL_DESCRIPTION.value].value
+    assert b"/GCM/NoPadding" in material_description
+    assert decrypt_python_item(encrypted_item, crypto_config) == parametrized_item
+
+
+def test_gcm_attributes_are_not_padded():
+    gcm_config = _mode_crypto_config(MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value)
+    cbc_config = _mode_crypto_config(MaterialDescriptionValues.CBC_PKCS5_ATTRIBUTE_ENCRYPTION.value)
+    item = {"value": {"S": "x" * 32}}
+    serialized_length = len(serialize_attribute(item["value"]))
+
+    gcm_ciphertext = encrypt_dynamodb_item(item, gcm_config)["value"]["B"]
+    cbc_ciphertext = encrypt_dynamodb_item(item, cbc_config)["value"]["B"]
+
+    # 12-byte IV and 16-byte tag, against a 16-byte IV and up to a full block of padding
+    assert len(gcm_ciphertext) == 12 + serialized_length + 16
+    assert len(cbc_ciphertext) == 16 + (serialized_length // 16 + 1) * 16
+
+
+def test_gcm_attribute_name_is_authenticated():
+    crypto_config = _mode_crypto_config(MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value)
+    encryption_key = crypto_config.encryption_materials().encryption_key
+    encrypted_attribute = encryption.encrypt_attribute(
+        "first", {"S": "value"}, encryption_key, "AES" + MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value
+    )
+
+    with pytest.raises(DecryptionError):
+        encryption.decrypt_attribute(
+            "second",
+            encrypted_attribute,
+            encryption_key,
+            "AES" + MaterialDescriptionValues.GCM_ATTRIBUTE_ENCRYPTION.value,
+        )
+
+
+def test_unsupported_encryption_mode():
+    crypto_config = _mode_crypto_config("/CTR/NoPadding")
+
+    with pytest.raises(EncryptionError) as exc_info:
+        encrypt_python_item({"test": "value"}, crypto_config)
+
+    exc_info.match(r'Unsupported attribute encryption mode: "/CTR/NoPadding"')
+
+
+def test_missing_encryption_mode(static_cmp_crypto_config):
+    encrypted_item = encrypt_dynamodb_item({"test": {"S": "value"}}, static_cmp_crypto_config)
+    # Only the signing algorithm is left in the material description.
+    material_description = {MaterialDescriptionKeys.SIGNING_KEY_ALGORITHM.value: "HmacSHA256"}
+    encrypted_item[ReservedAttributes.MATERIAL_DESCRIPTION.value] = serialize_material_description(material_description)
+
+    with pytest.raises(DecryptionError) as exc_info:
+        decrypt_dynamodb_item(encrypted_item, static_cmp_crypto_config)
+
+    exc_info.match(r"No attribute encryption mode found in material description")
+
+
 def test_only_sign_item(parametrized_item):
     signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
     cmp = StaticCryptographicMaterialsProvider(
@@ -159,6 +264,313 @@ def test_ephemeral_item_cycle(some_cmps, parametrized_actions, parametrized_item
     _item_cycle_check(some_cmps, parametrized_actions, parametrized_item)
 
 
+def test_ephemeral_items_cycle(some_cmps, parametrized_actions, parametrized_item):
+    """Test a small number of curated CMPs against a batch of curated items."""
+    crypto_config = CryptoConfig(
+        materials_provider=some_cmps, encryption_context=EncryptionContext(), attribute_actions=parametrized_actions
+    )
+    items = [dict(parametrized_item, counter=index) for index in range(3)]
+    cycle_items_check(items, crypto_config)
+
+
+def test_encrypt_items_resolves_materials_once(mocker, static_cmp_crypto_config):
+    mocker.spy(static_cmp_crypto_config.materials_provider, "encryption_materials")
+
+    encrypted_items = encrypt_python_items([{"counter": index} for index in range(5)], static_cmp_crypto_config)
+
+    assert len(encrypted_items) == 5
+    assert static_cmp_crypto_config.materials_provider.encryption_materials.call_count == 1
+
+
+def test_decrypt_items_resolves_materials_once_per_material_description(mocker):
+    wrapping_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    crypto_config = CryptoConfig(
+        materials_provider=WrappedCryptographicMaterialsProvider(
+            wrapping_key=wrapping_key, unwrapping_key=wrapping_key, signing_key=signing_key
+        ),
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    plaintext_items = [{"counter": index} for index in range(3)]
+    # Each batch is encrypted under a different content key, so has a different material description
+    encrypted_items = encrypt_python_items(plaintext_items, crypto_config)
+    encrypted_items.extend(encrypt_python_items(plaintext_items, crypto_config))
+    mocker.spy(crypto_config.materials_provider, "decryption_materials")
+
+    decrypted_items = decrypt_python_items(encrypted_items, crypto_config)
+
+    assert decrypted_items == plaintext_items * 2
+    assert crypto_config.materials_provider.decryption_materials.call_count == 2
+
+
+def test_wrapped_content_key_cache_cycle(mocker):
+    wrapping_key = JceNameLocalDelegatedKey.generate("RSA", 2048)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    crypto_config = CryptoConfig(
+        materials_provider=WrappedCryptographicMaterialsProvider(
+            wrapping_key=wrapping_key, unwrapping_key=wrapping_key, signing_key=signing_key, cache_max_age=60.0
+        ),
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    writer = CryptoConfig(
+        materials_provider=WrappedCryptographicMaterialsProvider(wrapping_key=wrapping_key, signing_key=signing_key),
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    plaintext_item = {"counter": 1, "value": "secret"}
+    encrypted_item = encrypt_python_item(plaintext_item, writer)
+    mocker.spy(wrapping_key, "unwrap")
+
+    for _ in range(3):
+        assert decrypt_python_item(encrypted_item, crypto_config) == plaintext_item
+
+    assert wrapping_key.unwrap.call_count == 1
+    assert crypto_config.materials_provider.counters().decryption_hits == 2
+
+
+def test_wrapped_content_key_reuse_cycle(mocker):
+    wrapping_key = JceNameLocalDelegatedKey.generate("RSA", 2048)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    writer = CryptoConfig(
+        materials_provider=WrappedCryptographicMaterialsProvider(
+            wrapping_key=wrapping_key,
+            unwrapping_key=wrapping_key,
+            signing_key=signing_key,
+            cache_max_age=60.0,
+            content_key_reuse_max_age=60.0,
+            cache_max_items=3,
+        ),
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    reader = CryptoConfig(
+        materials_provider=WrappedCryptographicMaterialsProvider(unwrapping_key=wrapping_key, signing_key=signing_key),
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    plaintext_items = [{"counter": index} for index in range(5)]
+    mocker.spy(wrapping_key, "wrap")
+    mocker.spy(wrapping_key, "unwrap")
+
+    encrypted_items = [encrypt_python_item(item, writer) for item in plaintext_items]
+
+    assert wrapping_key.wrap.call_count == 2
+    assert len({item[ReservedAttributes.MATERIAL_DESCRIPTION.value].value for item in encrypted_items}) == 2
+    assert [decrypt_python_item(item, reader) for item in encrypted_items] == plaintext_items
+    assert [decrypt_python_item(item, writer) for item in encrypted_items] == plaintext_items
+    # Only the reader unwraps: the writer already holds both content keys
+    assert wrapping_key.unwrap.call_count == 5
+
+
+@pytest.mark.parametrize(
+    "cache_kwargs", (dict(), dict(cache_max_age=60.0, content_key_reuse_max_age=60.0, cache_max_items=3))
+)
+def test_wrapped_provider_pickle_cycle(cache_kwargs):
+    wrapping_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    materials_provider = WrappedCryptographicMaterialsProvider(
+        wrapping_key=wrapping_key, unwrapping_key=wrapping_key, signing_key=signing_key, **cache_kwargs
+    )
+    materials_provider.encryption_materials(EncryptionContext())
+    crypto_config = CryptoConfig(
+        materials_provider=materials_provider,
+        encryption_context=EncryptionContext(),
+        attribute_actions=AttributeActions(),
+    )
+    plaintext_item = {"counter": 1, "value": "secret"}
+    encrypted_item = encrypt_python_item(plaintext_item, crypto_config)
+
+    unpickled = pickle.loads(pickle.dumps(materials_provider))
+    unpickled_config = CryptoConfig(
+        materials_provider=unpickled, encryption_context=EncryptionContext(), attribute_actions=AttributeActions()
+    )
+
+    assert unpickled.counters() == CacheCounters()
+    assert decrypt_python_item(encrypted_item, unpickled_config) == plaintext_item
+    assert decrypt_python_item(encrypt_python_item(plaintext_item, unpickled_config), crypto_config) == plaintext_item
+
+
+def test_encrypt_items_empty(static_cmp_crypto_config):
+    assert encrypt_dynamodb_items([], static_cmp_crypto_config) == []
+    assert decrypt_dynamodb_items([], static_cmp_crypto_config) == []
+
+
+@pytest.mark.parametrize("item", ({reserved.value: "asdf"} for reserved in ReservedAttributes))
+def test_reserved_attributes_on_encrypt_items(static_cmp_crypto_config, item):
+    with pytest.raises(EncryptionError) as exc_info:
+        encrypt_python_items([{"test": "valid"}, item], static_cmp_crypto_config)
+
+    exc_info.match(r"Reserved attribute name *")
+
+
+def test_encrypt_items_signs_in_one_batch(mocker, static_cmp_crypto_config):
+    plaintext_items = [{"counter": index} for index in range(5)]
+    signing_key = static_cmp_crypto_config.encryption_materials().signing_key
+    mocker.spy(signing_key, "sign_many")
+    mocker.spy(signing_key, "sign")
+
+    encrypted_items = encrypt_python_items(plaintext_items, static_cmp_crypto_config)
+
+    assert signing_key.sign_many.call_count == 1
+    assert signing_key.sign.call_count == 0
+    assert [decrypt_python_item(item, static_cmp_crypto_config) for item in encrypted_items] == plaintext_items
+
+
+def test_decrypt_items_rejects_tampered_item(static_cmp_crypto_config):
+    encrypted_items = encrypt_dynamodb_items(
+        [{"counter": {"N": str(index)}} for index in range(3)], static_cmp_crypto_config
+    )
+    encrypted_items[1]["counter"] = {"N": "100"}
+
+    with pytest.raises(SignatureVerificationError):
+        decrypt_dynamodb_items(encrypted_items, static_cmp_crypto_config)
+
+
+def test_unsigned_items(static_cmp_crypto_config):
+    with pytest.raises(DecryptionError) as exc_info:
+        decrypt_python_items([{"test": "no signature"}], static_cmp_crypto_config)
+
+    exc_info.match(r"No signature attribute found in item")
+
+
+def _wide_item_crypto_config():
+    return CryptoConfig(
+        materials_provider=build_static_jce_cmp("AES", 256, "HmacSHA256", 256),
+        encryption_context=EncryptionContext(table_name="table", partition_key_name="attribute_0"),
+        attribute_actions=AttributeActions(
+            default_action=CryptoAction.SIGN_ONLY,
+            attribute_actions={
+                "attribute_{}".format(index): CryptoAction.ENCRYPT_AND_SIGN for index in range(1, 50, 5)
+            },
+        ),
+    )
+
+
+def _wide_item():
+    return {
+        "attribute_{}".format(index): (
+            {"number": Decimal(index), "list": [Decimal(1), "two"]} if index % 2 else "value {}".format(index)
+        )
+        for index in range(50)
+    }
+
+
+def _legacy_encrypt_python_item(item, crypto_config):
+    return encrypt_python_item(item, crypto_config.with_item(dict_to_ddb(item)))
+
+
+def _legacy_decrypt_python_item(item, crypto_config):
+    return decrypt_python_item(item, crypto_config.with_item(dict_to_ddb(item)))
+
+
+def test_python_item_with_context_cycle(mocker):
+    crypto_config = _wide_item_crypto_config()
+    item = _wide_item()
+    mocker.spy(crypto_config.materials_provider, "encryption_materials")
+    mocker.spy(crypto_config.materials_provider, "decryption_materials")
+
+    encrypted_item = _encrypt_python_item_with_context(item, crypto_config)
+    decrypted_item = _decrypt_python_item_with_context(encrypted_item, crypto_config)
+
+    assert decrypted_item == item
+    assert _legacy_decrypt_python_item(encrypted_item, crypto_config) == item
+    assert _decrypt_python_item_with_context(_legacy_encrypt_python_item(item, crypto_config), crypto_config) == item
+    for materials_call in (
+        crypto_config.materials_provider.encryption_materials,
+        crypto_config.materials_provider.decryption_materials,
+    ):
+        encryption_context = materials_call.call_args[0][0]
+        assert encryption_context.attributes["attribute_0"] == {"S": "value 0"}
+
+
+def test_python_item_with_context_converts_each_attribute_once(mocker):
+    crypto_config = _wide_item_crypto_config()
+    item = {"attribute_{}".format(index): "value {}".format(index) for index in range(50)}
+    serialize = mocker.spy(TypeSerializer, "serialize")
+    deserialize = mocker.spy(TypeDeserializer, "deserialize")
+
+    encrypted_item = _encrypt_python_item_with_context(item, crypto_config)
+
+    assert serialize.call_count == 50
+    # Only the 10 encrypted attributes and the 2 reserved attributes are converted back.
+    assert deserialize.call_count == 12
+    for name, value in item.items():
+        if crypto_config.attribute_actions.action(name) is CryptoAction.SIGN_ONLY:
+            assert encrypted_item[name] is value
+
+    serialize.reset_mock()
+    deserialize.reset_mock()
+    decrypted_item = _decrypt_python_item_with_context(encrypted_item, crypto_config)
+
+    assert decrypted_item == item
+    assert serialize.call_count == 52
+    assert deserialize.call_count == 10
+
+
+def test_encrypt_and_sign_serializes_each_attribute_once(mocker):
+    crypto_config = _wide_item_crypto_config()
+    ddb_item = dict_to_ddb(_wide_item())
+    serializers = [
+        mocker.patch.object(module, "serialize_attribute", wraps=serialize_attribute)
+        for module in (authentication, encryption)
+    ]
+
+    encrypted_item = encrypt_dynamodb_item(ddb_item, crypto_config)
+
+    # 10 encrypted attributes are serialized to be encrypted and 40 signed attributes are serialized to be signed.
+    assert [serializer.call_count for serializer in serializers] == [40, 10]
+
+    for serializer in serializers:
+        serializer.reset_mock()
+    assert decrypt_dynamodb_item(encrypted_item, crypto_config) == ddb_item
+
+    # Encrypted attributes are verified from their ciphertext without being serialized.
+    assert [serializer.call_count for serializer in serializers] == [40, 0]
+
+
+def _wide_ddb_item_encrypted(crypto_config):
+    return encrypt_dynamodb_item(dict_to_ddb(_wide_item()), crypto_config)
+
+
+@pytest.mark.parametrize("copy_attributes", (True, False))
+def test_decrypt_dynamodb_item_does_not_modify_item(copy_attributes):
+    crypto_config = _wide_item_crypto_config()
+    encrypted_item = _wide_ddb_item_encrypted(crypto_config)
+    original_item = copy.deepcopy(encrypted_item)
+
+    decrypted_item = decrypt_dynamodb_item(encrypted_item, crypto_config, copy_attributes=copy_attributes)
+
+    assert encrypted_item == original_item
+    assert decrypted_item == dict_to_ddb(_wide_item())
+
+
+@pytest.mark.parametrize(
+    "decrypt",
+    (
+        lambda item, crypto_config, **kwargs: decrypt_dynamodb_item(item, crypto_config, **kwargs),
+        lambda item, crypto_config, **kwargs: decrypt_dynamodb_items([item], crypto_config, **kwargs)[0],
+    ),
+)
+def test_decrypt_dynamodb_item_copy_attributes(decrypt):
+    crypto_config = _wide_item_crypto_config()
+    encrypted_item = _wide_ddb_item_encrypted(crypto_config)
+
+    copied_item = decrypt(encrypted_item, crypto_config)
+    shared_item = decrypt(encrypted_item, crypto_config, copy_attributes=False)
+
+    assert copied_item == shared_item
+    for name, attribute in encrypted_item.items():
+        if name in (reserved.value for reserved in ReservedAttributes):
+            assert name not in shared_item
+        elif crypto_config.attribute_actions.action(name) is CryptoAction.SIGN_ONLY:
+            assert shared_item[name] is attribute
+            assert copied_item[name] is not attribute
+        else:
+            assert shared_item[name] is not attribute
+
+
 @pytest.mark.slow
 def test_ephemeral_item_cycle_slow(all_the_cmps, parametrized_actions, parametrized_item):
     """Test ALL THE CMPS against a small number of curated items."""
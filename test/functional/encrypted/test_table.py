@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for ``dynamodb_encryption_sdk.encrypted.table``."""
+
 import hypothesis
 import pytest
 
@@ -26,6 +27,10 @@ from ..functional_test_utils import (
     table_batch_writer_unprocessed_items_check,
     table_cycle_batch_writer_check,
     table_cycle_check,
+    table_executor_shutdown_check,
+    table_iter_scan_check,
+    table_parallel_decrypt_check,
+    table_parallel_scan_check,
 )
 from ..hypothesis_strategies import SLOW_SETTINGS, VERY_SLOW_SETTINGS, ddb_items
 
@@ -62,6 +67,26 @@ def test_batch_writer_unprocessed(example_table, parametrized_actions, parametri
     )
 
 
+def test_ephemeral_iter_scan(example_table, some_cmps, parametrized_actions, parametrized_item):
+    """Test streaming scan and query iterators against a small number of curated items."""
+    table_iter_scan_check(some_cmps, parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_parallel_decrypt(example_table, parametrized_actions, parametrized_item):
+    """Test decrypting read results in parallel with a single ephemeral static CMP."""
+    cmp = build_static_jce_cmp("AES", 256, "HmacSHA256", 256)
+    table_parallel_decrypt_check(cmp, parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_close_shuts_down_created_executor(example_table):
+    table_executor_shutdown_check(TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
+def test_parallel_scan(example_table, parametrized_actions, parametrized_item):
+    """Test decrypting a parallel scan in worker processes against a small number of curated items."""
+    table_parallel_scan_check(parametrized_actions, parametrized_item, TEST_TABLE_NAME, TEST_REGION_NAME)
+
+
 @pytest.mark.slow
 def test_ephemeral_item_cycle_slow(example_table, all_the_cmps, parametrized_actions, parametrized_item):
     """Test ALL THE CMPS against a small number of curated items."""
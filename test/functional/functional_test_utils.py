@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Helper tools for use in tests."""
+
 from __future__ import division
 
 import base64
@@ -18,10 +19,12 @@ import copy
 import itertools
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import boto3
 import pytest
+from boto3.dynamodb.conditions import Key
 from boto3.dynamodb.types import Binary
 from botocore.exceptions import NoRegionError
 from mock import patch
@@ -29,10 +32,15 @@ from moto import mock_dynamodb2
 
 from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
 from dynamodb_encryption_sdk.encrypted.client import EncryptedClient
-from dynamodb_encryption_sdk.encrypted.item import decrypt_python_item, encrypt_python_item
+from dynamodb_encryption_sdk.encrypted.item import (
+    decrypt_python_item,
+    decrypt_python_items,
+    encrypt_python_item,
+    encrypt_python_items,
+)
 from dynamodb_encryption_sdk.encrypted.resource import EncryptedResource
 from dynamodb_encryption_sdk.encrypted.table import EncryptedTable
-from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.identifiers import CryptoAction, EncryptionKeyType, KeyEncodingType
 from dynamodb_encryption_sdk.internal.identifiers import ReservedAttributes
 from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
 from dynamodb_encryption_sdk.material_providers.most_recent import CachingMostRecentProvider
@@ -218,6 +226,27 @@ def build_static_jce_cmp(encryption_algorithm, encryption_key_length, signing_al
     )
 
 
+def build_fixed_static_jce_cmp():
+    """Build a StaticCryptographicMaterialsProvider using fixed keys.
+
+    This is a module-level function that always builds equivalent providers,
+    so it can be used as a materials provider factory by worker processes.
+    """
+    encryption_key = JceNameLocalDelegatedKey(
+        key=b"\x01" * 32, algorithm="AES", key_type=EncryptionKeyType.SYMMETRIC, key_encoding=KeyEncodingType.RAW
+    )
+    signing_key = JceNameLocalDelegatedKey(
+        key=b"\x02" * 32,
+        algorithm="HmacSHA256",
+        key_type=EncryptionKeyType.SYMMETRIC,
+        key_encoding=KeyEncodingType.RAW,
+    )
+    return StaticCryptographicMaterialsProvider(
+        encryption_materials=RawEncryptionMaterials(signing_key=signing_key, encryption_key=encryption_key),
+        decryption_materials=RawDecryptionMaterials(verification_key=signing_key, decryption_key=encryption_key),
+    )
+
+
 def _build_wrapped_jce_cmp(wrapping_algorithm, wrapping_key_length, signing_algorithm, signing_key_length):
     """Build a WrappedCryptographicMaterialsProvider using ephemeral JceNameLocalDelegatedKeys as specified."""
     wrapping_key = _get_from_cache(JceNameLocalDelegatedKey, wrapping_algorithm, wrapping_key_length)
@@ -577,6 +606,25 @@ def cycle_item_check(plaintext_item, crypto_config):
     del cycled_item
 
 
+def cycle_items_check(plaintext_items, crypto_config):
+    """Check that cycling many items through the bulk item encryptors has the expected results."""
+    ciphertext_items = encrypt_python_items(plaintext_items, crypto_config)
+
+    assert len(ciphertext_items) == len(plaintext_items)
+    for plaintext_item, ciphertext_item in zip(plaintext_items, ciphertext_items):
+        check_encrypted_item(plaintext_item, ciphertext_item, crypto_config.attribute_actions)
+
+    # Items encrypted in bulk must be readable by the single item decryptor and vice versa
+    assert decrypt_python_item(copy.deepcopy(ciphertext_items[0]), crypto_config) == plaintext_items[0]
+    single_ciphertext_item = encrypt_python_item(plaintext_items[0], crypto_config)
+
+    cycled_items = decrypt_python_items(ciphertext_items + [single_ciphertext_item], crypto_config)
+
+    assert cycled_items == plaintext_items + [plaintext_items[0]]
+    del ciphertext_items
+    del cycled_items
+
+
 def table_cycle_check(materials_provider, initial_actions, initial_item, table_name, region_name=None):
     check_attribute_actions = initial_actions.copy()
     check_attribute_actions.set_index_keys(*list(TEST_KEY.keys()))
@@ -727,6 +775,259 @@ def client_cycle_batch_items_check(materials_provider, initial_actions, initial_
     assert not e_scan_result["Items"]
 
 
+def client_parallel_decrypt_check(materials_provider, initial_actions, initial_item, table_name, region_name=None):
+    """Check that decrypting read results in parallel gives the same results as decrypting them serially."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    client = boto3.client("dynamodb", **kwargs)
+    e_client = EncryptedClient(client=client, materials_provider=materials_provider, attribute_actions=initial_actions)
+    parallel_e_client = EncryptedClient(
+        client=client, materials_provider=materials_provider, attribute_actions=initial_actions, max_workers=4
+    )
+
+    items = _generate_items(initial_item, dict_to_ddb)
+    _put_result = e_client.batch_write_item(  # noqa
+        RequestItems={table_name: [{"PutRequest": {"Item": _item}} for _item in items]}
+    )
+
+    try:
+        serial_items = e_client.scan(TableName=table_name, ConsistentRead=True)["Items"]
+        parallel_items = parallel_e_client.scan(TableName=table_name, ConsistentRead=True)["Items"]
+        assert parallel_items == serial_items
+        assert_equal_lists_of_items(actual=parallel_items, expected=items, transformer=ddb_to_dict)
+
+        paginated_items = []
+        for page in parallel_e_client.get_paginator("scan").paginate(TableName=table_name, ConsistentRead=True):
+            paginated_items.extend(page["Items"])
+        assert paginated_items == serial_items
+
+        ddb_keys = [dict_to_ddb(key) for key in TEST_BATCH_KEYS]
+        batch_items = parallel_e_client.batch_get_item(RequestItems={table_name: {"Keys": ddb_keys}})
+        assert_equal_lists_of_items(
+            actual=batch_items["Responses"][table_name], expected=items, transformer=ddb_to_dict
+        )
+    finally:
+        _cleanup_items(e_client, dict_to_ddb, table_name)
+        parallel_e_client.close()
+
+    del items
+
+
+def table_parallel_decrypt_check(materials_provider, initial_actions, initial_item, table_name, region_name=None):
+    """Check that decrypting table read results in parallel gives the same results as decrypting them serially."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    table = boto3.resource("dynamodb", **kwargs).Table(table_name)
+    e_table = EncryptedTable(table=table, materials_provider=materials_provider, attribute_actions=initial_actions)
+    parallel_e_table = EncryptedTable(
+        table=table, materials_provider=materials_provider, attribute_actions=initial_actions, max_workers=4
+    )
+
+    items = _generate_items(initial_item, _nop_transformer)
+    with e_table.batch_writer() as writer:
+        for item in items:
+            writer.put_item(item)
+
+    try:
+        serial_items = e_table.scan(ConsistentRead=True)["Items"]
+        parallel_items = parallel_e_table.scan(ConsistentRead=True)["Items"]
+        assert parallel_items == serial_items
+        assert_equal_lists_of_items(actual=parallel_items, expected=items)
+
+        partition_key = TEST_BATCH_KEYS[0]["partition_attribute"]
+        serial_items = e_table.query(KeyConditionExpression=Key("partition_attribute").eq(partition_key))["Items"]
+        parallel_items = parallel_e_table.query(KeyConditionExpression=Key("partition_attribute").eq(partition_key))[
+            "Items"
+        ]
+        assert parallel_items == serial_items
+        assert len(parallel_items) == 3
+    finally:
+        with e_table.batch_writer() as writer:
+            for key in TEST_BATCH_KEYS:
+                writer.delete_item(Key=key)
+        parallel_e_table.close()
+
+    del items
+
+
+def client_executor_shutdown_check(table_name, region_name=None):
+    """Check that closing an encrypted client or paginator only shuts down thread pools that it created."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    materials_provider = build_static_jce_cmp("AES", 256, "HmacSHA256", 256)
+    caller_executor = ThreadPoolExecutor(max_workers=1)
+
+    with EncryptedClient(
+        client=boto3.client("dynamodb", **kwargs), materials_provider=materials_provider, max_workers=2
+    ) as e_client:
+        created_executor = e_client._executor
+        e_client.get_paginator("scan").close()
+        assert not created_executor._shutdown
+    with EncryptedClient(
+        client=boto3.client("dynamodb", **kwargs), materials_provider=materials_provider, executor=caller_executor
+    ) as e_client:
+        e_client.scan(TableName=table_name)
+
+    assert created_executor._shutdown
+    assert not caller_executor._shutdown
+    caller_executor.shutdown()
+
+
+def table_executor_shutdown_check(table_name, region_name=None):
+    """Check that closing an encrypted table only shuts down a thread pool that it created."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    table = boto3.resource("dynamodb", **kwargs).Table(table_name)
+    materials_provider = build_static_jce_cmp("AES", 256, "HmacSHA256", 256)
+    caller_executor = ThreadPoolExecutor(max_workers=1)
+
+    with EncryptedTable(table=table, materials_provider=materials_provider, max_workers=2) as e_table:
+        created_executor = e_table._executor
+    with EncryptedTable(table=table, materials_provider=materials_provider, executor=caller_executor) as e_table:
+        e_table.scan()
+
+    assert created_executor._shutdown
+    assert not caller_executor._shutdown
+    caller_executor.shutdown()
+
+
+def client_parallel_scan_check(initial_actions, initial_item, table_name, region_name=None):
+    """Check that a parallel scan through an EncryptedClient returns all of the plaintext items."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    client = boto3.client("dynamodb", **kwargs)
+    e_client = EncryptedClient(
+        client=client, materials_provider=build_fixed_static_jce_cmp(), attribute_actions=initial_actions
+    )
+
+    items = _generate_items(initial_item, dict_to_ddb)
+    _put_result = e_client.batch_write_item(  # noqa
+        RequestItems={table_name: [{"PutRequest": {"Item": _item}} for _item in items]}
+    )
+
+    try:
+        scanned_items = list(
+            e_client.parallel_scan(
+                TableName=table_name,
+                total_segments=1,
+                workers=2,
+                materials_provider_factory=build_fixed_static_jce_cmp,
+                ConsistentRead=True,
+            )
+        )
+        assert_equal_lists_of_items(actual=scanned_items, expected=items, transformer=ddb_to_dict)
+    finally:
+        _cleanup_items(e_client, dict_to_ddb, table_name)
+
+    del items
+
+
+def table_parallel_scan_check(initial_actions, initial_item, table_name, region_name=None):
+    """Check that a parallel scan through an EncryptedTable returns all of the plaintext items."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    table = boto3.resource("dynamodb", **kwargs).Table(table_name)
+    e_table = EncryptedTable(
+        table=table, materials_provider=build_fixed_static_jce_cmp(), attribute_actions=initial_actions
+    )
+
+    items = _generate_items(initial_item, _nop_transformer)
+    with e_table.batch_writer() as writer:
+        for item in items:
+            writer.put_item(item)
+
+    try:
+        scanned_items = list(
+            e_table.parallel_scan(
+                total_segments=1, workers=2, materials_provider_factory=build_fixed_static_jce_cmp, ConsistentRead=True
+            )
+        )
+        assert_equal_lists_of_items(actual=scanned_items, expected=items)
+    finally:
+        with e_table.batch_writer() as writer:
+            for key in TEST_BATCH_KEYS:
+                writer.delete_item(Key=key)
+
+    del items
+
+
+def client_iter_scan_check(materials_provider, initial_actions, initial_item, table_name, region_name=None):
+    """Check that the streaming query and scan iterators return all of the plaintext items."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    client = boto3.client("dynamodb", **kwargs)
+    e_client = EncryptedClient(client=client, materials_provider=materials_provider, attribute_actions=initial_actions)
+
+    items = _generate_items(initial_item, dict_to_ddb)
+    _put_result = e_client.batch_write_item(  # noqa
+        RequestItems={table_name: [{"PutRequest": {"Item": _item}} for _item in items]}
+    )
+
+    try:
+        scanned_items = list(e_client.iter_scan(TableName=table_name, ConsistentRead=True))
+        assert_equal_lists_of_items(actual=scanned_items, expected=items, transformer=ddb_to_dict)
+
+        # Limit caps the whole iteration, not each page
+        assert len(list(e_client.iter_scan(TableName=table_name, ConsistentRead=True, Limit=2))) == 2
+
+        queried_items = list(
+            e_client.iter_query(
+                TableName=table_name,
+                KeyConditionExpression="partition_attribute = :partition",
+                ExpressionAttributeValues={":partition": items[0]["partition_attribute"]},
+            )
+        )
+        assert_equal_lists_of_items(
+            actual=queried_items,
+            expected=[item for item in items if item["partition_attribute"] == items[0]["partition_attribute"]],
+            transformer=ddb_to_dict,
+        )
+    finally:
+        _cleanup_items(e_client, dict_to_ddb, table_name)
+
+    del items
+
+
+def table_iter_scan_check(materials_provider, initial_actions, initial_item, table_name, region_name=None):
+    """Check that the streaming table query and scan iterators return all of the plaintext items."""
+    kwargs = {}
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    table = boto3.resource("dynamodb", **kwargs).Table(table_name)
+    e_table = EncryptedTable(table=table, materials_provider=materials_provider, attribute_actions=initial_actions)
+
+    items = _generate_items(initial_item, _nop_transformer)
+    with e_table.batch_writer() as writer:
+        for item in items:
+            writer.put_item(item)
+
+    try:
+        scanned_items = list(e_table.iter_scan(ConsistentRead=True))
+        assert_equal_lists_of_items(actual=scanned_items, expected=items)
+
+        # Limit caps the whole iteration, not each page
+        assert len(list(e_table.iter_scan(ConsistentRead=True, Limit=2))) == 2
+
+        partition_key = items[0]["partition_attribute"]
+        queried_items = list(e_table.iter_query(KeyConditionExpression=Key("partition_attribute").eq(partition_key)))
+        assert_equal_lists_of_items(
+            actual=queried_items, expected=[item for item in items if item["partition_attribute"] == partition_key]
+        )
+    finally:
+        with e_table.batch_writer() as writer:
+            for key in TEST_BATCH_KEYS:
+                writer.delete_item(Key=key)
+
+    del items
+
+
 def client_batch_items_unprocessed_check(
     materials_provider, initial_actions, initial_item, table_name, region_name=None
 ):
@@ -12,11 +12,24 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Hypothesis strategies for use in tests."""
+
 from decimal import Decimal
 
 import hypothesis
 from boto3.dynamodb.types import Binary
-from hypothesis.strategies import binary, booleans, deferred, dictionaries, fractions, just, lists, none, sets, text
+from hypothesis.strategies import (
+    binary,
+    booleans,
+    deferred,
+    dictionaries,
+    fractions,
+    from_regex,
+    just,
+    lists,
+    none,
+    sets,
+    text,
+)
 
 SLOW_SETTINGS = hypothesis.settings(
     suppress_health_check=(
@@ -54,6 +67,8 @@ ddb_negative_numbers = ddb_positive_numbers.map(_negative)
 
 ddb_number = ddb_negative_numbers | just(Decimal("0")) | ddb_positive_numbers
 ddb_number_set = sets(ddb_number, min_size=1)
+# Number strings as they might be written by hand, with leading and trailing zeros and more digits than fit in a number
+ddb_number_strings = from_regex(r"\A-?[0-9]{0,45}(\.[0-9]{0,45})?\Z").filter(lambda val: any(c.isdigit() for c in val))
 
 ddb_binary = binary(min_size=1, max_size=MAX_ITEM_BYTES).map(Binary)
 ddb_binary_set = sets(ddb_binary, min_size=1)
@@ -0,0 +1,163 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Functional tests for ``dynamodb_encryption_sdk.internal.crypto.jce_bridge.encryption``."""
+
+import pytest
+from pytest_mock import mocker  # noqa pylint: disable=unused-import
+
+from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
+from dynamodb_encryption_sdk.exceptions import DecryptionError, EncryptionError, JceTransformationError
+from dynamodb_encryption_sdk.internal.crypto.jce_bridge import encryption
+from dynamodb_encryption_sdk.internal.crypto.jce_bridge.encryption import JavaCipher
+from dynamodb_encryption_sdk.internal.crypto.jce_bridge.primitives import JavaSymmetricEncryptionAlgorithm
+
+pytestmark = [pytest.mark.functional, pytest.mark.local]
+
+_AES_CBC_PKCS5 = "AES/CBC/PKCS5Padding"
+_AES_GCM = "AES/GCM/NoPadding"
+
+
+def _generic_encrypt(cipher, key, data):
+    return cipher.cipher.encrypt(key, data, cipher.mode, cipher.padding)
+
+
+def _generic_decrypt(cipher, key, data):
+    return cipher.cipher.decrypt(key, data, cipher.mode, cipher.padding)
+
+
+@pytest.mark.parametrize("transformation", (_AES_CBC_PKCS5, _AES_GCM, "AESWrap", "RSA", "AES/CTR/NoPadding"))
+def test_from_transformation_is_memoized(transformation):
+    cipher = JavaCipher.from_transformation(transformation)
+
+    assert JavaCipher.from_transformation(transformation) is cipher
+    assert cipher == JavaCipher._parse_transformation(transformation)
+
+
+def test_from_transformation_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(encryption, "_TRANSFORMATIONS", {})
+    monkeypatch.setattr(encryption, "_MAX_CACHED_TRANSFORMATIONS", 1)
+
+    first = JavaCipher.from_transformation(_AES_CBC_PKCS5)
+    second = JavaCipher.from_transformation("AES/CTR/NoPadding")
+
+    assert JavaCipher.from_transformation(_AES_CBC_PKCS5) is first
+    assert JavaCipher.from_transformation("AES/CTR/NoPadding") is not second
+    assert list(encryption._TRANSFORMATIONS) == [_AES_CBC_PKCS5]
+
+
+@pytest.mark.parametrize("transformation", ("AES/CBC", "DES/CBC/PKCS5Padding", "AES/XTS/PKCS5Padding"))
+def test_from_transformation_invalid_is_not_cached(transformation):
+    with pytest.raises(JceTransformationError):
+        JavaCipher.from_transformation(transformation)
+
+    assert transformation not in encryption._TRANSFORMATIONS
+
+
+@pytest.mark.parametrize("plaintext", (b"", b"a", b"a" * 15, b"a" * 16, b"a" * 17, b"a" * 1024))
+@pytest.mark.parametrize("prepared", (True, False))
+def test_aes_cbc_pkcs5_matches_generic_path(plaintext, prepared):
+    cipher = JavaCipher.from_transformation(_AES_CBC_PKCS5)
+    raw_key = JceNameLocalDelegatedKey.generate("AES", 256).key
+    key = cipher.cipher.prepare_key(raw_key) if prepared else raw_key
+
+    ciphertext = cipher.encrypt(key, plaintext)
+    generic_ciphertext = _generic_encrypt(cipher, raw_key, plaintext)
+
+    assert len(ciphertext) == len(generic_ciphertext)
+    assert _generic_decrypt(cipher, raw_key, ciphertext) == plaintext
+    assert cipher.decrypt(key, generic_ciphertext) == plaintext
+
+
+def test_aes_cbc_pkcs5_invalid_key():
+    cipher = JavaCipher.from_transformation(_AES_CBC_PKCS5)
+    key = cipher.cipher.prepare_key(b"too short")
+
+    assert key == b"too short"
+    with pytest.raises(EncryptionError) as excinfo:
+        cipher.encrypt(key, b"data")
+    excinfo.match(r"Encryption failed")
+
+
+@pytest.mark.parametrize("ciphertext", (b"", b"\x00" * 16, b"\x00" * 33))
+def test_aes_cbc_pkcs5_invalid_ciphertext(ciphertext):
+    cipher = JavaCipher.from_transformation(_AES_CBC_PKCS5)
+    key = cipher.cipher.prepare_key(JceNameLocalDelegatedKey.generate("AES", 256).key)
+
+    with pytest.raises(DecryptionError) as excinfo:
+        cipher.decrypt(key, ciphertext)
+    excinfo.match(r"Decryption failed")
+
+
+@pytest.mark.parametrize("method_name", ("encrypt_cbc_pkcs5", "decrypt_cbc_pkcs5", "encrypt_gcm", "decrypt_gcm"))
+def test_aes_wrap_dedicated_modes_disabled(method_name):
+    cipher = JavaCipher.from_transformation("AESWrap")
+
+    with pytest.raises(NotImplementedError):
+        getattr(cipher.cipher, method_name)(b"\x00" * 32, b"data")
+
+
+@pytest.mark.parametrize("plaintext", (b"", b"a", b"a" * 16, b"a" * 1024))
+def test_aes_gcm_cycle(plaintext):
+    cipher = JavaCipher.from_transformation(_AES_GCM)
+    key = cipher.cipher.prepare_key(JceNameLocalDelegatedKey.generate("AES", 256).key)
+
+    ciphertext = cipher.encrypt(key, plaintext, b"attribute")
+
+    assert len(ciphertext) == 12 + len(plaintext) + 16
+    assert cipher.decrypt(key, ciphertext, b"attribute") == plaintext
+
+
+def _flip_last_bit(data):
+    return data[:-1] + bytearray([data[-1] ^ 1])
+
+
+@pytest.mark.parametrize(
+    "ciphertext_transform, associated_data",
+    (
+        (lambda ciphertext: ciphertext, b"other attribute"),
+        (lambda ciphertext: ciphertext, None),
+        (_flip_last_bit, b"attribute"),
+        (lambda ciphertext: ciphertext[:27], b"attribute"),
+        (lambda ciphertext: b"", b"attribute"),
+    ),
+)
+def test_aes_gcm_rejects_invalid_ciphertext(ciphertext_transform, associated_data):
+    cipher = JavaCipher.from_transformation(_AES_GCM)
+    key = cipher.cipher.prepare_key(JceNameLocalDelegatedKey.generate("AES", 256).key)
+    ciphertext = ciphertext_transform(cipher.encrypt(key, b"some data", b"attribute"))
+
+    with pytest.raises(DecryptionError) as excinfo:
+        cipher.decrypt(key, bytes(ciphertext), associated_data)
+    excinfo.match(r"Decryption failed")
+
+
+def test_delegated_key_reuses_prepared_cipher_key(mocker):
+    delegated_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    JavaCipher.from_transformation(_AES_CBC_PKCS5)
+    parse_transformation = mocker.spy(JavaCipher, "_parse_transformation")
+    prepare_key = mocker.spy(JavaSymmetricEncryptionAlgorithm, "prepare_key")
+    load_key = mocker.spy(JavaSymmetricEncryptionAlgorithm, "load_key")
+    plaintexts = [b"a" * length for length in range(0, 200, 8)]
+
+    ciphertexts = [
+        delegated_key.encrypt(algorithm=_AES_CBC_PKCS5, name="attribute", plaintext=plaintext)
+        for plaintext in plaintexts
+    ]
+
+    assert [
+        delegated_key.decrypt(algorithm=_AES_CBC_PKCS5, name="attribute", ciphertext=ciphertext)
+        for ciphertext in ciphertexts
+    ] == plaintexts
+    assert not parse_transformation.called
+    assert not prepare_key.called
+    assert not load_key.called
@@ -12,8 +12,13 @@
 # language governing permissions and limitations under the License.
 """Functional tests for material description de/serialization."""
 import pytest
+from boto3.dynamodb.types import Binary
 
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.action_plan import AttributeActionPlan
+from dynamodb_encryption_sdk.internal.crypto import authentication
 from dynamodb_encryption_sdk.internal.crypto.authentication import _string_to_sign
+from dynamodb_encryption_sdk.structures import AttributeActions
 
 from ...functional_test_vector_generators import string_to_sign_test_vectors
 
@@ -24,3 +29,43 @@ pytestmark = [pytest.mark.functional, pytest.mark.local]
 def test_string_to_sign(item, table_name, attribute_actions, expected_result):
     generated_string = _string_to_sign(item, table_name, attribute_actions)
     assert generated_string == expected_result
+
+
+@pytest.mark.parametrize("item, table_name, attribute_actions, expected_result", string_to_sign_test_vectors())
+def test_string_to_sign_with_action_plan(item, table_name, attribute_actions, expected_result):
+    plan = AttributeActionPlan.compile(attribute_actions)
+
+    # The second call uses the memoized signing order for this set of attribute names.
+    for _ in range(2):
+        generated_string = _string_to_sign(item, table_name, plan)
+        assert generated_string == expected_result
+
+
+@pytest.mark.parametrize("item, table_name, attribute_actions, expected_result", string_to_sign_test_vectors())
+def test_string_to_sign_without_memoized_digests(monkeypatch, item, table_name, attribute_actions, expected_result):
+    monkeypatch.setattr(authentication, "_TABLE_DIGESTS", {})
+    monkeypatch.setattr(authentication, "_MAX_CACHED_TABLES", 0)
+
+    generated_string = _string_to_sign(item, table_name, attribute_actions)
+
+    assert generated_string == expected_result
+    assert authentication._TABLE_DIGESTS == {}
+
+
+def test_string_to_sign_memoized_digests_are_bounded(monkeypatch):
+    monkeypatch.setattr(authentication, "_TABLE_DIGESTS", {})
+    monkeypatch.setattr(authentication, "_MAX_CACHED_TABLES", 2)
+    monkeypatch.setattr(authentication, "_MAX_CACHED_NAMES_PER_TABLE", 3)
+    attribute_actions = AttributeActionPlan.compile(AttributeActions(default_action=CryptoAction.SIGN_ONLY))
+    item = {"attribute_{}".format(index): {"S": "value"} for index in range(5)}
+
+    for table_name in ("table_a", "table_b", "table_c"):
+        _string_to_sign(item, table_name, attribute_actions)
+
+    assert sorted(authentication._TABLE_DIGESTS) == ["table_a", "table_b"]
+    assert all(len(name_digests) == 3 for _, name_digests in authentication._TABLE_DIGESTS.values())
+
+
+@pytest.mark.parametrize("value", (b"", b"some ciphertext", Binary(b"some ciphertext"), b"\x00" * 1024))
+def test_binary_attribute_digest(value):
+    assert authentication.binary_attribute_digest(value) == authentication.attribute_digest({"B": value})
@@ -11,17 +11,34 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for attribute de/serialization."""
+
+import io
+import struct
+import sys
+from decimal import Decimal
+
 import hypothesis
 import pytest
-from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, Binary, TypeDeserializer, TypeSerializer
 
 from dynamodb_encryption_sdk.exceptions import DeserializationError, SerializationError
 from dynamodb_encryption_sdk.internal.formatting.deserialize.attribute import deserialize_attribute
-from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import serialize_attribute
+from dynamodb_encryption_sdk.internal.formatting.serialize.attribute import (
+    _transform_decimal_value,
+    _transform_number_value,
+    serialize_attribute,
+)
 from dynamodb_encryption_sdk.transform import ddb_to_dict, dict_to_ddb
 
 from ...functional_test_vector_generators import attribute_test_vectors
-from ...hypothesis_strategies import SLOW_SETTINGS, VERY_SLOW_SETTINGS, ddb_attribute_values, ddb_items
+from ...hypothesis_strategies import (
+    SLOW_SETTINGS,
+    VERY_SLOW_SETTINGS,
+    ddb_attribute_values,
+    ddb_items,
+    ddb_number,
+    ddb_number_strings,
+)
 
 pytestmark = [pytest.mark.functional, pytest.mark.local]
 
@@ -62,6 +79,8 @@ def test_deserialize_attribute(attribute, serialized):
         (b"\x00_", DeserializationError, r"Unsupported tag: *"),
         (b"__", DeserializationError, r"Invalid tag: reserved byte is not null"),
         (b"\x00M\x00\x00\x00\x01\x00\x00", DeserializationError, r"Malformed serialized map: *"),
+        (b"\x00M\x00\x00\x00\x01\x00L\x00\x00\x00\x00", DeserializationError, r'Malformed serialized map: found "L"'),
+        (b"\x00L\x00\x00\x00\x02\x00\x00", DeserializationError, r"Malformed serialized data"),
     ),
 )
 def test_deserialize_attribute_errors(data, expected_type, expected_message):
@@ -71,6 +90,247 @@ def test_deserialize_attribute_errors(data, expected_type, expected_message):
     exc_info.match(expected_message)
 
 
+@pytest.mark.parametrize("size", (100 * 1024, 350 * 1024))
+def test_deserialize_large_binary_attributes(size):
+    blob = bytes(bytearray(index % 256 for index in range(size)))
+    attribute = {"L": [{"B": blob}, {"BS": [blob[:10], blob]}, {"S": "after"}]}
+
+    deserialized_attribute = deserialize_attribute(serialize_attribute(attribute))
+
+    assert deserialized_attribute == {"L": [{"B": blob}, {"BS": [blob[:10], blob]}, {"S": "after"}]}
+    assert type(deserialized_attribute["L"][0]["B"]) is bytes
+
+
+def _deeply_nested(depth):
+    attribute = {"NULL": True}
+    for level in range(depth):
+        attribute = {"M": {"level": attribute}} if level % 2 else {"L": [attribute]}
+    return attribute
+
+
+def _nesting_depth(attribute):
+    depth = 0
+    while "NULL" not in attribute:
+        attribute = attribute["M"]["level"] if "M" in attribute else attribute["L"][0]
+        depth += 1
+    return depth
+
+
+def test_deeply_nested_attribute_cycle():
+    depth = sys.getrecursionlimit() * 4
+    attribute = _deeply_nested(depth)
+
+    serialized = serialize_attribute(attribute)
+    deserialized = deserialize_attribute(serialized)
+
+    assert (
+        serialized
+        == b"\x00M\x00\x00\x00\x01\x00s\x00\x00\x00\x05level\x00L\x00\x00\x00\x01" * (depth // 2) + b"\x00\x00"
+    )
+    assert _nesting_depth(deserialized) == depth
+    assert serialize_attribute(deserialized) == serialized
+
+
+def _legacy_serialize_attribute(attribute):
+    """Serializer that builds its member functions and dispatch table on every call, for comparison."""
+
+    def _value(value):
+        return struct.pack(">I{:d}s".format(len(value)), len(value), value)
+
+    def _binary(value):
+        return bytes(value.value) if isinstance(value, Binary) else bytes(value)
+
+    def _number(value):
+        return "{0:f}".format(DYNAMODB_CONTEXT.create_decimal(value).normalize()).encode("utf-8")
+
+    def _string(value):
+        return value.encode("utf-8")
+
+    def _set(tag, value, member_function):
+        stream = io.BytesIO()
+        stream.write(b"\x00" + tag + struct.pack(">I", len(value)))
+        for member in sorted([member_function(member) for member in value]):
+            stream.write(_value(member))
+        return stream.getvalue()
+
+    def _list(value):
+        stream = io.BytesIO()
+        stream.write(b"\x00L" + struct.pack(">I", len(value)))
+        for member in value:
+            stream.write(_legacy_serialize_attribute(member))
+        return stream.getvalue()
+
+    def _map(value):
+        stream = io.BytesIO()
+        stream.write(b"\x00M" + struct.pack(">I", len(value)))
+        for key, member in sorted((_string(key), member) for key, member in value.items()):
+            stream.write(b"\x00s" + _value(key))
+            stream.write(_legacy_serialize_attribute(member))
+        return stream.getvalue()
+
+    functions = {
+        "B": lambda value: b"\x00b" + _value(_binary(value)),
+        "N": lambda value: b"\x00n" + _value(_number(value)),
+        "S": lambda value: b"\x00s" + _value(_string(value)),
+        "BS": lambda value: _set(b"B", value, _binary),
+        "NS": lambda value: _set(b"N", value, _number),
+        "SS": lambda value: _set(b"S", value, _string),
+        "BOOL": lambda value: b"\x00?" + (b"\x01" if value else b"\x00"),
+        "NULL": lambda value: b"\x00\x00",
+        "L": _list,
+        "M": _map,
+    }
+    ((tag, value),) = attribute.items()
+    return functions[tag](value)
+
+
+def _legacy_deserialize_attribute(serialized_attribute):
+    """Deserializer that builds its member functions and dispatch table on every call, for comparison."""
+
+    def _unpack(format_string, stream):
+        return struct.unpack(format_string, stream.read(struct.calcsize(format_string)))
+
+    def _length(stream):
+        return _unpack(">I", stream)[0]
+
+    def _value(stream):
+        return _unpack(">{:d}s".format(_length(stream)), stream)[0]
+
+    def _number(value):
+        return "{0:f}".format(Decimal(value.decode("utf-8")).normalize())
+
+    def _string(value):
+        return value.decode("utf-8")
+
+    def _set(tag, transform):
+        return lambda stream: {tag: sorted([transform(_value(stream)) for _ in range(_length(stream))])}
+
+    def _map(stream):
+        members = {}
+        for _ in range(_length(stream)):
+            key = _deserialize(stream)["S"]
+            members[key] = _deserialize(stream)
+        return {"M": members}
+
+    functions = {
+        b"b": lambda stream: {"B": _value(stream)},
+        b"n": lambda stream: {"N": _number(_value(stream))},
+        b"s": lambda stream: {"S": _string(_value(stream))},
+        b"B": _set("BS", lambda value: value),
+        b"N": _set("NS", _number),
+        b"S": _set("SS", _string),
+        b"?": lambda stream: {"BOOL": _unpack(">1s", stream)[0] == b"\x01"},
+        b"\x00": lambda stream: {"NULL": True},
+        b"L": lambda stream: {"L": [_deserialize(stream) for _ in range(_length(stream))]},
+        b"M": _map,
+    }
+
+    def _deserialize(stream):
+        _reserved, tag = _unpack(">cc", stream)
+        return functions[tag](stream)
+
+    return _deserialize(io.BytesIO(serialized_attribute))
+
+
+def _nested_map_corpus(width=8, depth=3):
+    if depth == 0:
+        return {"S": "leaf value"}
+    return {
+        "M": {
+            "map {}".format(index): (
+                _nested_map_corpus(width, depth - 1)
+                if index % 2 == 0
+                else {
+                    "L": [
+                        {"N": str(index * 1000)},
+                        {"S": "member {}".format(index)},
+                        {"B": Binary(b"\x00\x01\x02" * index)},
+                        {"NS": [str(index), "1.5", "-2E+3"]},
+                        {"SS": ["a", "b", "c"]},
+                        {"BOOL": index % 3 == 0},
+                        {"NULL": True},
+                    ]
+                }
+            )
+            for index in range(width)
+        }
+    }
+
+
+def test_serialize_nested_map_corpus():
+    corpus = _nested_map_corpus()
+    serialized = serialize_attribute(corpus)
+
+    assert serialized == _legacy_serialize_attribute(corpus)
+    assert deserialize_attribute(serialized) == _legacy_deserialize_attribute(serialized)
+    assert serialize_attribute(deserialize_attribute(serialized)) == serialized
+
+
+def _number_canonicalization_check(value):
+    try:
+        expected = _transform_decimal_value(value)
+    except Exception as error:  # pylint: disable=broad-except
+        with pytest.raises(type(error)):
+            _transform_number_value(value)
+    else:
+        assert _transform_number_value(value) == expected
+        # Check again now that the result may have been memoized.
+        assert _transform_number_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "0",
+        "-0",
+        "-00",
+        "007",
+        "1000",
+        "1.",
+        ".5",
+        "-.50",
+        "-0.0",
+        "0.000",
+        "123.4500",
+        "1" * 28,
+        "1" * 29,
+        "1" * 39,
+        "1" + "0" * 38,
+        "0." + "0" * 40 + "1",
+        "+5",
+        "1E+3",
+        " 5",
+        "5\n",
+        "\u0661",
+        Decimal("1.50"),
+        10,
+    ),
+)
+def test_transform_number_value(value):
+    _number_canonicalization_check(value)
+
+
+@pytest.mark.parametrize("value", ("", "-", ".", "abc", "1.2.3"))
+def test_transform_number_value_invalid(value):
+    _number_canonicalization_check(value)
+
+
+@pytest.mark.slow
+@pytest.mark.hypothesis
+@SLOW_SETTINGS
+@hypothesis.given(ddb_number | ddb_number_strings)
+def test_transform_number_value_slow(value):
+    _number_canonicalization_check(TypeSerializer().serialize(value)["N"] if isinstance(value, Decimal) else value)
+
+
+@pytest.mark.veryslow
+@pytest.mark.hypothesis
+@VERY_SLOW_SETTINGS
+@hypothesis.given(ddb_number | ddb_number_strings)
+def test_transform_number_value_vslow(value):
+    _number_canonicalization_check(TypeSerializer().serialize(value)["N"] if isinstance(value, Decimal) else value)
+
+
 def _serialize_deserialize_cycle(attribute):
     raw_attribute = TypeSerializer().serialize(attribute)
     serialized_attribute = serialize_attribute(raw_attribute)
@@ -11,14 +11,21 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for material description de/serialization."""
+
+import copy
+import pickle
+import struct
+
 import hypothesis
 import pytest
 
 from dynamodb_encryption_sdk.exceptions import InvalidMaterialDescriptionError, InvalidMaterialDescriptionVersionError
+from dynamodb_encryption_sdk.internal.formatting import material_description
 from dynamodb_encryption_sdk.internal.formatting.material_description import (
     deserialize as deserialize_material_description,
     serialize as serialize_material_description,
 )
+from dynamodb_encryption_sdk.material_providers.most_recent import BasicCache
 
 from ...functional_test_vector_generators import material_description_test_vectors
 from ...hypothesis_strategies import SLOW_SETTINGS, VERY_SLOW_SETTINGS, material_descriptions
@@ -37,6 +44,8 @@ def test_serialize_material_description(material_description, serialized):
     (
         ({"test": 5}, InvalidMaterialDescriptionError, "Invalid name or value in material description: *"),
         ({5: "test"}, InvalidMaterialDescriptionError, "Invalid name or value in material description: *"),
+        ({"test": ["a"]}, InvalidMaterialDescriptionError, "Invalid name or value in material description: *"),
+        ({"amzn-ddb-env-key": 5}, InvalidMaterialDescriptionError, "Invalid name or value in material description: *"),
     ),
 )
 def test_serialize_material_description_errors(data, expected_type, expected_message):
@@ -82,6 +91,56 @@ def test_deserialize_material_description_errors(data, expected_type, expected_m
     exc_info.match(expected_message)
 
 
+def _legacy_serialize(description):
+    serialized = bytearray(b"\x00" * 4)
+    for name, value in sorted(description.items()):
+        for data in (name.encode("utf-8"), value.encode("utf-8")):
+            serialized.extend(struct.pack(">I", len(data)) + data)
+    return {"B": bytes(serialized)}
+
+
+def test_serialize_material_description_shares_templates(monkeypatch):
+    monkeypatch.setattr(material_description, "_TEMPLATES", BasicCache(10))
+    descriptions = [
+        {
+            "amzn-ddb-env-alg": "AES/256",
+            "amzn-ddb-env-key": "wrapped key {}".format(index),
+            "amzn-ddb-map-signingAlg": "HmacSHA256/256",
+            "amzn-ddb-map-sym-mode": "/CBC/PKCS5Padding",
+            "amzn-ddb-wrap-alg": "AESWrap",
+        }
+        for index in range(5)
+    ]
+
+    for description in descriptions:
+        assert serialize_material_description(description) == _legacy_serialize(description)
+
+    assert len(material_description._TEMPLATES._cache) == 1
+
+
+def test_deserialize_material_description_is_shared_and_read_only(monkeypatch):
+    monkeypatch.setattr(material_description, "_DESCRIPTIONS", BasicCache(10))
+    description = {"amzn-ddb-env-alg": "AES/256", "amzn-ddb-env-key": "wrapped key"}
+    serialized = serialize_material_description(description)
+
+    first = deserialize_material_description(serialized)
+    second = deserialize_material_description({"B": bytes(bytearray(serialized["B"]))})
+
+    assert first is second
+    assert first == description
+    with pytest.raises(TypeError):
+        first["amzn-ddb-env-alg"] = "AES/128"
+    with pytest.raises(TypeError):
+        first.update({"a": "b"})
+
+    for modifiable in (first.copy(), copy.copy(first), copy.deepcopy(first), pickle.loads(pickle.dumps(first))):
+        assert type(modifiable) is dict
+        assert modifiable == description
+        modifiable["a"] = "b"
+
+    assert first == description
+
+
 def _serialize_deserialize_cycle(material_description):
     serialized_material_description = serialize_material_description(material_description)
     deserialized_material_description = deserialize_material_description(serialized_material_description)
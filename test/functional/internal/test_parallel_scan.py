@@ -0,0 +1,188 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Functional tests for ``dynamodb_encryption_sdk.internal.parallel_scan``."""
+
+import threading
+
+import pytest
+
+from dynamodb_encryption_sdk.delegated_keys.jce import JceNameLocalDelegatedKey
+from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.encrypted.item import decrypt_dynamodb_item, encrypt_dynamodb_items
+from dynamodb_encryption_sdk.exceptions import InvalidArgumentError
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.parallel_scan import parallel_scan
+from dynamodb_encryption_sdk.material_providers.wrapped import WrappedCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
+
+from ..functional_test_utils import build_fixed_static_jce_cmp
+
+pytestmark = [pytest.mark.functional, pytest.mark.local]
+
+
+def _crypto_config(materials_provider=None):
+    return CryptoConfig(
+        materials_provider=materials_provider or build_fixed_static_jce_cmp(),
+        encryption_context=EncryptionContext(table_name="table", partition_key_name="id"),
+        attribute_actions=AttributeActions(attribute_actions={"id": CryptoAction.SIGN_ONLY}),
+    )
+
+
+class FakeSegmentedTable(object):
+    """Very simple stand-in for a segmented DynamoDB scan."""
+
+    def __init__(self, items):
+        self.items = items
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def scan(self, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.requests.append(kwargs)
+
+        try:
+            segment_items = [
+                item for item in self.items if int(item["id"]["N"]) % kwargs["TotalSegments"] == kwargs["Segment"]
+            ]
+            start = 0
+            if "ExclusiveStartKey" in kwargs:
+                start = [item["id"] for item in segment_items].index(kwargs["ExclusiveStartKey"]["id"]) + 1
+            page = segment_items[start : start + kwargs["Limit"]]
+
+            response = {"Items": page}
+            if start + kwargs["Limit"] < len(segment_items):
+                response["LastEvaluatedKey"] = {"id": page[-1]["id"]}
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def plaintext_items():
+    return [{"id": {"N": str(index)}, "data": {"S": "item {}".format(index)}} for index in range(25)]
+
+
+@pytest.fixture
+def fake_table(plaintext_items):
+    crypto_config = _crypto_config()
+    return FakeSegmentedTable(encrypt_dynamodb_items([item.copy() for item in plaintext_items], crypto_config))
+
+
+def _sorted_items(items):
+    return sorted(items, key=lambda item: int(item["id"]["N"]))
+
+
+@pytest.mark.parametrize("materials_provider_factory", (build_fixed_static_jce_cmp, None))
+def test_parallel_scan(fake_table, plaintext_items, materials_provider_factory):
+    crypto_config = _crypto_config()
+
+    results = parallel_scan(
+        decrypt_dynamodb_item,
+        lambda **kwargs: (crypto_config, kwargs),
+        fake_table.scan,
+        total_segments=3,
+        workers=2,
+        materials_provider_factory=materials_provider_factory,
+        TableName="table",
+        Limit=2,
+    )
+
+    assert _sorted_items(results) == plaintext_items
+    assert {request["Segment"] for request in fake_table.requests} == {0, 1, 2}
+    assert all(request["TotalSegments"] == 3 for request in fake_table.requests)
+    assert all(request["TableName"] == "table" for request in fake_table.requests)
+
+
+@pytest.mark.parametrize("cache_kwargs", (dict(), dict(cache_max_age=60.0)))
+def test_parallel_scan_wrapped_provider(plaintext_items, cache_kwargs):
+    wrapping_key = JceNameLocalDelegatedKey.generate("AES", 256)
+    signing_key = JceNameLocalDelegatedKey.generate("HmacSHA256", 256)
+    crypto_config = _crypto_config(
+        WrappedCryptographicMaterialsProvider(
+            wrapping_key=wrapping_key, unwrapping_key=wrapping_key, signing_key=signing_key, **cache_kwargs
+        )
+    )
+    fake_table = FakeSegmentedTable(encrypt_dynamodb_items([item.copy() for item in plaintext_items], crypto_config))
+
+    results = parallel_scan(
+        decrypt_dynamodb_item,
+        lambda **kwargs: (crypto_config, kwargs),
+        fake_table.scan,
+        total_segments=3,
+        workers=2,
+        Limit=2,
+    )
+
+    assert _sorted_items(results) == plaintext_items
+
+
+def test_parallel_scan_bounds_pages_in_flight(fake_table, plaintext_items):
+    crypto_config = _crypto_config()
+
+    results = parallel_scan(
+        decrypt_dynamodb_item,
+        lambda **kwargs: (crypto_config, kwargs),
+        fake_table.scan,
+        total_segments=5,
+        workers=1,
+        max_pages_in_flight=1,
+        materials_provider_factory=build_fixed_static_jce_cmp,
+        Limit=2,
+    )
+
+    assert _sorted_items(results) == plaintext_items
+    assert fake_table.max_in_flight == 1
+
+
+def test_parallel_scan_stops_early(fake_table):
+    crypto_config = _crypto_config()
+
+    results = parallel_scan(
+        decrypt_dynamodb_item,
+        lambda **kwargs: (crypto_config, kwargs),
+        fake_table.scan,
+        total_segments=3,
+        workers=2,
+        materials_provider_factory=build_fixed_static_jce_cmp,
+        Limit=2,
+    )
+    first_item = next(results)
+    results.close()
+
+    assert "data" in first_item
+    assert len(fake_table.requests) < 25
+
+
+@pytest.mark.parametrize(
+    "kwargs, error_message",
+    (
+        (dict(total_segments=0, workers=1), r'"total_segments" must be a positive integer'),
+        (dict(total_segments=1, workers=0), r'"workers" must be a positive integer'),
+        (dict(total_segments=1, workers=1, max_pages_in_flight=0), r'"max_pages_in_flight" must be a positive integer'),
+        (dict(total_segments=1, workers=1, Segment=0), r'"Segment" is not supported for parallel scans'),
+        (dict(total_segments=1, workers=1, TotalSegments=2), r'"TotalSegments" is not supported for parallel scans'),
+        (dict(total_segments=1, workers=1, ProjectionExpression="id"), r'"ProjectionExpression" is not supported'),
+    ),
+)
+def test_parallel_scan_invalid_arguments(fake_table, kwargs, error_message):
+    crypto_config = _crypto_config()
+
+    with pytest.raises(InvalidArgumentError) as excinfo:
+        next(parallel_scan(decrypt_dynamodb_item, lambda **kw: (crypto_config, kw), fake_table.scan, **kwargs))
+
+    excinfo.match(error_message)
@@ -12,19 +12,29 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Test suite for ``dynamodb_encryption_sdk.internal.utils``."""
+
 import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from mock import Mock
 
 from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.encrypted.item import decrypt_dynamodb_item, encrypt_dynamodb_item
+from dynamodb_encryption_sdk.exceptions import InvalidArgumentError
 from dynamodb_encryption_sdk.identifiers import CryptoAction
-from dynamodb_encryption_sdk.internal.utils import encrypt_batch_write_item
+from dynamodb_encryption_sdk.internal.utils import (
+    decrypt_executor,
+    decrypt_get_item,
+    decrypt_list_of_items,
+    encrypt_batch_write_item,
+    iter_decrypt_multi_get,
+)
 from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
 from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
 from dynamodb_encryption_sdk.transform import dict_to_ddb
 
-from ..functional_test_utils import diverse_item
+from ..functional_test_utils import build_static_jce_cmp, diverse_item
 
 
 def get_test_item(standard_dict_format, partition_key, sort_key=None):
@@ -150,3 +160,164 @@ def test_encrypt_batch_write_returns_plaintext_unprocessed_items_over_multiple_t
     items.update(more_items)
 
     check_encrypt_batch_write_item_call(items, crypto_config)
+
+
+def test_decrypt_executor_defaults_to_serial():
+    assert decrypt_executor(None, None) is None
+
+
+def test_decrypt_executor_uses_provided_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    assert decrypt_executor(executor, None) is executor
+
+
+def test_decrypt_executor_builds_thread_pool():
+    assert isinstance(decrypt_executor(None, 2), ThreadPoolExecutor)
+
+
+@pytest.mark.parametrize(
+    "executor, max_workers, error_message",
+    (
+        (ThreadPoolExecutor(max_workers=1), 2, r'Only one of "executor" or "max_workers" may be provided'),
+        (None, 0, r'"max_workers" must be a positive integer'),
+    ),
+)
+def test_decrypt_executor_invalid(executor, max_workers, error_message):
+    with pytest.raises(InvalidArgumentError) as excinfo:
+        decrypt_executor(executor, max_workers)
+
+    excinfo.match(error_message)
+
+
+@pytest.mark.parametrize("executor", (None, ThreadPoolExecutor(max_workers=4)))
+def test_decrypt_list_of_items_keeps_order(executor):
+    crypto_config = get_dummy_crypto_config()
+    items = [dict_to_ddb({"counter": index}) for index in range(50)]
+
+    def dummy_decrypt(item, crypto_config):
+        assert crypto_config.encryption_context.attributes is item
+        return {"decrypted": item["counter"]}
+
+    result = decrypt_list_of_items(
+        crypto_config=crypto_config, decrypt_method=dummy_decrypt, items=items, executor=executor
+    )
+
+    assert list(result) == [{"decrypted": {"N": str(index)}} for index in range(50)]
+
+
+def test_iter_decrypt_multi_get_follows_pages():
+    crypto_config = get_dummy_crypto_config()
+    pages = [[{"counter": index} for index in range(start, start + 3)] for start in (0, 3, 6)]
+    requests = []
+
+    def dummy_read(**kwargs):
+        requests.append(kwargs)
+        page_number = kwargs.get("ExclusiveStartKey", {"page": -1})["page"] + 1
+        response = {"Items": pages[page_number]}
+        if page_number < len(pages) - 1:
+            response["LastEvaluatedKey"] = {"page": page_number}
+        return response
+
+    def dummy_decrypt(item, crypto_config):
+        return {"decrypted": item["counter"]}
+
+    results = iter_decrypt_multi_get(
+        dummy_decrypt, lambda **kwargs: (crypto_config, kwargs), dummy_read, TableName="table"
+    )
+
+    assert next(results) == {"decrypted": 0}
+    assert len(requests) == 1
+    # Each encrypted item is released from the page as soon as it is decrypted
+    assert pages[0] == [{"counter": 1}, {"counter": 2}][::-1]
+
+    assert list(results) == [{"decrypted": index} for index in range(1, 9)]
+    assert requests == [
+        {"TableName": "table"},
+        {"TableName": "table", "ExclusiveStartKey": {"page": 0}},
+        {"TableName": "table", "ExclusiveStartKey": {"page": 1}},
+    ]
+
+
+def test_iter_decrypt_multi_get_limit_applies_across_pages():
+    crypto_config = get_dummy_crypto_config()
+    requests = []
+
+    def dummy_read(**kwargs):
+        requests.append(kwargs)
+        start = kwargs.get("ExclusiveStartKey", {"next": 0})["next"]
+        # Pages are capped at 3 items regardless of the requested limit
+        count = min(kwargs["Limit"], 3)
+        return {
+            "Items": [{"counter": index} for index in range(start, start + count)],
+            "ScannedCount": count,
+            "LastEvaluatedKey": {"next": start + count},
+        }
+
+    def dummy_decrypt(item, crypto_config):
+        return {"decrypted": item["counter"]}
+
+    results = iter_decrypt_multi_get(
+        dummy_decrypt, lambda **kwargs: (crypto_config, kwargs), dummy_read, TableName="table", Limit=7
+    )
+
+    assert list(results) == [{"decrypted": index} for index in range(7)]
+    assert requests == [
+        {"TableName": "table", "Limit": 7},
+        {"TableName": "table", "Limit": 4, "ExclusiveStartKey": {"next": 3}},
+        {"TableName": "table", "Limit": 1, "ExclusiveStartKey": {"next": 6}},
+    ]
+
+
+def test_iter_decrypt_multi_get_count_only_pages():
+    crypto_config = get_dummy_crypto_config()
+    pages = [{"Count": 3, "ScannedCount": 3, "LastEvaluatedKey": {"page": 0}}, {"Count": 2, "ScannedCount": 2}]
+
+    def dummy_read(**kwargs):
+        return pages[kwargs.get("ExclusiveStartKey", {"page": -1})["page"] + 1]
+
+    results = iter_decrypt_multi_get(
+        lambda item, crypto_config: item,
+        lambda **kwargs: (crypto_config, kwargs),
+        dummy_read,
+        TableName="table",
+        Select="COUNT",
+    )
+
+    assert list(results) == []
+
+
+def test_iter_decrypt_multi_get_invalid_arguments():
+    crypto_config = get_dummy_crypto_config()
+
+    with pytest.raises(InvalidArgumentError) as excinfo:
+        next(
+            iter_decrypt_multi_get(
+                lambda **kwargs: None, lambda **kwargs: (crypto_config, kwargs), None, ProjectionExpression="id"
+            )
+        )
+
+    excinfo.match(r'"ProjectionExpression" is not supported for this operation')
+
+
+def test_decrypt_get_item_does_not_copy_or_modify_encrypted_item():
+    crypto_config = CryptoConfig(
+        materials_provider=build_static_jce_cmp("AES", 256, "HmacSHA256", 256),
+        encryption_context=EncryptionContext(table_name="table"),
+        attribute_actions=AttributeActions(attribute_actions={"signed": CryptoAction.SIGN_ONLY}),
+    )
+    encrypted_item = encrypt_dynamodb_item(
+        dict_to_ddb({"signed": {"nested": "value"}, "encrypted": "secret"}), crypto_config
+    )
+    original_item = copy.deepcopy(encrypted_item)
+
+    response = decrypt_get_item(
+        decrypt_dynamodb_item,
+        lambda **kwargs: (crypto_config, kwargs),
+        lambda **kwargs: {"Item": encrypted_item},
+        TableName="table",
+    )
+
+    assert encrypted_item == original_item
+    assert response["Item"] == dict_to_ddb({"signed": {"nested": "value"}, "encrypted": "secret"})
+    assert response["Item"]["signed"] is encrypted_item["signed"]
@@ -0,0 +1,175 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Functional tests for ``dynamodb_encryption_sdk.material_providers.aio``."""
+
+import boto3
+import pytest
+from moto import mock_kms
+
+from dynamodb_encryption_sdk.exceptions import NoKnownVersionError, UnknownRegionError
+from dynamodb_encryption_sdk.internal.str_ops import to_str
+from dynamodb_encryption_sdk.material_providers.aio.aws_kms import AsyncAwsKmsCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.material_providers.aio.most_recent import AsyncCachingMostRecentProvider
+from dynamodb_encryption_sdk.material_providers.aio.store.meta import AsyncMetaStore
+from dynamodb_encryption_sdk.material_providers.aws_kms import AwsKmsCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.structures import EncryptionContext
+
+from ..aio_test_utils import AsyncWrapper, run
+from ..functional_test_utils import mock_metastore  # noqa=F401 pylint: disable=unused-import
+from ..functional_test_utils import TEST_REGION_NAME
+
+pytestmark = [pytest.mark.functional, pytest.mark.local]
+
+
+def _encryption_context():
+    return EncryptionContext(
+        table_name="table",
+        partition_key_name="partition",
+        attributes={"partition": {"S": "value"}},
+        material_description={},
+    )
+
+
+@pytest.fixture
+def kms_key_id():
+    with mock_kms():
+        client = boto3.client("kms", region_name=TEST_REGION_NAME)
+        yield client.create_key()["KeyMetadata"]["Arn"]
+
+
+def _async_kms_cmp(key_id):
+    return AsyncAwsKmsCryptographicMaterialsProvider(
+        key_id=key_id,
+        regional_clients={TEST_REGION_NAME: AsyncWrapper(boto3.client("kms", region_name=TEST_REGION_NAME))},
+    )
+
+
+def test_async_kms_cmp_cycle(kms_key_id):
+    materials_provider = _async_kms_cmp(kms_key_id)
+    encryption_context = _encryption_context()
+
+    encryption_materials = run(materials_provider.async_encryption_materials(encryption_context))
+    encryption_context.material_description = encryption_materials.material_description
+    decryption_materials = run(materials_provider.async_decryption_materials(encryption_context))
+    sync_decryption_materials = AwsKmsCryptographicMaterialsProvider(key_id=kms_key_id).decryption_materials(
+        encryption_context
+    )
+
+    assert decryption_materials.decryption_key.key == encryption_materials.encryption_key.key
+    assert decryption_materials.verification_key.key == encryption_materials.signing_key.key
+    assert decryption_materials.decryption_key.key == sync_decryption_materials.decryption_key.key
+    assert decryption_materials.verification_key.key == sync_decryption_materials.verification_key.key
+
+
+def test_async_kms_cmp_no_client_for_region(kms_key_id):
+    materials_provider = AsyncAwsKmsCryptographicMaterialsProvider(key_id=kms_key_id, regional_clients={})
+
+    with pytest.raises(UnknownRegionError) as excinfo:
+        run(materials_provider.async_encryption_materials(_encryption_context()))
+
+    excinfo.match(r'No AWS KMS client provided for region "{}"'.format(TEST_REGION_NAME))
+
+
+def test_async_kms_cmp_sync_methods_fail(kms_key_id):
+    materials_provider = _async_kms_cmp(kms_key_id)
+
+    with pytest.raises(AttributeError) as excinfo:
+        materials_provider.encryption_materials(_encryption_context())
+
+    excinfo.match(r"Encryption materials are only available from async_encryption_materials")
+
+
+def _async_metastore(metastore):
+    return AsyncMetaStore(table=AsyncWrapper(metastore._table), materials_provider=metastore._materials_provider)
+
+
+def test_async_metastore_versions(mock_metastore):
+    async_metastore = _async_metastore(mock_metastore)
+
+    async def _versions():
+        try:
+            await async_metastore.max_version("example_name")
+        except NoKnownVersionError:
+            pass
+        else:
+            raise AssertionError("Expected no known version")
+
+        first = await async_metastore.provider("example_name")
+        second = await async_metastore.new_provider("example_name")
+        return first, second, await async_metastore.max_version("example_name")
+
+    first, second, max_version = run(_versions())
+
+    assert async_metastore.version_from_material_description(first._material_description) == 0
+    assert async_metastore.version_from_material_description(second._material_description) == 1
+    assert max_version == 1
+    # Materials written by the asynchronous MetaStore can be read by the synchronous MetaStore.
+    sync_provider = mock_metastore.provider("example_name", 1)
+    assert sync_provider._signing_key.key == second._signing_key.key
+
+
+def test_async_most_recent_provider_refresh_ahead_fails(mock_metastore):
+    with pytest.raises(ValueError) as excinfo:
+        AsyncCachingMostRecentProvider(
+            provider_store=_async_metastore(mock_metastore),
+            material_name="example_name",
+            version_ttl=600.0,
+            refresh_ahead=60.0,
+        )
+
+    excinfo.match("Refresh ahead is not supported with an asynchronous provider store")
+
+
+def test_async_most_recent_provider_missing_version(mock_metastore):
+    materials_provider = AsyncCachingMostRecentProvider(
+        provider_store=_async_metastore(mock_metastore),
+        material_name="example_name",
+        version_ttl=600.0,
+        missing_version_ttl=60.0,
+    )
+    encryption_context = _encryption_context()
+    encryption_context.material_description = mock_metastore._material_description("example_name", 5)
+
+    for _ in range(2):
+        with pytest.raises(AttributeError) as excinfo:
+            run(materials_provider.async_decryption_materials(encryption_context))
+
+        excinfo.match("No decryption materials available")
+
+    counters = materials_provider.counters()
+    assert counters.missing_version_hits == 1
+    assert counters.missing_version_misses == 1
+
+
+def test_async_most_recent_provider_cycle(mock_metastore):
+    materials_provider = AsyncCachingMostRecentProvider(
+        provider_store=_async_metastore(mock_metastore), material_name="example_name", version_ttl=600.0
+    )
+    encryption_context = _encryption_context()
+
+    async def _cycle():
+        encryption_materials = await materials_provider.async_encryption_materials(encryption_context)
+        # The wrapped data key is only converted to text when the material description is serialized.
+        encryption_context.material_description = {
+            key: to_str(value) for key, value in encryption_materials.material_description.items()
+        }
+        decryption_materials = await materials_provider.async_decryption_materials(encryption_context)
+        # The provider for the current version is cached.
+        await materials_provider.async_encryption_materials(_encryption_context())
+        return encryption_materials, decryption_materials
+
+    encryption_materials, decryption_materials = run(_cycle())
+
+    assert decryption_materials.decryption_key.key == encryption_materials.encryption_key.key
+    assert materials_provider._version == 0
+    assert len(materials_provider._cache._cache) == 1
@@ -0,0 +1,203 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Functional tests for ``dynamodb_encryption_sdk.material_providers.caching``."""
+
+import pytest
+from mock import patch
+
+from dynamodb_encryption_sdk.encrypted import CryptoConfig
+from dynamodb_encryption_sdk.encrypted.item import decrypt_dynamodb_item, encrypt_dynamodb_item
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
+from dynamodb_encryption_sdk.material_providers.caching import CacheCounters, CachingCryptographicMaterialsProvider
+from dynamodb_encryption_sdk.structures import AttributeActions, EncryptionContext
+
+from ..functional_test_utils import _build_wrapped_jce_cmp
+
+pytestmark = [pytest.mark.functional, pytest.mark.local]
+
+
+class CountingCryptographicMaterialsProvider(CryptographicMaterialsProvider):
+    def __init__(self, materials_provider):
+        self._materials_provider = materials_provider
+        self.encryption_calls = 0
+        self.decryption_calls = 0
+        self.refresh_calls = 0
+
+    def encryption_materials(self, encryption_context):
+        self.encryption_calls += 1
+        return self._materials_provider.encryption_materials(encryption_context)
+
+    def decryption_materials(self, encryption_context):
+        self.decryption_calls += 1
+        return self._materials_provider.decryption_materials(encryption_context)
+
+    def refresh(self):
+        self.refresh_calls += 1
+
+
+@pytest.fixture
+def counting_provider():
+    return CountingCryptographicMaterialsProvider(_build_wrapped_jce_cmp("AES", 256, "HmacSHA256", 256))
+
+
+def _crypto_config(materials_provider):
+    return CryptoConfig(
+        materials_provider=materials_provider,
+        encryption_context=EncryptionContext(table_name="table", partition_key_name="id"),
+        attribute_actions=AttributeActions(attribute_actions={"id": CryptoAction.SIGN_ONLY}),
+    )
+
+
+def _items(count):
+    return [{"id": {"S": str(index)}, "data": {"S": "some data {}".format(index)}} for index in range(count)]
+
+
+def _encrypt(item, crypto_config):
+    return encrypt_dynamodb_item(item, crypto_config.with_item(item))
+
+
+def _decrypt(item, crypto_config):
+    return decrypt_dynamodb_item(item, crypto_config.with_item(item))
+
+
+def test_cycle_within_one_partition(counting_provider):
+    provider = CachingCryptographicMaterialsProvider(counting_provider, max_age=60.0, partition_by_primary_key=False)
+    crypto_config = _crypto_config(provider)
+    items = _items(5)
+
+    encrypted_items = [_encrypt(item, crypto_config) for item in items]
+    decrypted_items = [_decrypt(item, crypto_config) for item in encrypted_items]
+
+    assert decrypted_items == items
+    assert counting_provider.encryption_calls == 1
+    assert counting_provider.decryption_calls == 1
+    assert provider.counters() == CacheCounters(
+        encryption_hits=4, encryption_misses=1, decryption_hits=4, decryption_misses=1
+    )
+    # Every item shares the cached content key, so every item carries the same wrapped key
+    assert len({item["*amzn-ddb-map-desc*"]["B"] for item in encrypted_items}) == 1
+
+
+def test_partitions_by_primary_key(counting_provider):
+    provider = CachingCryptographicMaterialsProvider(counting_provider, max_age=60.0)
+    crypto_config = _crypto_config(provider)
+    items = _items(3) + _items(3)
+
+    encrypted_items = [_encrypt(item, crypto_config) for item in items]
+
+    assert [_decrypt(item, crypto_config) for item in encrypted_items] == items
+    assert counting_provider.encryption_calls == 3
+    assert counting_provider.decryption_calls == 3
+    assert provider.counters() == CacheCounters(
+        encryption_hits=3, encryption_misses=3, decryption_hits=3, decryption_misses=3
+    )
+
+
+def test_distinct_items_hit_cache_without_primary_key_partition(counting_provider):
+    default_provider = CachingCryptographicMaterialsProvider(counting_provider, max_age=60.0)
+    shared_provider = CachingCryptographicMaterialsProvider(
+        counting_provider, max_age=60.0, partition_by_primary_key=False
+    )
+    items = _items(5)
+
+    for provider in (default_provider, shared_provider):
+        crypto_config = _crypto_config(provider)
+        encrypted_items = [_encrypt(item, crypto_config) for item in items]
+        assert [_decrypt(item, crypto_config) for item in encrypted_items] == items
+
+    # Every item has a distinct primary key, so the default partitioning never hits the cache
+    assert default_provider.counters() == CacheCounters(encryption_misses=5, decryption_misses=5)
+    assert shared_provider.counters() == CacheCounters(
+        encryption_hits=4, encryption_misses=1, decryption_hits=4, decryption_misses=1
+    )
+    assert counting_provider.encryption_calls == 6
+    assert counting_provider.decryption_calls == 6
+
+
+def test_max_items(counting_provider):
+    provider = CachingCryptographicMaterialsProvider(
+        counting_provider, max_age=60.0, max_items=2, partition_by_primary_key=False
+    )
+    crypto_config = _crypto_config(provider)
+
+    for item in _items(5):
+        _encrypt(item, crypto_config)
+
+    assert counting_provider.encryption_calls == 3
+
+
+def test_max_bytes(counting_provider):
+    item = _items(1)[0]
+    provider = CachingCryptographicMaterialsProvider(
+        counting_provider, max_age=60.0, max_bytes=50, partition_by_primary_key=False
+    )
+    crypto_config = _crypto_config(provider)
+
+    for _ in range(4):
+        _encrypt(item, crypto_config)
+
+    # Each item is 24 bytes once serialized, so only two items fit into 50 bytes
+    assert counting_provider.encryption_calls == 2
+
+
+def test_max_age(counting_provider):
+    provider = CachingCryptographicMaterialsProvider(counting_provider, max_age=10.0, partition_by_primary_key=False)
+    crypto_config = _crypto_config(provider)
+    item = _items(1)[0]
+
+    with patch("dynamodb_encryption_sdk.material_providers.caching.time") as mock_time:
+        mock_time.time.return_value = 0.0
+        encrypted_item = _encrypt(item, crypto_config)
+        _decrypt(encrypted_item, crypto_config)
+
+        mock_time.time.return_value = 9.0
+        _encrypt(item, crypto_config)
+        _decrypt(encrypted_item, crypto_config)
+
+        mock_time.time.return_value = 10.0
+        _encrypt(item, crypto_config)
+        _decrypt(encrypted_item, crypto_config)
+
+    assert counting_provider.encryption_calls == 2
+    assert counting_provider.decryption_calls == 2
+
+
+def test_refresh_clears_cache(counting_provider):
+    provider = CachingCryptographicMaterialsProvider(counting_provider, max_age=60.0, partition_by_primary_key=False)
+    crypto_config = _crypto_config(provider)
+    item = _items(1)[0]
+
+    _encrypt(item, crypto_config)
+    provider.refresh()
+    _encrypt(item, crypto_config)
+
+    assert counting_provider.refresh_calls == 1
+    assert counting_provider.encryption_calls == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs, error_type, error_message",
+    (
+        (dict(max_age=0.0), ValueError, "Max age must be greater than 0"),
+        (dict(max_age=60), TypeError, "max_age"),
+        (dict(max_age=60.0, max_items=0), ValueError, '"max_items" must be at least 1'),
+        (dict(max_age=60.0, max_bytes=0), ValueError, '"max_bytes" must be at least 1'),
+        (dict(max_age=60.0, cache_size=0), ValueError, "Cache capacity must be at least 1"),
+    ),
+)
+def test_invalid_configuration(counting_provider, kwargs, error_type, error_message):
+    with pytest.raises(error_type) as excinfo:
+        CachingCryptographicMaterialsProvider(counting_provider, **kwargs)
+
+    excinfo.match(error_message)
@@ -11,15 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Functional tests for ``dynamodb_encryption_sdk.material_providers.most_recent``."""
+
+import gc
+import random
 import time
 from collections import defaultdict
+from threading import Lock, Thread
 
 import pytest
 from mock import MagicMock, sentinel
 
-from dynamodb_encryption_sdk.exceptions import NoKnownVersionError
+from dynamodb_encryption_sdk.exceptions import InvalidVersionError, NoKnownVersionError
 from dynamodb_encryption_sdk.material_providers import CryptographicMaterialsProvider
-from dynamodb_encryption_sdk.material_providers.most_recent import CachingMostRecentProvider, TtlActions
+from dynamodb_encryption_sdk.material_providers.most_recent import (
+    CachingMostRecentProvider,
+    ClockCache,
+    ProviderCacheCounters,
+    TtlActions,
+)
 from dynamodb_encryption_sdk.material_providers.store import ProviderStore
 
 from ..functional_test_utils import example_table  # noqa=F401 pylint: disable=unused-import
@@ -83,6 +92,153 @@ def test_constructor():
     assert provider._cache.capacity == 42
 
 
+def test_clock_cache_capacity_fail():
+    with pytest.raises(ValueError) as excinfo:
+        ClockCache(0)
+
+    excinfo.match("Cache capacity must be at least 1")
+
+
+def test_clock_cache_evicts_unreferenced_entry():
+    cache = ClockCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    with pytest.raises(KeyError):
+        cache.get("b")
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.counters() == ProviderCacheCounters(hits=3, misses=1, evictions=1)
+
+
+def test_clock_cache_put_replaces_value():
+    cache = ClockCache(2)
+    cache.put("a", 1)
+    cache.put("a", 2)
+
+    assert cache.get("a") == 2
+    assert len(cache._cache) == 1
+
+
+def test_clock_cache_evict_frees_slot():
+    cache = ClockCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.evict("a")
+    cache.evict("not cached")
+    cache.put("c", 3)
+
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert cache.counters().evictions == 0
+
+
+def test_clock_cache_clear():
+    cache = ClockCache(2)
+    cache.put("a", 1)
+
+    cache.clear()
+    cache.put("b", 2)
+    cache.put("c", 3)
+
+    with pytest.raises(KeyError):
+        cache.get("a")
+    assert cache.counters() == ProviderCacheCounters(misses=1)
+
+
+def _clock_cache_worker(cache, seed, lookups):
+    keys = random.Random(seed)
+    for _ in range(lookups):
+        key = keys.randrange(50)
+        try:
+            cache.get(key)
+        except KeyError:
+            cache.put(key, key)
+        if key % 7 == 0:
+            cache.evict(key)
+
+
+def test_clock_cache_concurrent_use():
+    cache = ClockCache(10)
+    threads = [Thread(target=_clock_cache_worker, args=(cache, seed, 2000)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counters = cache.counters()
+    assert counters.hits + counters.misses == 8 * 2000
+    assert counters.evictions > 0
+    assert len(cache._cache) <= 10
+    for key, entry in cache._cache.items():
+        assert entry.value == key
+        assert cache._slots[entry.slot] == key
+
+
+def test_clock_cache_retires_exited_thread_counts():
+    cache = ClockCache(10)
+    cache.put(0, sentinel.value)
+
+    for _ in range(20):
+        _get_in_threads(cache, 5, 10)
+    gc.collect()
+
+    assert cache._lookup_counts == {}
+    assert cache.counters() == ProviderCacheCounters(hits=20 * 5 * 10)
+
+
+def test_provider_counters():
+    provider = CachingMostRecentProvider(provider_store=MockProviderStore(), material_name="material", version_ttl=10.0)
+
+    provider.encryption_materials(sentinel.encryption_context_1)
+    provider.encryption_materials(sentinel.encryption_context_1)
+
+    # The first request looks for both the last known version and the max version before loading it
+    assert provider.counters() == ProviderCacheCounters(hits=1, misses=2)
+
+
+def _get_in_threads(cache, thread_count, lookups):
+    def _get():
+        for _ in range(lookups):
+            cache.get(0)
+
+    threads = [Thread(target=_get) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class _CountingLock(object):
+    def __init__(self):
+        self.acquisitions = 0
+        self._lock = Lock()
+
+    def __enter__(self):
+        self.acquisitions += 1
+        return self._lock.__enter__()
+
+    def __exit__(self, *args):
+        return self._lock.__exit__(*args)
+
+
+def test_clock_cache_threaded_reads_do_not_take_lock():
+    cache = ClockCache(1000)
+    cache.put(0, (time.time(), sentinel.provider))
+    cache._cache_lock = _CountingLock()
+
+    _get_in_threads(cache, 8, 1000)
+    gc.collect()
+
+    # Each thread only takes the lock to register its counts and to retire them once it exits
+    assert cache._cache_lock.acquisitions <= 2 * 8
+    assert cache.counters() == ProviderCacheCounters(hits=8 * 1000)
+
+
 def test_ttl_action_first_encrypt():
     """Test that when _last_updated has never been set, ttl_action returns TtlActions.EXPIRED."""
     store = MagicMock(__class__=ProviderStore)
@@ -581,5 +737,181 @@ def test_caching_provider_decryption_materials_cache_in_grace_period_fail_to_acq
     assert store.provider_calls == expected_calls
 
 
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "Timed out waiting for the refresh-ahead thread"
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize("refresh_ahead", (0.0, 10.0, 11.0))
+def test_refresh_ahead_limits_fail(refresh_ahead):
+    with pytest.raises(ValueError) as excinfo:
+        CachingMostRecentProvider(
+            provider_store=MockProviderStore(), material_name="material", version_ttl=10.0, refresh_ahead=refresh_ahead
+        )
+
+    excinfo.match("Refresh ahead must be greater than 0 and less than the version TTL")
+
+
+def test_refresh_ahead_starts_after_first_encryption():
+    store = MockProviderStore()
+    name = "material"
+
+    with CachingMostRecentProvider(
+        provider_store=store, material_name=name, version_ttl=10.0, refresh_ahead=1.0
+    ) as provider:
+        assert provider._refresh_ahead_thread is None
+        assert store.provider_calls == []
+
+        test = provider.encryption_materials(sentinel.encryption_context_1)
+
+        assert provider._refresh_ahead_thread.is_alive()
+
+    assert test is sentinel.material_0_encryption
+    assert not provider._refresh_ahead_thread.is_alive()
+    assert store.provider_calls.count(("max_version", name)) == 1
+
+
+def test_refresh_ahead_not_started_by_decryption():
+    store = MockProviderStore()
+    name = "material"
+    store.get_or_create_provider(name, 3)
+
+    with CachingMostRecentProvider(
+        provider_store=store, material_name=name, version_ttl=0.2, refresh_ahead=0.15
+    ) as provider:
+        test = provider.decryption_materials(MagicMock(material_description=3))
+        time.sleep(0.1)
+
+        assert provider._refresh_ahead_thread is None
+
+    assert test is sentinel.material_3_decryption
+    assert list(store._providers[name]) == [3]
+    assert ("max_version", name) not in store.provider_calls
+
+
+def test_refresh_ahead_refreshes_before_expiry():
+    store = MockProviderStore()
+    name = "material"
+
+    with CachingMostRecentProvider(
+        provider_store=store, material_name=name, version_ttl=0.3, refresh_ahead=0.25
+    ) as provider:
+        assert provider.encryption_materials(sentinel.encryption_context_1) is sentinel.material_0_encryption
+        store.get_or_create_provider(name, 1)
+        _wait_for(lambda: provider._version == 1)
+
+        assert provider._ttl_action(None, "encrypt") is TtlActions.LIVE
+        assert provider.encryption_materials(sentinel.encryption_context_1) is sentinel.material_1_encryption
+
+
+def test_refresh_ahead_retries_after_failure(mocker):
+    mocker.patch("dynamodb_encryption_sdk.material_providers.most_recent._REFRESH_AHEAD_RETRY_INTERVAL", 0.01)
+    store = MockProviderStore()
+    name = "material"
+    mocker.patch.object(store, "max_version", side_effect=(0, Exception("store unavailable"), 1))
+    store.get_or_create_provider(name, 0)
+    store.get_or_create_provider(name, 1)
+
+    with CachingMostRecentProvider(
+        provider_store=store, material_name=name, version_ttl=0.3, refresh_ahead=0.25
+    ) as provider:
+        provider.encryption_materials(sentinel.encryption_context_1)
+        _wait_for(lambda: provider._version == 1)
+
+    assert store.max_version.call_count == 3
+
+
+def _unused_refresh_ahead_thread():
+    provider = CachingMostRecentProvider(
+        provider_store=MockProviderStore(), material_name="material", version_ttl=0.2, refresh_ahead=0.1
+    )
+    provider.encryption_materials(sentinel.encryption_context_1)
+    return provider._refresh_ahead_thread
+
+
+def test_refresh_ahead_thread_exits_with_provider():
+    thread = _unused_refresh_ahead_thread()
+
+    gc.collect()
+    thread.join(5.0)
+
+    assert not thread.is_alive()
+
+
+def _missing_version_provider(**kwargs):
+    store = MagicMock(__class__=ProviderStore)
+    store.version_from_material_description.side_effect = lambda material_description: material_description
+    store.provider.side_effect = InvalidVersionError("Version not found")
+    return CachingMostRecentProvider(provider_store=store, material_name="material", version_ttl=10.0, **kwargs)
+
+
+def _decrypt_missing_version(provider, attempts):
+    for _ in range(attempts):
+        with pytest.raises(AttributeError) as excinfo:
+            provider.decryption_materials(MagicMock(material_description=5))
+
+        excinfo.match("No decryption materials available")
+
+
+def test_missing_version_ttl_fail():
+    with pytest.raises(ValueError) as excinfo:
+        _missing_version_provider(missing_version_ttl=0.0)
+
+    excinfo.match("Missing version TTL must be greater than 0")
+
+
+def test_missing_version_not_remembered_by_default():
+    provider = _missing_version_provider()
+
+    _decrypt_missing_version(provider, 3)
+
+    assert provider._provider_store.provider.call_count == 3
+    assert provider.counters().missing_version_hits == 0
+    assert provider.counters().missing_version_misses == 3
+
+
+def test_missing_version_remembered():
+    provider = _missing_version_provider(missing_version_ttl=60.0)
+
+    _decrypt_missing_version(provider, 3)
+
+    provider._provider_store.provider.assert_called_once_with("material", 5)
+    assert provider.counters().missing_version_hits == 2
+    assert provider.counters().missing_version_misses == 1
+
+
+def test_missing_version_expires(mocker):
+    mock_time = mocker.patch("dynamodb_encryption_sdk.material_providers.most_recent.time")
+    provider = _missing_version_provider(missing_version_ttl=60.0)
+
+    for now in (0.0, 59.0, 60.0):
+        mock_time.time.return_value = now
+        _decrypt_missing_version(provider, 1)
+
+    assert provider._provider_store.provider.call_count == 2
+
+
+def test_missing_version_cache_size():
+    provider = _missing_version_provider(missing_version_ttl=60.0, missing_version_cache_size=1)
+
+    for version in (5, 6, 5):
+        with pytest.raises(AttributeError):
+            provider.decryption_materials(MagicMock(material_description=version))
+
+    assert provider._provider_store.provider.call_count == 3
+
+
+def test_refresh_clears_missing_versions():
+    provider = _missing_version_provider(missing_version_ttl=60.0)
+
+    _decrypt_missing_version(provider, 1)
+    provider.refresh()
+    _decrypt_missing_version(provider, 1)
+
+    assert provider._provider_store.provider.call_count == 2
+
+
 def test_cache_use_encrypt(mock_metastore, example_table, caplog):
     check_metastore_cache_use_encrypt(mock_metastore, TEST_TABLE_NAME, caplog)
@@ -0,0 +1,56 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Unit tests for ``dynamodb_encryption_sdk.internal.formatting.deserialize``."""
+
+import struct
+
+import pytest
+
+from dynamodb_encryption_sdk.exceptions import DeserializationError
+from dynamodb_encryption_sdk.internal.formatting.deserialize import ByteCursor
+
+pytestmark = [pytest.mark.unit, pytest.mark.local]
+
+
+def test_byte_cursor():
+    data = b"\x00s\x00\x00\x00\x05hello\x01"
+    cursor = ByteCursor(data)
+
+    assert cursor.decode_tag() == b"s"
+    value = cursor.decode_value()
+    assert isinstance(value, memoryview)
+    assert value.obj is data
+    assert value.tobytes() == b"hello"
+    assert cursor.decode_byte() == b"\x01"
+    assert cursor.offset == len(data)
+
+
+@pytest.mark.parametrize(
+    "data, method",
+    (
+        (b"\x00\x00\x00", "decode_length"),
+        (b"\x00\x00\x00\x05abcd", "decode_value"),
+        (b"", "decode_byte"),
+        (b"\x00", "decode_tag"),
+    ),
+)
+def test_byte_cursor_truncated(data, method):
+    with pytest.raises(struct.error):
+        getattr(ByteCursor(data), method)()
+
+
+def test_byte_cursor_invalid_tag():
+    with pytest.raises(DeserializationError) as excinfo:
+        ByteCursor(b"\x01s").decode_tag()
+
+    excinfo.match(r"Invalid tag: reserved byte is not null")
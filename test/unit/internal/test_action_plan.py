@@ -0,0 +1,146 @@
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Unit tests for ``dynamodb_encryption_sdk.internal.action_plan``."""
+import pytest
+
+from dynamodb_encryption_sdk.exceptions import InvalidArgumentError
+from dynamodb_encryption_sdk.identifiers import CryptoAction
+from dynamodb_encryption_sdk.internal.action_plan import (
+    AttributeActionPlan,
+    AttributeActionPlanCache,
+    signed_attributes,
+)
+from dynamodb_encryption_sdk.structures import AttributeActions, TableIndex, TableInfo
+
+pytestmark = [pytest.mark.unit, pytest.mark.local]
+
+
+def _attribute_actions():
+    return AttributeActions(
+        default_action=CryptoAction.ENCRYPT_AND_SIGN,
+        attribute_actions={"sign": CryptoAction.SIGN_ONLY, "ignore": CryptoAction.DO_NOTHING},
+    )
+
+
+def _table_info(name="table"):
+    return TableInfo(name=name, primary_index=TableIndex(partition="partition", sort="sort"), secondary_indexes=[])
+
+
+def test_compile_sets_index_keys_on_a_copy():
+    attribute_actions = _attribute_actions()
+
+    plan = AttributeActionPlan.compile(attribute_actions, "partition", "sort")
+
+    assert plan.action("partition") is CryptoAction.SIGN_ONLY
+    assert plan.action("sort") is CryptoAction.SIGN_ONLY
+    assert "partition" not in attribute_actions.attribute_actions
+
+
+def test_compile_invalid_index_key():
+    attribute_actions = AttributeActions(attribute_actions={"partition": CryptoAction.ENCRYPT_AND_SIGN})
+
+    with pytest.raises(InvalidArgumentError) as excinfo:
+        AttributeActionPlan.compile(attribute_actions, "partition")
+
+    excinfo.match(r'Cannot overwrite a previously requested action on indexed attribute: "partition"')
+
+
+@pytest.mark.parametrize("name", ("sign", "ignore", "anything_else"))
+def test_action_matches_attribute_actions(name):
+    attribute_actions = _attribute_actions()
+    plan = AttributeActionPlan.compile(attribute_actions)
+
+    assert plan.action(name) is attribute_actions.action(name)
+    assert plan.action(name) is attribute_actions.action(name)
+
+
+@pytest.mark.parametrize("action", CryptoAction)
+def test_contains_action_matches_attribute_actions(action):
+    attribute_actions = AttributeActions(
+        default_action=CryptoAction.DO_NOTHING, attribute_actions={"sign": CryptoAction.SIGN_ONLY}
+    )
+    plan = AttributeActionPlan.compile(attribute_actions)
+
+    assert plan.contains_action(action) is attribute_actions.contains_action(action)
+
+
+def test_set_index_keys_resets_memoized_values():
+    plan = AttributeActionPlan.compile(_attribute_actions())
+    item = {"key": {"S": "value"}}
+    assert plan.action("key") is CryptoAction.ENCRYPT_AND_SIGN
+    assert signed_attributes(plan, item) == (("key", CryptoAction.ENCRYPT_AND_SIGN, b"key"),)
+
+    plan.set_index_keys("key")
+
+    assert plan.action("key") is CryptoAction.SIGN_ONLY
+    assert signed_attributes(plan, item) == (("key", CryptoAction.SIGN_ONLY, b"key"),)
+
+
+def test_copy_is_mutable_attribute_actions():
+    plan = AttributeActionPlan.compile(_attribute_actions())
+
+    copied = plan.copy()
+
+    assert type(copied) is AttributeActions
+    assert copied.attribute_actions == plan.attribute_actions
+
+
+@pytest.mark.parametrize("compile_plan", (True, False))
+def test_signed_attributes(compile_plan):
+    attribute_actions = _attribute_actions()
+    if compile_plan:
+        attribute_actions = AttributeActionPlan.compile(attribute_actions)
+    item = {"sign": {"S": "a"}, "ignore": {"S": "b"}, "encrypt": {"S": "c"}, "é": {"S": "d"}}
+
+    test = signed_attributes(attribute_actions, item)
+
+    assert test == (
+        ("encrypt", CryptoAction.ENCRYPT_AND_SIGN, b"encrypt"),
+        ("sign", CryptoAction.SIGN_ONLY, b"sign"),
+        ("é", CryptoAction.ENCRYPT_AND_SIGN, "é".encode("utf-8")),
+    )
+
+
+def test_signed_attributes_memoized_per_key_set():
+    plan = AttributeActionPlan.compile(_attribute_actions())
+
+    first = plan.signed_attributes({"b": {"S": "1"}, "a": {"S": "2"}})
+    second = plan.signed_attributes({"b": {"S": "3"}, "a": {"S": "4"}})
+    other = plan.signed_attributes({"a": {"S": "5"}})
+
+    assert first is second
+    assert [name for name, _action, _encoded in first] == ["a", "b"]
+    assert [name for name, _action, _encoded in other] == ["a"]
+
+
+def test_plan_cache_reuses_plan_for_table():
+    cache = AttributeActionPlanCache()
+    attribute_actions = _attribute_actions()
+    table_info = _table_info()
+
+    plan = cache.plan(attribute_actions, table_info)
+
+    assert cache.plan(attribute_actions, table_info) is plan
+    assert plan.action("partition") is CryptoAction.SIGN_ONLY
+    assert cache.plan(attribute_actions, _table_info(name="other")) is not plan
+
+
+def test_plan_cache_rebuilds_plan_for_new_attribute_actions():
+    cache = AttributeActionPlanCache()
+    table_info = _table_info()
+    plan = cache.plan(_attribute_actions(), table_info)
+
+    new_plan = cache.plan(AttributeActions(default_action=CryptoAction.SIGN_ONLY), table_info)
+
+    assert new_plan is not plan
+    assert new_plan.action("anything_else") is CryptoAction.SIGN_ONLY
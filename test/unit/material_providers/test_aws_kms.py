@@ -28,6 +28,7 @@ from dynamodb_encryption_sdk.material_providers.aws_kms import (
     _DEFAULT_CONTENT_ENCRYPTION_ALGORITHM,
     _DEFAULT_SIGNING_ALGORITHM,
     AwsKmsCryptographicMaterialsProvider,
+    DataKeyPartition,
     KeyInfo,
 )
 from dynamodb_encryption_sdk.structures import EncryptionContext
@@ -205,6 +206,10 @@ def test_key_info_from_description_fails():
         dict(regional_clients="not a dict"),
         dict(regional_clients={3: "generate client"}),
         dict(regional_clients={"region": "not a client"}),
+        dict(cache_max_age=60),
+        dict(cache_max_items="not an int"),
+        dict(cache_size="not an int"),
+        dict(data_key_partition="*keys*"),
     ),
 )
 def test_kms_cmp_attrs_fail(invalid_kwargs):
@@ -212,6 +217,21 @@ def test_kms_cmp_attrs_fail(invalid_kwargs):
         _kms_cmp(**invalid_kwargs)
 
 
+@pytest.mark.parametrize(
+    "invalid_kwargs, error_message",
+    (
+        (dict(cache_max_age=0.0), "Cache max age must be greater than 0"),
+        (dict(cache_max_age=60.0, cache_max_items=0), "Cache max items must be at least 1"),
+        (dict(cache_size=0), "Cache capacity must be at least 1"),
+    ),
+)
+def test_kms_cmp_cache_limits_fail(invalid_kwargs, error_message):
+    with pytest.raises(ValueError) as excinfo:
+        _kms_cmp(**invalid_kwargs)
+
+    excinfo.match(error_message)
+
+
 def test_loaded_key_infos():
     cmp = _kms_cmp(material_description={})
 
@@ -372,6 +392,25 @@ def test_kms_encryption_context(default_kms_cmp, encryption_context, additional_
     assert test == expected_keypairs
 
 
+def test_kms_encryption_context_table_coverage(default_kms_cmp):
+    encryption_context = EncryptionContext(
+        table_name="example table",
+        partition_key_name="partition_key",
+        sort_key_name="sort_key",
+        attributes={"partition_key": {"S": "some string value"}, "sort_key": {"N": "55.2"}},
+    )
+
+    test = default_kms_cmp._kms_encryption_context(
+        encryption_context, "encryption_description/123", "signing_description/123", "*table*"
+    )
+
+    assert test == {
+        "*amzn-ddb-env-alg*": "encryption_description/123",
+        "*amzn-ddb-sig-alg*": "signing_description/123",
+        "*aws-kms-table*": "example table",
+    }
+
+
 def test_generate_initial_material(default_kms_cmp, patch_kms_client):
     default_kms_cmp._key_id = _KEY_ID
 
@@ -443,3 +482,108 @@ def test_encryption_materials(default_kms_cmp, patch_generate_initial_material):
     assert test.signing_key == _DELEGATED_KEYS["signing"]
     assert test.encryption_key == _DELEGATED_KEYS["encryption"]
     assert test.material_description == expected_material_description
+
+
+def _item_encryption_context(partition_key_value, material_description=None):
+    return EncryptionContext(
+        table_name="example table",
+        partition_key_name="partition_key",
+        attributes={"partition_key": {"S": partition_key_value}},
+        material_description=material_description or {},
+    )
+
+
+def test_encryption_materials_not_cached_by_default(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID)
+
+    for _ in range(3):
+        cmp.encryption_materials(_item_encryption_context("a"))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 3
+
+
+def test_encryption_materials_cached_by_kms_encryption_context(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=60.0)
+
+    first = cmp.encryption_materials(_item_encryption_context("a"))
+    second = cmp.encryption_materials(_item_encryption_context("a"))
+    cmp.encryption_materials(_item_encryption_context("b"))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 2
+    assert second.material_description == first.material_description
+    # The derived keys are reused, not recomputed
+    assert second.signing_key is first.signing_key
+    assert second.encryption_key is first.encryption_key
+
+
+def test_encryption_materials_table_partition_shares_data_key(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=60.0, data_key_partition=DataKeyPartition.TABLE)
+
+    for partition_key_value in ("a", "b", "c"):
+        test = cmp.encryption_materials(_item_encryption_context(partition_key_value))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 1
+    assert test.material_description["aws-kms-ec-attr"] == "*table*"
+    _, kwargs = patch_kms_client.return_value.generate_data_key.call_args
+    assert "partition_key" not in kwargs["EncryptionContext"]
+
+
+def test_encryption_materials_cache_max_items(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=60.0, cache_max_items=2)
+
+    for _ in range(5):
+        cmp.encryption_materials(_item_encryption_context("a"))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 3
+
+
+def test_encryption_materials_cache_max_age(mocker, patch_kms_client):
+    mock_time = mocker.patch("dynamodb_encryption_sdk.material_providers.caching.time")
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=10.0)
+
+    for now in (0.0, 9.0, 10.0):
+        mock_time.time.return_value = now
+        cmp.encryption_materials(_item_encryption_context("a"))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 2
+
+
+def test_decryption_materials_cached_by_ciphertext_and_kms_encryption_context(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=60.0)
+    other_material_description = _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION.copy()
+    other_material_description["amzn-ddb-env-key"] = base64.b64encode(b"another data key").decode("utf-8")
+
+    first = cmp.decryption_materials(_item_encryption_context("a", _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION))
+    second = cmp.decryption_materials(_item_encryption_context("a", _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION))
+    cmp.decryption_materials(_item_encryption_context("b", _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION))
+    cmp.decryption_materials(_item_encryption_context("a", other_material_description))
+
+    assert patch_kms_client.return_value.decrypt.call_count == 3
+    assert second.verification_key is first.verification_key
+    assert second.decryption_key is first.decryption_key
+    assert second.material_description == _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION
+
+
+def test_decryption_materials_table_coverage(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID)
+    material_description = _DEFAULT_ADDITIONAL_MATERIAL_DESCRIPTION.copy()
+    material_description["aws-kms-ec-attr"] = "*table*"
+
+    cmp.decryption_materials(_item_encryption_context("a", material_description))
+
+    _, kwargs = patch_kms_client.return_value.decrypt.call_args
+    assert kwargs["EncryptionContext"] == {
+        "*amzn-ddb-env-alg*": "AES/256",
+        "*amzn-ddb-sig-alg*": "HmacSHA256/256",
+        "*aws-kms-table*": "example table",
+    }
+
+
+def test_refresh_clears_data_key_cache(patch_kms_client):
+    cmp = _kms_cmp(key_id=_KEY_ID, cache_max_age=60.0)
+
+    cmp.encryption_materials(_item_encryption_context("a"))
+    cmp.refresh()
+    cmp.encryption_materials(_item_encryption_context("a"))
+
+    assert patch_kms_client.return_value.generate_data_key.call_count == 2
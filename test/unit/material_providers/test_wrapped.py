@@ -11,6 +11,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Unit tests for ``dynamodb_encryption_sdk.material_providers.wrapped``."""
+
+import os
+
 import pytest
 from mock import MagicMock
 from pytest_mock import mocker  # noqa pylint: disable=unused-import
@@ -18,6 +21,8 @@ from pytest_mock import mocker  # noqa pylint: disable=unused-import
 import dynamodb_encryption_sdk.material_providers.wrapped
 from dynamodb_encryption_sdk.delegated_keys import DelegatedKey
 from dynamodb_encryption_sdk.exceptions import UnwrappingError, WrappingError
+from dynamodb_encryption_sdk.internal.str_ops import to_str
+from dynamodb_encryption_sdk.material_providers.caching import CacheCounters
 from dynamodb_encryption_sdk.material_providers.wrapped import WrappedCryptographicMaterialsProvider
 from dynamodb_encryption_sdk.structures import EncryptionContext
 
@@ -89,3 +94,177 @@ def test_build_materials(mocker):
         material_description=material_description,
     )
     assert test is dynamodb_encryption_sdk.material_providers.wrapped.WrappedCryptographicMaterials.return_value
+
+
+@pytest.mark.parametrize(
+    "invalid_kwargs, error_message",
+    (
+        (dict(cache_max_age=0.0), "Cache max age must be greater than 0"),
+        (dict(content_key_reuse_max_age=0.0, cache_max_items=1), "Content key reuse max age must be greater than 0"),
+        (dict(content_key_reuse_max_age=60.0, cache_max_items=0), "Cache max items must be at least 1"),
+        (dict(content_key_reuse_max_age=60.0, cache_max_bytes=0), "Cache max bytes must be at least 1"),
+        (dict(content_key_reuse_max_age=60.0), "Content key reuse requires cache max items or cache max bytes"),
+        (dict(cache_size=0), "Cache capacity must be at least 1"),
+    ),
+)
+def test_cache_limits_fail(invalid_kwargs, error_message):
+    with pytest.raises(ValueError) as excinfo:
+        WrappedCryptographicMaterialsProvider(signing_key=MagicMock(__class__=DelegatedKey), **invalid_kwargs)
+
+    excinfo.match(error_message)
+
+
+def _unwrapping_cmp(**kwargs):
+    unwrapping_key = MagicMock(__class__=DelegatedKey, algorithm="AES")
+    unwrapping_key.unwrap.side_effect = lambda **_kwargs: MagicMock(__class__=DelegatedKey)
+    return WrappedCryptographicMaterialsProvider(
+        signing_key=MagicMock(__class__=DelegatedKey), unwrapping_key=unwrapping_key, **kwargs
+    )
+
+
+def _wrapped_key_context(wrapped_key="d3JhcHBlZCBrZXk=", wrapping_algorithm="AESWrap"):
+    return EncryptionContext(
+        material_description={"amzn-ddb-env-key": wrapped_key, "amzn-ddb-wrap-alg": wrapping_algorithm}
+    )
+
+
+def test_content_key_not_cached_by_default():
+    cmp = _unwrapping_cmp()
+
+    for _ in range(3):
+        cmp.decryption_materials(_wrapped_key_context())
+
+    assert cmp._unwrapping_key.unwrap.call_count == 3
+    assert cmp.counters() == CacheCounters()
+
+
+def test_content_key_cached_by_wrapped_key():
+    cmp = _unwrapping_cmp(cache_max_age=60.0)
+
+    first = cmp.decryption_materials(_wrapped_key_context())
+    second = cmp.decryption_materials(_wrapped_key_context())
+    cmp.decryption_materials(_wrapped_key_context(wrapped_key="YW5vdGhlciB3cmFwcGVkIGtleQ=="))
+    cmp.decryption_materials(_wrapped_key_context(wrapping_algorithm="AES"))
+
+    assert cmp._unwrapping_key.unwrap.call_count == 3
+    assert second.decryption_key is first.decryption_key
+    assert second.material_description == first.material_description
+    assert cmp.counters() == CacheCounters(decryption_hits=1, decryption_misses=3)
+
+
+def test_content_key_cache_max_age(mocker):
+    mock_time = mocker.patch("dynamodb_encryption_sdk.material_providers.caching.time")
+    cmp = _unwrapping_cmp(cache_max_age=10.0)
+
+    for now in (0.0, 9.0, 10.0):
+        mock_time.time.return_value = now
+        cmp.decryption_materials(_wrapped_key_context())
+
+    assert cmp._unwrapping_key.unwrap.call_count == 2
+
+
+def test_refresh_clears_content_key_cache():
+    cmp = _unwrapping_cmp(cache_max_age=60.0)
+
+    cmp.decryption_materials(_wrapped_key_context())
+    cmp.refresh()
+    cmp.decryption_materials(_wrapped_key_context())
+
+    assert cmp._unwrapping_key.unwrap.call_count == 2
+
+
+def _wrapping_cmp(**kwargs):
+    wrapping_key = MagicMock(__class__=DelegatedKey, algorithm="AES")
+    wrapping_key.wrap.side_effect = lambda **_kwargs: os.urandom(40)
+    return WrappedCryptographicMaterialsProvider(
+        signing_key=MagicMock(__class__=DelegatedKey), wrapping_key=wrapping_key, unwrapping_key=wrapping_key, **kwargs
+    )
+
+
+def _item_context(value="value", material_description=None):
+    return EncryptionContext(attributes={"attribute": {"S": value}}, material_description=material_description or {})
+
+
+def test_content_key_not_reused_by_default():
+    cmp = _wrapping_cmp()
+
+    for _ in range(3):
+        cmp.encryption_materials(_item_context())
+
+    assert cmp._wrapping_key.wrap.call_count == 3
+
+
+def test_content_key_reused_by_material_description():
+    cmp = _wrapping_cmp(content_key_reuse_max_age=60.0, cache_max_items=10)
+
+    first = cmp.encryption_materials(_item_context())
+    second = cmp.encryption_materials(_item_context("another value"))
+    cmp.encryption_materials(_item_context(material_description={"some": "data"}))
+
+    assert cmp._wrapping_key.wrap.call_count == 2
+    assert second.encryption_key is first.encryption_key
+    assert second.material_description == first.material_description
+    assert cmp.counters() == CacheCounters(encryption_hits=1, encryption_misses=2)
+
+
+def test_content_key_reuse_max_items():
+    cmp = _wrapping_cmp(content_key_reuse_max_age=60.0, cache_max_items=2)
+
+    for _ in range(5):
+        cmp.encryption_materials(_item_context())
+
+    assert cmp._wrapping_key.wrap.call_count == 3
+
+
+def test_content_key_reuse_max_bytes():
+    # Each item context serializes to 11 bytes
+    cmp = _wrapping_cmp(content_key_reuse_max_age=60.0, cache_max_bytes=30)
+
+    for _ in range(5):
+        cmp.encryption_materials(_item_context("abcde"))
+
+    assert cmp._wrapping_key.wrap.call_count == 3
+
+
+def test_content_key_reuse_max_age(mocker):
+    mock_time = mocker.patch("dynamodb_encryption_sdk.material_providers.caching.time")
+    cmp = _wrapping_cmp(content_key_reuse_max_age=10.0, cache_max_items=10)
+
+    for now in (0.0, 9.0, 10.0):
+        mock_time.time.return_value = now
+        cmp.encryption_materials(_item_context())
+
+    assert cmp._wrapping_key.wrap.call_count == 2
+
+
+def test_encryption_not_changed_by_content_key_cache():
+    cmp = _wrapping_cmp(cache_max_age=60.0)
+
+    for _ in range(3):
+        cmp.encryption_materials(_item_context())
+
+    assert cmp._wrapping_key.wrap.call_count == 3
+    assert cmp.counters() == CacheCounters()
+
+
+def test_generated_content_key_cached_for_decryption():
+    cmp = _wrapping_cmp(content_key_reuse_max_age=60.0, cache_max_items=10, cache_max_age=60.0)
+
+    encryption_materials = cmp.encryption_materials(_item_context())
+    # Reading an item back decodes its material description to text
+    material_description = {key: to_str(value) for key, value in encryption_materials.material_description.items()}
+    decryption_materials = cmp.decryption_materials(EncryptionContext(material_description=material_description))
+
+    assert not cmp._unwrapping_key.unwrap.called
+    assert decryption_materials.decryption_key is encryption_materials.encryption_key
+    assert cmp.counters() == CacheCounters(encryption_misses=1, decryption_hits=1)
+
+
+def test_refresh_clears_reused_content_key():
+    cmp = _wrapping_cmp(content_key_reuse_max_age=60.0, cache_max_items=10)
+
+    cmp.encryption_materials(_item_context())
+    cmp.refresh()
+    cmp.encryption_materials(_item_context())
+
+    assert cmp._wrapping_key.wrap.call_count == 2